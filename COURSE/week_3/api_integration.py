@@ -6,10 +6,25 @@ This exercise focuses on working with APIs in Python.
 """
 
 import requests
+import hashlib
 import json
+import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+# Download tuning: bytes read per network chunk and bytes buffered per file write
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+DOWNLOAD_BUFFER_SIZE = 8 * 1024 * 1024
+
+# Errors after which a download is resumed from the bytes already written
+RESUMABLE_ERRORS = (requests.exceptions.ConnectionError, requests.exceptions.ChunkedEncodingError,
+                    requests.exceptions.Timeout)
+
+
+class DownloadError(IOError):
+    """Raised when a download cannot be completed or fails checksum verification."""
+
 def make_api_request(url, method="GET", headers=None, params=None, data=None, timeout=10):
     """
     Make an API request.
@@ -134,22 +149,189 @@ def handle_rate_limits(func, max_retries=3, delay=1):
                     raise
     return wrapper
 
-def download_file_from_url(url, save_path):
+def download_file_from_url(url, save_path, checksum=None, resume=True, segments=1,
+                           chunk_size=DOWNLOAD_CHUNK_SIZE, max_retries=3, session=None, timeout=30):
     """
     Download a file from a URL and save it to the specified path.
     
+    The body is streamed to save_path + '.part' and only renamed to
+    save_path once complete and verified, so memory use stays flat and an
+    interrupted download can be picked up later: with resume=True an
+    existing .part file is continued with an HTTP Range request. Dropped
+    connections are resumed the same way, up to max_retries times.
+    
+    With segments > 1 and a server that supports ranges, the file is
+    preallocated and its byte ranges are downloaded in parallel.
+    
     Args:
         url (str): URL of the file to download
         save_path (str): Path where the file should be saved
+        checksum (str, optional): Expected digest as 'algorithm:hex' (e.g.
+            'sha256:9f86...') or a bare SHA-256 hex digest. Defaults to None.
+        resume (bool, optional): Continue an existing .part file. Defaults to True.
+        segments (int, optional): Parallel range requests. Defaults to 1.
+        chunk_size (int, optional): Bytes read per chunk. Defaults to DOWNLOAD_CHUNK_SIZE.
+        max_retries (int, optional): Resumes allowed after dropped connections. Defaults to 3.
+        session (requests.Session, optional): Session to use. Defaults to a new one,
+            closed when the download ends.
+        timeout (int, optional): Request timeout in seconds. Defaults to 30.
         
     Returns:
         bool: True if download was successful
         
     Raises:
         requests.exceptions.RequestException: If the request fails
+        DownloadError: If the server misbehaves or the checksum does not match
     """
-    # YOUR CODE HERE
-    pass
+    if session is None:
+        with requests.Session() as session:
+            adapter = requests.adapters.HTTPAdapter(pool_maxsize=max(segments, 1))
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            return download_file_from_url(url, save_path, checksum, resume, segments, chunk_size,
+                                          max_retries, session, timeout)
+    
+    directory = os.path.dirname(save_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    part_path = save_path + '.part'
+    algorithm, expected = _parse_checksum(checksum)
+    
+    size = _probe_size(session, url, timeout) if segments > 1 else None
+    if size:
+        _download_segments(session, url, part_path, size, segments, chunk_size, max_retries, timeout)
+        hasher = _hash_file(part_path, algorithm) if algorithm else None
+    else:
+        hasher = _stream_download(session, url, part_path, algorithm, resume, chunk_size,
+                                  max_retries, timeout)
+    
+    if hasher is not None and hasher.hexdigest() != expected:
+        os.remove(part_path)
+        raise DownloadError(f"Checksum mismatch for {url}: expected {expected}, got {hasher.hexdigest()}")
+    os.replace(part_path, save_path)
+    return True
+
+def _parse_checksum(checksum):
+    """Split 'algorithm:hex' into (algorithm, hex); bare digests are SHA-256."""
+    if not checksum:
+        return None, None
+    algorithm, _, expected = checksum.rpartition(':')
+    return (algorithm or 'sha256').lower(), expected.lower()
+
+def _hash_file(path, algorithm):
+    """Hash a file in chunks."""
+    hasher = hashlib.new(algorithm)
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(DOWNLOAD_CHUNK_SIZE), b''):
+            hasher.update(block)
+    return hasher
+
+def _content_range_total(response):
+    """Get the total size from a 'bytes start-end/total' Content-Range header."""
+    total = response.headers.get('Content-Range', '').rpartition('/')[2]
+    return int(total) if total.isdigit() else None
+
+def _probe_size(session, url, timeout):
+    """
+    Ask for the first byte to learn whether the server supports ranges.
+    
+    Returns:
+        int: The file size, or None if ranges are not supported
+    """
+    with session.get(url, headers={'Range': 'bytes=0-0'}, stream=True, timeout=timeout) as response:
+        response.raise_for_status()
+        if response.status_code != 206:
+            return None
+        return _content_range_total(response)
+
+def _stream_download(session, url, part_path, algorithm, resume, chunk_size, max_retries, timeout):
+    """
+    Stream a URL into part_path, resuming from its current size with Range requests.
+    
+    Returns:
+        The hasher over the whole file if algorithm is given, else None
+    """
+    if not resume and os.path.exists(part_path):
+        # Remove a stale part so an early error cannot resume from it
+        os.remove(part_path)
+    offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+    hasher = None
+    if algorithm:
+        hasher = _hash_file(part_path, algorithm) if offset else hashlib.new(algorithm)
+    
+    attempt = 0
+    while True:
+        headers = {'Range': f"bytes={offset}-"} if offset else None
+        try:
+            with session.get(url, headers=headers, stream=True, timeout=timeout) as response:
+                if offset and response.status_code == 416:
+                    if _content_range_total(response) == offset:
+                        return hasher
+                    os.remove(part_path)
+                    offset = 0
+                    hasher = hashlib.new(algorithm) if algorithm else None
+                    continue
+                response.raise_for_status()
+                if offset and response.status_code != 206:
+                    # The server ignored the range, so start over
+                    offset = 0
+                    hasher = hashlib.new(algorithm) if algorithm else None
+                
+                with open(part_path, 'ab' if offset else 'wb', buffering=DOWNLOAD_BUFFER_SIZE) as f:
+                    for chunk in response.iter_content(chunk_size):
+                        f.write(chunk)
+                        if hasher is not None:
+                            hasher.update(chunk)
+                        offset += len(chunk)
+            return hasher
+        except RESUMABLE_ERRORS:
+            attempt += 1
+            if attempt > max_retries:
+                raise
+            # Everything hashed so far was flushed to the file when it closed; a
+            # failure before the first byte leaves no file, so start from scratch
+            offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+            if not offset:
+                hasher = hashlib.new(algorithm) if algorithm else None
+
+def _download_segments(session, url, part_path, size, segments, chunk_size, max_retries, timeout):
+    """Preallocate part_path and download its byte ranges in parallel."""
+    with open(part_path, 'wb') as f:
+        f.truncate(size)
+    segments = min(segments, size)
+    bounds = [(i * size // segments, (i + 1) * size // segments - 1) for i in range(segments)]
+    with ThreadPoolExecutor(max_workers=segments) as executor:
+        futures = [executor.submit(_download_range, session, url, part_path, start, end,
+                                   chunk_size, max_retries, timeout) for start, end in bounds]
+        for future in futures:
+            future.result()
+
+def _download_range(session, url, part_path, start, end, chunk_size, max_retries, timeout):
+    """Download bytes start..end (inclusive) into their place in part_path, resuming on errors."""
+    position = start
+    attempt = 0
+    with open(part_path, 'r+b', buffering=DOWNLOAD_BUFFER_SIZE) as f:
+        while position <= end:
+            try:
+                with session.get(url, headers={'Range': f"bytes={position}-{end}"},
+                                 stream=True, timeout=timeout) as response:
+                    response.raise_for_status()
+                    if response.status_code != 206:
+                        raise DownloadError(f"Server ignored range request for {url}")
+                    f.seek(position)
+                    for chunk in response.iter_content(chunk_size):
+                        chunk = chunk[:end + 1 - position]
+                        f.write(chunk)
+                        position += len(chunk)
+            except RESUMABLE_ERRORS:
+                attempt += 1
+                if attempt > max_retries:
+                    raise
+                continue
+            if position <= end:
+                attempt += 1
+                if attempt > max_retries:
+                    raise DownloadError(f"Range {start}-{end} of {url} ended early at byte {position}")
 
 def create_api_client(base_url, auth_token=None):
     """
@@ -6,11 +6,148 @@ This exercise focuses on creating a robust client for interacting with RESTful A
 """
 
 import requests
+import hashlib
 import json
+import mimetypes
 import os
+import random
 import time
 import logging
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from urllib.parse import urljoin
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+# Connection pool defaults
+DEFAULT_POOL_SIZE = 10
+DEFAULT_CONNECT_TIMEOUT = 3.05
+
+# Retry defaults
+DEFAULT_MAX_DELAY = 30
+
+# Methods that can be repeated without changing the result
+IDEMPOTENT_METHODS = {'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'}
+
+# Statuses worth retrying for idempotent requests
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Statuses that mean the server did not process the request, safe to retry for any method
+REJECTED_STATUSES = {429, 503}
+
+# Header that makes a non-idempotent request safe to retry
+IDEMPOTENCY_KEY_HEADER = 'Idempotency-Key'
+
+# Download tuning: bytes read per network chunk and bytes buffered per file write
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+DOWNLOAD_BUFFER_SIZE = 8 * 1024 * 1024
+
+# Bytes of the file read at a time when streaming an upload
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Errors after which a download is resumed from the bytes already written
+RESUMABLE_ERRORS = (requests.exceptions.ConnectionError, requests.exceptions.ChunkedEncodingError,
+                    requests.exceptions.Timeout)
+
+
+class DownloadError(IOError):
+    """Raised when a download cannot be completed or fails checksum verification."""
+
+class MultipartStream:
+    """
+    A multipart/form-data request body that streams a file in chunks.
+    
+    Form fields and part headers are encoded up front, but the file is only
+    read chunk_size bytes at a time while the body is sent, so memory use
+    does not depend on the file size. The total length is known in advance:
+    pass the stream itself as the body to send it with a Content-Length
+    header, or iter(stream) to send it with chunked transfer encoding.
+    
+    Attributes:
+        boundary (str): The multipart boundary
+        content_type (str): Value for the Content-Type header
+        length (int): Total body length in bytes
+        bytes_sent (int): Body bytes handed to the connection so far
+    """
+    
+    def __init__(self, filepath, file_field='file', fields=None, chunk_size=UPLOAD_CHUNK_SIZE,
+                 progress_callback=None, boundary=None):
+        """
+        Prepare a multipart body for a file and form fields.
+        
+        Args:
+            filepath (str): Path to the file to upload
+            file_field (str, optional): Name of the file field. Defaults to 'file'.
+            fields (dict, optional): Additional form fields. Defaults to None.
+            chunk_size (int, optional): Bytes of the file read at a time. Defaults to UPLOAD_CHUNK_SIZE.
+            progress_callback (callable, optional): Called as progress_callback(bytes_sent, length)
+                each time a piece of the body is sent. Defaults to None.
+            boundary (str, optional): Multipart boundary. Defaults to a random one.
+        """
+        self.filepath = filepath
+        self.chunk_size = chunk_size
+        self.progress_callback = progress_callback
+        self.boundary = boundary or uuid.uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={self.boundary}"
+        
+        filename = os.path.basename(filepath)
+        file_type = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+        head = ''.join(
+            f'--{self.boundary}\r\nContent-Disposition: form-data; '
+            f'name="{_quote_header_param(name)}"\r\n\r\n{value}\r\n'
+            for name, value in (fields or {}).items()
+        )
+        head += (f'--{self.boundary}\r\nContent-Disposition: form-data; name="{_quote_header_param(file_field)}"; '
+                 f'filename="{_quote_header_param(filename)}"\r\nContent-Type: {file_type}\r\n\r\n')
+        self._head = head.encode('utf-8')
+        self._tail = f'\r\n--{self.boundary}--\r\n'.encode('utf-8')
+        self.length = len(self._head) + os.path.getsize(filepath) + len(self._tail)
+        self.bytes_sent = 0
+        
+        # State for read()
+        self._pieces = None
+        self._piece = b''
+        self._offset = 0
+    
+    def __len__(self):
+        return self.length
+    
+    def __iter__(self):
+        """Yield the body in pieces of at most chunk_size bytes of the file."""
+        yield self._sent(self._head)
+        with open(self.filepath, 'rb') as f:
+            for chunk in iter(lambda: f.read(self.chunk_size), b''):
+                yield self._sent(chunk)
+        yield self._sent(self._tail)
+    
+    def read(self, size=-1):
+        """
+        Read the next part of the body, at most size bytes.
+        
+        May return fewer bytes than requested; returns b'' at the end.
+        """
+        if self._pieces is None:
+            self._pieces = iter(self)
+        while self._offset >= len(self._piece):
+            self._piece = next(self._pieces, None)
+            self._offset = 0
+            if self._piece is None:
+                self._piece = b''
+                return b''
+        end = len(self._piece) if size is None or size < 0 else self._offset + size
+        data = self._piece[self._offset:end]
+        self._offset += len(data)
+        return data
+    
+    def _sent(self, piece):
+        """Count a piece of the body as sent and report progress."""
+        self.bytes_sent += len(piece)
+        if self.progress_callback:
+            self.progress_callback(self.bytes_sent, self.length)
+        return piece
+
 
 class APIClient:
     """
@@ -21,6 +158,7 @@ class APIClient:
         headers (dict): Default headers to send with requests
         timeout (int): Default timeout for requests in seconds
         logger (logging.Logger): Logger for the client
+        session (requests.Session): Pooled keep-alive session used for every request
         
     Methods:
         get: Send a GET request
@@ -31,17 +169,46 @@ class APIClient:
         set_auth_token: Set an authentication token
     """
     
-    def __init__(self, base_url, auth_token=None, timeout=10):
+    def __init__(self, base_url, auth_token=None, timeout=10, pool_size=DEFAULT_POOL_SIZE,
+                 connect_timeout=DEFAULT_CONNECT_TIMEOUT):
         """
         Initialize the API client.
         
+        The client owns one session whose connections are kept alive and
+        reused across requests, up to pool_size connections per host.
+        
         Args:
             base_url (str): The base URL of the API
             auth_token (str, optional): Authentication token. Defaults to None.
             timeout (int, optional): Default timeout in seconds. Defaults to 10.
+            pool_size (int, optional): Connections kept per host. Defaults to DEFAULT_POOL_SIZE.
+            connect_timeout (float, optional): Timeout for opening a connection in
+                seconds. Defaults to DEFAULT_CONNECT_TIMEOUT.
         """
-        # YOUR CODE HERE
-        pass
+        self.base_url = base_url if base_url.endswith('/') else base_url + '/'
+        self.timeout = timeout
+        self.connect_timeout = connect_timeout
+        self.logger = logging.getLogger(__name__)
+        
+        self.session = requests.Session()
+        # Retries are handled by retry_request, not by urllib3
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.headers = self.session.headers
+        self.headers.update({'Accept': 'application/json', 'Connection': 'keep-alive'})
+        if auth_token:
+            self.set_auth_token(auth_token)
+    
+    def close(self):
+        """Close the session and its pooled connections."""
+        self.session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
     
     def get(self, endpoint, params=None):
         """
@@ -58,8 +225,7 @@ class APIClient:
             requests.exceptions.RequestException: If the request fails
             ValueError: If the API returns an error response
         """
-        # YOUR CODE HERE
-        pass
+        return self.handle_response(self._request('GET', endpoint, params=params))
     
     def post(self, endpoint, data=None, json_data=None):
         """
@@ -77,8 +243,7 @@ class APIClient:
             requests.exceptions.RequestException: If the request fails
             ValueError: If the API returns an error response
         """
-        # YOUR CODE HERE
-        pass
+        return self.handle_response(self._request('POST', endpoint, data=data, json_data=json_data))
     
     def put(self, endpoint, data=None, json_data=None):
         """
@@ -96,8 +261,7 @@ class APIClient:
             requests.exceptions.RequestException: If the request fails
             ValueError: If the API returns an error response
         """
-        # YOUR CODE HERE
-        pass
+        return self.handle_response(self._request('PUT', endpoint, data=data, json_data=json_data))
     
     def delete(self, endpoint, params=None):
         """
@@ -114,8 +278,7 @@ class APIClient:
             requests.exceptions.RequestException: If the request fails
             ValueError: If the API returns an error response
         """
-        # YOUR CODE HERE
-        pass
+        return self.handle_response(self._request('DELETE', endpoint, params=params))
     
     def handle_response(self, response):
         """
@@ -130,8 +293,22 @@ class APIClient:
         Raises:
             ValueError: If the response contains an error
         """
-        # YOUR CODE HERE
-        pass
+        if not response.ok:
+            try:
+                payload = response.json()
+                message = payload
+                if isinstance(payload, dict):
+                    message = payload.get('error') or payload.get('message') or payload
+            except ValueError:
+                message = response.text or response.reason
+            raise ValueError(f"API error {response.status_code}: {message}")
+        
+        if not response.content:
+            return {}
+        try:
+            return response.json()
+        except ValueError:
+            return {'content': response.text}
     
     def set_auth_token(self, token, token_type="Bearer"):
         """
@@ -144,8 +321,7 @@ class APIClient:
         Returns:
             None
         """
-        # YOUR CODE HERE
-        pass
+        self.headers['Authorization'] = f"{token_type} {token}"
     
     def set_basic_auth(self, username, password):
         """
@@ -158,8 +334,7 @@ class APIClient:
         Returns:
             None
         """
-        # YOUR CODE HERE
-        pass
+        self.session.auth = (username, password)
     
     def set_custom_header(self, key, value):
         """
@@ -172,18 +347,26 @@ class APIClient:
         Returns:
             None
         """
-        # YOUR CODE HERE
-        pass
+        self.headers[key] = value
     
-    def upload_file(self, endpoint, filepath, file_param_name='file', additional_data=None):
+    def upload_file(self, endpoint, filepath, file_param_name='file', additional_data=None,
+                    progress_callback=None, chunked=False, chunk_size=UPLOAD_CHUNK_SIZE):
         """
         Upload a file to the API.
         
+        The multipart body is streamed with MultipartStream, so only about
+        chunk_size bytes of the file are in memory at a time.
+        
         Args:
             endpoint (str): API endpoint (relative to base_url)
             filepath (str): Path to the file to upload
             file_param_name (str, optional): Name of the file parameter. Defaults to 'file'.
             additional_data (dict, optional): Additional form data. Defaults to None.
+            progress_callback (callable, optional): Called as progress_callback(bytes_sent, total_bytes).
+                Defaults to None.
+            chunked (bool, optional): Use chunked transfer encoding instead of a
+                Content-Length header. Defaults to False.
+            chunk_size (int, optional): Bytes of the file read at a time. Defaults to UPLOAD_CHUNK_SIZE.
             
         Returns:
             dict or list: Parsed JSON response
@@ -193,17 +376,40 @@ class APIClient:
             requests.exceptions.RequestException: If the request fails
             ValueError: If the API returns an error response
         """
-        # YOUR CODE HERE
-        pass
+        if not os.path.isfile(filepath):
+            raise FileNotFoundError(f"File not found: {filepath}")
+        
+        body = MultipartStream(filepath, file_param_name, additional_data, chunk_size, progress_callback)
+        response = self._request('POST', endpoint, data=iter(body) if chunked else body,
+                                 headers={'Content-Type': body.content_type})
+        self.logger.info(f"Uploaded {filepath} ({body.length} bytes) to {endpoint}")
+        return self.handle_response(response)
     
-    def download_file(self, endpoint, save_path, params=None):
+    def download_file(self, endpoint, save_path, params=None, checksum=None, resume=True, segments=1,
+                      chunk_size=DOWNLOAD_CHUNK_SIZE, max_retries=3):
         """
         Download a file from the API.
         
+        The body is streamed to save_path + '.part' and only renamed to
+        save_path once complete and verified, so memory use stays flat and an
+        interrupted download can be picked up later: with resume=True an
+        existing .part file is continued with an HTTP Range request. Dropped
+        connections are resumed the same way, up to max_retries times.
+        
+        With segments > 1 and a server that supports ranges, the file is
+        preallocated and its byte ranges are downloaded in parallel over the
+        pooled session (use a pool_size of at least segments).
+        
         Args:
             endpoint (str): API endpoint (relative to base_url)
             save_path (str): Path where to save the file
             params (dict, optional): Query parameters. Defaults to None.
+            checksum (str, optional): Expected digest as 'algorithm:hex' (e.g.
+                'sha256:9f86...') or a bare SHA-256 hex digest. Defaults to None.
+            resume (bool, optional): Continue an existing .part file. Defaults to True.
+            segments (int, optional): Parallel range requests. Defaults to 1.
+            chunk_size (int, optional): Bytes read per chunk. Defaults to DOWNLOAD_CHUNK_SIZE.
+            max_retries (int, optional): Resumes allowed after dropped connections. Defaults to 3.
             
         Returns:
             bool: True if download was successful
@@ -211,19 +417,160 @@ class APIClient:
         Raises:
             requests.exceptions.RequestException: If the request fails
             IOError: If writing to the file fails
+            DownloadError: If the server misbehaves or the checksum does not match
         """
-        # YOUR CODE HERE
-        pass
+        directory = os.path.dirname(save_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        part_path = save_path + '.part'
+        algorithm, expected = _parse_checksum(checksum)
+        download = {'endpoint': endpoint, 'params': params, 'part_path': part_path,
+                    'chunk_size': chunk_size, 'max_retries': max_retries}
+        
+        size = self._probe_size(endpoint, params) if segments > 1 else None
+        if size:
+            self._download_segments(download, size, segments)
+            hasher = _hash_file(part_path, algorithm) if algorithm else None
+        else:
+            hasher = self._stream_download(download, algorithm, resume)
+        
+        if hasher is not None and hasher.hexdigest() != expected:
+            os.remove(part_path)
+            raise DownloadError(f"Checksum mismatch for {endpoint}: expected {expected}, "
+                                f"got {hasher.hexdigest()}")
+        os.replace(part_path, save_path)
+        self.logger.info(f"Downloaded {endpoint} to {save_path}")
+        return True
+    
+    def _probe_size(self, endpoint, params=None):
+        """
+        Ask for the first byte to learn whether the server supports ranges.
+        
+        Returns:
+            int: The file size, or None if ranges are not supported
+        """
+        with self._request('GET', endpoint, params=params, headers={'Range': 'bytes=0-0'},
+                           stream=True) as response:
+            response.raise_for_status()
+            if response.status_code != 206:
+                return None
+            return _content_range_total(response)
+    
+    def _stream_download(self, download, algorithm, resume):
+        """
+        Stream a download into its .part file, resuming from its size with Range requests.
+        
+        Returns:
+            The hasher over the whole file if algorithm is given, else None
+        """
+        part_path = download['part_path']
+        if not resume and os.path.exists(part_path):
+            # Remove a stale part so an early error cannot resume from it
+            os.remove(part_path)
+        offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+        hasher = None
+        if algorithm:
+            hasher = _hash_file(part_path, algorithm) if offset else hashlib.new(algorithm)
+        
+        attempt = 0
+        while True:
+            headers = {'Range': f"bytes={offset}-"} if offset else None
+            try:
+                with self._request('GET', download['endpoint'], params=download['params'],
+                                   headers=headers, stream=True) as response:
+                    if offset and response.status_code == 416:
+                        if _content_range_total(response) == offset:
+                            return hasher
+                        os.remove(part_path)
+                        offset = 0
+                        hasher = hashlib.new(algorithm) if algorithm else None
+                        continue
+                    response.raise_for_status()
+                    if offset and response.status_code != 206:
+                        # The server ignored the range, so start over
+                        offset = 0
+                        hasher = hashlib.new(algorithm) if algorithm else None
+                    
+                    with open(part_path, 'ab' if offset else 'wb', buffering=DOWNLOAD_BUFFER_SIZE) as f:
+                        for chunk in response.iter_content(download['chunk_size']):
+                            f.write(chunk)
+                            if hasher is not None:
+                                hasher.update(chunk)
+                            offset += len(chunk)
+                return hasher
+            except RESUMABLE_ERRORS as e:
+                attempt += 1
+                if attempt > download['max_retries']:
+                    raise
+                # Everything hashed so far was flushed to the file when it closed; a
+                # failure before the first byte leaves no file, so start from scratch
+                offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+                if not offset:
+                    hasher = hashlib.new(algorithm) if algorithm else None
+                self.logger.warning(f"Download of {download['endpoint']} interrupted ({e}), "
+                                    f"resuming at byte {offset}")
+    
+    def _download_segments(self, download, size, segments):
+        """Preallocate the .part file and download its byte ranges in parallel."""
+        with open(download['part_path'], 'wb') as f:
+            f.truncate(size)
+        segments = min(segments, size)
+        bounds = [(i * size // segments, (i + 1) * size // segments - 1) for i in range(segments)]
+        with ThreadPoolExecutor(max_workers=segments) as executor:
+            futures = [executor.submit(self._download_range, download, start, end) for start, end in bounds]
+            for future in futures:
+                future.result()
+    
+    def _download_range(self, download, start, end):
+        """Download bytes start..end (inclusive) into their place in the .part file, resuming on errors."""
+        position = start
+        attempt = 0
+        with open(download['part_path'], 'r+b', buffering=DOWNLOAD_BUFFER_SIZE) as f:
+            while position <= end:
+                try:
+                    with self._request('GET', download['endpoint'], params=download['params'],
+                                       headers={'Range': f"bytes={position}-{end}"}, stream=True) as response:
+                        response.raise_for_status()
+                        if response.status_code != 206:
+                            raise DownloadError(f"Server ignored range request for {download['endpoint']}")
+                        f.seek(position)
+                        for chunk in response.iter_content(download['chunk_size']):
+                            chunk = chunk[:end + 1 - position]
+                            f.write(chunk)
+                            position += len(chunk)
+                except RESUMABLE_ERRORS:
+                    attempt += 1
+                    if attempt > download['max_retries']:
+                        raise
+                    continue
+                if position <= end:
+                    attempt += 1
+                    if attempt > download['max_retries']:
+                        raise DownloadError(f"Range {start}-{end} of {download['endpoint']} "
+                                            f"ended early at byte {position}")
     
-    def retry_request(self, method, endpoint, max_retries=3, retry_delay=1, **kwargs):
+    def retry_request(self, method, endpoint, max_retries=3, retry_delay=1, max_delay=DEFAULT_MAX_DELAY,
+                      **kwargs):
         """
         Send a request with automatic retry logic.
         
+        Retries wait with exponential backoff and full jitter: a random delay
+        between 0 and retry_delay * 2 ** attempt, capped at max_delay. A
+        Retry-After header from the server is used instead when present.
+        
+        Idempotent methods (GET, HEAD, OPTIONS, PUT, DELETE) are retried after
+        connection errors, timeouts and RETRY_STATUSES. Other methods are only
+        retried when the server cannot have processed the request (connect
+        timeouts and REJECTED_STATUSES), unless the request or the session
+        carries an Idempotency-Key header (in any letter case).
+        
         Args:
             method (str): HTTP method ('get', 'post', 'put', 'delete')
             endpoint (str): API endpoint (relative to base_url)
             max_retries (int, optional): Maximum number of retries. Defaults to 3.
-            retry_delay (int, optional): Delay between retries in seconds. Defaults to 1.
+            retry_delay (int, optional): Base delay between retries in seconds. Defaults to 1.
+            max_delay (float, optional): Longest delay between retries in seconds.
+                Defaults to DEFAULT_MAX_DELAY.
             **kwargs: Additional arguments to pass to the request method
             
         Returns:
@@ -233,8 +580,110 @@ class APIClient:
             requests.exceptions.RequestException: If all retries fail
             ValueError: If the API returns an error response on all retries
         """
-        # YOUR CODE HERE
-        pass
+        method = method.upper()
+        headers = CaseInsensitiveDict(self.session.headers)
+        headers.update(kwargs.get('headers') or {})
+        idempotent = method in IDEMPOTENT_METHODS or bool(headers.get(IDEMPOTENCY_KEY_HEADER))
+        
+        for attempt in range(max_retries + 1):
+            retry_after = None
+            try:
+                response = self._request(method, endpoint, **kwargs)
+            except requests.exceptions.RequestException as e:
+                if attempt == max_retries or not self._should_retry_error(e, idempotent):
+                    raise
+                self.logger.warning(f"{method} {endpoint} failed ({e}), retrying")
+            else:
+                retryable = RETRY_STATUSES if idempotent else REJECTED_STATUSES
+                if attempt == max_retries or response.status_code not in retryable:
+                    return self.handle_response(response)
+                retry_after = self._retry_after(response)
+                self.logger.warning(f"{method} {endpoint} returned {response.status_code}, retrying")
+            
+            if retry_after is not None:
+                delay = min(retry_after, max_delay)
+            else:
+                delay = random.uniform(0, min(max_delay, retry_delay * 2 ** attempt))
+            time.sleep(delay)
+    
+    def _request(self, method, endpoint, params=None, data=None, json_data=None, headers=None, **kwargs):
+        """
+        Send a request through the pooled session.
+        
+        Args:
+            method (str): HTTP method
+            endpoint (str): API endpoint (relative to base_url)
+            params (dict, optional): Query parameters. Defaults to None.
+            data (dict, optional): Form data. Defaults to None.
+            json_data (dict, optional): JSON data. Defaults to None.
+            headers (dict, optional): Extra headers for this request. Defaults to None.
+            **kwargs: Additional arguments for requests.Session.request
+            
+        Returns:
+            requests.Response: The raw response
+            
+        Raises:
+            requests.exceptions.RequestException: If the request fails
+        """
+        url = urljoin(self.base_url, endpoint.lstrip('/'))
+        kwargs.setdefault('timeout', (self.connect_timeout, self.timeout))
+        return self.session.request(method.upper(), url, params=params, data=data, json=json_data,
+                                    headers=headers, **kwargs)
+    
+    @staticmethod
+    def _should_retry_error(error, idempotent):
+        """Decide whether a failed request can be retried safely."""
+        if isinstance(error, requests.exceptions.ConnectTimeout):
+            return True
+        if idempotent:
+            return isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout))
+        return False
+    
+    @staticmethod
+    def _retry_after(response):
+        """Get the delay requested by a Retry-After header, in seconds or as an HTTP date, if given."""
+        value = response.headers.get('Retry-After', '').strip()
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def _quote_header_param(value):
+    """Percent-encode the quote and line breaks in a Content-Disposition parameter, as browsers do."""
+    return str(value).translate({10: '%0A', 13: '%0D', 34: '%22'})
+
+
+def _parse_checksum(checksum):
+    """Split 'algorithm:hex' into (algorithm, hex); bare digests are SHA-256."""
+    if not checksum:
+        return None, None
+    algorithm, _, expected = checksum.rpartition(':')
+    return (algorithm or 'sha256').lower(), expected.lower()
+
+
+def _hash_file(path, algorithm):
+    """Hash a file in chunks."""
+    hasher = hashlib.new(algorithm)
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(DOWNLOAD_CHUNK_SIZE), b''):
+            hasher.update(block)
+    return hasher
+
+
+def _content_range_total(response):
+    """Get the total size from a 'bytes start-end/total' Content-Range header."""
+    total = response.headers.get('Content-Range', '').rpartition('/')[2]
+    return int(total) if total.isdigit() else None
 
 
 class APIClientExample:
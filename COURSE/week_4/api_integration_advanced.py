@@ -7,11 +7,17 @@ advanced API interaction techniques.
 """
 
 import requests
+import asyncio
 import json
 import os
+import sys
 import time
 import logging
+import threading
+from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from functools import partial
 from datetime import datetime, timedelta
 
 # Setup logging
@@ -19,14 +25,226 @@ logging.basicConfig(level=logging.INFO,
                     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Defaults for the response cache
+DEFAULT_CACHE_ENTRIES = 1024
+DEFAULT_CACHE_BYTES = 16 * 1024 * 1024
+DEFAULT_CACHE_TTL = 3600
+
+# Defaults for concurrent requests
+DEFAULT_MAX_CONCURRENCY = 10
+
+# Query parameter carrying the API key, per API
+API_KEY_PARAMS = {'weather': 'appid', 'news': 'apiKey', 'stocks': 'apikey'}
+
+# Alpha Vantage function per stock interval, and days covered per period
+STOCK_FUNCTIONS = {'1d': 'TIME_SERIES_DAILY', '1wk': 'TIME_SERIES_WEEKLY', '1mo': 'TIME_SERIES_MONTHLY'}
+STOCK_PERIOD_DAYS = {'1d': 1, '5d': 5, '1mo': 31, '3mo': 92, '6mo': 183, '1y': 366}
+
+
+class _Flight:
+    """A load in progress that concurrent callers for the same key wait on."""
+    
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class ResponseCache:
+    """
+    A thread-safe response cache with a size budget, LRU eviction and per-key TTL.
+    
+    Entries are evicted least recently used first once either the entry or
+    the byte budget is exceeded. Concurrent misses for the same key made
+    through get_or_load are coalesced: one caller runs the loader and the
+    others wait for its result.
+    
+    Attributes:
+        max_entries (int): Maximum number of cached entries
+        max_bytes (int): Maximum total size of cached values in bytes
+        default_ttl (float): Seconds an entry stays fresh unless set otherwise
+    """
+    
+    def __init__(self, max_entries=DEFAULT_CACHE_ENTRIES, max_bytes=DEFAULT_CACHE_BYTES,
+                 default_ttl=DEFAULT_CACHE_TTL, clock=time.monotonic):
+        """
+        Initialize an empty cache.
+        
+        Args:
+            max_entries (int, optional): Entry budget. Defaults to DEFAULT_CACHE_ENTRIES.
+            max_bytes (int, optional): Byte budget. Defaults to DEFAULT_CACHE_BYTES.
+            default_ttl (float, optional): Default TTL in seconds. Defaults to DEFAULT_CACHE_TTL.
+            clock (callable, optional): Monotonic clock, overridable for tests.
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # key -> (value, expires_at, size)
+        self._flights = {}
+        self._bytes = 0
+        self._counts = dict.fromkeys(
+            ('hits', 'misses', 'expirations', 'evictions', 'loads', 'load_errors', 'coalesced'), 0)
+    
+    def __len__(self):
+        return len(self._entries)
+    
+    def get(self, key):
+        """
+        Get a fresh cached value.
+        
+        Args:
+            key (str): Cache key
+            
+        Returns:
+            The cached value, or None if missing or expired
+        """
+        with self._lock:
+            return self._lookup(key)[1]
+    
+    def set(self, key, value, ttl=None):
+        """
+        Cache a value, evicting least recently used entries to stay in budget.
+        
+        Values larger than the whole byte budget are not cached.
+        
+        Args:
+            key (str): Cache key
+            value: JSON-serializable value
+            ttl (float, optional): Seconds the value stays fresh. Defaults to default_ttl.
+        """
+        size = _value_size(value)
+        expires_at = self._clock() + (self.default_ttl if ttl is None else ttl)
+        with self._lock:
+            self._remove(key)
+            if size > self.max_bytes:
+                return
+            self._entries[key] = (value, expires_at, size)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self._counts['evictions'] += 1
+    
+    def get_or_load(self, key, loader, ttl=None):
+        """
+        Get a cached value, calling loader once on a miss.
+        
+        If another thread is already loading the key, wait for its result
+        instead of calling loader again. Errors raised by loader are
+        re-raised in every waiting caller and nothing is cached.
+        
+        Args:
+            key (str): Cache key
+            loader (callable): Function without arguments returning the value
+            ttl (float, optional): Seconds the loaded value stays fresh
+            
+        Returns:
+            The cached or loaded value
+        """
+        with self._lock:
+            found, value = self._lookup(key)
+            if found:
+                return value
+            flight = self._flights.get(key)
+            if flight is not None:
+                self._counts['coalesced'] += 1
+                leader = False
+            else:
+                flight = self._flights[key] = _Flight()
+                self._counts['loads'] += 1
+                leader = True
+        
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+        
+        try:
+            flight.value = loader()
+            self.set(key, flight.value, ttl)
+        except BaseException as e:
+            flight.error = e
+            with self._lock:
+                self._counts['load_errors'] += 1
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+        return flight.value
+    
+    def invalidate(self, key):
+        """
+        Remove a key from the cache.
+        
+        Args:
+            key (str): Cache key
+        """
+        with self._lock:
+            self._remove(key)
+    
+    def clear(self):
+        """Remove every entry (statistics are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+    
+    def stats(self):
+        """
+        Get cache statistics.
+        
+        Returns:
+            dict: hits, misses, expirations, evictions, loads, load_errors,
+                coalesced, entries, bytes and hit_rate
+        """
+        with self._lock:
+            stats = dict(self._counts, entries=len(self._entries), bytes=self._bytes)
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = round(stats['hits'] / lookups, 4) if lookups else 0.0
+        return stats
+    
+    def _lookup(self, key):
+        """Find a fresh entry, counting the hit or miss. Call with the lock held."""
+        entry = self._entries.get(key)
+        if entry is not None and entry[1] <= self._clock():
+            self._remove(key)
+            self._counts['expirations'] += 1
+            entry = None
+        if entry is None:
+            self._counts['misses'] += 1
+            return False, None
+        self._entries.move_to_end(key)
+        self._counts['hits'] += 1
+        return True, entry[0]
+    
+    def _remove(self, key):
+        """Drop an entry if present. Call with the lock held."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[2]
+
+
+def _value_size(value):
+    """Estimate the size of a cached value in bytes from its JSON encoding."""
+    try:
+        return len(json.dumps(value, separators=(',', ':')))
+    except (TypeError, ValueError):
+        return sys.getsizeof(value)
+
+
 class MultiAPIClient:
     """
     A class for interacting with multiple APIs and combining their data.
     
     Attributes:
         apis (dict): Dictionary of API configurations
-        cache (dict): Simple cache for API responses
-        cache_expiry (dict): Expiry times for cached responses
+        cache (ResponseCache): Bounded cache for API responses
+        session (requests.Session): Session shared by all requests
+        timeout (float): Timeout for requests in seconds
+        max_concurrency (int): Requests allowed in flight at once
+        api_limits (dict): Requests allowed in flight at once per API name
         
     Methods:
         get_weather_data: Get weather data for a location
@@ -35,7 +253,9 @@ class MultiAPIClient:
         combine_data: Combine data from multiple APIs
     """
     
-    def __init__(self, config=None):
+    def __init__(self, config=None, cache_max_entries=DEFAULT_CACHE_ENTRIES,
+                 cache_max_bytes=DEFAULT_CACHE_BYTES, cache_ttl=DEFAULT_CACHE_TTL, timeout=10,
+                 max_concurrency=DEFAULT_MAX_CONCURRENCY, api_limits=None):
         """
         Initialize the MultiAPIClient.
         
@@ -49,9 +269,26 @@ class MultiAPIClient:
                     },
                     ...
                 }
+            cache_max_entries (int, optional): Cached response budget. Defaults to DEFAULT_CACHE_ENTRIES.
+            cache_max_bytes (int, optional): Cached bytes budget. Defaults to DEFAULT_CACHE_BYTES.
+            cache_ttl (float, optional): Default cache TTL in seconds. Defaults to DEFAULT_CACHE_TTL.
+            timeout (float, optional): Timeout for requests in seconds. Defaults to 10.
+            max_concurrency (int, optional): Global limit on requests in flight.
+                Defaults to DEFAULT_MAX_CONCURRENCY.
+            api_limits (dict, optional): Per-API limits on requests in flight,
+                e.g. {'stocks': 2}. Defaults to None (only the global limit).
         """
-        # YOUR CODE HERE
-        pass
+        self.apis = config or {}
+        self.cache = ResponseCache(cache_max_entries, cache_max_bytes, cache_ttl)
+        self.timeout = timeout
+        self.max_concurrency = max_concurrency
+        self.api_limits = dict(api_limits or {})
+        
+        # Keep one pooled connection per concurrent request
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=max_concurrency)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
     
     def get_weather_data(self, location, units='metric'):
         """
@@ -68,8 +305,13 @@ class MultiAPIClient:
             ValueError: If the location is not found
             requests.exceptions.RequestException: If the request fails
         """
-        # YOUR CODE HERE
-        pass
+        try:
+            return self._get_api_data('weather', 'current', {'q': location, 'units': units},
+                                      expire_seconds=600)
+        except requests.exceptions.HTTPError as e:
+            if e.response is not None and e.response.status_code == 404:
+                raise ValueError(f"Location not found: {location}") from e
+            raise
     
     def get_news_data(self, query=None, category=None, country=None, max_results=10):
         """
@@ -87,8 +329,11 @@ class MultiAPIClient:
         Raises:
             requests.exceptions.RequestException: If the request fails
         """
-        # YOUR CODE HERE
-        pass
+        params = {'q': query, 'category': category, 'country': country, 'pageSize': max_results}
+        endpoint = 'everything' if query and not (category or country) else 'top_headlines'
+        data = self._get_api_data('news', endpoint, {k: v for k, v in params.items() if v is not None},
+                                  expire_seconds=900)
+        return data.get('articles', [])[:max_results]
     
     def get_stock_data(self, symbol, interval='1d', period='1mo'):
         """
@@ -106,8 +351,21 @@ class MultiAPIClient:
             ValueError: If the symbol is not found
             requests.exceptions.RequestException: If the request fails
         """
-        # YOUR CODE HERE
-        pass
+        function = STOCK_FUNCTIONS.get(interval)
+        params = {'function': function or 'TIME_SERIES_INTRADAY', 'symbol': symbol}
+        if function is None:
+            params['interval'] = interval
+        data = self._get_api_data('stocks', 'time_series_daily', params, expire_seconds=300)
+        if 'Error Message' in data:
+            raise ValueError(f"Symbol not found: {symbol}")
+        
+        series_key = next((key for key in data if key.startswith('Time Series')), None)
+        series = data.get(series_key, {})
+        days = STOCK_PERIOD_DAYS.get(period)
+        if days is not None and series:
+            start = (datetime.fromisoformat(max(series)[:10]) - timedelta(days=days)).date().isoformat()
+            series = {date: values for date, values in series.items() if date[:10] > start}
+        return {'symbol': symbol, 'interval': interval, 'period': period, 'series': series}
     
     def combine_data(self, location, stock_symbols=None):
         """
@@ -122,9 +380,51 @@ class MultiAPIClient:
             
         Raises:
             ValueError: If data cannot be retrieved
+            RuntimeError: If called from a running event loop; await
+                combine_data_async there instead
         """
-        # YOUR CODE HERE
-        pass
+        _check_no_running_loop('combine_data')
+        return asyncio.run(self.combine_data_async(location, stock_symbols))
+    
+    async def combine_data_async(self, location, stock_symbols=None):
+        """
+        Combine data from weather, news, and optionally stock APIs concurrently.
+        
+        All sub-requests are issued at once, subject to the client's global
+        and per-API limits. A failed sub-request leaves its value as None and
+        is reported under 'errors' instead of failing the whole result.
+        
+        Args:
+            location (str): Location for weather and news
+            stock_symbols (list, optional): Stock symbols to include. Defaults to None.
+            
+        Returns:
+            dict: location, weather, news, stocks (by symbol), errors (by
+                source name) and timestamp
+            
+        Raises:
+            ValueError: If no data could be retrieved
+        """
+        stock_symbols = list(stock_symbols or [])
+        calls = [
+            {'api': 'weather', 'func': partial(self.get_weather_data, location)},
+            {'api': 'news', 'func': partial(self.get_news_data, query=location)},
+        ] + [{'api': 'stocks', 'func': partial(self.get_stock_data, symbol)} for symbol in stock_symbols]
+        names = ['weather', 'news'] + [f"stocks.{symbol}" for symbol in stock_symbols]
+        
+        results = await self._run_calls(calls)
+        
+        errors = {name: result['error'] for name, result in zip(names, results) if not result['ok']}
+        if len(errors) == len(results):
+            raise ValueError(f"No data could be retrieved for {location}: {errors}")
+        return {
+            'location': location,
+            'weather': results[0]['data'],
+            'news': results[1]['data'],
+            'stocks': {symbol: result['data'] for symbol, result in zip(stock_symbols, results[2:])},
+            'errors': errors,
+            'timestamp': datetime.now().isoformat(),
+        }
     
     def _cache_response(self, cache_key, data, expire_seconds=3600):
         """
@@ -138,8 +438,7 @@ class MultiAPIClient:
         Returns:
             None
         """
-        # YOUR CODE HERE
-        pass
+        self.cache.set(cache_key, data, ttl=expire_seconds)
     
     def _get_cached_response(self, cache_key):
         """
@@ -151,10 +450,62 @@ class MultiAPIClient:
         Returns:
             The cached data if available and not expired, None otherwise
         """
-        # YOUR CODE HERE
-        pass
+        return self.cache.get(cache_key)
     
-    def _make_request(self, url, params=None, headers=None, method='GET'):
+    def _get_api_data(self, api_name, endpoint, params=None, expire_seconds=None):
+        """
+        Get data from a configured API endpoint through the response cache.
+        
+        Concurrent calls for the same request share one upstream request.
+        
+        Args:
+            api_name (str): Name of the API in the configuration
+            endpoint (str): Name of the endpoint in the API's configuration
+            params (dict, optional): Query parameters. Defaults to None.
+            expire_seconds (int, optional): Cache expiry time in seconds. Defaults to the cache TTL.
+            
+        Returns:
+            dict or list: Parsed JSON response
+            
+        Raises:
+            ValueError: If the API or endpoint is not configured
+            requests.exceptions.RequestException: If the request fails
+        """
+        url, params = self._build_request(api_name, endpoint, params)
+        return self.cache.get_or_load(self._cache_key(url, params),
+                                      lambda: self._make_request(url, params=params),
+                                      ttl=expire_seconds)
+    
+    def _build_request(self, api_name, endpoint, params=None):
+        """
+        Build the URL and query parameters for a configured API endpoint.
+        
+        Args:
+            api_name (str): Name of the API in the configuration
+            endpoint (str): Name of the endpoint in the API's configuration
+            params (dict, optional): Query parameters. Defaults to None.
+            
+        Returns:
+            tuple: (url, params) with the API key added to params
+            
+        Raises:
+            ValueError: If the API or endpoint is not configured
+        """
+        api = self.apis.get(api_name)
+        if api is None or endpoint not in api.get('endpoints', {}):
+            raise ValueError(f"API endpoint not configured: {api_name}.{endpoint}")
+        params = dict(params or {})
+        if api.get('api_key'):
+            params[API_KEY_PARAMS.get(api_name, 'api_key')] = api['api_key']
+        return api['base_url'] + api['endpoints'][endpoint], params
+    
+    @staticmethod
+    def _cache_key(url, params=None, method='GET'):
+        """Build a cache key from the request method, URL and sorted parameters."""
+        query = '&'.join(f"{k}={v}" for k, v in sorted((params or {}).items()))
+        return f"{method} {url}?{query}"
+    
+    def _make_request(self, url, params=None, headers=None, method='GET', timeout=None):
         """
         Make an API request with error handling.
         
@@ -163,6 +514,7 @@ class MultiAPIClient:
             params (dict, optional): Query parameters. Defaults to None.
             headers (dict, optional): HTTP headers. Defaults to None.
             method (str, optional): HTTP method. Defaults to 'GET'.
+            timeout (float, optional): Timeout in seconds. Defaults to the client's timeout.
             
         Returns:
             dict or list: Parsed JSON response
@@ -170,13 +522,18 @@ class MultiAPIClient:
         Raises:
             requests.exceptions.RequestException: If the request fails
         """
-        # YOUR CODE HERE
-        pass
+        response = self.session.request(method, url, params=params, headers=headers,
+                                        timeout=timeout or self.timeout)
+        response.raise_for_status()
+        return response.json()
     
-    def fetch_parallel_data(self, requests_config):
+    def fetch_parallel_data(self, requests_config, max_concurrency=None, api_limits=None):
         """
         Fetch data from multiple APIs in parallel.
         
+        A failed or timed-out request does not stop the others; each result
+        reports whether its request succeeded.
+        
         Args:
             requests_config (list): List of request configurations
                 Format: [
@@ -184,19 +541,125 @@ class MultiAPIClient:
                         'url': 'https://api.example.com/endpoint',
                         'params': {'param1': 'value1'},
                         'headers': {'header1': 'value1'},
-                        'method': 'GET'
+                        'method': 'GET',
+                        'api': 'weather',    # optional, for per-API limits
+                        'timeout': 5         # optional, in seconds
                     },
                     ...
                 ]
+            max_concurrency (int, optional): Global limit on requests in flight.
+                Defaults to the client's max_concurrency.
+            api_limits (dict, optional): Per-API limits, merged over the client's.
             
         Returns:
-            list: Responses from all requests
+            list: One result per request, in order, each a dict with 'ok',
+                'data' (parsed JSON or None), 'error' (message or None) and
+                'elapsed' (seconds)
             
         Raises:
-            Exception: If any request fails
+            RuntimeError: If called from a running event loop; await
+                fetch_parallel_data_async there instead
         """
-        # YOUR CODE HERE
-        pass
+        _check_no_running_loop('fetch_parallel_data')
+        return asyncio.run(self.fetch_parallel_data_async(requests_config, max_concurrency, api_limits))
+    
+    async def fetch_parallel_data_async(self, requests_config, max_concurrency=None, api_limits=None):
+        """
+        Fetch data from multiple APIs concurrently from a running event loop.
+        
+        Args:
+            requests_config (list): Request configurations, as for fetch_parallel_data
+            max_concurrency (int, optional): Global limit on requests in flight.
+            api_limits (dict, optional): Per-API limits, merged over the client's.
+            
+        Returns:
+            list: One result dict per request, as for fetch_parallel_data
+        """
+        calls = []
+        for config in requests_config:
+            timeout = config.get('timeout')
+            func = partial(self._make_request, config['url'], params=config.get('params'),
+                           headers=config.get('headers'), method=config.get('method', 'GET'),
+                           timeout=timeout)
+            calls.append({'api': config.get('api'), 'func': func, 'timeout': timeout})
+        return await self._run_calls(calls, max_concurrency, api_limits)
+    
+    async def _run_calls(self, calls, max_concurrency=None, api_limits=None):
+        """
+        Run blocking calls concurrently under the global and per-API limits.
+        
+        Each call waits for a slot of its API first and then for a global
+        slot, so requests queued behind a busy API do not hold global slots.
+        Timeouts apply from the moment a call starts running on a worker
+        thread: a timed-out call keeps its thread until the request returns,
+        and calls queued behind it do not lose that time from their own
+        timeout.
+        
+        Args:
+            calls (list): Dicts with 'func' (callable without arguments),
+                and optionally 'api' (name for per-API limits) and 'timeout'
+                (seconds, defaults to the client's timeout)
+            max_concurrency (int, optional): Global limit. Defaults to the client's.
+            api_limits (dict, optional): Per-API limits, merged over the client's.
+            
+        Returns:
+            list: One result dict per call, in order
+        """
+        max_concurrency = max_concurrency or self.max_concurrency
+        global_slots = asyncio.Semaphore(max_concurrency)
+        api_slots = {name: asyncio.Semaphore(limit)
+                     for name, limit in dict(self.api_limits, **(api_limits or {})).items()}
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(max_workers=max_concurrency)
+        
+        async def run(call):
+            timeout = call.get('timeout') or self.timeout
+            started = asyncio.Event()
+            
+            def work():
+                loop.call_soon_threadsafe(started.set)
+                return call['func']()
+            
+            async with api_slots.get(call.get('api')) or nullcontext():
+                async with global_slots:
+                    future = loop.run_in_executor(executor, work)
+                    await started.wait()
+                    start = time.perf_counter()
+                    try:
+                        data = await asyncio.wait_for(future, timeout)
+                        error = None
+                    except asyncio.TimeoutError:
+                        data, error = None, f"Timed out after {timeout}s"
+                    except Exception as e:
+                        data, error = None, f"{type(e).__name__}: {e}"
+                    elapsed = time.perf_counter() - start
+            if error:
+                logger.warning(f"Request to {call.get('api') or 'API'} failed: {error}")
+            return {'ok': error is None, 'data': data, 'error': error, 'elapsed': elapsed}
+        
+        try:
+            return await asyncio.gather(*(run(call) for call in calls))
+        finally:
+            # Timed-out requests finish in the background, bounded by the request timeout
+            executor.shutdown(wait=False)
+
+
+def _check_no_running_loop(name):
+    """
+    Refuse to start an event loop from inside a running one.
+    
+    Args:
+        name (str): Name of the blocking method being called
+        
+    Raises:
+        RuntimeError: If an event loop is running in this thread
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    raise RuntimeError(f"{name}() cannot be called from a running event loop; "
+                       f"use 'await {name}_async(...)' instead")
 
 
 class DataAnalyzer:
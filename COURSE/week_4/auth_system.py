@@ -11,25 +11,530 @@ import json
 import os
 import hashlib
 import hmac
+import logging
 import secrets
+import sqlite3
+import threading
 import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from functools import wraps
 
+from flask import g, jsonify, request
+
+logger = logging.getLogger(__name__)
+
+
+def _env_int(name, default, minimum=1):
+    """
+    Read an integer setting from the environment.
+    
+    Missing values fall back to the default silently; values that are not
+    integers or are below the minimum fall back with a warning instead of
+    failing the import.
+    
+    Args:
+        name (str): Environment variable name
+        default (int): Value used when the variable is unset or invalid
+        minimum (int, optional): Smallest accepted value. Defaults to 1.
+        
+    Returns:
+        int: The setting
+    """
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    try:
+        number = int(value)
+    except ValueError:
+        number = None
+    if number is None or number < minimum:
+        logger.warning(f"Ignoring invalid {name}={value!r}; using {default}")
+        return default
+    return number
+
+
 # Constants
 JWT_SECRET = os.environ.get('JWT_SECRET', 'your-jwt-secret-key')  # In production, use an environment variable
 JWT_ALGORITHM = 'HS256'
 JWT_EXPIRATION_DELTA = timedelta(hours=1)
 API_KEYS_FILE = 'api_keys.json'
 USERS_FILE = 'users.json'
+AUTH_DB_FILE = 'auth.db'
+PASSWORD_HASH_ITERATIONS = _env_int('PASSWORD_HASH_ITERATIONS', 200_000)
+PASSWORD_HASH_WORKERS = os.cpu_count() or 1
+PASSWORD_HASH_QUEUE = 32
+TOKEN_CACHE_SIZE = 10_000
+TOKEN_CACHE_TTL = 60  # seconds; bounds how late revocations by other processes are seen
+
+
+def hash_api_key(api_key):
+    """
+    Hash an API key for storage and lookup.
+    
+    API keys are long random strings, so a fast unsalted hash is enough:
+    the stored hash cannot be turned back into a usable key.
+    
+    Args:
+        api_key (str): The API key
+        
+    Returns:
+        str: SHA-256 hex digest
+    """
+    return hashlib.sha256(api_key.encode('utf-8')).hexdigest()
+
+
+class HasherBusyError(RuntimeError):
+    """Raised when the password hashing pool and its queue are full."""
+
+
+class PasswordHasher:
+    """
+    A bounded worker pool for PBKDF2 password hashing.
+    
+    Hashing is deliberately slow, so it runs on a fixed number of worker
+    threads instead of the request threads; pbkdf2_hmac releases the GIL,
+    so the workers run in parallel with each other and with request
+    handling. At most max_queue hashes wait for a worker; beyond that
+    hash() fails at once with HasherBusyError, which a server can turn
+    into a 503, instead of letting a login burst pile up.
+    
+    Attributes:
+        max_workers (int): Number of hashing threads
+        max_queue (int): Hashes allowed to wait for a free worker
+    """
+    
+    def __init__(self, max_workers=PASSWORD_HASH_WORKERS, max_queue=PASSWORD_HASH_QUEUE, window=1000):
+        """
+        Start a hashing pool.
+        
+        Args:
+            max_workers (int, optional): Hashing threads. Defaults to PASSWORD_HASH_WORKERS.
+            max_queue (int, optional): Waiting hashes before rejecting. Defaults to PASSWORD_HASH_QUEUE.
+            window (int, optional): Recent hashes kept for latency percentiles. Defaults to 1000.
+        """
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(max_workers, thread_name_prefix='password-hash')
+        self._slots = threading.BoundedSemaphore(max_workers + max_queue)
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._active = 0
+        self._hash_times = deque(maxlen=window)
+        self._wait_times = deque(maxlen=window)
+        self._counts = dict.fromkeys(('completed', 'rejected'), 0)
+    
+    def hash(self, password, salt, iterations):
+        """
+        Hash a password on the pool and wait for the result.
+        
+        Args:
+            password (str): Password to hash
+            salt (str): Salt for hashing
+            iterations (int): PBKDF2 iterations
+            
+        Returns:
+            bytes: PBKDF2-HMAC-SHA256 digest
+            
+        Raises:
+            HasherBusyError: If every worker is busy and the queue is full
+        """
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self._counts['rejected'] += 1
+            raise HasherBusyError("Password hashing is saturated, try again later")
+        try:
+            with self._lock:
+                self._queued += 1
+            return self._executor.submit(self._run, password, salt, iterations, time.perf_counter()).result()
+        finally:
+            self._slots.release()
+    
+    def _run(self, password, salt, iterations, submitted):
+        """Hash on a worker thread, recording wait and hash times."""
+        started = time.perf_counter()
+        with self._lock:
+            self._queued -= 1
+            self._active += 1
+        try:
+            return hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt.encode('utf-8'), iterations)
+        finally:
+            finished = time.perf_counter()
+            with self._lock:
+                self._active -= 1
+                self._counts['completed'] += 1
+                self._hash_times.append(finished - started)
+                self._wait_times.append(started - submitted)
+    
+    def stats(self):
+        """
+        Get pool metrics.
+        
+        Returns:
+            dict: queue_depth, active, completed and rejected counts, and the
+                median and 95th percentile hash and queue wait times in ms over
+                recent hashes
+        """
+        with self._lock:
+            stats = {'queue_depth': self._queued, 'active': self._active, **self._counts}
+            samples = {'hash': sorted(self._hash_times), 'wait': sorted(self._wait_times)}
+        for name, values in samples.items():
+            for label, fraction in (('p50', 0.5), ('p95', 0.95)):
+                index = min(len(values) - 1, int(fraction * len(values)))
+                stats[f"{name}_ms_{label}"] = values[index] * 1000 if values else 0.0
+        return stats
+    
+    def shutdown(self):
+        """Stop the worker threads once queued hashes finish."""
+        self._executor.shutdown()
+
+
+class AuthStore:
+    """
+    SQLite-backed storage for users, API keys and revoked JWT tokens.
+    
+    Users are keyed by username, API keys by the SHA-256 hash of the key and
+    revoked tokens by their jti claim, so lookups use the primary key index
+    instead of scanning. Every change is one committed transaction. The
+    database runs in WAL mode, so readers do not block the writer, and
+    SQLite's file locking keeps writes atomic across processes as well as
+    threads.
+    """
+    
+    def __init__(self, path=AUTH_DB_FILE, timeout=30):
+        """
+        Open or create an auth store.
+        
+        Args:
+            path (str, optional): SQLite database file (':memory:' for a throwaway store).
+                Defaults to AUTH_DB_FILE.
+            timeout (float, optional): Seconds to wait for another writer's lock. Defaults to 30.
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=timeout, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._conn:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS users (
+                    username TEXT PRIMARY KEY,
+                    email TEXT NOT NULL,
+                    role TEXT NOT NULL,
+                    password_hash TEXT NOT NULL,
+                    salt TEXT NOT NULL,
+                    iterations INTEGER NOT NULL,
+                    created_at TEXT NOT NULL,
+                    last_login TEXT
+                )
+            """)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS users_email ON users (email)")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS api_keys (
+                    key_hash TEXT PRIMARY KEY,
+                    owner TEXT NOT NULL,
+                    permissions TEXT NOT NULL,
+                    created_at TEXT NOT NULL,
+                    revoked_at TEXT
+                )
+            """)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS api_keys_owner ON api_keys (owner)")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS revoked_tokens (
+                    jti TEXT PRIMARY KEY,
+                    expires_at REAL NOT NULL
+                )
+            """)
+    
+    def close(self):
+        """Close the underlying database connection."""
+        self._conn.close()
+    
+    def add_user(self, user):
+        """
+        Insert a new user.
+        
+        Args:
+            user (dict): username, email, role, password_hash, salt, iterations
+                and created_at
+            
+        Raises:
+            ValueError: If the username already exists
+        """
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT INTO users (username, email, role, password_hash, salt, iterations, created_at) "
+                    "VALUES (:username, :email, :role, :password_hash, :salt, :iterations, :created_at)",
+                    user
+                )
+        except sqlite3.IntegrityError:
+            raise ValueError(f"Username already exists: {user['username']}") from None
+    
+    def get_user(self, username):
+        """
+        Look up a user by username.
+        
+        Args:
+            username (str): Username
+            
+        Returns:
+            dict: The stored user, or None if unknown
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM users WHERE username = ?", (username,)).fetchone()
+        return dict(row) if row else None
+    
+    def update_user(self, username, **fields):
+        """
+        Update columns of a user.
+        
+        Args:
+            username (str): Username
+            **fields: Column names and new values, e.g. last_login='...'
+            
+        Returns:
+            bool: True if the user exists
+        """
+        assignments = ', '.join(f"{name} = ?" for name in fields)
+        with self._lock, self._conn:
+            cursor = self._conn.execute(f"UPDATE users SET {assignments} WHERE username = ?",
+                                        (*fields.values(), username))
+        return cursor.rowcount > 0
+    
+    def count_users(self):
+        """Return the number of users."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM users").fetchone()[0]
+    
+    def add_api_key(self, key_hash, owner, permissions):
+        """
+        Insert a new API key.
+        
+        Args:
+            key_hash (str): Hash of the key, from hash_api_key
+            owner (str): Name of the key owner
+            permissions (list): Granted permissions
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO api_keys (key_hash, owner, permissions, created_at) VALUES (?, ?, ?, ?)",
+                (key_hash, owner, json.dumps(sorted(set(permissions))), datetime.now().isoformat())
+            )
+    
+    def get_api_key(self, key_hash):
+        """
+        Look up an API key by its hash.
+        
+        Args:
+            key_hash (str): Hash of the key, from hash_api_key
+            
+        Returns:
+            dict: owner, permissions (list), created_at and revoked_at, or None if unknown
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM api_keys WHERE key_hash = ?", (key_hash,)).fetchone()
+        if row is None:
+            return None
+        record = dict(row)
+        record['permissions'] = json.loads(record['permissions'])
+        return record
+    
+    def revoke_api_key(self, key_hash):
+        """
+        Mark an API key as revoked.
+        
+        Args:
+            key_hash (str): Hash of the key, from hash_api_key
+            
+        Returns:
+            bool: True if an active key was revoked
+        """
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "UPDATE api_keys SET revoked_at = ? WHERE key_hash = ? AND revoked_at IS NULL",
+                (datetime.now().isoformat(), key_hash)
+            )
+        return cursor.rowcount > 0
+    
+    def revoke_token(self, jti, expires_at):
+        """
+        Add a JWT to the revocation list.
+        
+        Entries whose token has expired anyway are purged at the same time.
+        
+        Args:
+            jti (str): Token ID (the jti claim)
+            expires_at (float): Expiry of the token as a Unix timestamp
+            
+        Returns:
+            bool: True if the token was not revoked before
+        """
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM revoked_tokens WHERE expires_at < ?", (time.time(),))
+            cursor = self._conn.execute(
+                "INSERT OR IGNORE INTO revoked_tokens (jti, expires_at) VALUES (?, ?)", (jti, expires_at)
+            )
+        return cursor.rowcount > 0
+    
+    def is_token_revoked(self, jti):
+        """
+        Check whether a JWT is on the revocation list.
+        
+        Args:
+            jti (str): Token ID (the jti claim)
+            
+        Returns:
+            bool: True if the token was revoked
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT 1 FROM revoked_tokens WHERE jti = ?", (jti,)).fetchone()
+        return row is not None
+    
+    def import_records(self, users=None, api_keys=None):
+        """
+        Bulk-insert users and API keys, skipping ones that already exist.
+        
+        Args:
+            users (list, optional): User dicts, as for add_user
+            api_keys (list, optional): (key_hash, owner, permissions, created_at, revoked_at) tuples
+        """
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO users (username, email, role, password_hash, salt, iterations, created_at) "
+                "VALUES (:username, :email, :role, :password_hash, :salt, :iterations, :created_at)",
+                users or []
+            )
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO api_keys (key_hash, owner, permissions, created_at, revoked_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [(h, owner, json.dumps(sorted(set(perms))), created, revoked)
+                 for h, owner, perms, created, revoked in api_keys or []]
+            )
+
+
+class TokenCache:
+    """
+    A bounded, thread-safe cache of verified credentials.
+    
+    Holds what was learned by verifying a JWT token or API key (its claims,
+    or its owner and permissions). Entries are keyed by the SHA-256 digest
+    of the credential, so the secrets themselves are not kept and lookups
+    never compare them, and are valid until their own expiry or the cache
+    TTL, whichever comes first. The TTL bounds how long a credential
+    revoked by another process can still be accepted here; revocations
+    made through the same AuthManager invalidate the entry at once. The
+    least recently used entry is evicted when the cache is full.
+    
+    Attributes:
+        max_entries (int): Maximum number of cached credentials (0 disables caching)
+        ttl (float): Maximum seconds an entry is trusted
+    """
+    
+    def __init__(self, max_entries=TOKEN_CACHE_SIZE, ttl=TOKEN_CACHE_TTL, clock=time.time):
+        """
+        Initialize an empty cache.
+        
+        Args:
+            max_entries (int, optional): Entry budget. Defaults to TOKEN_CACHE_SIZE.
+            ttl (float, optional): Maximum entry age in seconds. Defaults to TOKEN_CACHE_TTL.
+            clock (callable, optional): Wall clock returning Unix time, overridable for tests.
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # digest -> (value, expires_at)
+        self._counts = dict.fromkeys(('hits', 'misses', 'evictions', 'invalidations'), 0)
+    
+    def __len__(self):
+        return len(self._entries)
+    
+    @staticmethod
+    def _key(token):
+        return hashlib.sha256(token.encode('utf-8')).digest()
+    
+    def get(self, token):
+        """
+        Get the cached verification result of a credential.
+        
+        Args:
+            token (str): JWT token or API key
+            
+        Returns:
+            The cached value, or None if not cached or expired
+        """
+        key = self._key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[1] <= self._clock():
+                if entry is not None:
+                    del self._entries[key]
+                self._counts['misses'] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._counts['hits'] += 1
+            return entry[0]
+    
+    def set(self, token, value, expires_at=None):
+        """
+        Cache the verification result of a credential until it expires or the TTL.
+        
+        Args:
+            token (str): JWT token or API key
+            value: Verification result, not modified while cached
+            expires_at (float, optional): Unix time the credential expires. Defaults to never.
+        """
+        if self.max_entries <= 0:
+            return
+        expires_at = min(expires_at or float('inf'), self._clock() + self.ttl)
+        key = self._key(token)
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._counts['evictions'] += 1
+    
+    def invalidate(self, token):
+        """
+        Drop a credential from the cache.
+        
+        Args:
+            token (str): JWT token or API key
+        """
+        with self._lock:
+            if self._entries.pop(self._key(token), None) is not None:
+                self._counts['invalidations'] += 1
+    
+    def clear(self):
+        """Drop every cached credential."""
+        with self._lock:
+            self._entries.clear()
+    
+    def stats(self):
+        """
+        Get cache counters.
+        
+        Returns:
+            dict: entries, hits, misses, evictions and invalidations
+        """
+        with self._lock:
+            return {'entries': len(self._entries), **self._counts}
+
 
 class AuthManager:
     """
     A class for managing authentication and authorization.
     
     Attributes:
-        api_keys (dict): Dictionary of API keys and their metadata
-        users (dict): Dictionary of user data
+        store (AuthStore): Storage for users, API keys and revoked tokens
+        password_iterations (int): PBKDF2 iterations for new password hashes
+        password_hasher (PasswordHasher): Worker pool that runs password hashing
+        token_cache (TokenCache): Claims of recently verified JWT tokens
+        key_cache (TokenCache): Owner and permissions of recently verified API keys
         
     Methods:
         generate_api_key: Generate a new API key
@@ -38,12 +543,63 @@ class AuthManager:
         authenticate_user: Authenticate a user with username and password
         generate_jwt_token: Generate a JWT token for a user
         validate_jwt_token: Validate a JWT token
+        refresh_jwt_token: Exchange a JWT token for a new one
+        revoke_jwt_token: Revoke a JWT token
     """
     
-    def __init__(self):
-        """Initialize the AuthManager."""
-        self.api_keys = self._load_api_keys()
-        self.users = self._load_users()
+    def __init__(self, store=None, db_path=AUTH_DB_FILE, password_iterations=PASSWORD_HASH_ITERATIONS,
+                 token_cache=None, key_cache=None, password_hasher=None):
+        """
+        Initialize the AuthManager.
+        
+        Users and API keys left in the JSON files of earlier versions are
+        imported into the store once, and the files renamed to *.migrated.
+        
+        Args:
+            store (AuthStore, optional): Storage to use. Defaults to an AuthStore at db_path.
+            db_path (str, optional): Database file when no store is given. Defaults to AUTH_DB_FILE.
+            password_iterations (int, optional): PBKDF2 iterations for new password
+                hashes. Stored hashes with another cost are rehashed on the next
+                successful login. Defaults to PASSWORD_HASH_ITERATIONS.
+            token_cache (TokenCache, optional): Cache of verified tokens. Defaults to a
+                new TokenCache; pass TokenCache(max_entries=0) to verify every time.
+            key_cache (TokenCache, optional): Cache of verified API keys. Defaults to a
+                new TokenCache.
+            password_hasher (PasswordHasher, optional): Hashing pool. Defaults to a
+                new PasswordHasher.
+        """
+        self.store = store or AuthStore(db_path)
+        self.password_iterations = password_iterations
+        self.token_cache = token_cache if token_cache is not None else TokenCache()
+        self.key_cache = key_cache if key_cache is not None else TokenCache()
+        self.password_hasher = password_hasher or PasswordHasher()
+        self._migrate_json_files()
+    
+    def close(self):
+        """Close the store and stop the hashing pool."""
+        self.store.close()
+        self.password_hasher.shutdown()
+    
+    def _migrate_json_files(self):
+        """Import the users and API keys of the JSON files, if present, into the store."""
+        if not (os.path.exists(API_KEYS_FILE) or os.path.exists(USERS_FILE)):
+            return
+        defaults = {'email': '', 'role': 'user', 'iterations': self.password_iterations,
+                    'created_at': datetime.now().isoformat()}
+        users = [{**defaults, **data, 'username': username} for username, data in self._load_users().items()]
+        api_keys = [
+            (hash_api_key(key), data.get('owner', ''), data.get('permissions', []),
+             data.get('created_at', datetime.now().isoformat()),
+             datetime.now().isoformat() if data.get('revoked') else None)
+            for key, data in self._load_api_keys().items()
+        ]
+        self.store.import_records(users, api_keys)
+        for path in (API_KEYS_FILE, USERS_FILE):
+            try:
+                os.replace(path, path + '.migrated')
+            except FileNotFoundError:
+                # Absent, or another process migrated it first
+                pass
     
     def _load_api_keys(self):
         """Load API keys from file or create empty dict if file doesn't exist."""
@@ -57,16 +613,6 @@ class AuthManager:
             print(f"Error loading API keys: {e}")
             return {}
     
-    def _save_api_keys(self):
-        """Save API keys to file."""
-        try:
-            with open(API_KEYS_FILE, 'w') as f:
-                json.dump(self.api_keys, f, indent=2)
-            return True
-        except Exception as e:
-            print(f"Error saving API keys: {e}")
-            return False
-    
     def _load_users(self):
         """Load users from file or create empty dict if file doesn't exist."""
         try:
@@ -79,16 +625,6 @@ class AuthManager:
             print(f"Error loading users: {e}")
             return {}
     
-    def _save_users(self):
-        """Save users to file."""
-        try:
-            with open(USERS_FILE, 'w') as f:
-                json.dump(self.users, f, indent=2)
-            return True
-        except Exception as e:
-            print(f"Error saving users: {e}")
-            return False
-    
     def generate_api_key(self, owner_name, permissions=None):
         """
         Generate a new API key.
@@ -100,13 +636,18 @@ class AuthManager:
         Returns:
             str: The generated API key
         """
-        # YOUR CODE HERE
-        pass
+        api_key = secrets.token_urlsafe(32)
+        self.store.add_api_key(hash_api_key(api_key), owner_name, permissions or [])
+        return api_key
     
     def validate_api_key(self, api_key, required_permissions=None):
         """
         Validate an API key and check permissions.
         
+        Active keys are cached with their permissions as a frozenset, so
+        repeated calls skip the store and check permissions with one set
+        operation. Unknown and revoked keys are looked up every time.
+        
         Args:
             api_key (str): The API key to validate
             required_permissions (list, optional): Required permissions. Defaults to None.
@@ -114,8 +655,19 @@ class AuthManager:
         Returns:
             tuple: (is_valid, owner_name, permissions)
         """
-        # YOUR CODE HERE
-        pass
+        if not api_key:
+            return False, None, None
+        entry = self.key_cache.get(api_key)
+        if entry is None:
+            record = self.store.get_api_key(hash_api_key(api_key))
+            if record is None or record['revoked_at']:
+                return False, None, None
+            entry = (record['owner'], frozenset(record['permissions']), tuple(record['permissions']))
+            self.key_cache.set(api_key, entry)
+        owner, granted, permissions = entry
+        if required_permissions and not granted.issuperset(required_permissions):
+            return False, owner, list(permissions)
+        return True, owner, list(permissions)
     
     def register_user(self, username, password, email, role='user'):
         """
@@ -132,9 +684,23 @@ class AuthManager:
             
         Raises:
             ValueError: If username already exists
+            HasherBusyError: If password hashing is saturated
         """
-        # YOUR CODE HERE
-        pass
+        if not username or not password:
+            raise ValueError("Username and password are required")
+        
+        password_hash, salt = self._hash_password(password)
+        user = {
+            'username': username,
+            'email': email,
+            'role': role,
+            'password_hash': password_hash,
+            'salt': salt,
+            'iterations': self.password_iterations,
+            'created_at': datetime.now().isoformat(),
+        }
+        self.store.add_user(user)
+        return _public_user(user)
     
     def authenticate_user(self, username, password):
         """
@@ -146,9 +712,27 @@ class AuthManager:
             
         Returns:
             tuple: (is_authenticated, user_data)
+            
+        Raises:
+            HasherBusyError: If password hashing is saturated
         """
-        # YOUR CODE HERE
-        pass
+        user = self.store.get_user(username)
+        if user is None:
+            # Hash anyway so unknown usernames take as long as wrong passwords
+            self._hash_password(password)
+            return False, None
+        
+        password_hash, _ = self._hash_password(password, user['salt'], user['iterations'])
+        if not hmac.compare_digest(password_hash, user['password_hash']):
+            return False, None
+        user['last_login'] = datetime.now().isoformat()
+        if user['iterations'] != self.password_iterations:
+            password_hash, salt = self._hash_password(password)
+            self.store.update_user(username, last_login=user['last_login'], password_hash=password_hash,
+                                   salt=salt, iterations=self.password_iterations)
+        else:
+            self.store.update_user(username, last_login=user['last_login'])
+        return True, _public_user(user)
     
     def generate_jwt_token(self, user_data):
         """
@@ -160,26 +744,52 @@ class AuthManager:
         Returns:
             str: JWT token
         """
-        # YOUR CODE HERE
-        pass
+        now = int(time.time())
+        payload = {
+            'sub': user_data['username'],
+            'email': user_data.get('email'),
+            'role': user_data.get('role', 'user'),
+            'iat': now,
+            'exp': now + int(JWT_EXPIRATION_DELTA.total_seconds()),
+            'jti': uuid.uuid4().hex,
+        }
+        return jwt.encode(payload, JWT_SECRET, algorithm=JWT_ALGORITHM)
     
     def validate_jwt_token(self, token):
         """
         Validate a JWT token.
         
+        Verified claims are cached until the token expires, so repeated
+        requests with the same token skip decoding, the signature check and
+        the revocation lookup.
+        
         Args:
             token (str): JWT token
             
         Returns:
             tuple: (is_valid, payload)
         """
-        # YOUR CODE HERE
-        pass
+        if not token:
+            return False, None
+        payload = self.token_cache.get(token)
+        if payload is not None:
+            return True, dict(payload)
+        try:
+            payload = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM],
+                                 options={'require': ['exp', 'sub', 'jti']})
+        except jwt.InvalidTokenError:
+            return False, None
+        if self.store.is_token_revoked(payload['jti']):
+            return False, None
+        self.token_cache.set(token, payload, payload['exp'])
+        return True, dict(payload)
     
     def refresh_jwt_token(self, token):
         """
         Refresh a JWT token.
         
+        The old token is revoked, so each token can be refreshed once.
+        
         Args:
             token (str): JWT token
             
@@ -189,22 +799,48 @@ class AuthManager:
         Raises:
             ValueError: If token is invalid or expired
         """
-        # YOUR CODE HERE
-        pass
+        is_valid, payload = self.validate_jwt_token(token)
+        if not is_valid or not self._revoke_token(token, payload):
+            raise ValueError("Invalid or expired token")
+        return self.generate_jwt_token({'username': payload['sub'], 'email': payload.get('email'),
+                                        'role': payload.get('role', 'user')})
     
-    def _hash_password(self, password, salt=None):
+    def revoke_jwt_token(self, token):
         """
-        Hash a password securely.
+        Revoke a JWT token before it expires.
+        
+        Args:
+            token (str): JWT token
+            
+        Returns:
+            bool: True if a valid token was revoked
+        """
+        is_valid, payload = self.validate_jwt_token(token)
+        return is_valid and self._revoke_token(token, payload)
+    
+    def _revoke_token(self, token, payload):
+        """Put a verified token on the revocation list and drop it from the cache."""
+        self.token_cache.invalidate(token)
+        return self.store.revoke_token(payload['jti'], payload['exp'])
+    
+    def _hash_password(self, password, salt=None, iterations=None):
+        """
+        Hash a password securely on the hashing pool.
         
         Args:
             password (str): Password to hash
             salt (str, optional): Salt for hashing. Defaults to None.
+            iterations (int, optional): PBKDF2 iterations. Defaults to password_iterations.
             
         Returns:
             tuple: (hash, salt)
+            
+        Raises:
+            HasherBusyError: If password hashing is saturated
         """
-        # YOUR CODE HERE
-        pass
+        salt = salt or secrets.token_hex(16)
+        password_hash = self.password_hasher.hash(password, salt, iterations or self.password_iterations)
+        return password_hash.hex(), salt
     
     def revoke_api_key(self, api_key):
         """
@@ -216,33 +852,60 @@ class AuthManager:
         Returns:
             bool: True if revoked successfully
         """
-        # YOUR CODE HERE
-        pass
+        revoked = self.store.revoke_api_key(hash_api_key(api_key))
+        self.key_cache.invalidate(api_key)
+        return revoked
+
+
+def _public_user(user):
+    """Return user data without the password hash, salt and hashing cost."""
+    return {key: value for key, value in user.items()
+            if key not in ('password_hash', 'salt', 'iterations')}
 
 
 # Flask middleware decorators (for use with the Flask API exercise)
-def require_api_key(auth_manager):
+def require_api_key(auth_manager, required_permissions=None):
     """
     Decorator for requiring API key in Flask routes.
     
+    The key is read from the X-API-Key header and its owner is made
+    available to the route as flask.g.api_key_owner.
+    
     Args:
         auth_manager (AuthManager): AuthManager instance
+        required_permissions (list, optional): Permissions the key must have. Defaults to None.
         
     Returns:
         function: Decorator function
     """
+    required_permissions = frozenset(required_permissions or ())
+    
     def decorator(f):
         @wraps(f)
         def decorated_function(*args, **kwargs):
-            # YOUR CODE HERE
-            pass
+            is_valid, owner, _ = auth_manager.validate_api_key(request.headers.get('X-API-Key'),
+                                                               required_permissions)
+            if not is_valid:
+                if owner is None:
+                    return jsonify({'error': 'Invalid or missing API key'}), 401
+                return jsonify({'error': 'Insufficient permissions'}), 403
+            g.api_key_owner = owner
+            return f(*args, **kwargs)
         return decorated_function
     return decorator
 
+def _bearer_token():
+    """Return the token of a 'Bearer' Authorization header, or None."""
+    scheme, _, token = request.headers.get('Authorization', '').partition(' ')
+    return token.strip() if scheme.lower() == 'bearer' else None
+
 def require_jwt_token(auth_manager):
     """
     Decorator for requiring JWT token in Flask routes.
     
+    The token is read from an 'Authorization: Bearer' header and its claims
+    are made available to the route as flask.g.jwt_payload.
+    
     Args:
         auth_manager (AuthManager): AuthManager instance
         
@@ -252,8 +915,11 @@ def require_jwt_token(auth_manager):
     def decorator(f):
         @wraps(f)
         def decorated_function(*args, **kwargs):
-            # YOUR CODE HERE
-            pass
+            is_valid, payload = auth_manager.validate_jwt_token(_bearer_token())
+            if not is_valid:
+                return jsonify({'error': 'Invalid or missing token'}), 401
+            g.jwt_payload = payload
+            return f(*args, **kwargs)
         return decorated_function
     return decorator
 
@@ -268,11 +934,18 @@ def require_role(auth_manager, required_roles):
     Returns:
         function: Decorator function
     """
+    required_roles = frozenset(required_roles)
+    
     def decorator(f):
         @wraps(f)
         def decorated_function(*args, **kwargs):
-            # YOUR CODE HERE
-            pass
+            is_valid, payload = auth_manager.validate_jwt_token(_bearer_token())
+            if not is_valid:
+                return jsonify({'error': 'Invalid or missing token'}), 401
+            if payload.get('role') not in required_roles:
+                return jsonify({'error': 'Insufficient role'}), 403
+            g.jwt_payload = payload
+            return f(*args, **kwargs)
         return decorated_function
     return decorator
 
@@ -338,10 +1011,10 @@ class AuthExample:
             print(f"Error: {e}")
         
         # Clean up example files
-        if os.path.exists(API_KEYS_FILE):
-            os.remove(API_KEYS_FILE)
-        if os.path.exists(USERS_FILE):
-            os.remove(USERS_FILE)
+        auth_manager.close()
+        for suffix in ('', '-wal', '-shm'):
+            if os.path.exists(AUTH_DB_FILE + suffix):
+                os.remove(AUTH_DB_FILE + suffix)
 
 
 def main():
@@ -6,13 +6,21 @@ This exercise focuses on building RESTful APIs with Flask.
 """
 
 from flask import Flask, request, jsonify, abort, make_response
+import atexit
+import bisect
+import heapq
 import json
 import os
+import re
+import threading
 import uuid
 from datetime import datetime
 from functools import wraps
+from itertools import islice
 import logging
 
+from auth_system import AuthManager, HasherBusyError
+
 # Setup logging
 logging.basicConfig(level=logging.INFO, 
                     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -23,12 +31,25 @@ app = Flask(__name__)
 
 # Sample data (in a real app, this would come from a database)
 BOOKS_FILE = 'books.json'
+WRITE_PERMISSIONS = frozenset({'write'})
+FLUSH_INTERVAL = 1.0  # seconds between write-behind saves of changed books
+SEARCH_FIELDS = ('title', 'author', 'genre')
+BOOK_FIELDS = {'title': str, 'author': str, 'published_year': int, 'genre': str}
+REQUIRED_BOOK_FIELDS = ('title', 'author')
+TOKEN_PATTERN = re.compile(r'\w+')
+
+# Validates API keys and user logins; created on first use
+auth_manager = None
+
+# Holds the books in memory; created on first use
+book_store = None
 
-def load_books():
+def load_books(path=None):
     """Load books from JSON file or create empty list if file doesn't exist."""
+    path = path or BOOKS_FILE
     try:
-        if os.path.exists(BOOKS_FILE):
-            with open(BOOKS_FILE, 'r') as f:
+        if os.path.exists(path):
+            with open(path, 'r') as f:
                 return json.load(f)
         else:
             return []
@@ -36,16 +57,349 @@ def load_books():
         logger.error(f"Error loading books: {e}")
         return []
 
-def save_books(books):
-    """Save books to JSON file."""
+def save_books(books, path=None):
+    """
+    Save books to JSON file.
+    
+    The file is written under a temporary name and then renamed, so readers
+    never see a half-written file.
+    """
+    path = path or BOOKS_FILE
     try:
-        with open(BOOKS_FILE, 'w') as f:
-            json.dump(books, f, indent=2)
+        with open(path + '.tmp', 'w') as f:
+            json.dump(books, f)
+        os.replace(path + '.tmp', path)
         return True
     except Exception as e:
         logger.error(f"Error saving books: {e}")
         return False
 
+def tokenize(text):
+    """Split text into lowercase word tokens."""
+    return TOKEN_PATTERN.findall(str(text).lower())
+
+
+class BookStore:
+    """
+    An in-memory book collection with search indexes and write-behind persistence.
+    
+    Books are loaded from the JSON file once and served from memory. Changes
+    mark the store dirty and a background thread saves the whole collection
+    at most every flush_interval seconds, so writes do not wait for the file.
+    Each book gets an internal sequence number in insertion order, used by
+    the indexes:
+    
+    - an inverted index from each word of title, author and genre to the
+      books containing it;
+    - a genre index, for filtering and per-genre counts;
+    - a sorted published_year index, for range filters.
+    
+    Book dicts are replaced, never modified, on update, so the books
+    returned by the store can be serialized without holding its lock; they
+    must not be modified by callers.
+    
+    Attributes:
+        path (str): JSON file the books are persisted to
+        flush_interval (float): Seconds between write-behind saves
+    """
+    
+    def __init__(self, path=None, flush_interval=FLUSH_INTERVAL, books=None):
+        """
+        Load a book store.
+        
+        Books whose ID was already loaded are skipped with a warning; the
+        first one wins.
+        
+        Args:
+            path (str, optional): JSON file of books. Defaults to BOOKS_FILE.
+            flush_interval (float, optional): Seconds between saves. Defaults to FLUSH_INTERVAL.
+            books (list, optional): Books to start with instead of reading the file.
+        """
+        self.path = path or BOOKS_FILE
+        self.flush_interval = flush_interval
+        self._lock = threading.RLock()
+        self._save_lock = threading.Lock()
+        self._books = {}         # seq -> book, in insertion order
+        self._seqs = {}          # book id -> seq
+        self._tokens = {}        # token -> set of seqs
+        self._genres = {}        # lowercase genre -> set of seqs
+        self._year_keys = []     # published years, sorted
+        self._year_seqs = []     # seqs, parallel to _year_keys
+        self._next_seq = 0
+        self._dirty = False
+        self._closed = threading.Event()
+        self._writer = None
+        for book in (load_books(self.path) if books is None else books):
+            if book['id'] in self._seqs:
+                logger.warning(f"Skipping duplicate book ID {book['id']} in {self.path}")
+                continue
+            self._insert(book, index_year=False)
+        # One sort instead of an insort per book; equal years stay in seq order
+        years = sorted((book['published_year'], seq) for seq, book in self._books.items()
+                       if isinstance(book.get('published_year'), int))
+        self._year_keys = [year for year, _ in years]
+        self._year_seqs = [seq for _, seq in years]
+    
+    def __len__(self):
+        return len(self._books)
+    
+    def _insert(self, book, index_year=True):
+        """Add a book to the collection under the next seq."""
+        seq = self._next_seq
+        self._next_seq += 1
+        self._books[seq] = book
+        self._seqs[book['id']] = seq
+        self._index(seq, book, index_year)
+    
+    def _index(self, seq, book, index_year=True):
+        """Add a book to the search indexes."""
+        for token in self._book_tokens(book):
+            seqs = self._tokens.get(token)
+            if seqs is None:
+                self._tokens[token] = {seq}
+            else:
+                seqs.add(seq)
+        if book.get('genre'):
+            self._genres.setdefault(book['genre'].lower(), set()).add(seq)
+        year = book.get('published_year')
+        if index_year and isinstance(year, int):
+            position = bisect.bisect_right(self._year_keys, year)
+            self._year_keys.insert(position, year)
+            self._year_seqs.insert(position, seq)
+    
+    def _unindex(self, seq, book):
+        """Remove a book from the search indexes."""
+        for token in self._book_tokens(book):
+            seqs = self._tokens[token]
+            seqs.discard(seq)
+            if not seqs:
+                del self._tokens[token]
+        if book.get('genre'):
+            seqs = self._genres[book['genre'].lower()]
+            seqs.discard(seq)
+            if not seqs:
+                del self._genres[book['genre'].lower()]
+        year = book.get('published_year')
+        if isinstance(year, int):
+            start = bisect.bisect_left(self._year_keys, year)
+            end = bisect.bisect_right(self._year_keys, year)
+            position = self._year_seqs.index(seq, start, end)
+            del self._year_keys[position]
+            del self._year_seqs[position]
+    
+    @staticmethod
+    def _book_tokens(book):
+        return set(tokenize(' '.join(str(book[field]) for field in SEARCH_FIELDS if book.get(field))))
+    
+    def get(self, book_id):
+        """
+        Get a book by ID.
+        
+        Args:
+            book_id (str): Book ID
+            
+        Returns:
+            dict: The book, or None if not found
+        """
+        with self._lock:
+            seq = self._seqs.get(book_id)
+            return None if seq is None else self._books[seq]
+    
+    def add(self, book):
+        """
+        Add a book.
+        
+        Args:
+            book (dict): Book data including a unique id
+            
+        Raises:
+            ValueError: If a book with the same ID exists
+        """
+        with self._lock:
+            if book['id'] in self._seqs:
+                raise ValueError(f"Book already exists: {book['id']}")
+            self._insert(book)
+            self._mark_dirty()
+    
+    def update(self, book_id, fields):
+        """
+        Update fields of a book.
+        
+        Args:
+            book_id (str): Book ID
+            fields (dict): Fields to change; the ID cannot be changed
+            
+        Returns:
+            dict: The updated book, or None if not found
+        """
+        with self._lock:
+            seq = self._seqs.get(book_id)
+            if seq is None:
+                return None
+            book = {**self._books[seq], **fields, 'id': book_id}
+            self._unindex(seq, self._books[seq])
+            self._books[seq] = book
+            self._index(seq, book)
+            self._mark_dirty()
+            return book
+    
+    def delete(self, book_id):
+        """
+        Delete a book.
+        
+        Args:
+            book_id (str): Book ID
+            
+        Returns:
+            dict: The deleted book, or None if not found
+        """
+        with self._lock:
+            seq = self._seqs.get(book_id)
+            if seq is None:
+                return None
+            book = self._books.pop(seq)
+            del self._seqs[book_id]
+            self._unindex(seq, book)
+            self._mark_dirty()
+            return book
+    
+    def _year_range(self, min_year=None, max_year=None):
+        """Return the seqs of books published within the inclusive year range."""
+        start = 0 if min_year is None else bisect.bisect_left(self._year_keys, min_year)
+        end = len(self._year_keys) if max_year is None else bisect.bisect_right(self._year_keys, max_year)
+        return self._year_seqs[start:end]
+    
+    def query(self, genre=None, author=None, min_year=None, max_year=None, offset=0, limit=None):
+        """
+        List books, optionally filtered, in insertion order.
+        
+        Args:
+            genre (str, optional): Genre, matched case-insensitively
+            author (str, optional): Author, matched case-insensitively
+            min_year (int, optional): Earliest publication year
+            max_year (int, optional): Latest publication year
+            offset (int, optional): Matching books to skip. Defaults to 0.
+            limit (int, optional): Maximum books to return. Defaults to all.
+            
+        Returns:
+            list: Matching books
+        """
+        with self._lock:
+            candidates = []
+            if genre is not None:
+                candidates.append(self._genres.get(genre.lower(), set()))
+            if author is not None:
+                candidates.append(self._match_all(tokenize(author)))
+            if min_year is not None or max_year is not None:
+                candidates.append(self._year_range(min_year, max_year))
+            seqs = self._intersect(candidates) if candidates else self._books.keys()
+            if author is not None:
+                author = author.lower()
+                seqs = [seq for seq in seqs if str(self._books[seq].get('author', '')).lower() == author]
+            return self._page(seqs, offset, limit, ordered=not candidates)
+    
+    def search(self, query, min_year=None, max_year=None, offset=0, limit=None):
+        """
+        Find books whose title, author or genre contain every word of a query.
+        
+        Args:
+            query (str): Search words
+            min_year (int, optional): Earliest publication year
+            max_year (int, optional): Latest publication year
+            offset (int, optional): Matching books to skip. Defaults to 0.
+            limit (int, optional): Maximum books to return. Defaults to all.
+            
+        Returns:
+            list: Matching books in insertion order
+        """
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+        with self._lock:
+            candidates = [self._match_all(tokens)]
+            if min_year is not None or max_year is not None:
+                candidates.append(self._year_range(min_year, max_year))
+            return self._page(self._intersect(candidates), offset, limit)
+    
+    def _match_all(self, tokens):
+        """Return the seqs of books containing every token."""
+        postings = [self._tokens.get(token) for token in set(tokens)]
+        if not postings or None in postings:
+            return set()
+        postings.sort(key=len)
+        return postings[0].intersection(*postings[1:])
+    
+    @staticmethod
+    def _intersect(candidates):
+        """Intersect candidate seq collections, starting from the smallest."""
+        candidates = sorted(candidates, key=len)
+        return set(candidates[0]).intersection(*candidates[1:])
+    
+    def _page(self, seqs, offset, limit, ordered=False):
+        """Return one page of books, in seq order, for a collection of seqs."""
+        if ordered:
+            seqs = islice(seqs, offset, None if limit is None else offset + limit)
+        elif limit is None:
+            seqs = sorted(seqs)[offset:]
+        else:
+            seqs = heapq.nsmallest(offset + limit, seqs)[offset:]
+        return [self._books[seq] for seq in seqs]
+    
+    def stats(self):
+        """
+        Get statistics about the collection.
+        
+        Returns:
+            dict: total_books, books_per_genre, oldest_year and newest_year
+        """
+        with self._lock:
+            return {
+                'total_books': len(self._books),
+                'books_per_genre': {self._books[next(iter(seqs))]['genre']: len(seqs)
+                                    for seqs in self._genres.values()},
+                'oldest_year': self._year_keys[0] if self._year_keys else None,
+                'newest_year': self._year_keys[-1] if self._year_keys else None,
+            }
+    
+    def _mark_dirty(self):
+        """Record a change and make sure the write-behind thread is running."""
+        self._dirty = True
+        if self._writer is None:
+            self._writer = threading.Thread(target=self._write_behind, name='book-store-writer', daemon=True)
+            self._writer.start()
+    
+    def _write_behind(self):
+        """Save changed books every flush_interval seconds until closed."""
+        while not self._closed.wait(self.flush_interval):
+            self.flush()
+    
+    def flush(self):
+        """
+        Save the books now if anything changed since the last save.
+        
+        Returns:
+            bool: True if the books are saved
+        """
+        # One save at a time, so an older snapshot never overwrites a newer one
+        with self._save_lock:
+            with self._lock:
+                if not self._dirty:
+                    return True
+                books = list(self._books.values())
+                self._dirty = False
+            if save_books(books, self.path):
+                return True
+            with self._lock:
+                self._dirty = True
+            return False
+    
+    def close(self):
+        """Stop the write-behind thread and save pending changes."""
+        self._closed.set()
+        if self._writer is not None:
+            self._writer.join()
+        self.flush()
+
 # Sample books data for initial setup
 SAMPLE_BOOKS = [
     {
@@ -75,28 +429,83 @@ SAMPLE_BOOKS = [
 if not os.path.exists(BOOKS_FILE):
     save_books(SAMPLE_BOOKS)
 
-# Auth functions (to be implemented)
+def get_book_store():
+    """Return the BookStore that serves the API, loading it on first use."""
+    global book_store
+    if book_store is None:
+        book_store = BookStore()
+        atexit.register(book_store.close)
+    return book_store
+
+# Auth functions
+def get_auth_manager():
+    """Return the AuthManager that validates API keys and logins, creating it on first use."""
+    global auth_manager
+    if auth_manager is None:
+        auth_manager = AuthManager()
+    return auth_manager
+
 def require_api_key(f):
-    """Decorator for requiring API key."""
+    """
+    Decorator for requiring an API key with write permission.
+    
+    Keys are checked by AuthManager.validate_api_key, which caches verified
+    keys, so repeated requests with the same key do not reach the store.
+    """
     @wraps(f)
     def decorated_function(*args, **kwargs):
         api_key = request.headers.get('X-API-Key')
-        # TODO: Implement your API key validation logic
-        # YOUR CODE HERE
+        is_valid, owner, _ = get_auth_manager().validate_api_key(api_key, WRITE_PERMISSIONS)
+        if not is_valid:
+            if owner is None:
+                return make_response(jsonify({'error': 'Invalid or missing API key'}), 401)
+            return make_response(jsonify({'error': 'Insufficient permissions'}), 403)
         return f(*args, **kwargs)
     return decorated_function
 
 
+def _int_arg(name, default=None):
+    """Read a non-negative integer query parameter, aborting with 400 if it is invalid."""
+    value = request.args.get(name, '')
+    if not value:
+        return default
+    if not value.isdigit():
+        abort(400)
+    return int(value)
+
+def _book_fields(partial=False):
+    """Return the book fields of the JSON body, aborting with 400 if it is invalid."""
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        abort(400)
+    fields = {name: value for name, value in data.items() if name in BOOK_FIELDS}
+    for name, value in fields.items():
+        if not isinstance(value, BOOK_FIELDS[name]) or isinstance(value, bool):
+            abort(400)
+    if not fields or (not partial and not all(fields.get(name) for name in REQUIRED_BOOK_FIELDS)):
+        abort(400)
+    return fields
+
 @app.route('/api/v1/books', methods=['GET'])
 def get_books():
     """
     Get all books or filter by query parameters.
     
+    Query parameters are genre, author, min_year and max_year, plus offset
+    and limit for paging.
+    
     Returns:
         json: A list of books
     """
-    # YOUR CODE HERE
-    pass
+    books = get_book_store().query(
+        genre=request.args.get('genre'),
+        author=request.args.get('author'),
+        min_year=_int_arg('min_year'),
+        max_year=_int_arg('max_year'),
+        offset=_int_arg('offset', 0),
+        limit=_int_arg('limit'),
+    )
+    return jsonify(books)
 
 @app.route('/api/v1/books/<book_id>', methods=['GET'])
 def get_book(book_id):
@@ -112,8 +521,10 @@ def get_book(book_id):
     Raises:
         404: If the book is not found
     """
-    # YOUR CODE HERE
-    pass
+    book = get_book_store().get(book_id)
+    if book is None:
+        abort(404)
+    return jsonify(book)
 
 @app.route('/api/v1/books', methods=['POST'])
 @require_api_key
@@ -127,8 +538,9 @@ def create_book():
     Raises:
         400: If the request data is invalid
     """
-    # YOUR CODE HERE
-    pass
+    book = {'id': str(uuid.uuid4()), **_book_fields(), 'created_at': datetime.now().isoformat()}
+    get_book_store().add(book)
+    return make_response(jsonify(book), 201)
 
 @app.route('/api/v1/books/<book_id>', methods=['PUT'])
 @require_api_key
@@ -146,8 +558,11 @@ def update_book(book_id):
         404: If the book is not found
         400: If the request data is invalid
     """
-    # YOUR CODE HERE
-    pass
+    fields = _book_fields(partial=True)
+    book = get_book_store().update(book_id, {**fields, 'updated_at': datetime.now().isoformat()})
+    if book is None:
+        abort(404)
+    return jsonify(book)
 
 @app.route('/api/v1/books/<book_id>', methods=['DELETE'])
 @require_api_key
@@ -164,19 +579,86 @@ def delete_book(book_id):
     Raises:
         404: If the book is not found
     """
-    # YOUR CODE HERE
-    pass
+    if get_book_store().delete(book_id) is None:
+        abort(404)
+    return jsonify({'message': f"Book {book_id} deleted"})
 
 @app.route('/api/v1/books/search', methods=['GET'])
 def search_books():
     """
     Search for books by title, author, or genre.
     
+    Returns the books containing every word of the q parameter, looked up
+    in the store's inverted index. min_year, max_year, offset and limit
+    work as for the book list.
+    
     Returns:
         json: A list of matching books
+        
+    Raises:
+        400: If q is missing
+    """
+    query = request.args.get('q', '')
+    if not query.strip():
+        abort(400)
+    books = get_book_store().search(
+        query,
+        min_year=_int_arg('min_year'),
+        max_year=_int_arg('max_year'),
+        offset=_int_arg('offset', 0),
+        limit=_int_arg('limit'),
+    )
+    return jsonify(books)
+
+def _credentials():
+    """Return the username and password of the JSON body, aborting with 400 if either is missing."""
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        abort(400)
+    username, password = data.get('username'), data.get('password')
+    if not isinstance(username, str) or not isinstance(password, str) or not username or not password:
+        abort(400)
+    return username, password, data
+
+@app.route('/api/v1/auth/register', methods=['POST'])
+def register():
+    """
+    Register a user.
+    
+    Returns:
+        json: The user data without the password
+        
+    Raises:
+        400: If the username or password is missing
+        409: If the username is taken
+        503: If password hashing is saturated
     """
-    # YOUR CODE HERE
-    pass
+    username, password, data = _credentials()
+    try:
+        user = get_auth_manager().register_user(username, password, data.get('email'))
+    except ValueError as e:
+        return make_response(jsonify({'error': str(e)}), 409)
+    return make_response(jsonify(user), 201)
+
+@app.route('/api/v1/auth/login', methods=['POST'])
+def login():
+    """
+    Log a user in.
+    
+    Returns:
+        json: A JWT token for the user
+        
+    Raises:
+        400: If the username or password is missing
+        401: If the credentials are wrong
+        503: If password hashing is saturated
+    """
+    username, password, _ = _credentials()
+    manager = get_auth_manager()
+    is_authenticated, user = manager.authenticate_user(username, password)
+    if not is_authenticated:
+        return make_response(jsonify({'error': 'Invalid username or password'}), 401)
+    return jsonify({'token': manager.generate_jwt_token(user)})
 
 @app.route('/api/v1/stats', methods=['GET'])
 def get_stats():
@@ -186,8 +668,7 @@ def get_stats():
     Returns:
         json: Statistics like total books, books per genre, etc.
     """
-    # YOUR CODE HERE
-    pass
+    return jsonify(get_book_store().stats())
 
 @app.errorhandler(400)
 def bad_request(error):
@@ -204,6 +685,13 @@ def server_error(error):
     """Handle 500 errors."""
     return make_response(jsonify({'error': 'Internal Server Error'}), 500)
 
+@app.errorhandler(HasherBusyError)
+def hashing_busy(error):
+    """Handle saturated password hashing on register and login with a 503 the client can retry."""
+    response = make_response(jsonify({'error': 'Service Unavailable'}), 503)
+    response.headers['Retry-After'] = '1'
+    return response
+
 # Custom middleware to log requests
 @app.before_request
 def log_request_info():
@@ -225,13 +713,15 @@ if __name__ == '__main__':
     
     print("Flask API Server")
     print("Available endpoints:")
-    print("  GET    /api/v1/books           - Get all books")
+    print("  GET    /api/v1/books           - Get all books (genre, author, min_year, max_year)")
     print("  GET    /api/v1/books/<id>      - Get book by ID")
     print("  POST   /api/v1/books           - Create a new book (requires API key)")
     print("  PUT    /api/v1/books/<id>      - Update a book (requires API key)")
     print("  DELETE /api/v1/books/<id>      - Delete a book (requires API key)")
-    print("  GET    /api/v1/books/search    - Search books")
+    print("  GET    /api/v1/books/search    - Search books (q)")
     print("  GET    /api/v1/stats           - Get collection statistics")
+    print("  POST   /api/v1/auth/register   - Register a user (username, password, email)")
+    print("  POST   /api/v1/auth/login      - Log in and get a JWT token")
     print("\nRunning on http://127.0.0.1:5000/")
     
     app.run(debug=True)
\ No newline at end of file
@@ -18,24 +18,58 @@ REQUIREMENTS:
 - Extract data from tables, charts, or other interactive elements
 - Implement robust error handling for various scenarios
 - Save extracted data in a structured format (CSV, JSON, etc.)
+
+JSON ENDPOINT MODE:
+Many "dynamic" pages only render a table that JavaScript loads from a JSON
+endpoint (an XHR visible in the browser's network tab). For those pages it
+is far faster to call the endpoint directly with requests and fetch its
+pages concurrently. scrape_player_stats does this when the page config
+names a data endpoint, and only falls back to the browser when the endpoint
+is missing or fails. A page config is a dict:
+
+    {
+        'url': 'https://example.org/ncaa-stats',     # page, for the browser
+        'data_endpoint': 'https://example.org/api/players',
+        'params': {'season': '2024'},                # fixed query parameters
+        'page_param': 'page',                        # page number parameter
+        'first_page': 1,
+        'page_size_param': 'per_page',               # optional
+        'page_size': 50,
+        'records_key': 'data.players',               # dotted path to the rows
+        'id_key': 'player_id',                       # optional, identifies a row
+        'total_pages_key': 'meta.total_pages',       # optional, or:
+        'total_records_key': 'meta.total',           # optional
+        'headers': {'Accept': 'application/json'},   # optional
+        'table_selector': 'table.player-stats',      # for the browser
+        'next_button_selector': 'button.pagination-next',
+    }
 """
 
 import time
 import json
 import csv
 import os
-from typing import List, Dict, Any, Optional
+import logging
+import math
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
 
 # You'll need to install these packages:
 # pip install selenium webdriver_manager
+#
+# Selenium is imported inside the browser functions, so JSON endpoint mode
+# works without it.
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TABLE_SELECTOR = "table.player-stats"
+DEFAULT_NEXT_BUTTON_SELECTOR = "button.pagination-next"
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_TIMEOUT = (5, 30)
+
 
-# Uncomment when implementing:
-# from selenium import webdriver
-# from selenium.webdriver.common.by import By
-# from selenium.webdriver.support.ui import WebDriverWait
-# from selenium.webdriver.support import expected_conditions as EC
-# from selenium.common.exceptions import TimeoutException, NoSuchElementException
-# from webdriver_manager.chrome import ChromeDriverManager
+class EndpointError(Exception):
+    """Raised when a data endpoint returns something other than the expected JSON."""
 
 
 def initialize_driver():
@@ -45,12 +79,18 @@ def initialize_driver():
     Returns:
         A configured WebDriver instance
     """
-    # TODO: Implement this function to:
-    # - Initialize the WebDriver with appropriate options
-    # - Configure headless mode for production use
-    # - Set appropriate window size
-    # - Set timeouts and other parameters
-    pass
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.chrome.service import Service
+    from webdriver_manager.chrome import ChromeDriverManager
+
+    options = Options()
+    options.add_argument("--headless=new")
+    options.add_argument("--window-size=1920,1080")
+    service = Service(ChromeDriverManager().install())
+    driver = webdriver.Chrome(service=service, options=options)
+    driver.set_page_load_timeout(30)
+    return driver
 
 
 def navigate_to_page(driver, url: str) -> bool:
@@ -64,12 +104,12 @@ def navigate_to_page(driver, url: str) -> bool:
     Returns:
         True if navigation was successful, False otherwise
     """
-    # TODO: Implement this function to:
-    # - Navigate to the specified URL
-    # - Wait for the page to fully load
-    # - Handle any login or popup dialogs
-    # - Return success/failure status
-    pass
+    try:
+        driver.get(url)
+        return True
+    except Exception as e:
+        logger.error(f"Failed to load {url}: {e}")
+        return False
 
 
 def wait_for_element(driver, selector: str, timeout: int = 10) -> Optional[Any]:
@@ -84,29 +124,41 @@ def wait_for_element(driver, selector: str, timeout: int = 10) -> Optional[Any]:
     Returns:
         The element if found, None otherwise
     """
-    # TODO: Implement this function to:
-    # - Wait for an element to be visible
-    # - Return the element if found
-    # - Handle timeouts appropriately
-    pass
+    from selenium.common.exceptions import TimeoutException
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    try:
+        return WebDriverWait(driver, timeout).until(
+            EC.visibility_of_element_located((By.CSS_SELECTOR, selector))
+        )
+    except TimeoutException:
+        logger.warning(f"Timed out waiting for element: {selector}")
+        return None
 
 
-def extract_player_stats(driver) -> List[Dict[str, Any]]:
+def extract_player_stats(driver, table_selector: str = DEFAULT_TABLE_SELECTOR) -> List[Dict[str, Any]]:
     """
-    Extract player statistics from a dynamic page.
+    Extract player statistics from the table currently shown on a dynamic page.
     
     Args:
         driver: The WebDriver instance
+        table_selector: CSS selector for the player statistics table
         
     Returns:
         A list of dictionaries containing player statistics
     """
-    # TODO: Implement this function to:
-    # - Wait for the player statistics table to load
-    # - Extract data from each row
-    # - Handle pagination if applicable
-    # - Process and clean the extracted data
-    pass
+    from selenium.webdriver.common.by import By
+
+    if wait_for_element(driver, table_selector) is None:
+        return []
+    headers = [th.text.strip() for th in driver.find_elements(By.CSS_SELECTOR, f"{table_selector} thead th")]
+    players = []
+    for row in driver.find_elements(By.CSS_SELECTOR, f"{table_selector} tbody tr"):
+        cells = [td.text.strip() for td in row.find_elements(By.TAG_NAME, "td")]
+        players.append(dict(zip(headers, cells)))
+    return players
 
 
 def extract_team_stats(driver) -> Dict[str, Any]:
@@ -137,12 +189,245 @@ def handle_pagination(driver, next_button_selector: str) -> bool:
     Returns:
         True if navigation to the next page was successful, False otherwise
     """
-    # TODO: Implement this function to:
-    # - Check if there's a next page
-    # - Click the next button if available
-    # - Wait for the next page to load
-    # - Return whether the navigation was successful
-    pass
+    from selenium.common.exceptions import NoSuchElementException
+    from selenium.webdriver.common.by import By
+
+    try:
+        next_button = driver.find_element(By.CSS_SELECTOR, next_button_selector)
+    except NoSuchElementException:
+        return False
+    if "disabled" in (next_button.get_attribute("class") or "") or not next_button.is_enabled():
+        return False
+    next_button.click()
+    return True
+
+
+def extract_with_browser(config: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Extract every page of player statistics by driving a browser.
+    
+    This is the slow path, used when a page has no usable data endpoint.
+    
+    Args:
+        config: Page config with 'url' and optionally 'table_selector' and
+            'next_button_selector'
+        
+    Returns:
+        A list of dictionaries containing player statistics from all pages
+        
+    Raises:
+        ValueError: If the config has no 'url'
+    """
+    if not config.get('url'):
+        raise ValueError("Page config has no url for the browser")
+    table_selector = config.get('table_selector', DEFAULT_TABLE_SELECTOR)
+    next_button_selector = config.get('next_button_selector', DEFAULT_NEXT_BUTTON_SELECTOR)
+    driver = initialize_driver()
+    try:
+        if not navigate_to_page(driver, config['url']):
+            return []
+        players = extract_player_stats(driver, table_selector)
+        while handle_pagination(driver, next_button_selector):
+            # Wait for the old table to be replaced before reading the next page
+            time.sleep(config.get('page_load_delay', 1))
+            players.extend(extract_player_stats(driver, table_selector))
+        return players
+    finally:
+        driver.quit()
+
+
+def _get_path(data: Any, path: Optional[str]) -> Any:
+    """Follow a dotted key path ('data.players') into parsed JSON."""
+    if not path:
+        return data
+    for key in path.split('.'):
+        if not isinstance(data, dict) or key not in data:
+            return None
+        data = data[key]
+    return data
+
+
+def make_session(max_workers: int = DEFAULT_MAX_WORKERS):
+    """
+    Create a requests session whose connection pool fits the worker count.
+    
+    Args:
+        max_workers: Number of concurrent page fetches
+        
+    Returns:
+        A requests.Session
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def fetch_json_page(session, config: Dict[str, Any], page: int,
+                    timeout=DEFAULT_TIMEOUT) -> Tuple[List[Dict[str, Any]], Any]:
+    """
+    Fetch one page of records from a data endpoint.
+    
+    Args:
+        session: A requests.Session
+        config: Page config (see module docstring)
+        page: Page number to fetch
+        timeout: Request timeout in seconds, or (connect, read)
+        
+    Returns:
+        A (records, payload) tuple: the page's rows and the whole parsed JSON
+        
+    Raises:
+        requests.exceptions.RequestException: If the request fails
+        EndpointError: If the response is not JSON or has no list of records
+    """
+    params = dict(config.get('params', {}))
+    params[config.get('page_param', 'page')] = page
+    if config.get('page_size_param') and config.get('page_size'):
+        params[config['page_size_param']] = config['page_size']
+    headers = {'Accept': 'application/json', **config.get('headers', {})}
+
+    response = session.get(config['data_endpoint'], params=params, headers=headers, timeout=timeout)
+    response.raise_for_status()
+    try:
+        payload = response.json()
+    except ValueError as e:
+        raise EndpointError(f"{response.url} did not return JSON") from e
+    records = _get_path(payload, config.get('records_key'))
+    if not isinstance(records, list):
+        raise EndpointError(f"No list of records at '{config.get('records_key')}' in {response.url}")
+    return records, payload
+
+
+def _total_pages(config: Dict[str, Any], payload: Any) -> Optional[int]:
+    """Number of pages announced by the first page, if the endpoint says."""
+    total_pages = _get_path(payload, config.get('total_pages_key'))
+    if config.get('total_pages_key') and isinstance(total_pages, int):
+        return total_pages
+    total_records = _get_path(payload, config.get('total_records_key'))
+    if config.get('total_records_key') and isinstance(total_records, int) and config.get('page_size'):
+        return math.ceil(total_records / config['page_size'])
+    return None
+
+
+def _record_id(config: Dict[str, Any], record: Any) -> Any:
+    """Identity of a record: its id_key field, or the whole record serialized."""
+    if config.get('id_key') and isinstance(record, dict):
+        return str(record.get(config['id_key']))
+    return json.dumps(record, sort_keys=True, default=str)
+
+
+def extract_via_json_endpoint(config: Dict[str, Any], max_workers: int = DEFAULT_MAX_WORKERS,
+                              session=None, max_pages: int = 10_000) -> List[Dict[str, Any]]:
+    """
+    Extract every page of records by calling the data endpoint directly.
+    
+    The first page is fetched alone to learn the page count; the remaining
+    pages are then fetched concurrently. If the endpoint does not announce
+    a page count, pages are fetched in concurrent batches of max_workers
+    until one comes back empty, with a 404, with fewer than page_size
+    records, or with no records not already seen (an endpoint that ignores
+    the page parameter returns the first page again). Records are returned
+    in page order.
+    
+    Args:
+        config: Page config (see module docstring)
+        max_workers: Maximum number of concurrent page fetches
+        session: requests.Session to use (default: a pooled session)
+        max_pages: Safety limit on the number of pages fetched
+        
+    Returns:
+        A list of dictionaries containing the records from all pages
+        
+    Raises:
+        requests.exceptions.RequestException: If any page fails
+        EndpointError: If any page is not the expected JSON
+    """
+    import requests
+
+    owns_session = session is None
+    session = session or make_session(max_workers)
+    first_page = config.get('first_page', 1)
+    try:
+        records, payload = fetch_json_page(session, config, first_page)
+        if not records:
+            return []
+        total_pages = _total_pages(config, payload)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            def fetch(page):
+                return fetch_json_page(session, config, page)[0]
+
+            if total_pages is not None:
+                pages = range(first_page + 1, first_page + min(total_pages, max_pages))
+                for page_records in executor.map(fetch, pages):
+                    records.extend(page_records)
+                return records
+
+            def probe(page):
+                # Endpoints that do not announce a page count may 404 past the last page
+                try:
+                    return fetch(page)
+                except requests.exceptions.HTTPError as e:
+                    if e.response is not None and e.response.status_code == 404:
+                        return []
+                    raise
+
+            page_size = config.get('page_size')
+            if page_size and len(records) < page_size:
+                return records
+            seen = {_record_id(config, record) for record in records}
+            next_page = first_page + 1
+            while next_page < first_page + max_pages:
+                batch = range(next_page, min(next_page + max_workers, first_page + max_pages))
+                for page_records in executor.map(probe, batch):
+                    ids = [_record_id(config, record) for record in page_records]
+                    if seen.issuperset(ids):
+                        return records
+                    records.extend(page_records)
+                    seen.update(ids)
+                    if page_size and len(page_records) < page_size:
+                        return records
+                next_page = batch.stop
+            return records
+    finally:
+        if owns_session:
+            session.close()
+
+
+def scrape_player_stats(config: Dict[str, Any], max_workers: int = DEFAULT_MAX_WORKERS,
+                        session=None, browser_fallback: bool = True) -> List[Dict[str, Any]]:
+    """
+    Extract player statistics, preferring the page's JSON data endpoint.
+    
+    Args:
+        config: Page config (see module docstring)
+        max_workers: Maximum number of concurrent page fetches in JSON mode
+        session: requests.Session for JSON mode (default: a pooled session)
+        browser_fallback: Drive a browser when JSON mode is unavailable or fails
+        
+    Returns:
+        A list of dictionaries containing player statistics
+        
+    Raises:
+        requests.exceptions.RequestException, EndpointError: If JSON mode
+            fails and browser_fallback is False
+    """
+    import requests
+
+    if config.get('data_endpoint'):
+        try:
+            return extract_via_json_endpoint(config, max_workers=max_workers, session=session)
+        except (requests.exceptions.RequestException, EndpointError) as e:
+            if not browser_fallback:
+                raise
+            logger.warning(f"Data endpoint failed ({e}), falling back to the browser")
+    elif not browser_fallback:
+        raise EndpointError("Page config has no data_endpoint")
+    return extract_with_browser(config)
 
 
 def save_to_file(data: Any, filename: str, format: str = 'json') -> None:
@@ -19,6 +19,14 @@ REQUIREMENTS:
 - Create functions to extract different types of data
 - Store extracted data in CSV format
 - Add proper documentation and comments
+
+COLUMNAR EXTRACTION:
+extract_player_stats builds one dictionary per row, which is simple but slow
+for pages with tens of thousands of rows. extract_table_columns walks the
+table once, appending cell text to one list per column, then detects the
+header row and converts each column to integers, floats or text in a single
+vectorized numpy step. save_columns_to_csv writes the columns in buffered
+batches of rows.
 """
 
 import requests
@@ -27,6 +35,17 @@ import csv
 import os
 from typing import List, Dict, Any, Optional
 
+import numpy as np
+
+# Cell text treated as missing
+MISSING_VALUES = ['', '-', '--', 'N/A']
+
+# Rows inspected when deciding whether the first row is a header
+HEADER_SAMPLE_ROWS = 5
+
+# Rows written per batch by save_columns_to_csv
+DEFAULT_BATCH_SIZE = 5000
+
 
 def fetch_webpage(url: str) -> Optional[str]:
     """
@@ -70,16 +89,187 @@ def extract_player_stats(soup: BeautifulSoup) -> List[Dict[str, Any]]:
     Returns:
         A list of dictionaries containing player statistics
     """
-    # TODO: Implement this function to extract player statistics
-    # Each player should be represented as a dictionary with keys such as:
-    # - player_name
-    # - position
-    # - goals
-    # - assists
-    # - shots
-    # - shots_on_goal
-    # - etc.
-    pass
+    players = []
+    player_table = soup.select_one('table.stats-table')
+    if not player_table:
+        return players
+
+    headers = [header.text.strip() for header in player_table.select('thead th')]
+    for row in player_table.select('tbody tr'):
+        player_data = {}
+        for i, cell in enumerate(row.select('td')):
+            if i < len(headers):
+                player_data[headers[i]] = cell.text.strip()
+        players.append(player_data)
+    return players
+
+
+def _numeric_masks(values: np.ndarray):
+    """
+    Classify cell strings as integers or decimals, element-wise.
+    
+    Args:
+        values: Array of cell strings with thousands separators removed
+        
+    Returns:
+        A (is_integer, is_number) pair of boolean arrays
+    """
+    unsigned = np.char.lstrip(values, '+-')
+    is_integer = np.char.isdigit(unsigned)
+    is_number = is_integer | np.char.isdigit(np.char.replace(unsigned, '.', '', count=1))
+    return is_integer, is_number
+
+
+def coerce_column(values: List[str]) -> np.ndarray:
+    """
+    Convert a column of cell strings to integers, floats or text.
+    
+    Thousands separators are stripped and missing markers become NaN (or
+    None in text columns). Integer columns with missing cells become floats.
+    Integers too large for int64 keep the column as text.
+    
+    Args:
+        values: Cell strings of one column
+        
+    Returns:
+        An int64, float64 or object numpy array
+    """
+    text = np.array(values, dtype=str)
+    cleaned = np.char.replace(text, ',', '')
+    missing = np.isin(cleaned, MISSING_VALUES)
+    is_integer, is_number = _numeric_masks(cleaned)
+    try:
+        if is_integer.all():
+            return cleaned.astype(np.int64)
+        if (is_number | missing).all() and not missing.all():
+            # Converting through float64 would silently round huge integers
+            cleaned[is_integer].astype(np.int64)
+            return np.where(missing, 'nan', cleaned).astype(np.float64)
+    except (ValueError, OverflowError):
+        pass
+    column = text.astype(object)
+    column[missing] = None
+    return column
+
+
+def unique_column_names(names: List[str]) -> List[str]:
+    """
+    Make header names distinct so no column overwrites another.
+    
+    Empty names become col_<position> and repeated names are numbered from
+    their second occurrence: 'G', 'G_2', 'G_3'.
+    
+    Args:
+        names: Header text in column order
+        
+    Returns:
+        The names in the same order, all non-empty and distinct
+    """
+    names = [name or f"col_{i}" for i, name in enumerate(names, 1)]
+    taken = set(names)
+    seen = set()
+    unique = []
+    for name in names:
+        if name in seen:
+            suffix = 2
+            while f"{name}_{suffix}" in taken:
+                suffix += 1
+            name = f"{name}_{suffix}"
+            taken.add(name)
+        seen.add(name)
+        unique.append(name)
+    return unique
+
+
+def detect_header(rows: List[List[str]], header_flags: List[bool]) -> int:
+    """
+    Decide how many leading rows of a table are headers.
+    
+    Rows inside <thead> or made only of <th> cells are headers. Otherwise
+    the first row is a header when none of its cells are numeric but the
+    rows after it contain numbers.
+    
+    Args:
+        rows: Cell text of the first few rows
+        header_flags: For each row, whether it is in <thead> or all <th>
+        
+    Returns:
+        Number of header rows (0 if the table has no header)
+    """
+    count = 0
+    while count < len(rows) and header_flags[count]:
+        count += 1
+    if count or len(rows) < 2:
+        return count
+
+    width = max(len(row) for row in rows)
+    sample = np.array([row + [''] * (width - len(row)) for row in rows], dtype=str)
+    numeric_share = _numeric_masks(np.char.replace(sample, ',', ''))[1].mean(axis=1)
+    return 1 if numeric_share[0] == 0 and numeric_share[1:].max() > 0 else 0
+
+
+def extract_table_columns(soup: BeautifulSoup, selector: str = 'table.stats-table') -> Dict[str, np.ndarray]:
+    """
+    Extract a table into typed columns in a single pass over its rows.
+    
+    Rows in <tfoot>, such as team totals, are skipped.
+    
+    Args:
+        soup: The BeautifulSoup object containing the parsed HTML
+        selector: CSS selector for the table
+        
+    Returns:
+        A dictionary mapping header text to a typed numpy array, in column
+        order. Tables without a header row get names col_1, col_2, ...;
+        repeated header text is numbered (see unique_column_names)
+    """
+    table = soup.select_one(selector)
+    if table is None:
+        return {}
+
+    headers = None
+    columns = []
+    sample, sample_flags = [], []
+
+    def add_row(cells):
+        for i in range(len(columns)):
+            columns[i].append(cells[i] if i < len(cells) else '')
+
+    for row in table.find_all('tr'):
+        if row.parent.name == 'tfoot':
+            continue
+        cells = [cell for cell in row.children if cell.name in ('td', 'th')]
+        if not cells:
+            continue
+        texts = [cell.get_text().strip() for cell in cells]
+        if headers is not None:
+            add_row(texts)
+            continue
+
+        # Buffer the first rows until the header can be detected
+        sample.append(texts)
+        sample_flags.append(row.parent.name == 'thead' or all(cell.name == 'th' for cell in cells))
+        if len(sample) == HEADER_SAMPLE_ROWS:
+            headers = _start_columns(sample, sample_flags, columns, add_row)
+
+    if headers is None:
+        if not sample:
+            return {}
+        headers = _start_columns(sample, sample_flags, columns, add_row)
+    return {name: coerce_column(values) for name, values in zip(unique_column_names(headers), columns)}
+
+
+def _start_columns(sample, sample_flags, columns, add_row) -> List[str]:
+    """Detect the header in buffered rows, create the columns and add the data rows."""
+    header_rows = detect_header(sample, sample_flags)
+    if header_rows:
+        headers = sample[header_rows - 1]
+    else:
+        headers = [f"col_{i + 1}" for i in range(max(len(row) for row in sample))]
+    columns.extend([] for _ in headers)
+    for texts in sample[header_rows:]:
+        add_row(texts)
+    return headers
 
 
 def extract_team_stats(soup: BeautifulSoup) -> Dict[str, Any]:
@@ -112,12 +302,55 @@ def save_to_csv(data: List[Dict[str, Any]], filename: str) -> None:
         data: The data to save (list of dictionaries)
         filename: The name of the CSV file to save to
     """
-    # TODO: Implement this function to save the data to a CSV file
-    # Make sure to:
-    # - Create the file with appropriate headers
-    # - Handle cases where the dictionaries might have different keys
-    # - Create the directory if it doesn't exist
-    pass
+    if not data:
+        print(f"No data to save to {filename}")
+        return
+
+    if os.path.dirname(filename):
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+
+    fieldnames = set()
+    for item in data:
+        fieldnames.update(item.keys())
+
+    with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=sorted(fieldnames))
+        writer.writeheader()
+        writer.writerows(data)
+
+
+def save_columns_to_csv(columns: Dict[str, np.ndarray], filename: str,
+                        batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+    """
+    Save typed columns to a CSV file in buffered batches of rows.
+    
+    Args:
+        columns: Column name to array, as returned by extract_table_columns
+        filename: The name of the CSV file to save to
+        batch_size: Rows converted and written per batch
+        
+    Returns:
+        Number of data rows written
+    """
+    if os.path.dirname(filename):
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+
+    names = list(columns)
+    n_rows = len(columns[names[0]]) if names else 0
+    with open(filename, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(names)
+        for start in range(0, n_rows, batch_size):
+            batch = [_csv_values(columns[name][start:start + batch_size]) for name in names]
+            writer.writerows(zip(*batch))
+    return n_rows
+
+
+def _csv_values(values: np.ndarray) -> list:
+    """Convert a slice of a column to Python values, writing missing values as empty cells."""
+    if values.dtype == np.float64:
+        return np.where(np.isnan(values), None, values).tolist()
+    return values.tolist()
 
 
 def main():
@@ -0,0 +1,117 @@
+"""
+API Client Throughput Benchmark
+
+Compares request throughput of the week 4 APIClient's pooled keep-alive
+session with unpooled calls (a module-level requests.get per call, which
+opens a new connection every time) against a local HTTP/1.1 server.
+Both are run from one thread and from several threads sharing the client.
+
+Usage:
+    $ python bench_api_client.py
+    $ python bench_api_client.py --requests 2000 --threads 1 8 --latency 0.002
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(os.path.dirname(PROJECT_DIR), 'COURSE', 'week_4'))
+from api_client import APIClient
+
+BODY = json.dumps({'id': 1, 'name': 'Player', 'goals': 7}).encode('utf-8')
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    """Answer every GET with a small JSON body over persistent connections."""
+
+    protocol_version = 'HTTP/1.1'
+    # Headers and body are written separately; without this, Nagle's
+    # algorithm and delayed ACKs add ~40 ms to every keep-alive response
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        self.server.count_connection(self.client_address)
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class BenchServer(ThreadingHTTPServer):
+    """Threading server that counts the distinct connections it served."""
+
+    request_queue_size = 128
+    daemon_threads = True
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.connections = set()
+        self.lock = threading.Lock()
+
+    def count_connection(self, client_address):
+        with self.lock:
+            self.connections.add(client_address)
+
+
+def start_server(latency):
+    """Start the benchmark server in a background thread and return it."""
+    server = BenchServer(('127.0.0.1', 0), KeepAliveHandler)
+    server.latency = latency
+    server.url = f"http://127.0.0.1:{server.server_address[1]}"
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def run(server, call, n_requests, threads):
+    """Make n_requests calls over the given number of threads; return (req/s, connections)."""
+    server.connections.clear()
+    start = time.perf_counter()
+    if threads == 1:
+        for _ in range(n_requests):
+            call()
+    else:
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            list(executor.map(lambda _: call(), range(n_requests)))
+    elapsed = time.perf_counter() - start
+    return n_requests / elapsed, len(server.connections)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark pooled vs unpooled API client throughput')
+    parser.add_argument('--requests', type=int, default=1000, help='Requests per measurement')
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 8], help='Client thread counts')
+    parser.add_argument('--latency', type=float, default=0.0, help='Server delay per request in seconds')
+    args = parser.parse_args()
+
+    server = start_server(args.latency)
+    url = f"{server.url}/players/1"
+    print(f"{args.requests} GET requests, {args.latency * 1000:.1f} ms server latency")
+    print(f"{'threads':>7} {'path':<10} {'req/s':>9} {'connections':>12} {'speedup':>8}")
+
+    for threads in args.threads:
+        unpooled, unpooled_conns = run(server, lambda: requests.get(url, timeout=10).json(),
+                                       args.requests, threads)
+        with APIClient(server.url, pool_size=max(threads, 1)) as client:
+            pooled, pooled_conns = run(server, lambda: client.get('players/1'), args.requests, threads)
+        print(f"{threads:>7} {'unpooled':<10} {unpooled:>9.0f} {unpooled_conns:>12}")
+        print(f"{threads:>7} {'pooled':<10} {pooled:>9.0f} {pooled_conns:>12} {pooled / unpooled:>7.2f}x")
+
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
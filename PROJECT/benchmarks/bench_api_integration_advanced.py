@@ -0,0 +1,151 @@
+"""
+Multi-API Fan-Out Latency Benchmark
+
+Measures the week 4 MultiAPIClient's asyncio execution path against a local
+stand-in server that injects a delay into every response:
+
+- combine_data (weather, news and stock sub-requests issued concurrently)
+  compared with calling the same getters one after another;
+- fetch_parallel_data over many requests at several global concurrency
+  limits, reporting throughput and per-request latency percentiles.
+
+Usage:
+    $ python bench_api_integration_advanced.py
+    $ python bench_api_integration_advanced.py --latency 0.1 --requests 200 --concurrency 1 8 32
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(os.path.dirname(PROJECT_DIR), 'COURSE', 'week_4'))
+from api_integration_advanced import MultiAPIClient
+
+# Response delay of each stand-in API, as a multiple of --latency
+LATENCY_FACTORS = {'/weather': 1.0, '/everything': 1.5, '/query': 2.0}
+
+RESPONSES = {
+    '/weather': {'name': 'Boston', 'main': {'temp': 18}, 'weather': [{'main': 'Rain'}]},
+    '/everything': {'articles': [{'title': f"Story {i}", 'description': 'Local news'} for i in range(10)]},
+    '/query': {'Time Series (Daily)': {'2024-05-01': {'4. close': '170.1'}}},
+}
+
+
+class StandInAPI(BaseHTTPRequestHandler):
+    """Serve canned JSON responses after an injected delay."""
+
+    def do_GET(self):
+        path = urlparse(self.path).path
+        time.sleep(self.server.latency * LATENCY_FACTORS.get(path, 1.0))
+        body = json.dumps(RESPONSES.get(path, {'path': self.path})).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StandInServer(ThreadingHTTPServer):
+    """Threading server with a backlog deep enough for large fan-outs."""
+
+    request_queue_size = 128
+
+
+def start_server(latency):
+    """Start the stand-in server in a background thread and return it."""
+    server = StandInServer(('127.0.0.1', 0), StandInAPI)
+    server.daemon_threads = True
+    server.latency = latency
+    server.url = f"http://127.0.0.1:{server.server_address[1]}"
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def make_client(base_url, max_concurrency=10):
+    """Create a client with an empty cache pointed at the stand-in server."""
+    return MultiAPIClient({
+        'weather': {'base_url': base_url, 'api_key': 'k', 'endpoints': {'current': '/weather'}},
+        'news': {'base_url': base_url, 'api_key': 'k',
+                 'endpoints': {'everything': '/everything', 'top_headlines': '/top-headlines'}},
+        'stocks': {'base_url': base_url, 'api_key': 'k', 'endpoints': {'time_series_daily': '/query'}},
+    }, max_concurrency=max_concurrency)
+
+
+def combine_sequentially(client, location, stock_symbols):
+    """Call the getters one after another, as combine_data used to."""
+    return {
+        'weather': client.get_weather_data(location),
+        'news': client.get_news_data(query=location),
+        'stocks': {symbol: client.get_stock_data(symbol) for symbol in stock_symbols},
+    }
+
+
+def best_time(func, repeat):
+    """Return the best wall time of repeated calls."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def percentile(values, fraction):
+    """Return a percentile of a list of values."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark MultiAPIClient fan-out latency')
+    parser.add_argument('--latency', type=float, default=0.1, help='Base response delay in seconds')
+    parser.add_argument('--symbols', type=int, default=3, help='Stock symbols in combine_data')
+    parser.add_argument('--requests', type=int, default=100, help='Requests for fetch_parallel_data')
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 8, 32],
+                        help='Global concurrency limits for fetch_parallel_data')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per measurement (best is reported)')
+    args = parser.parse_args()
+
+    server = start_server(args.latency)
+    symbols = [f"SYM{i}" for i in range(args.symbols)]
+    print(f"Injected latency: weather {args.latency * 1000:.0f} ms, news {args.latency * 1500:.0f} ms, "
+          f"stocks {args.latency * 2000:.0f} ms")
+
+    # A fresh client per run keeps the response cache from hiding the latency
+    sequential = best_time(lambda: combine_sequentially(make_client(server.url), 'Boston', symbols),
+                           args.repeat)
+    concurrent = best_time(lambda: make_client(server.url).combine_data('Boston', symbols), args.repeat)
+    print(f"\ncombine_data with {args.symbols} stock symbols")
+    print(f"{'sequential getters':<22} {sequential:>8.3f} s")
+    print(f"{'asyncio fan-out':<22} {concurrent:>8.3f} s  ({sequential / concurrent:.2f}x)")
+
+    configs = [{'url': f"{server.url}/item/{i}", 'api': 'items'} for i in range(args.requests)]
+    print(f"\nfetch_parallel_data, {args.requests} requests of {args.latency * 1000:.0f} ms")
+    print(f"{'concurrency':>11} {'total s':>9} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8}")
+    for limit in args.concurrency:
+        client = make_client(server.url, max_concurrency=limit)
+        start = time.perf_counter()
+        results = client.fetch_parallel_data(configs)
+        total = time.perf_counter() - start
+        failed = sum(not r['ok'] for r in results)
+        if failed:
+            raise RuntimeError(f"{failed} requests failed at concurrency {limit}")
+        latencies = [r['elapsed'] * 1000 for r in results]
+        print(f"{limit:>11} {total:>9.3f} {args.requests / total:>8.1f} "
+              f"{statistics.median(latencies):>8.1f} {percentile(latencies, 0.95):>8.1f}")
+
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+"""
+Auth Decorator Overhead Benchmark
+
+Measures the per-request cost that the week 4 auth decorators add to a Flask
+view. Each decorated view is called repeatedly inside one request context,
+so the numbers exclude routing and WSGI handling:
+
+- an unprotected view, as the baseline;
+- require_jwt_token with the verified-token cache disabled, which decodes
+  the token, checks its signature and looks up the revocation list on every
+  call;
+- require_jwt_token with the cache, over a pool of distinct tokens;
+- require_api_key with and without the verified-key cache, over a pool of
+  keys stored among --stored-keys others.
+
+Usage:
+    $ python bench_auth_decorators.py
+    $ python bench_auth_decorators.py --requests 100000 --tokens 1000 --stored-keys 100000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+from flask import Flask
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(os.path.dirname(PROJECT_DIR), 'COURSE', 'week_4'))
+from auth_system import AuthManager, TokenCache, hash_api_key, require_api_key, require_jwt_token
+
+
+def view():
+    return 'ok'
+
+
+def per_call_us(app, func, headers, n_requests, repeat):
+    """Call func n_requests times, cycling through headers; return the best microseconds per call."""
+    contexts = [app.test_request_context('/', headers=h) for h in headers]
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for i in range(n_requests):
+            with contexts[i % len(contexts)]:
+                result = func()
+            if result != 'ok':
+                raise RuntimeError(f"Request was rejected: {result}")
+        best = min(best, (time.perf_counter() - start) / n_requests * 1e6)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark auth decorator overhead per request')
+    parser.add_argument('--requests', type=int, default=50_000, help='Calls per measurement')
+    parser.add_argument('--tokens', type=int, default=100, help='Distinct tokens and API keys in rotation')
+    parser.add_argument('--stored-keys', type=int, default=10_000, help='Other API keys in the store')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per measurement (best is reported)')
+    args = parser.parse_args()
+
+    app = Flask(__name__)
+    with tempfile.TemporaryDirectory() as workdir:
+        db_path = os.path.join(workdir, 'auth.db')
+        cached = AuthManager(db_path=db_path)
+        uncached = AuthManager(db_path=db_path, token_cache=TokenCache(max_entries=0),
+                               key_cache=TokenCache(max_entries=0))
+        cached.store.import_records(api_keys=[(hash_api_key(f"stored-{i}"), f"owner{i}", ['read'], '', None)
+                                              for i in range(args.stored_keys)])
+        headers = [{'Authorization': f"Bearer {cached.generate_jwt_token({'username': f'user{i}'})}",
+                    'X-API-Key': cached.generate_api_key(f"user{i}", ['read', 'write'])}
+                   for i in range(args.tokens)]
+
+        def measure(func):
+            return per_call_us(app, func, headers, args.requests, args.repeat)
+
+        baseline = measure(view)
+        results = [
+            ('no auth', baseline),
+            ('jwt, no cache', measure(require_jwt_token(uncached)(view))),
+            ('jwt, cached', measure(require_jwt_token(cached)(view))),
+            ('api key, no cache', measure(require_api_key(uncached, ['write'])(view))),
+            ('api key, cached', measure(require_api_key(cached, ['write'])(view))),
+        ]
+        token_stats = cached.token_cache.stats()
+        key_stats = cached.key_cache.stats()
+        cached.close()
+        uncached.close()
+
+    print(f"{args.requests:,} requests over {args.tokens} tokens and keys, request context push included")
+    print(f"{'path':<18} {'us/request':>11} {'overhead us':>12}")
+    for name, us in results:
+        print(f"{name:<18} {us:>11.2f} {us - baseline:>12.2f}")
+    print()
+    for name, stats in (('Token', token_stats), ('Key', key_stats)):
+        print(f"{name} cache: {stats['hits']:,} hits, {stats['misses']:,} misses")
+
+
+if __name__ == '__main__':
+    main()
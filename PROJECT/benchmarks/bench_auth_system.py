@@ -0,0 +1,107 @@
+"""
+Auth Storage Benchmark
+
+Measures the week 4 AuthManager's SQLite store with 100k users and 100k API
+keys already stored:
+
+- registration throughput (one committed transaction per user);
+- API key validation and login lookup throughput;
+- startup time, compared with loading the JSON files of the old design;
+- the old design's cost per write, rewriting the whole JSON file.
+
+Password hashing is set to a single PBKDF2 iteration so the numbers show
+storage cost, not hashing cost.
+
+Usage:
+    $ python bench_auth_system.py
+    $ python bench_auth_system.py --users 100000 --operations 20000
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(os.path.dirname(PROJECT_DIR), 'COURSE', 'week_4'))
+from auth_system import AuthManager, AuthStore, hash_api_key
+
+
+def populate(store, n_users):
+    """Bulk-load users and API keys; return the plain API keys."""
+    now = datetime.now().isoformat()
+    users = [{'username': f"user{i}", 'email': f"user{i}@example.com", 'role': 'user',
+              'password_hash': 'x' * 64, 'salt': 's' * 32, 'iterations': 1, 'created_at': now}
+             for i in range(n_users)]
+    keys = [f"key-{i:08d}-{random.getrandbits(64):016x}" for i in range(n_users)]
+    store.import_records(users, [(hash_api_key(key), f"user{i}", ['read', 'write'], now, None)
+                                 for i, key in enumerate(keys)])
+    return keys, users
+
+
+def rate(func, n):
+    """Call func(i) for i in range(n) and return calls per second."""
+    start = time.perf_counter()
+    for i in range(n):
+        func(i)
+    return n / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark AuthManager storage at scale')
+    parser.add_argument('--users', type=int, default=100_000, help='Users and API keys stored beforehand')
+    parser.add_argument('--operations', type=int, default=20_000, help='Lookups per measurement')
+    parser.add_argument('--registrations', type=int, default=2_000, help='Users registered in the measurement')
+    parser.add_argument('--json-writes', type=int, default=5, help='Whole-file JSON rewrites to time')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        db_path = os.path.join(workdir, 'auth.db')
+        store = AuthStore(db_path)
+        keys, users = populate(store, args.users)
+        store.close()
+
+        start = time.perf_counter()
+        auth = AuthManager(db_path=db_path, password_iterations=1)
+        open_s = time.perf_counter() - start
+
+        sample = random.Random(0)
+        register = rate(lambda i: auth.register_user(f"new{i}", 'pw', f"new{i}@example.com"),
+                        args.registrations)
+        validate = rate(lambda i: auth.validate_api_key(sample.choice(keys), ['read']), args.operations)
+        lookup = rate(lambda i: auth.store.get_user(f"user{sample.randrange(args.users)}"), args.operations)
+        login = rate(lambda i: auth.authenticate_user(f"new{i % args.registrations}", 'pw'),
+                     args.operations)
+        auth.close()
+
+        # The old design: everything in JSON files, rewritten on every change
+        users_file = os.path.join(workdir, 'users.json')
+        legacy_users = {user['username']: user for user in users}
+        with open(users_file, 'w') as f:
+            json.dump(legacy_users, f, indent=2)
+        start = time.perf_counter()
+        with open(users_file) as f:
+            legacy_users = json.load(f)
+        json_load_s = time.perf_counter() - start
+        start = time.perf_counter()
+        for i in range(args.json_writes):
+            legacy_users[f"new{i}"] = dict(users[0], username=f"new{i}")
+            with open(users_file, 'w') as f:
+                json.dump(legacy_users, f, indent=2)
+        json_write_ms = (time.perf_counter() - start) / args.json_writes * 1000
+
+    print(f"{args.users:,} users and API keys stored")
+    print(f"{'operation':<28} {'per second':>12} {'ms each':>9}")
+    for name, per_second in [('register_user (sqlite)', register), ('validate_api_key', validate),
+                             ('get_user', lookup), ('authenticate_user', login)]:
+        print(f"{name:<28} {per_second:>12,.0f} {1000 / per_second:>9.3f}")
+    print(f"{'register_user (json file)':<28} {1000 / json_write_ms:>12,.1f} {json_write_ms:>9.1f}")
+    print(f"\nStartup: sqlite {open_s * 1000:.1f} ms, json users file {json_load_s * 1000:.0f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,158 @@
+"""
+Dynamic Scraper Extraction Benchmark
+
+Compares pages per second for the week 5 dynamic scraper's extraction
+paths against a local stand-in site with injected latency:
+
+- JSON endpoint mode, sequential (one worker) and concurrent;
+- the browser path (Selenium), when --browser is given and Selenium and a
+  Chrome driver are installed. The stand-in page renders its table from
+  the same JSON endpoint with JavaScript, like the real sites do.
+
+Usage:
+    $ python bench_dynamic_scraper.py
+    $ python bench_dynamic_scraper.py --pages 100 --latency 0.05 --workers 1 4 8 16
+    $ python bench_dynamic_scraper.py --browser
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(os.path.dirname(PROJECT_DIR), 'COURSE', 'week_5'))
+from dynamic_scraper import extract_via_json_endpoint, extract_with_browser
+
+PAGE_SIZE = 25
+
+STATS_PAGE = """<!DOCTYPE html>
+<html><body>
+<table class="player-stats"><thead><tr><th>name</th><th>goals</th></tr></thead><tbody></tbody></table>
+<button class="pagination-next">Next</button>
+<script>
+let page = 1;
+async function load() {
+  const response = await fetch(`/api/players?page=${page}&per_page=%(page_size)d`);
+  const body = await response.json();
+  document.querySelector('tbody').innerHTML = body.data.players
+    .map(p => `<tr><td>${p.name}</td><td>${p.goals}</td></tr>`).join('');
+  const next = document.querySelector('.pagination-next');
+  next.className = page >= body.meta.total_pages ? 'pagination-next disabled' : 'pagination-next';
+}
+document.querySelector('.pagination-next').onclick = () => { page += 1; load(); };
+load();
+</script>
+</body></html>
+"""
+
+
+class StandInSite(BaseHTTPRequestHandler):
+    """Serve a paginated JSON endpoint and a page rendering it."""
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path == '/stats':
+            body, content_type = STATS_PAGE % {'page_size': PAGE_SIZE}, 'text/html'
+        else:
+            time.sleep(self.server.latency)
+            query = parse_qs(url.query)
+            page = int(query['page'][0])
+            players = [{'name': f"Player {i}", 'goals': i % 7}
+                       for i in range((page - 1) * PAGE_SIZE, min(page, self.server.pages) * PAGE_SIZE)]
+            body = json.dumps({'data': {'players': players},
+                               'meta': {'total_pages': self.server.pages}})
+            content_type = 'application/json'
+        body = body.encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StandInServer(ThreadingHTTPServer):
+    """Threading server with a backlog deep enough for large worker pools."""
+
+    request_queue_size = 64
+
+
+def start_site(pages, latency):
+    """Start the stand-in site in a background thread and return the server."""
+    server = StandInServer(('127.0.0.1', 0), StandInSite)
+    server.daemon_threads = True
+    server.pages = pages
+    server.latency = latency
+    server.url = f"http://127.0.0.1:{server.server_address[1]}"
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def page_config(base_url):
+    """Page config for the stand-in site."""
+    return {
+        'url': f"{base_url}/stats",
+        'data_endpoint': f"{base_url}/api/players",
+        'page_size_param': 'per_page',
+        'page_size': PAGE_SIZE,
+        'records_key': 'data.players',
+        'total_pages_key': 'meta.total_pages',
+        'page_load_delay': 0.2,
+    }
+
+
+def time_extraction(func, expected_rows):
+    """Run an extraction and return its wall time in seconds."""
+    start = time.perf_counter()
+    rows = func()
+    elapsed = time.perf_counter() - start
+    if len(rows) != expected_rows:
+        raise RuntimeError(f"Expected {expected_rows} rows, got {len(rows)}")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark dynamic scraper extraction paths')
+    parser.add_argument('--pages', type=int, default=40, help='Pages served by the endpoint')
+    parser.add_argument('--latency', type=float, default=0.05, help='Seconds added to each JSON response')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 4, 8, 16],
+                        help='Worker counts for JSON endpoint mode')
+    parser.add_argument('--browser', action='store_true', help='Also time the Selenium browser path')
+    args = parser.parse_args()
+
+    server = start_site(args.pages, args.latency)
+    config = page_config(server.url)
+    expected_rows = args.pages * PAGE_SIZE
+    print(f"{args.pages} pages of {PAGE_SIZE} rows, {args.latency * 1000:.0f} ms latency per page")
+    print(f"{'path':<24} {'seconds':>8} {'pages/s':>9} {'speedup':>8}")
+
+    baseline = None
+    for workers in args.workers:
+        elapsed = time_extraction(lambda: extract_via_json_endpoint(config, max_workers=workers),
+                                  expected_rows)
+        baseline = baseline or elapsed
+        print(f"{f'json, {workers} workers':<24} {elapsed:>8.2f} {args.pages / elapsed:>9.1f} "
+              f"{baseline / elapsed:>7.2f}x")
+
+    if args.browser:
+        try:
+            elapsed = time_extraction(lambda: extract_with_browser(config), expected_rows)
+        except ImportError as e:
+            print(f"{'browser':<24} skipped ({e})")
+        else:
+            print(f"{'browser':<24} {elapsed:>8.2f} {args.pages / elapsed:>9.1f} {baseline / elapsed:>7.2f}x")
+    else:
+        print(f"{'browser':<24} skipped (pass --browser with Selenium installed)")
+
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
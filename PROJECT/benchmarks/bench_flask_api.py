@@ -0,0 +1,133 @@
+"""
+Flask API Book Store Benchmark
+
+Measures the week 4 Flask API's in-memory BookStore on a large generated
+collection, against what each request cost when books were re-read from
+books.json and scanned linearly:
+
+- startup: loading the JSON file and building the indexes;
+- per request: search (a rare and a common word, first page), a
+  published_year range filter (first page), lookup by ID and an update;
+- the write-behind save of the whole collection, off the request path;
+- the old per-request path: json.load of the file plus a linear scan.
+
+Usage:
+    $ python bench_flask_api.py
+    $ python bench_flask_api.py --books 1000000 --queries 200
+"""
+
+import argparse
+import json
+import os
+import random
+import resource
+import sys
+import tempfile
+import time
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(os.path.dirname(PROJECT_DIR), 'COURSE', 'week_4'))
+
+WORDS = ['river', 'night', 'garden', 'empire', 'silent', 'winter', 'shadow', 'glass', 'iron', 'ocean',
+         'crown', 'letter', 'stone', 'fire', 'summer', 'house', 'secret', 'light', 'storm', 'mountain']
+GENRES = ['Fiction', 'Mystery', 'Fantasy', 'Science Fiction', 'Romance', 'History', 'Biography',
+          'Poetry', 'Horror', 'Thriller', 'Dystopian', 'Travel']
+
+
+def generate_books(n_books, seed=0):
+    """Generate n_books books with random titles, authors, genres and years."""
+    rng = random.Random(seed)
+    # A long tail of rare words makes some queries selective
+    rare = [f"word{i}" for i in range(20_000)]
+    authors = [f"{rng.choice(['Ann', 'Ben', 'Cara', 'Dev', 'Eli', 'Fay'])} Author{i}" for i in range(50_000)]
+    return [{
+        'id': str(i),
+        'title': ' '.join(rng.sample(WORDS, 2) + [rng.choice(rare)]).title(),
+        'author': rng.choice(authors),
+        'published_year': rng.randint(1800, 2024),
+        'genre': rng.choice(GENRES),
+    } for i in range(n_books)]
+
+
+def rss_mb():
+    """Return the peak resident set size of this process in MB."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def per_call_ms(func, args_list):
+    """Call func once per argument tuple and return the mean milliseconds per call."""
+    start = time.perf_counter()
+    for args in args_list:
+        func(*args)
+    return (time.perf_counter() - start) / len(args_list) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the in-memory book store at scale')
+    parser.add_argument('--books', type=int, default=1_000_000, help='Books in the collection')
+    parser.add_argument('--queries', type=int, default=200, help='Requests per measurement')
+    parser.add_argument('--page', type=int, default=50, help='Page size for searches and filters')
+    parser.add_argument('--scans', type=int, default=2, help='Requests of the old load-and-scan path')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        from flask_api import BookStore, load_books, save_books
+
+        books = generate_books(args.books)
+        path = os.path.join(workdir, 'books.json')
+        save_books(books, path)
+        file_mb = os.path.getsize(path) / 1e6
+        del books
+        base_rss = rss_mb()
+
+        start = time.perf_counter()
+        store = BookStore(path, flush_interval=3600)
+        startup_s = time.perf_counter() - start
+        store_rss = rss_mb() - base_rss
+
+        rng = random.Random(1)
+        page = args.page
+        rare_words = [(f"word{rng.randrange(20_000)}",) for _ in range(args.queries)]
+        common_words = [(rng.choice(WORDS),) for _ in range(args.queries)]
+        ranges = [(year, year + 4) for year in (rng.randint(1800, 2020) for _ in range(args.queries))]
+        book_ids = [(str(rng.randrange(args.books)),) for _ in range(args.queries)]
+        rare_hits = len(store.search(rare_words[0][0]))
+        common_hits = len(store.search(common_words[0][0]))
+
+        results = [
+            (f"search rare word (~{rare_hits} hits)", per_call_ms(
+                lambda q: store.search(q, limit=page), rare_words)),
+            (f"search common word (~{common_hits:,} hits)", per_call_ms(
+                lambda q: store.search(q, limit=page), common_words)),
+            ('search two words', per_call_ms(
+                lambda q: store.search(f"{q} {rng.choice(WORDS)}", limit=page), common_words)),
+            ('5-year range filter', per_call_ms(
+                lambda lo, hi: store.query(min_year=lo, max_year=hi, limit=page), ranges)),
+            ('get by id', per_call_ms(store.get, book_ids)),
+            ('update (title and year)', per_call_ms(
+                lambda book_id: store.update(book_id, {'title': 'Renamed Storm', 'published_year': 1999}),
+                book_ids)),
+        ]
+
+        start = time.perf_counter()
+        store.flush()
+        flush_s = time.perf_counter() - start
+        store.close()
+
+        def load_and_scan(word):
+            return [book for book in load_books(path) if word in book['title'].lower()][:page]
+
+        scan_ms = per_call_ms(load_and_scan, rare_words[:args.scans])
+
+    print(f"{args.books:,} books, {file_mb:.0f} MB JSON file")
+    print(f"Startup (load + index): {startup_s:.1f} s, peak RSS growth {store_rss:,.0f} MB")
+    print(f"\n{'request (first page of ' + str(page) + ')':<36} {'ms each':>10}")
+    for name, ms in results:
+        print(f"{name:<36} {ms:>10.3f}")
+    print(f"{'old path: load file + scan':<36} {scan_ms:>10.1f}")
+    print(f"\nWrite-behind save of the whole collection: {flush_s:.1f} s (background thread)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+"""
+Scraper Import Time Benchmark
+
+Measures how long importing the scraper module takes in a fresh
+interpreter, checks that no heavy dependency is imported eagerly, and
+checks that importing creates no files. Exits with status 1 if any check
+fails, so it can guard against regressions in CI.
+
+Usage:
+    $ python bench_import_time.py
+    $ python bench_import_time.py --repeat 20 --max-ms 100
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SRC_DIR = os.path.join(PROJECT_DIR, 'src')
+
+# Modules the scraper must only import on first use
+HEAVY_MODULES = ['pandas', 'numpy', 'requests', 'bs4', 'lxml', 'pyarrow']
+
+DEFAULT_MODULE = 'scraping.ncaa_scraper'
+DEFAULT_REPEAT = 10
+DEFAULT_MAX_MS = 150
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+heavy = [m for m in {heavy!r} if m in sys.modules]
+print(json.dumps({{'seconds': elapsed, 'heavy': heavy}}))
+"""
+
+
+def measure_import(module=DEFAULT_MODULE, cwd=None):
+    """
+    Import a module in a fresh interpreter.
+
+    Args:
+        module (str): Dotted module name, importable from src
+        cwd (str): Working directory of the interpreter
+
+    Returns:
+        dict: 'seconds' taken by the import and the 'heavy' modules it loaded
+    """
+    env = dict(os.environ, PYTHONPATH=SRC_DIR, PYTHONDONTWRITEBYTECODE='1')
+    output = subprocess.run(
+        [sys.executable, '-c', PROBE.format(module=module, heavy=HEAVY_MODULES)],
+        cwd=cwd, env=env, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def run_benchmark(module=DEFAULT_MODULE, repeat=DEFAULT_REPEAT):
+    """
+    Time repeated imports and check for eager imports and created files.
+
+    Args:
+        module (str): Dotted module name
+        repeat (int): Number of fresh interpreters to time
+
+    Returns:
+        dict: median_ms, best_ms, heavy modules loaded and files created
+    """
+    times = []
+    heavy = set()
+    with tempfile.TemporaryDirectory() as cwd:
+        for _ in range(repeat):
+            result = measure_import(module, cwd=cwd)
+            times.append(result['seconds'] * 1000)
+            heavy.update(result['heavy'])
+        created = sorted(os.listdir(cwd))
+    return {
+        'module': module,
+        'median_ms': statistics.median(times),
+        'best_ms': min(times),
+        'heavy_modules': sorted(heavy),
+        'files_created': created,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark scraper import time')
+    parser.add_argument('--module', default=DEFAULT_MODULE, help='Module to import')
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT,
+                        help='Fresh interpreters to time')
+    parser.add_argument('--max-ms', type=float, default=DEFAULT_MAX_MS,
+                        help='Fail if the median import takes longer')
+    args = parser.parse_args()
+
+    report = run_benchmark(args.module, args.repeat)
+    print(f"{report['module']}: median {report['median_ms']:.1f} ms, best {report['best_ms']:.1f} ms")
+    print(f"Heavy modules imported: {', '.join(report['heavy_modules']) or 'none'}")
+    print(f"Files created: {', '.join(report['files_created']) or 'none'}")
+
+    failed = (report['median_ms'] > args.max_ms or report['heavy_modules']
+              or report['files_created'])
+    if failed:
+        print(f"FAIL: import must take under {args.max_ms:.0f} ms without heavy imports or side effects")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
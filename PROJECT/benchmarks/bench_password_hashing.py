@@ -0,0 +1,111 @@
+"""
+Password Hashing Burst Benchmark
+
+Simulates a login burst against the week 4 AuthManager: many request
+threads call authenticate_user at once while a probe thread keeps making a
+cheap request (a cached API key check) and records its latency. Compares:
+
+- unbounded hashing, one hashing thread per login, as when every request
+  thread hashes for itself;
+- the bounded PasswordHasher pool, where logins beyond the workers and the
+  queue limit are rejected at once (a 503 in the Flask API).
+
+Usage:
+    $ python bench_password_hashing.py
+    $ python bench_password_hashing.py --burst 128 --iterations 200000 --workers 2 --queue 16
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(os.path.dirname(PROJECT_DIR), 'COURSE', 'week_4'))
+from auth_system import AuthManager, HasherBusyError, PasswordHasher
+
+
+def percentile(values, fraction):
+    """Return a percentile of a list of values."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] if ordered else 0.0
+
+
+def run_burst(auth, api_key, burst):
+    """Run a login burst with a probe thread; return login and probe latencies in ms."""
+    logins, rejected, probes = [], [], []
+    done = threading.Event()
+    start_gate = threading.Barrier(burst + 1)
+
+    def login():
+        start_gate.wait()
+        start = time.perf_counter()
+        try:
+            if not auth.authenticate_user('sam', 'pa55word')[0]:
+                raise RuntimeError("Login failed")
+            logins.append((time.perf_counter() - start) * 1000)
+        except HasherBusyError:
+            rejected.append((time.perf_counter() - start) * 1000)
+
+    def probe():
+        while not done.is_set():
+            start = time.perf_counter()
+            auth.validate_api_key(api_key, ['read'])
+            probes.append((time.perf_counter() - start) * 1000)
+            time.sleep(0.005)
+
+    threads = [threading.Thread(target=login) for _ in range(burst)]
+    for thread in threads:
+        thread.start()
+    prober = threading.Thread(target=probe)
+    start = time.perf_counter()
+    start_gate.wait()
+    prober.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    done.set()
+    prober.join()
+    return elapsed, logins, rejected, probes
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark password hashing under a login burst')
+    parser.add_argument('--burst', type=int, default=64, help='Concurrent logins')
+    parser.add_argument('--iterations', type=int, default=100_000, help='PBKDF2 iterations')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='Hashing pool workers')
+    parser.add_argument('--queue', type=int, default=16, help='Hashing pool queue limit')
+    args = parser.parse_args()
+
+    configs = [
+        ('unbounded', PasswordHasher(max_workers=args.burst, max_queue=0)),
+        ('bounded pool', PasswordHasher(max_workers=args.workers, max_queue=args.queue)),
+    ]
+    print(f"{args.burst} concurrent logins, {args.iterations:,} PBKDF2 iterations, "
+          f"pool of {args.workers} workers with a queue of {args.queue}")
+    print(f"{'hashing':<13} {'wall s':>7} {'ok':>4} {'503':>4} {'login p50':>10} {'login p95':>10} "
+          f"{'503 p95':>8} {'probe p50':>10} {'probe p95':>10}")
+
+    with tempfile.TemporaryDirectory() as workdir:
+        for name, hasher in configs:
+            auth = AuthManager(db_path=os.path.join(workdir, f"{name}.db"),
+                               password_iterations=args.iterations, password_hasher=hasher)
+            auth.register_user('sam', 'pa55word', 'sam@example.com')
+            api_key = auth.generate_api_key('Probe', ['read'])
+            elapsed, logins, rejected, probes = run_burst(auth, api_key, args.burst)
+            stats = hasher.stats()
+            auth.close()
+            print(f"{name:<13} {elapsed:>7.2f} {len(logins):>4} {len(rejected):>4} "
+                  f"{statistics.median(logins):>10.1f} {percentile(logins, 0.95):>10.1f} "
+                  f"{percentile(rejected, 0.95):>8.2f} {statistics.median(probes):>10.2f} "
+                  f"{percentile(probes, 0.95):>10.2f}")
+            print(f"{'':<13} pool metrics: hash p50 {stats['hash_ms_p50']:.1f} ms, "
+                  f"queue wait p95 {stats['wait_ms_p95']:.1f} ms")
+    print("\nLatencies in ms. The probe is a cached API key check made every 5 ms during the burst.")
+
+
+if __name__ == '__main__':
+    main()
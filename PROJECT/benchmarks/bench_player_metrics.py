@@ -0,0 +1,253 @@
+"""
+Player Metrics Benchmark Suite
+
+This script times every metric function in analysis.player_metrics on
+generated player frames and records peak memory for each call. Results are
+saved as JSON together with machine metadata so runs can be compared over time.
+
+Usage:
+    $ python bench_player_metrics.py                       # 1e3 .. 1e7 rows
+    $ python bench_player_metrics.py --sizes 1000 100000   # custom sizes
+    $ python bench_player_metrics.py --output results.json
+    $ python bench_player_metrics.py --compare baseline.json --threshold 0.25
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+# Add the src directory to the path for imports
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+from analysis import player_metrics
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000, 1_000_000, 10_000_000]
+DEFAULT_REPEAT = 5
+DEFAULT_THRESHOLD = 0.20
+
+ALL_METRICS = ['goals_per_90', 'assists_per_90', 'goal_contributions',
+               'shot_accuracy', 'conversion_rate', 'efficiency_score']
+
+
+def generate_player_stats(n_rows, seed=42):
+    """
+    Generate a synthetic player statistics frame.
+
+    Only the columns the metric functions read are generated, with a share of
+    zero minutes and zero shots so the division-by-zero paths are exercised.
+
+    Args:
+        n_rows (int): Number of rows to generate
+        seed (int): Random seed for reproducible frames
+
+    Returns:
+        pd.DataFrame: Generated player statistics
+    """
+    rng = np.random.default_rng(seed)
+    minutes = rng.integers(0, 2000, n_rows)
+    shots = rng.integers(0, 60, n_rows)
+    shots_on_goal = (shots * rng.random(n_rows)).astype(np.int64)
+    goals = (shots_on_goal * rng.random(n_rows)).astype(np.int64)
+    return pd.DataFrame({
+        'minutes': minutes,
+        'goals': goals,
+        'assists': rng.integers(0, 15, n_rows),
+        'shots': shots,
+        'shots_on_goal': shots_on_goal,
+    })
+
+
+def get_benchmark_targets():
+    """
+    Collect the functions to benchmark.
+
+    Every ``calculate_*`` function in player_metrics is picked up automatically,
+    so new metrics are benchmarked without editing this script.
+
+    Returns:
+        dict: Mapping of benchmark name to a callable taking a DataFrame
+    """
+    targets = {
+        name: func for name, func in sorted(vars(player_metrics).items())
+        if name.startswith('calculate_') and callable(func)
+    }
+    targets['compare_players'] = lambda df: player_metrics.compare_players(df, ALL_METRICS)
+    return targets
+
+
+def time_function(func, data, repeat=DEFAULT_REPEAT):
+    """
+    Time a function and measure its peak memory usage.
+
+    Args:
+        func (callable): Function to benchmark
+        data (pd.DataFrame): Input frame
+        repeat (int): Number of timed runs
+
+    Returns:
+        dict: Best, median and mean wall time in seconds and peak memory in bytes
+    """
+    # Warm-up run so one-off import and allocation costs are not timed
+    func(data)
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(data)
+        timings.append(time.perf_counter() - start)
+
+    # Peak memory is measured in a separate run because tracing slows execution
+    tracemalloc.start()
+    func(data)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'best_s': min(timings),
+        'median_s': float(np.median(timings)),
+        'mean_s': float(np.mean(timings)),
+        'peak_memory_bytes': peak,
+    }
+
+
+def get_machine_metadata():
+    """
+    Describe the machine and library versions a benchmark ran on.
+
+    Returns:
+        dict: Machine metadata
+    """
+    return {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'hostname': platform.node(),
+        'platform': platform.platform(),
+        'processor': platform.processor() or platform.machine(),
+        'cpu_count': os.cpu_count(),
+        'python_version': platform.python_version(),
+        'numpy_version': np.__version__,
+        'pandas_version': pd.__version__,
+    }
+
+
+def run_benchmarks(sizes=None, repeat=DEFAULT_REPEAT, targets=None):
+    """
+    Run every benchmark target on frames of each size.
+
+    Args:
+        sizes (list): Row counts to benchmark (default: 1e3 to 1e7)
+        repeat (int): Number of timed runs per target and size
+        targets (dict): Benchmark targets (default: all metric functions)
+
+    Returns:
+        dict: Machine metadata and a list of benchmark results
+    """
+    if sizes is None:
+        sizes = DEFAULT_SIZES
+    if targets is None:
+        targets = get_benchmark_targets()
+
+    results = []
+    for n_rows in sizes:
+        data = generate_player_stats(n_rows)
+        for name, func in targets.items():
+            stats = time_function(func, data, repeat=repeat)
+            results.append({'name': name, 'rows': n_rows, **stats})
+            print(f"{name:<32} {n_rows:>10,} rows  "
+                  f"{stats['best_s'] * 1000:>10.3f} ms  "
+                  f"{stats['peak_memory_bytes'] / 1e6:>10.1f} MB")
+        del data
+
+    return {'metadata': get_machine_metadata(), 'repeat': repeat, 'results': results}
+
+
+def save_results(report, path):
+    """
+    Save a benchmark report as JSON.
+
+    Args:
+        report (dict): Report returned by run_benchmarks
+        path (str): Output file path
+    """
+    with open(path, 'w') as f:
+        json.dump(report, f, indent=2)
+
+
+def compare_to_baseline(report, baseline, threshold=DEFAULT_THRESHOLD):
+    """
+    Compare a benchmark report against a stored baseline.
+
+    Runs are matched on benchmark name and row count; best times are compared
+    because they are the least sensitive to background noise.
+
+    Args:
+        report (dict): Current benchmark report
+        baseline (dict): Baseline benchmark report
+        threshold (float): Allowed relative slowdown (0.2 = 20% slower)
+
+    Returns:
+        list: Regressions as dicts with name, rows, baseline, current and ratio
+    """
+    baseline_times = {
+        (r['name'], r['rows']): r['best_s'] for r in baseline['results']
+    }
+
+    regressions = []
+    for result in report['results']:
+        key = (result['name'], result['rows'])
+        if key not in baseline_times or baseline_times[key] <= 0:
+            continue
+        ratio = result['best_s'] / baseline_times[key]
+        if ratio > 1 + threshold:
+            regressions.append({
+                'name': result['name'],
+                'rows': result['rows'],
+                'baseline_s': baseline_times[key],
+                'current_s': result['best_s'],
+                'ratio': ratio,
+            })
+    return regressions
+
+
+def main():
+    """Run the benchmark suite from the command line."""
+    parser = argparse.ArgumentParser(description='Benchmark player metric calculations')
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help='Row counts to benchmark')
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT,
+                        help='Timed runs per benchmark')
+    parser.add_argument('--output', default='benchmark_results.json',
+                        help='Where to save the JSON results')
+    parser.add_argument('--compare', metavar='BASELINE',
+                        help='Baseline JSON file to compare against')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='Allowed relative slowdown before failing (default: 0.20)')
+    args = parser.parse_args()
+
+    report = run_benchmarks(args.sizes, repeat=args.repeat)
+    save_results(report, args.output)
+    print(f"Results saved to {args.output}")
+
+    if args.compare:
+        with open(args.compare, 'r') as f:
+            baseline = json.load(f)
+        regressions = compare_to_baseline(report, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} benchmark(s) slower than baseline by more than "
+                  f"{args.threshold:.0%}:")
+            for r in regressions:
+                print(f"  {r['name']} ({r['rows']:,} rows): "
+                      f"{r['baseline_s'] * 1000:.3f} ms -> {r['current_s'] * 1000:.3f} ms "
+                      f"({r['ratio']:.2f}x)")
+            sys.exit(1)
+        print(f"\nNo regressions beyond {args.threshold:.0%} of baseline.")
+
+
+if __name__ == "__main__":
+    main()
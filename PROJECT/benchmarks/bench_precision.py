@@ -0,0 +1,95 @@
+"""
+Metric Precision Benchmark
+
+Compares compare_players in float64 and float32 mode: wall time, peak memory
+while computing, memory of the stored metric table, and the largest relative
+difference between the two.
+
+Usage:
+    $ python bench_precision.py
+    $ python bench_precision.py --sizes 100000 1000000 --output precision.json
+"""
+
+import argparse
+import json
+
+import numpy as np
+
+from bench_player_metrics import (
+    ALL_METRICS,
+    DEFAULT_REPEAT,
+    generate_player_stats,
+    get_machine_metadata,
+    time_function,
+)
+from analysis.player_metrics import compare_players
+
+DEFAULT_SIZES = [100_000, 1_000_000, 10_000_000]
+
+
+def run_precision_benchmark(sizes=None, repeat=DEFAULT_REPEAT):
+    """
+    Benchmark compare_players in both supported precisions.
+
+    Args:
+        sizes (list): Row counts to benchmark
+        repeat (int): Number of timed runs per precision and size
+
+    Returns:
+        dict: Machine metadata and one result per size
+    """
+    if sizes is None:
+        sizes = DEFAULT_SIZES
+
+    results = []
+    for n_rows in sizes:
+        data = generate_player_stats(n_rows)
+        row = {'rows': n_rows}
+        tables = {}
+        for dtype in ('float64', 'float32'):
+            stats = time_function(lambda df: compare_players(df, ALL_METRICS, dtype=dtype),
+                                  data, repeat=repeat)
+            tables[dtype] = compare_players(data, ALL_METRICS, dtype=dtype)
+            row[dtype] = {
+                **stats,
+                'table_bytes': int(tables[dtype].memory_usage(deep=True).sum()),
+            }
+
+        full = tables['float64'].to_numpy(dtype=np.float64)
+        reduced = tables['float32'].to_numpy(dtype=np.float64)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rel_error = np.abs(reduced - full) / np.abs(full)
+        row['max_relative_error'] = float(np.nanmax(np.where(np.isinf(rel_error), np.nan, rel_error)))
+        row['time_ratio'] = row['float32']['best_s'] / row['float64']['best_s']
+        row['table_memory_ratio'] = row['float32']['table_bytes'] / row['float64']['table_bytes']
+        results.append(row)
+
+        print(f"{n_rows:>10,} rows  "
+              f"time {row['float64']['best_s'] * 1000:9.2f} -> {row['float32']['best_s'] * 1000:9.2f} ms  "
+              f"table {row['float64']['table_bytes'] / 1e6:8.1f} -> {row['float32']['table_bytes'] / 1e6:8.1f} MB  "
+              f"peak {row['float64']['peak_memory_bytes'] / 1e6:8.1f} -> {row['float32']['peak_memory_bytes'] / 1e6:8.1f} MB  "
+              f"max rel err {row['max_relative_error']:.2e}")
+        del data, tables
+
+    return {'metadata': get_machine_metadata(), 'repeat': repeat, 'results': results}
+
+
+def main():
+    """Run the precision benchmark from the command line."""
+    parser = argparse.ArgumentParser(description='Compare float64 and float32 metric computation')
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help='Row counts to benchmark')
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT,
+                        help='Timed runs per benchmark')
+    parser.add_argument('--output', help='Optional path to save the JSON results')
+    args = parser.parse_args()
+
+    report = run_precision_benchmark(args.sizes, repeat=args.repeat)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"Results saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Replayed Crawl Concurrency Benchmark
+
+Measures crawl throughput offline by replaying an archive with injected
+latency, comparing sequential fetching with thread pools of several sizes.
+Pass --archive to replay a real recording (made with
+NCAAStatsScraper(record_path=...)); otherwise an archive of copies of the
+saved team stats fixture is generated.
+
+Usage:
+    $ python bench_replay_crawl.py
+    $ python bench_replay_crawl.py --pages 200 --latency 0.05 0.15 --workers 1 4 8 16
+    $ python bench_replay_crawl.py --archive crawl.jsonl
+"""
+
+import argparse
+import base64
+import json
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(PROJECT_DIR, 'src'))
+from scraping.ncaa_scraper import NCAAStatsScraper
+from scraping.rate_limiter import HostRateLimiter
+
+FIXTURE_PATH = os.path.join(PROJECT_DIR, 'tests', 'fixtures', 'team_stats_page.html')
+BASE_URL = 'https://stats.ncaa.org'
+
+
+def build_fixture_archive(path, pages):
+    """
+    Write an archive with one fixture page per team URL.
+
+    Args:
+        path (str): Archive file to write
+        pages (int): Number of team pages
+
+    Returns:
+        list: Archived URLs
+    """
+    with open(FIXTURE_PATH, 'rb') as f:
+        body = base64.b64encode(f.read()).decode('ascii')
+    urls = [f"{BASE_URL}/teams/{team_id}" for team_id in range(pages)]
+    with open(path, 'w') as f:
+        for url in urls:
+            f.write(json.dumps({'method': 'GET', 'url': url, 'status_code': 200, 'reason': 'OK',
+                                'headers': {'Content-Type': 'text/html; charset=utf-8'},
+                                'body': body, 'elapsed': 0.0}) + '\n')
+    return urls
+
+
+def read_archive_urls(path):
+    """List the distinct GET URLs in an archive, in recorded order."""
+    with open(path, 'r') as f:
+        entries = [json.loads(line) for line in f if line.strip()]
+    return list(dict.fromkeys(e['url'] for e in entries if e['method'] == 'GET'))
+
+
+def run_crawl(archive, urls, workers, latency):
+    """
+    Fetch and parse every URL through a replaying scraper.
+
+    Returns:
+        float: Elapsed seconds
+    """
+    scraper = NCAAStatsScraper(base_url=BASE_URL,
+                               rate_limiter=HostRateLimiter(rate=1e6, capacity=1e6),
+                               replay_path=archive, replay_latency=latency)
+
+    def fetch(url):
+        return scraper._parse_stats_table(scraper._make_request(url))
+
+    start = time.perf_counter()
+    if workers == 1:
+        for url in urls:
+            fetch(url)
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(fetch, urls))
+    return time.perf_counter() - start
+
+
+def main():
+    """Run the replay benchmark from the command line."""
+    parser = argparse.ArgumentParser(description='Benchmark crawl concurrency against a replayed archive')
+    parser.add_argument('--archive', help='Recorded archive to replay (default: generated from the fixture)')
+    parser.add_argument('--pages', type=int, default=100, help='Pages in the generated archive')
+    parser.add_argument('--latency', type=float, nargs='+', default=[0.05],
+                        help='Injected latency in seconds, or a min and max')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 4, 8, 16],
+                        help='Worker counts to compare')
+    args = parser.parse_args()
+
+    latency = tuple(args.latency) if len(args.latency) == 2 else args.latency[0]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        if args.archive:
+            archive, urls = args.archive, read_archive_urls(args.archive)
+        else:
+            archive = os.path.join(tmp_dir, 'archive.jsonl')
+            urls = build_fixture_archive(archive, args.pages)
+
+        print(f"{len(urls)} pages, latency {latency}")
+        baseline = None
+        for workers in args.workers:
+            elapsed = run_crawl(archive, urls, workers, latency)
+            baseline = baseline or elapsed
+            print(f"  {workers:>3} worker(s)  {elapsed:8.2f} s  {len(urls) / elapsed:8.1f} pages/s  "
+                  f"{baseline / elapsed:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Stats Table Parser Benchmark
+
+Compares the targeted stats parser against parsing the whole page with
+BeautifulSoup's default parser and building a dict per row. Runs offline on
+the saved HTML fixture, optionally enlarged by repeating its player rows.
+
+Usage:
+    $ python bench_stats_parser.py
+    $ python bench_stats_parser.py --scales 1 10 100 --repeat 20
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+
+import pandas as pd
+from bs4 import BeautifulSoup
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(PROJECT_DIR, 'src'))
+from scraping.stats_parser import parse_stats_table
+
+FIXTURE_PATH = os.path.join(PROJECT_DIR, 'tests', 'fixtures', 'team_stats_page.html')
+
+
+def load_fixture(scale=1):
+    """
+    Load the fixture page, repeating its player rows `scale` times.
+
+    Args:
+        scale (int): How many copies of the player rows to include
+
+    Returns:
+        str: Page HTML
+    """
+    with open(FIXTURE_PATH, 'r') as f:
+        html = f.read()
+    if scale == 1:
+        return html
+    rows = re.search(r'<tbody>(.*)</tbody>', html, re.S).group(1)
+    return html.replace(rows, rows * scale)
+
+
+def parse_full_page(html):
+    """Baseline: full parse with html.parser and a dict per row."""
+    soup = BeautifulSoup(html, 'html.parser')
+    table = soup.find('table', id='stat_grid')
+    headers = [th.get_text(strip=True) for th in table.find('thead').find_all('th')]
+    records = []
+    for row in table.find('tbody').find_all('tr'):
+        cells = [td.get_text(strip=True) for td in row.find_all('td')]
+        records.append(dict(zip(headers, cells)))
+    return pd.DataFrame(records)
+
+
+def time_parser(func, html, repeat):
+    """Best wall time in seconds over `repeat` runs."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(html)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    """Run the parser benchmark from the command line."""
+    parser = argparse.ArgumentParser(description='Benchmark stats table parsing')
+    parser.add_argument('--scales', type=int, nargs='+', default=[1, 10, 100],
+                        help='Player-row multipliers applied to the fixture')
+    parser.add_argument('--repeat', type=int, default=10, help='Timed runs per parser')
+    args = parser.parse_args()
+
+    variants = {
+        'full page, dict per row': parse_full_page,
+        'strainer + html.parser': lambda html: parse_stats_table(html, parser='html.parser'),
+        'lxml, table only': lambda html: parse_stats_table(html, parser='lxml'),
+    }
+
+    for scale in args.scales:
+        html = load_fixture(scale)
+        rows = len(parse_stats_table(html))
+        print(f"\n{rows:,} rows, {len(html) / 1024:,.0f} KB page")
+        baseline = None
+        for name, func in variants.items():
+            best = time_parser(func, html, args.repeat)
+            baseline = baseline or best
+            print(f"  {name:<26} {best * 1000:9.2f} ms  {rows / best:12,.0f} rows/s  "
+                  f"{baseline / best:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Web Scraper Table Extraction Benchmark
+
+Compares the week 5 web scraper's dict-per-row path (extract_player_stats
+and save_to_csv) with the columnar path (extract_table_columns and
+save_columns_to_csv) on large generated stats pages. Pages are saved to
+disk first and both paths parse the same saved file, so parse time is
+reported separately from extraction and writing.
+
+Usage:
+    $ python bench_web_scraper.py
+    $ python bench_web_scraper.py --rows 10000 50000 --repeat 3
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+from bs4 import BeautifulSoup
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(os.path.dirname(PROJECT_DIR), 'COURSE', 'week_5'))
+from web_scraper import extract_player_stats, extract_table_columns, save_columns_to_csv, save_to_csv
+
+HEADERS = ['Player Name', 'Position', 'Games', 'Goals', 'Assists', 'Shots',
+           'Shots on Goal', 'Minutes', 'Rating']
+
+
+def generate_page(n_rows, seed=0):
+    """Generate a stats page with n_rows players."""
+    rng = random.Random(seed)
+    rows = []
+    for i in range(n_rows):
+        minutes = rng.randint(0, 3000)
+        rating = f"{rng.uniform(5, 9):.2f}" if rng.random() > 0.05 else '-'
+        cells = [f"Player {i}", rng.choice('FMDG'), rng.randint(0, 30), rng.randint(0, 25),
+                 rng.randint(0, 20), rng.randint(0, 90), rng.randint(0, 50), f"{minutes:,}", rating]
+        rows.append('<tr>' + ''.join(f"<td>{cell}</td>" for cell in cells) + '</tr>')
+    header = ''.join(f"<th>{name}</th>" for name in HEADERS)
+    return (f'<html><body><table class="stats-table"><thead><tr>{header}</tr></thead>'
+            f'<tbody>{"".join(rows)}</tbody></table></body></html>')
+
+
+def time_call(func, repeat):
+    """Return the best wall time of repeated calls, and the last result."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def run_benchmark(n_rows, repeat, parser, workdir):
+    """Benchmark both paths on one saved page and print the results."""
+    page_path = os.path.join(workdir, f"stats_{n_rows}.html")
+    with open(page_path, 'w', encoding='utf-8') as f:
+        f.write(generate_page(n_rows))
+    with open(page_path, encoding='utf-8') as f:
+        html = f.read()
+
+    parse_s, soup = time_call(lambda: BeautifulSoup(html, parser), 1)
+
+    rows_s, players = time_call(lambda: extract_player_stats(soup), repeat)
+    rows_write_s, _ = time_call(lambda: save_to_csv(players, os.path.join(workdir, 'rows.csv')), repeat)
+    cols_s, columns = time_call(lambda: extract_table_columns(soup), repeat)
+    cols_write_s, written = time_call(
+        lambda: save_columns_to_csv(columns, os.path.join(workdir, 'columns.csv')), repeat)
+    if len(players) != n_rows or written != n_rows:
+        raise RuntimeError(f"Expected {n_rows} rows, got {len(players)} and {written}")
+
+    rows_total = rows_s + rows_write_s
+    cols_total = cols_s + cols_write_s
+    print(f"{n_rows:>8} rows, {os.path.getsize(page_path) / 1e6:.1f} MB page, parse {parse_s:.2f} s")
+    print(f"{'path':<12} {'extract s':>10} {'write s':>9} {'total s':>9} {'rows/s':>10}")
+    print(f"{'dict rows':<12} {rows_s:>10.3f} {rows_write_s:>9.3f} {rows_total:>9.3f} {n_rows / rows_total:>10,.0f}")
+    print(f"{'columnar':<12} {cols_s:>10.3f} {cols_write_s:>9.3f} {cols_total:>9.3f} {n_rows / cols_total:>10,.0f}"
+          f"  ({rows_total / cols_total:.2f}x)")
+    print()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark web scraper table extraction paths')
+    parser.add_argument('--rows', type=int, nargs='+', default=[10000, 50000],
+                        help='Rows in each generated page')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per path (best is reported)')
+    parser.add_argument('--parser', default='html.parser', help='BeautifulSoup parser, e.g. lxml')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        for n_rows in args.rows:
+            run_benchmark(n_rows, args.repeat, args.parser, workdir)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,336 @@
+"""
+Player Identity Resolution
+
+This module links player records from different seasons and sources (NCAA
+stats pages, rosters, manual entries) to one canonical player ID, even when
+names are spelled differently.
+
+Comparing every pair of records is quadratic, so candidates are generated
+by blocking instead: only records that share a block are compared. Two
+kinds of block are used:
+
+- team blocks: same team and the same last-name prefix, which catches
+  nicknames, initials and typos within a program;
+- name n-gram blocks: same first-name prefix and the same leading or trailing
+  last-name trigram, which catches transfers between teams even when one
+  end of the name is misspelled. Oversized blocks (common names) are
+  skipped rather than compared exhaustively.
+
+Records are first collapsed to unique (first name, last name, team)
+entries, so a player appearing in many seasons and sources is compared
+once. Accepted pairs are merged with union-find.
+"""
+
+import hashlib
+import logging
+import re
+import unicodedata
+from collections import defaultdict
+from difflib import SequenceMatcher
+from functools import lru_cache
+from itertools import combinations
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Columns identifying a player record
+NAME_COLUMNS = ['first_name', 'last_name', 'team']
+
+# Name suffixes dropped before comparison
+NAME_SUFFIXES = {'jr', 'sr', 'ii', 'iii', 'iv'}
+
+# Weights of first and last name similarity in a name score
+FIRST_NAME_WEIGHT = 0.4
+LAST_NAME_WEIGHT = 0.6
+
+# Common nicknames mapped to their full first name
+NICKNAMES = {
+    'alex': 'alexander', 'andy': 'andrew', 'ben': 'benjamin', 'bill': 'william',
+    'bob': 'robert', 'chris': 'christopher', 'dan': 'daniel', 'dave': 'david',
+    'jake': 'jacob', 'jim': 'james', 'joe': 'joseph', 'jon': 'jonathan',
+    'kate': 'katherine', 'liz': 'elizabeth', 'matt': 'matthew', 'mike': 'michael',
+    'nate': 'nathan', 'nick': 'nicholas', 'pat': 'patrick', 'sam': 'samuel',
+    'steve': 'steven', 'tom': 'thomas', 'tony': 'anthony', 'will': 'william',
+}
+
+
+def normalize_name(name):
+    """
+    Normalize a name for comparison.
+
+    Accents and punctuation are removed, case is folded and suffixes such
+    as 'Jr.' are dropped.
+
+    Args:
+        name (str): Raw name
+
+    Returns:
+        str: Normalized name (empty string for missing names)
+    """
+    if not isinstance(name, str):
+        return ''
+    name = unicodedata.normalize('NFKD', name).encode('ascii', 'ignore').decode('ascii')
+    words = re.sub(r"[^a-z ]", '', re.sub(r"[-.']", ' ', name.lower())).split()
+    return ' '.join(w for w in words if w not in NAME_SUFFIXES)
+
+
+@lru_cache(maxsize=1 << 16)
+def first_name_similarity(a, b):
+    """
+    Similarity of two normalized first names.
+
+    Known nicknames and prefixes ('Alex'/'Alexander') count as strong
+    matches; a bare initial is a weaker one.
+
+    Args:
+        a (str): Normalized first name
+        b (str): Normalized first name
+
+    Returns:
+        float: Similarity between 0 and 1
+    """
+    if a == b:
+        return 1.0
+    if not a or not b:
+        return 0.5
+    if NICKNAMES.get(a, a) == NICKNAMES.get(b, b):
+        return 0.95
+    if a.startswith(b) or b.startswith(a):
+        return 0.9 if min(len(a), len(b)) > 1 else 0.8
+    return SequenceMatcher(None, a, b).ratio()
+
+
+@lru_cache(maxsize=1 << 18)
+def last_name_similarity(a, b):
+    """
+    Similarity of two normalized last names.
+
+    Args:
+        a (str): Normalized last name
+        b (str): Normalized last name
+
+    Returns:
+        float: Similarity between 0 and 1
+    """
+    return 1.0 if a == b else SequenceMatcher(None, a, b).ratio()
+
+
+def name_similarity(first_a, last_a, first_b, last_b):
+    """
+    Similarity of two normalized player names, weighting the last name more.
+
+    Args:
+        first_a (str): First name of the first player
+        last_a (str): Last name of the first player
+        first_b (str): First name of the second player
+        last_b (str): Last name of the second player
+
+    Returns:
+        float: Similarity between 0 and 1
+    """
+    return (FIRST_NAME_WEIGHT * first_name_similarity(first_a, first_b)
+            + LAST_NAME_WEIGHT * last_name_similarity(last_a, last_b))
+
+
+class PlayerIdentityResolver:
+    """
+    Assign canonical player IDs to records using blocked fuzzy matching.
+
+    Records are rows with 'first_name', 'last_name' and 'team', plus
+    optional 'season', 'source', 'source_id' and 'canonical_id' columns:
+
+    - records sharing a (source, source_id) always resolve together;
+    - two entries seen on the same (source, season) roster of one team are
+      different players and are never merged;
+    - existing canonical IDs are kept, so IDs stay stable across runs, and
+      two different existing IDs are never merged.
+
+    Attributes:
+        stats (dict): Counts from the last resolve call (records, entries,
+            blocks, skipped_blocks, comparisons, matches, players)
+    """
+
+    def __init__(self, prefix_length=3, threshold=0.85, cross_team_threshold=0.95,
+                 max_block_size=100, id_prefix='PL'):
+        """
+        Initialize the resolver.
+
+        Args:
+            prefix_length (int): Last-name characters used in team blocks
+            threshold (float): Minimum similarity to match within a team
+            cross_team_threshold (float): Minimum similarity to match
+                across teams (stricter, since common names repeat)
+            max_block_size (int): Name n-gram blocks larger than this are
+                skipped
+            id_prefix (str): Prefix of generated canonical IDs
+        """
+        self.prefix_length = prefix_length
+        self.threshold = threshold
+        self.cross_team_threshold = cross_team_threshold
+        self.max_block_size = max_block_size
+        self.id_prefix = id_prefix
+        self.stats = {}
+
+    def resolve(self, records):
+        """
+        Assign a canonical ID to every record.
+
+        Args:
+            records (pd.DataFrame): Player records
+
+        Returns:
+            pd.DataFrame: Copy of the records with a 'canonical_id' column
+
+        Raises:
+            ValueError: If a name column is missing
+        """
+        missing = [column for column in NAME_COLUMNS if column not in records]
+        if missing:
+            raise ValueError(f"Player records are missing columns: {missing}")
+        first = self._normalize_column(records['first_name'])
+        last = self._normalize_column(records['last_name'])
+        team = records['team'].fillna('').astype(str)
+
+        # Collapse records to unique (first, last, team) entries
+        names = pd.DataFrame({'first': first, 'last': last, 'team': team})
+        entry_of_record = names.groupby(['first', 'last', 'team'], sort=False).ngroup().to_numpy()
+        entries = names.drop_duplicates()
+        firsts, lasts, teams = (entries[column].tolist() for column in ['first', 'last', 'team'])
+
+        parent = list(range(len(entries)))
+        existing_ids = self._existing_ids(records, entry_of_record)
+        roster_slots = self._roster_slots(records, entry_of_record)
+        self.stats = {'records': len(records), 'entries': len(entries), 'blocks': 0,
+                      'skipped_blocks': 0, 'comparisons': 0, 'matches': 0}
+
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        def union(i, j):
+            root_i, root_j = find(i), find(j)
+            if root_i == root_j:
+                return True
+            id_i, id_j = existing_ids.get(root_i), existing_ids.get(root_j)
+            if id_i is not None and id_j is not None and id_i != id_j:
+                return False
+            if roster_slots[root_i] & roster_slots[root_j]:
+                return False
+            root, child = min(root_i, root_j), max(root_i, root_j)
+            parent[child] = root
+            roster_slots[root] |= roster_slots.pop(child, set())
+            existing_ids.pop(child, None)
+            if id_i is not None or id_j is not None:
+                existing_ids[root] = id_i if id_i is not None else id_j
+            return True
+
+        # Shared source IDs are authoritative
+        if 'source_id' in records:
+            linked = records.assign(entry=entry_of_record).dropna(subset=['source_id'])
+            source = linked['source'].fillna('') if 'source' in linked else pd.Series('', index=linked.index)
+            for group in linked.groupby([source, linked['source_id']])['entry'].unique():
+                for other in group[1:]:
+                    union(group[0], other)
+
+        # Score every candidate first, then merge best matches first so the
+        # result does not depend on record order
+        lengths = [len(name) for name in lasts]
+        accepted = []
+        for i, j in self._candidate_pairs(firsts, lasts, teams):
+            required = self.threshold if teams[i] == teams[j] else self.cross_team_threshold
+            score = FIRST_NAME_WEIGHT * first_name_similarity(firsts[i], firsts[j])
+            # Cheap upper bound on the last-name ratio rules most pairs out
+            length_bound = 2 * min(lengths[i], lengths[j]) / max(lengths[i] + lengths[j], 1)
+            if score + LAST_NAME_WEIGHT * length_bound < required or find(i) == find(j):
+                continue
+            self.stats['comparisons'] += 1
+            score += LAST_NAME_WEIGHT * last_name_similarity(lasts[i], lasts[j])
+            if score >= required:
+                pair = sorted([(lasts[i], firsts[i], teams[i], i), (lasts[j], firsts[j], teams[j], j)])
+                accepted.append((-score, pair))
+
+        for _, ((*_, i), (*_, j)) in sorted(accepted):
+            if union(i, j):
+                self.stats['matches'] += 1
+
+        # New IDs derive from each cluster's smallest entry, independent of input order
+        roots = [find(i) for i in range(len(entries))]
+        anchors = {}
+        for entry, root in enumerate(roots):
+            key = (lasts[entry], firsts[entry], teams[entry])
+            if root not in anchors or key < anchors[root]:
+                anchors[root] = key
+        canonical = {root: existing_ids.get(root) or self._new_id(*anchor)
+                     for root, anchor in anchors.items()}
+        self.stats['players'] = len(canonical)
+        logger.info(f"Resolved {len(records)} records to {len(canonical)} players "
+                    f"with {self.stats['comparisons']} comparisons")
+
+        entry_ids = [canonical[root] for root in roots]
+        return records.assign(canonical_id=[entry_ids[e] for e in entry_of_record])
+
+    def _normalize_column(self, names):
+        """Normalize a name column, computing each distinct name once."""
+        distinct = names.dropna().unique()
+        return names.map(dict(zip(distinct, map(normalize_name, distinct)))).fillna('')
+
+    def _existing_ids(self, records, entry_of_record):
+        """Existing canonical ID per entry, from a 'canonical_id' column."""
+        if 'canonical_id' not in records:
+            return {}
+        known = pd.Series(records['canonical_id'].values, index=entry_of_record).dropna()
+        return known.groupby(level=0).min().to_dict()
+
+    def _roster_slots(self, records, entry_of_record):
+        """Codes of the (source, season, team) rosters each entry appears on."""
+        slots = defaultdict(set)
+        if 'season' not in records:
+            return slots
+        rosters = pd.DataFrame({'source': records['source'] if 'source' in records else '',
+                                'season': records['season'], 'team': records['team']})
+        slot_of_record = rosters.groupby(['source', 'season', 'team'], sort=False, dropna=False).ngroup()
+        n_slots = int(slot_of_record.max()) + 1
+        appearances = np.unique(entry_of_record.astype(np.int64) * n_slots + slot_of_record.to_numpy())
+        for entry, slot in zip(*np.divmod(appearances, n_slots)):
+            slots[int(entry)].add(int(slot))
+        return slots
+
+    def _candidate_pairs(self, firsts, lasts, teams):
+        """
+        Generate entry pairs sharing a block.
+
+        Yields:
+            tuple: (i, j) entry indices with i < j, each pair once
+        """
+        team_blocks = defaultdict(list)
+        gram_blocks = defaultdict(list)
+        for i, (first, last, team) in enumerate(zip(firsts, lasts, teams)):
+            team_blocks[(team, last[:self.prefix_length])].append(i)
+            # Cross-team matches need near-identical first names, so block on
+            # the first two letters of the full (nickname-resolved) first name
+            given = NICKNAMES.get(first, first)[:2]
+            gram_blocks[(given, '^' + last[:3])].append(i)
+            gram_blocks[(given, last[-3:] + '$')].append(i)
+
+        seen = set()
+        for blocks, capped in ((team_blocks, False), (gram_blocks, True)):
+            for members in blocks.values():
+                if len(members) < 2:
+                    continue
+                if capped and len(members) > self.max_block_size:
+                    self.stats['skipped_blocks'] += 1
+                    continue
+                self.stats['blocks'] += 1
+                for pair in combinations(members, 2):
+                    if pair not in seen:
+                        seen.add(pair)
+                        yield pair
+
+    def _new_id(self, last, first, team):
+        """Deterministic ID derived from a cluster's anchor entry."""
+        digest = hashlib.sha1(f"{first}|{last}|{team}".encode('utf-8')).hexdigest()[:10]
+        return f"{self.id_prefix}-{digest}"
@@ -3,11 +3,38 @@ Player Performance Metrics
 
 This module provides functions for calculating various performance metrics
 for soccer players based on their statistics.
+
+Reduced precision:
+    compare_players and build_metrics_snapshot accept dtype='float32' to
+    compute and store metrics in single precision, halving the memory of
+    large metric tables. Against float64, with integer stat columns below
+    2**24, the error bounds are:
+
+    - goals_per_90, assists_per_90, shot_accuracy, conversion_rate:
+      one rounding step, relative error <= 2**-24 (about 6e-8). Rankings
+      are identical to float64 because distinct ratios of realistic stat
+      counts differ by far more than that.
+    - goal_contributions: exact (integer sums are representable).
+    - efficiency_score: a few chained roundings, relative error below
+      FLOAT32_RELATIVE_ERROR_BOUND (1e-6). Players whose float64 scores are
+      within that tolerance of each other may swap places.
 """
 
 import pandas as pd
 import numpy as np
 
+# Stat columns read by the metric functions
+STAT_COLUMNS = ['minutes', 'goals', 'assists', 'shots', 'shots_on_goal']
+
+# Precisions supported by compare_players and build_metrics_snapshot
+SUPPORTED_DTYPES = ('float64', 'float32')
+
+# Documented worst-case relative error of float32 metrics against float64
+FLOAT32_RELATIVE_ERROR_BOUND = 1e-6
+
+# Identifier columns kept alongside metrics in a snapshot
+SNAPSHOT_ID_COLUMNS = ['player_id', 'first_name', 'last_name', 'team', 'position']
+
 def calculate_goals_per_90(player_stats):
     """
     Calculate goals per 90 minutes played.
@@ -108,20 +135,33 @@ def calculate_efficiency_score(player_stats):
     
     return efficiency
 
-def compare_players(player_stats, metrics=None):
+def compare_players(player_stats, metrics=None, dtype='float64'):
     """
     Compare players across selected metrics.
     
     Args:
         player_stats (pd.DataFrame): DataFrame containing player statistics
         metrics (list): List of metrics to compare (default: standard metrics)
+        dtype (str): 'float64' (default) or 'float32' to compute and store
+            the metrics in single precision (see module docstring for bounds)
     
     Returns:
         pd.DataFrame: DataFrame with calculated metrics for each player
+    
+    Raises:
+        ValueError: If dtype is not supported
     """
+    if dtype not in SUPPORTED_DTYPES:
+        raise ValueError(f"Unsupported dtype '{dtype}', expected one of {SUPPORTED_DTYPES}")
+    
     if metrics is None:
         metrics = ['goals_per_90', 'assists_per_90', 'shot_accuracy', 'conversion_rate']
     
+    if dtype == 'float32':
+        # Cast the inputs so the arithmetic itself runs in single precision
+        columns = [col for col in STAT_COLUMNS if col in player_stats.columns]
+        player_stats = player_stats[columns].astype(dtype)
+    
     results = pd.DataFrame(index=player_stats.index)
     
     # Calculate each metric
@@ -143,8 +183,29 @@ def compare_players(player_stats, metrics=None):
     if 'efficiency_score' in metrics:
         results['efficiency_score'] = calculate_efficiency_score(player_stats)
     
+    if dtype == 'float32':
+        results = results.astype(dtype)
+    
     return results
 
+def build_metrics_snapshot(player_stats, metrics=None, dtype='float64'):
+    """
+    Build a snapshot table of player identifiers and calculated metrics.
+    
+    Args:
+        player_stats (pd.DataFrame): DataFrame containing player statistics
+        metrics (list): List of metrics to include (default: standard metrics)
+        dtype (str): 'float64' (default) or 'float32' for the metric columns
+    
+    Returns:
+        pd.DataFrame: Identifier columns followed by one column per metric
+    """
+    id_columns = [col for col in SNAPSHOT_ID_COLUMNS if col in player_stats.columns]
+    return pd.concat([
+        player_stats[id_columns],
+        compare_players(player_stats, metrics, dtype=dtype)
+    ], axis=1)
+
 def main():
     """Test function to demonstrate the metrics calculation."""
     try:
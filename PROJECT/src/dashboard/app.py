@@ -12,7 +12,7 @@ import sys
 
 # Add parent directory to path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from analysis.player_metrics import compare_players
+from analysis.player_metrics import compare_players, build_metrics_snapshot
 
 app = Flask(__name__)
 
@@ -72,14 +72,8 @@ def get_metrics():
     else:
         metrics_list = ['goals_per_90', 'assists_per_90', 'shot_accuracy', 'efficiency_score']
     
-    # Calculate metrics
-    metrics = compare_players(player_data, metrics_list)
-    
-    # Combine with player identifiers
-    result = pd.concat([
-        player_data[['player_id', 'first_name', 'last_name', 'team', 'position']],
-        metrics
-    ], axis=1)
+    # Calculate metrics alongside player identifiers
+    result = build_metrics_snapshot(player_data, metrics_list)
     
     return jsonify(result.to_dict('records'))
 
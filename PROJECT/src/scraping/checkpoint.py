@@ -0,0 +1,358 @@
+"""
+Crawl Checkpoint Store
+
+This module keeps crawl state in a local SQLite database so an interrupted
+crawl can resume where it stopped. It records the frontier (keys pending,
+done and failed, with a content hash of what was fetched) and a watermark
+per team and season: the latest game date seen and the validators (ETag,
+Last-Modified) of the game log it came from. Nightly runs use them to
+revalidate each game log and keep only the games played since the last
+completed crawl. It also keeps each key's fetch history (how often fetches
+found changed content) for scheduling.
+
+Pages fetched for a key that has not finished yet are saved too, so a
+resumed crawl serves them from the store instead of requesting them again.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import zlib
+from datetime import datetime
+
+PENDING = 'pending'
+DONE = 'done'
+FAILED = 'failed'
+
+
+def content_hash(data):
+    """
+    Hash fetched content for change detection.
+
+    Args:
+        data (bytes or str): Content to hash
+
+    Returns:
+        str: SHA-256 hex digest
+    """
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    return hashlib.sha256(data).hexdigest()
+
+
+def _season_key(season):
+    """Store the current season (None) as an empty string."""
+    return '' if season is None else str(season)
+
+
+class CrawlCheckpoint:
+    """
+    A SQLite-backed crawl frontier and watermark store.
+
+    Frontier keys are page URLs or crawl task identifiers. Every status change
+    is committed immediately, so the store is consistent whenever the crawl
+    dies.
+    """
+
+    def __init__(self, path):
+        """
+        Open or create a checkpoint store.
+
+        Args:
+            path (str): SQLite database file (':memory:' for a throwaway store)
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS frontier (
+                    key TEXT PRIMARY KEY,
+                    status TEXT NOT NULL,
+                    content_hash TEXT,
+                    error TEXT,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    updated_at TEXT NOT NULL
+                )
+            """)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS frontier_status ON frontier (status)")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS fetch_history (
+                    key TEXT PRIMARY KEY,
+                    fetch_count INTEGER NOT NULL,
+                    change_count INTEGER NOT NULL,
+                    last_fetched_at TEXT NOT NULL
+                )
+            """)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS pages (
+                    url TEXT PRIMARY KEY,
+                    key TEXT NOT NULL,
+                    content_hash TEXT NOT NULL,
+                    content BLOB NOT NULL,
+                    meta TEXT NOT NULL,
+                    fetched_at TEXT NOT NULL
+                )
+            """)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS pages_key ON pages (key)")
+            # Replaces the team-only 'watermarks' table, which older stores may still hold
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS team_watermarks (
+                    team_id TEXT NOT NULL,
+                    season TEXT NOT NULL,
+                    last_game_date TEXT NOT NULL,
+                    validators TEXT NOT NULL,
+                    updated_at TEXT NOT NULL,
+                    PRIMARY KEY (team_id, season)
+                )
+            """)
+
+    def close(self):
+        """Close the underlying database connection."""
+        self._conn.close()
+
+    def start_run(self, keys):
+        """
+        Register the keys of a crawl and decide which still need fetching.
+
+        If any of the keys is still pending, a previous run was interrupted and
+        is resumed. Otherwise a new run starts and every key is reset to
+        pending, keeping its last content hash for change detection and
+        dropping the pages saved for it.
+
+        Args:
+            keys (list): Frontier keys making up the crawl
+
+        Returns:
+            list: Keys to fetch (pending or failed), in the given order
+        """
+        keys = list(dict.fromkeys(keys))
+        now = datetime.now().isoformat()
+        with self._lock, self._conn:
+            statuses = self._statuses(keys)
+            if statuses and PENDING not in statuses.values():
+                self._conn.executemany(
+                    "UPDATE frontier SET status = ?, error = NULL, updated_at = ? WHERE key = ?",
+                    [(PENDING, now, key) for key in statuses]
+                )
+                self._conn.executemany("DELETE FROM pages WHERE key = ?", [(key,) for key in statuses])
+                statuses = dict.fromkeys(statuses, PENDING)
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO frontier (key, status, updated_at) VALUES (?, ?, ?)",
+                [(key, PENDING, now) for key in keys if key not in statuses]
+            )
+        return [key for key in keys if statuses.get(key, PENDING) != DONE]
+
+    def _statuses(self, keys):
+        """Look up the status of known keys. Caller holds the lock."""
+        statuses = {}
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            rows = self._conn.execute(
+                f"SELECT key, status FROM frontier WHERE key IN ({','.join('?' * len(chunk))})",
+                chunk
+            )
+            statuses.update(rows)
+        return statuses
+
+    def mark_done(self, key, content_hash=None):
+        """
+        Record a key as fetched and drop the pages saved for it.
+
+        Args:
+            key (str): Frontier key
+            content_hash (str): Hash of the fetched content
+
+        Returns:
+            bool: True if the content differs from the previously stored hash
+        """
+        now = datetime.now().isoformat()
+        with self._lock, self._conn:
+            row = self._conn.execute("SELECT content_hash FROM frontier WHERE key = ?", (key,)).fetchone()
+            changed = row is None or row[0] != content_hash
+            self._conn.execute("""
+                INSERT INTO frontier (key, status, content_hash, attempts, updated_at)
+                VALUES (?, ?, ?, 1, ?)
+                ON CONFLICT(key) DO UPDATE SET status = excluded.status,
+                    content_hash = excluded.content_hash, error = NULL,
+                    attempts = attempts + 1, updated_at = excluded.updated_at
+            """, (key, DONE, content_hash, now))
+            self._conn.execute("""
+                INSERT INTO fetch_history (key, fetch_count, change_count, last_fetched_at)
+                VALUES (?, 1, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET fetch_count = fetch_count + 1,
+                    change_count = change_count + excluded.change_count,
+                    last_fetched_at = excluded.last_fetched_at
+            """, (key, int(changed), now))
+            self._conn.execute("DELETE FROM pages WHERE key = ?", (key,))
+        return changed
+
+    def mark_failed(self, key, error=None):
+        """
+        Record a key as failed so the next run retries it.
+
+        Args:
+            key (str): Frontier key
+            error (str): Error description
+        """
+        now = datetime.now().isoformat()
+        with self._lock, self._conn:
+            self._conn.execute("""
+                INSERT INTO frontier (key, status, error, attempts, updated_at)
+                VALUES (?, ?, ?, 1, ?)
+                ON CONFLICT(key) DO UPDATE SET status = excluded.status, error = excluded.error,
+                    attempts = attempts + 1, updated_at = excluded.updated_at
+            """, (key, FAILED, None if error is None else str(error), now))
+
+    def get_entry(self, key):
+        """
+        Get the stored state of a key.
+
+        Args:
+            key (str): Frontier key
+
+        Returns:
+            dict: status, content_hash, error and attempts, or None if unknown
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status, content_hash, error, attempts FROM frontier WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        return dict(zip(['status', 'content_hash', 'error', 'attempts'], row))
+
+    def save_page(self, url, key, content, meta=None):
+        """
+        Save a page fetched for a key that is not done yet.
+
+        The page is kept until the key is marked done or a new run starts, so
+        a crawl interrupted in between does not request it again.
+
+        Args:
+            url (str): Page URL, including its query string
+            key (str): Frontier key the page belongs to
+            content (bytes): Response body
+            meta (dict): JSON-serializable response details, e.g. headers
+        """
+        now = datetime.now().isoformat()
+        with self._lock, self._conn:
+            self._conn.execute("""
+                INSERT OR REPLACE INTO pages (url, key, content_hash, content, meta, fetched_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, (url, key, content_hash(content), zlib.compress(content), json.dumps(meta or {}), now))
+
+    def get_page(self, url):
+        """
+        Get a page saved by save_page.
+
+        Args:
+            url (str): Page URL, including its query string
+
+        Returns:
+            dict: key, content_hash, content (bytes) and meta, or None if the
+                page is not saved
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT key, content_hash, content, meta FROM pages WHERE url = ?", (url,)
+            ).fetchone()
+        if row is None:
+            return None
+        return {'key': row[0], 'content_hash': row[1], 'content': zlib.decompress(row[2]),
+                'meta': json.loads(row[3])}
+
+    def get_fetch_history(self, key):
+        """
+        Get how often a key was fetched and found changed.
+
+        Args:
+            key (str): Frontier key
+
+        Returns:
+            dict: fetch_count, change_count and last_fetched_at (ISO string);
+                zero counts and None if never fetched
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT fetch_count, change_count, last_fetched_at FROM fetch_history WHERE key = ?",
+                (key,)
+            ).fetchone()
+        if row is None:
+            return {'fetch_count': 0, 'change_count': 0, 'last_fetched_at': None}
+        return dict(zip(['fetch_count', 'change_count', 'last_fetched_at'], row))
+
+    def counts(self):
+        """
+        Count frontier keys by status.
+
+        Returns:
+            dict: {'pending': n, 'done': n, 'failed': n}
+        """
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) FROM frontier GROUP BY status").fetchall()
+        counts = {PENDING: 0, DONE: 0, FAILED: 0}
+        counts.update(rows)
+        return counts
+
+    def get_watermark(self, team_id, season=None):
+        """
+        Get the latest game date recorded for a team in a season.
+
+        Args:
+            team_id (str): NCAA team ID
+            season (str): Season year (default: current season)
+
+        Returns:
+            str: ISO date of the newest game seen, or None
+        """
+        row = self._watermark_row(team_id, season)
+        return row[0] if row else None
+
+    def get_validators(self, team_id, season=None):
+        """
+        Get the revalidation headers of the game log behind a watermark.
+
+        Args:
+            team_id (str): NCAA team ID
+            season (str): Season year (default: current season)
+
+        Returns:
+            dict: If-None-Match / If-Modified-Since headers; empty if the
+                page had no validators or there is no watermark
+        """
+        row = self._watermark_row(team_id, season)
+        return json.loads(row[1]) if row else {}
+
+    def _watermark_row(self, team_id, season):
+        """Look up a (last_game_date, validators) row."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT last_game_date, validators FROM team_watermarks WHERE team_id = ? AND season = ?",
+                (str(team_id), _season_key(season))
+            ).fetchone()
+
+    def set_watermark(self, team_id, last_game_date, season=None, validators=None):
+        """
+        Advance a team's watermark. Older dates never move it backwards.
+
+        The validators always replace the stored ones, since they describe
+        the game log as last fetched.
+
+        Args:
+            team_id (str): NCAA team ID
+            last_game_date (str): ISO date of the newest game fetched
+            season (str): Season year (default: current season)
+            validators (dict): Revalidation headers of the game log
+        """
+        now = datetime.now().isoformat()
+        with self._lock, self._conn:
+            self._conn.execute("""
+                INSERT INTO team_watermarks (team_id, season, last_game_date, validators, updated_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(team_id, season) DO UPDATE SET
+                    last_game_date = MAX(last_game_date, excluded.last_game_date),
+                    validators = excluded.validators,
+                    updated_at = excluded.updated_at
+            """, (str(team_id), _season_key(season), str(last_game_date), json.dumps(validators or {}), now))
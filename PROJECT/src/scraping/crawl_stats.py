@@ -0,0 +1,209 @@
+"""
+Crawl Throughput Statistics
+
+This module collects the numbers needed to tell whether a crawl is bound by
+the network, the parser or the writes: time spent per stage (with waits for
+the rate limiter counted as throttling, not request time), pages and bytes
+downloaded, retries and cache hits. At the end of a run the stats are
+summarized into a flat dict that is logged and appended as one JSON line to
+a stats file, so crawl performance can be charted across runs.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+# Stages timed by the scraper
+STAGES = ('request', 'throttle', 'parse', 'write', 'checkpoint')
+
+
+class CrawlStats:
+    """
+    Thread-safe counters and stage timers for one crawl run.
+
+    Stage times are summed across worker threads, so with several workers
+    they can exceed the wall-clock duration; their shares show which stage
+    dominates.
+
+    Attributes:
+        pages (int): Pages fetched (including pages served from the cache)
+        bytes_downloaded (int): Body bytes received from the network
+        cache_hits (int): Pages served from the cache or a crawl checkpoint
+        retries (int): Retried requests
+        teams (int): Teams crawled successfully
+        failures (int): Teams whose crawl failed
+    """
+
+    def __init__(self, clock=time.perf_counter):
+        """
+        Initialize empty stats.
+
+        Args:
+            clock (callable): Monotonic clock, overridable for tests
+        """
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._stage_seconds = dict.fromkeys(STAGES, 0.0)
+        self._stage_calls = dict.fromkeys(STAGES, 0)
+        self.started_at = None
+        self.finished_at = None
+        self._start = None
+        self._end = None
+        self.pages = 0
+        self.bytes_downloaded = 0
+        self.cache_hits = 0
+        self.retries = 0
+        self.teams = 0
+        self.failures = 0
+
+    def start(self):
+        """Mark the start of the run."""
+        self.started_at = datetime.now().isoformat()
+        self._start = self._clock()
+
+    def finish(self):
+        """Mark the end of the run."""
+        self.finished_at = datetime.now().isoformat()
+        self._end = self._clock()
+
+    @property
+    def elapsed(self):
+        """Wall-clock seconds since start (until finish, if finished)."""
+        if self._start is None:
+            return 0.0
+        end = self._end if self._end is not None else self._clock()
+        return end - self._start
+
+    @contextmanager
+    def stage(self, name):
+        """
+        Time a block of work as part of a stage.
+
+        Args:
+            name (str): Stage name, e.g. 'request'
+        """
+        start = self._clock()
+        try:
+            yield
+        finally:
+            elapsed = self._clock() - start
+            with self._lock:
+                self._stage_seconds[name] = self._stage_seconds.get(name, 0.0) + elapsed
+                self._stage_calls[name] = self._stage_calls.get(name, 0) + 1
+
+    def reassign(self, seconds, from_stage, to_stage, calls=0):
+        """
+        Move time measured inside one stage to another.
+
+        The transport waits for the rate limiter within the 'request' stage;
+        moving those waits to 'throttle' keeps throttling from looking like
+        network latency.
+
+        Args:
+            seconds (float): Seconds to move
+            from_stage (str): Stage the time was timed in, e.g. 'request'
+            to_stage (str): Stage it belongs to, e.g. 'throttle'
+            calls (int): Calls to count for to_stage
+        """
+        with self._lock:
+            self._stage_seconds[from_stage] = max(0.0, self._stage_seconds.get(from_stage, 0.0) - seconds)
+            self._stage_seconds[to_stage] = self._stage_seconds.get(to_stage, 0.0) + seconds
+            self._stage_calls[to_stage] = self._stage_calls.get(to_stage, 0) + calls
+
+    def add(self, **counts):
+        """
+        Increment counters.
+
+        Args:
+            **counts: Counter names and amounts, e.g. pages=1, bytes_downloaded=512
+        """
+        with self._lock:
+            for name, amount in counts.items():
+                setattr(self, name, getattr(self, name) + amount)
+
+    def summary(self):
+        """
+        Summarize the run.
+
+        Returns:
+            dict: Flat, JSON-serializable summary with run times, counters,
+                pages_per_second, bytes_per_second, and per-stage seconds,
+                calls and share of the total stage time
+        """
+        with self._lock:
+            elapsed = self.elapsed
+            stage_total = sum(self._stage_seconds.values())
+            summary = {
+                'started_at': self.started_at,
+                'finished_at': self.finished_at,
+                'elapsed_s': round(elapsed, 6),
+                'teams': self.teams,
+                'failures': self.failures,
+                'pages': self.pages,
+                'bytes_downloaded': self.bytes_downloaded,
+                'cache_hits': self.cache_hits,
+                'retries': self.retries,
+                'pages_per_second': round(self.pages / elapsed, 3) if elapsed else 0.0,
+                'bytes_per_second': round(self.bytes_downloaded / elapsed, 1) if elapsed else 0.0,
+            }
+            for name, seconds in self._stage_seconds.items():
+                summary[f'{name}_s'] = round(seconds, 6)
+                summary[f'{name}_calls'] = self._stage_calls[name]
+                summary[f'{name}_share'] = round(seconds / stage_total, 4) if stage_total else 0.0
+        return summary
+
+    def bottleneck(self):
+        """
+        Name the stage that took the most time.
+
+        Returns:
+            str: Stage name, or None if nothing was timed
+        """
+        with self._lock:
+            name, seconds = max(self._stage_seconds.items(), key=lambda item: item[1])
+        return name if seconds > 0 else None
+
+    def write(self, path, **extra):
+        """
+        Append the summary as one JSON line to a stats file.
+
+        Args:
+            path (str): Stats file (JSON Lines, one run per line)
+            **extra: Additional fields stored with the run, e.g. season
+
+        Returns:
+            dict: The record written
+        """
+        record = dict(self.summary(), **extra)
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'a') as f:
+            f.write(json.dumps(record) + '\n')
+        return record
+
+    def log_summary(self):
+        """Log the summary as a single structured line."""
+        summary = self.summary()
+        logger.info(f"Crawl summary ({summary['pages_per_second']} pages/s, "
+                    f"bottleneck: {self.bottleneck()}): {json.dumps(summary)}")
+
+
+def read_stats(path):
+    """
+    Read every run recorded in a stats file.
+
+    Args:
+        path (str): Stats file written by CrawlStats.write
+
+    Returns:
+        list: One summary dict per run, oldest first
+    """
+    with open(path, 'r') as f:
+        return [json.loads(line) for line in f if line.strip()]
@@ -0,0 +1,360 @@
+"""
+On-Disk HTTP Response Cache
+
+This module provides a conditional-request cache for the scraper. Responses
+are stored on disk keyed by URL and query parameters together with their
+ETag/Last-Modified validators. On refetch the scraper sends If-None-Match /
+If-Modified-Since and, when the server answers 304 Not Modified, the body is
+served from disk instead of being downloaded again.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+logger = logging.getLogger(__name__)
+
+# Response headers kept with each cached body
+STORED_HEADERS = ['Content-Type', 'ETag', 'Last-Modified', 'Cache-Control']
+
+# Locks serializing file writes per entry (keys are spread over the stripes)
+KEY_LOCK_STRIPES = 64
+
+# Metadata fields every entry must have, with their types
+META_FIELDS = {
+    'url': str,
+    'status_code': int,
+    'headers': dict,
+    'size': int,
+    'validated_at': (int, float),
+}
+
+
+def make_cache_key(url, params=None):
+    """
+    Build a stable cache key for a URL and its query parameters.
+
+    Args:
+        url (str): Request URL
+        params (dict): Query parameters
+
+    Returns:
+        str: Hex digest identifying the request
+    """
+    items = sorted((str(k), str(v)) for k, v in (params or {}).items())
+    raw = json.dumps([url, items], separators=(',', ':'))
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
+class HTTPCache:
+    """
+    A thread-safe on-disk cache of HTTP responses with conditional revalidation.
+
+    Each entry is a body file plus a JSON metadata file. Entries not stored or
+    revalidated within `ttl` seconds are evicted, and the least recently used
+    entries are evicted once the bodies exceed `max_bytes`.
+
+    The in-memory index is guarded by one lock that is never held during file
+    I/O. Files are written and removed under a per-key stripe lock instead,
+    so writers of different entries do not wait for each other's disk.
+
+    Attributes:
+        hits (int): Requests answered from the cache (fresh or 304)
+        misses (int): Requests that downloaded a full, cacheable body
+        revalidations (int): Hits confirmed by a 304 response
+        bytes_saved (int): Body bytes served from disk instead of the network
+        evictions (int): Entries removed by TTL or size limits
+    """
+
+    def __init__(self, cache_dir, ttl=7 * 24 * 3600, max_bytes=512 * 1024 * 1024,
+                 fresh_for=0, clock=time.time):
+        """
+        Initialize the cache and index any entries already on disk.
+
+        Args:
+            cache_dir (str): Directory holding cached responses
+            ttl (float): Seconds an entry survives without being revalidated
+            max_bytes (int): Maximum total size of cached bodies
+            fresh_for (float): Seconds an entry is served without contacting
+                the server at all (default 0: always revalidate)
+            clock (callable): Wall clock, overridable for tests
+        """
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.fresh_for = fresh_for
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._key_locks = [threading.Lock() for _ in range(KEY_LOCK_STRIPES)]
+        self._index = {}
+        self._total_bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.bytes_saved = 0
+        self.evictions = 0
+
+        os.makedirs(cache_dir, exist_ok=True)
+        self._load_index()
+
+    def _meta_path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def _body_path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.body")
+
+    def _key_lock(self, key):
+        """Get the stripe lock guarding an entry's files."""
+        return self._key_locks[int(key[:8], 16) % KEY_LOCK_STRIPES]
+
+    def _load_index(self):
+        """Read entry metadata from disk, dropping unreadable entries."""
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith('.json'):
+                continue
+            key = name[:-len('.json')]
+            try:
+                with open(self._meta_path(key), 'r') as f:
+                    meta = json.load(f)
+                for field, types in META_FIELDS.items():
+                    if not isinstance(meta.get(field), types):
+                        raise ValueError(f"missing or invalid {field}")
+                if not isinstance(meta.setdefault('last_access', meta['validated_at']), (int, float)):
+                    raise ValueError("invalid last_access")
+                if not os.path.exists(self._body_path(key)):
+                    raise FileNotFoundError(self._body_path(key))
+            except (OSError, ValueError, AttributeError) as e:
+                logger.warning(f"Dropping unreadable cache entry {key}: {e}")
+                self._remove_files(key)
+                continue
+            self._index[key] = meta
+            self._total_bytes += meta['size']
+        for key in self._evict_locked():
+            self._remove_files(key)
+
+    def _write_atomic(self, path, data):
+        """Write bytes to a temporary file and rename it into place."""
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def _remove_files(self, key):
+        for path in (self._meta_path(key), self._body_path(key)):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def _drop_locked(self, key):
+        """
+        Remove an entry from the index. Caller holds the lock.
+
+        The entry's files stay on disk until the key is passed to
+        _remove_dropped after the lock is released.
+        """
+        meta = self._index.pop(key, None)
+        if meta is not None:
+            self._total_bytes -= meta['size']
+            self.evictions += 1
+
+    def _remove_dropped(self, keys):
+        """Delete the files of dropped entries unless they were stored again meanwhile."""
+        for key in keys:
+            with self._key_lock(key):
+                with self._lock:
+                    if key in self._index:
+                        continue
+                self._remove_files(key)
+
+    def _evict_locked(self):
+        """
+        Apply TTL and size limits. Caller holds the lock.
+
+        Returns:
+            list: Keys dropped from the index, for _remove_dropped
+        """
+        now = self._clock()
+        dropped = [k for k, m in self._index.items() if now - m['validated_at'] > self.ttl]
+        for key in dropped:
+            self._drop_locked(key)
+        if self._total_bytes > self.max_bytes:
+            for key in sorted(self._index, key=lambda k: self._index[k]['last_access']):
+                if self._total_bytes <= self.max_bytes:
+                    break
+                self._drop_locked(key)
+                dropped.append(key)
+        return dropped
+
+    def lookup(self, url, params=None):
+        """
+        Find the cached entry for a request.
+
+        Args:
+            url (str): Request URL
+            params (dict): Query parameters
+
+        Returns:
+            dict: Entry metadata, or None when nothing usable is cached
+        """
+        key = make_cache_key(url, params)
+        with self._lock:
+            meta = self._index.get(key)
+            expired = meta is not None and self._clock() - meta['validated_at'] > self.ttl
+            if expired:
+                self._drop_locked(key)
+                meta = None
+        if expired:
+            self._remove_dropped([key])
+        return dict(meta, key=key) if meta is not None else None
+
+    def is_fresh(self, entry):
+        """Whether an entry may be served without contacting the server."""
+        return self._clock() - entry['validated_at'] <= self.fresh_for
+
+    def conditional_headers(self, entry):
+        """
+        Build the revalidation headers for a cached entry.
+
+        Args:
+            entry (dict): Entry returned by lookup
+
+        Returns:
+            dict: If-None-Match / If-Modified-Since headers
+        """
+        headers = {}
+        if entry['headers'].get('ETag'):
+            headers['If-None-Match'] = entry['headers']['ETag']
+        if entry['headers'].get('Last-Modified'):
+            headers['If-Modified-Since'] = entry['headers']['Last-Modified']
+        return headers
+
+    def serve(self, entry, revalidated=False):
+        """
+        Build a response from a cached entry and count the hit.
+
+        Args:
+            entry (dict): Entry returned by lookup
+            revalidated (bool): True when the server confirmed it with a 304
+
+        Returns:
+            requests.Response: Response carrying the cached body, or None if
+                the entry disappeared from disk
+        """
+        key = entry['key']
+        try:
+            with open(self._body_path(key), 'rb') as f:
+                body = f.read()
+        except OSError:
+            with self._lock:
+                self._drop_locked(key)
+            self._remove_dropped([key])
+            return None
+
+        with self._lock:
+            meta = self._index.get(key)
+            if meta is not None:
+                meta['last_access'] = self._clock()
+                if revalidated:
+                    meta['validated_at'] = meta['last_access']
+            self.hits += 1
+            self.bytes_saved += len(body)
+            if revalidated:
+                self.revalidations += 1
+        if revalidated and meta is not None:
+            with self._key_lock(key):
+                with self._lock:
+                    # Skip if the entry was replaced or dropped meanwhile
+                    current = self._index.get(key) is meta
+                    data = json.dumps(meta).encode('utf-8')
+                if current:
+                    self._write_atomic(self._meta_path(key), data)
+
+        response = requests.Response()
+        response.status_code = entry['status_code']
+        response._content = body
+        response.headers = CaseInsensitiveDict(entry['headers'])
+        response.url = entry['url']
+        response.encoding = entry.get('encoding')
+        response.from_cache = True
+        return response
+
+    def store(self, url, params, response):
+        """
+        Cache a full response if it can be revalidated later.
+
+        Args:
+            url (str): Request URL
+            params (dict): Query parameters
+            response (requests.Response): Successful response to cache
+
+        Returns:
+            bool: True if the response was stored; responses that cannot be
+                stored are not counted as misses
+        """
+        headers = {h: response.headers[h] for h in STORED_HEADERS if h in response.headers}
+        if not ('ETag' in headers or 'Last-Modified' in headers or self.fresh_for > 0):
+            return False
+        body = response.content
+        if len(body) > self.max_bytes:
+            return False
+        with self._lock:
+            self.misses += 1
+
+        key = make_cache_key(url, params)
+        now = self._clock()
+        meta = {
+            'url': response.url or url,
+            'status_code': response.status_code,
+            'headers': headers,
+            'encoding': response.encoding,
+            'size': len(body),
+            'validated_at': now,
+            'last_access': now,
+        }
+        # Write the files first; the index lock is only taken to publish them
+        with self._key_lock(key):
+            self._write_atomic(self._body_path(key), body)
+            self._write_atomic(self._meta_path(key), json.dumps(meta).encode('utf-8'))
+            with self._lock:
+                old = self._index.pop(key, None)
+                if old is not None:
+                    self._total_bytes -= old['size']
+                self._index[key] = meta
+                self._total_bytes += len(body)
+                dropped = self._evict_locked()
+        self._remove_dropped(dropped)
+        return True
+
+    @property
+    def hit_ratio(self):
+        """Fraction of cacheable lookups answered from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self):
+        """
+        Get cache counters.
+
+        Returns:
+            dict: Hits, misses, revalidations, hit ratio, bytes saved,
+                evictions, entry count and stored bytes
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'revalidations': self.revalidations,
+                'hit_ratio': self.hit_ratio,
+                'bytes_saved': self.bytes_saved,
+                'evictions': self.evictions,
+                'entries': len(self._index),
+                'stored_bytes': self._total_bytes,
+            }
@@ -2,35 +2,97 @@
 NCAA Division II Soccer Data Scraper
 
 This module provides functions for scraping soccer player data from NCAA Division II websites.
+
+Importing the module has no side effects and stays cheap: pandas, requests,
+the parser stack and the scraping modules built on them are imported on
+first use, sys.path is left alone, and logging is configured only by the
+command-line entry point (main). Run it as a package module from the src
+directory, or as a script:
+
+    $ python -m scraping.ncaa_scraper
+    $ python PROJECT/src/scraping/ncaa_scraper.py
 """
 
-import requests
-from bs4 import BeautifulSoup
-import pandas as pd
 import logging
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+if not __package__:
+    # Run as a script: make the scraping package importable
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scraping.checkpoint import content_hash
+from scraping.crawl_stats import CrawlStats
+from scraping.rate_limiter import HostRateLimiter
+from scraping.scheduler import StalenessScheduler
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[logging.FileHandler("scraper.log"), logging.StreamHandler()]
-)
 logger = logging.getLogger(__name__)
 
+# Log file written by the command-line entry point
+LOG_FILE = "scraper.log"
+
+# Team pages, relative to base_url
+TEAM_STATS_PATH = "/teams/{team_id}"
+GAME_LOG_PATH = "/teams/{team_id}/games"
+
+# The game-by-game results table on a team's game log page
+GAME_LOG_ATTRS = {'id': 'game_log'}
+
+# Sink modes an incremental crawl needs: player stats are a full snapshot on
+# every run, game results only the games since the watermark
+INCREMENTAL_SINK_MODES = {'player_stats': 'overwrite', 'game_results': 'append'}
+
 class NCAAStatsScraper:
     """
     A class for scraping NCAA Division II soccer statistics.
+    
+    Attributes:
+        stats (CrawlStats): Throughput stats of the current or last crawl
     """
     
-    def __init__(self, base_url="https://stats.ncaa.org"):
+    def __init__(self, base_url="https://stats.ncaa.org", rate_limiter=None, cache_dir=None, cache=None,
+                 transport=None, record_path=None, replay_path=None, replay_latency=0.0):
         """
         Initialize the scraper with the base URL.
         
         Args:
             base_url (str): Base URL for NCAA stats
+            rate_limiter (HostRateLimiter): Limiter shared by all requests
+                (default: one request per second per host)
+            cache_dir (str): Directory for an on-disk response cache
+                (default: no caching)
+            cache (HTTPCache): Preconfigured cache, overrides cache_dir
+            transport (Transport): Pooled transport with timeouts, retries and
+                circuit breaking (default: Transport using rate_limiter)
+            record_path (str): Archive every request and response to this file
+            replay_path (str): Serve responses from this archive instead of
+                the network (takes precedence over record_path)
+            replay_latency (float or tuple): Seconds added to each replayed
+                response, or a (min, max) range
         """
         self.base_url = base_url
-        self.session = requests.Session()
+        self.rate_limiter = rate_limiter if rate_limiter is not None else HostRateLimiter()
+        if transport is None:
+            from scraping.transport import Transport
+            transport = Transport(rate_limiter=self.rate_limiter)
+        self.transport = transport
+        self.session = transport.session
+        if replay_path is not None:
+            from scraping.replay import enable_replay
+            enable_replay(self.session, replay_path, latency=replay_latency)
+        elif record_path is not None:
+            from scraping.replay import enable_recording
+            enable_recording(self.session, record_path, pool_connections=transport.pool_size,
+                             pool_maxsize=transport.pool_size, max_retries=0)
+        if cache is None and cache_dir is not None:
+            from scraping.http_cache import HTTPCache
+            cache = HTTPCache(cache_dir)
+        self.cache = cache
+        self.stats = CrawlStats()
+        # Checkpoint and frontier key of the team each worker is crawling
+        self._local = threading.local()
         
     def get_teams(self, division=2, season=None):
         """
@@ -43,6 +105,8 @@ class NCAAStatsScraper:
         Returns:
             pd.DataFrame: DataFrame containing team information
         """
+        import pandas as pd
+        
         # This is a placeholder. Actual implementation will depend on the website structure.
         logger.info(f"Getting teams for Division {division}, Season {season}")
         # Placeholder code
@@ -59,48 +123,454 @@ class NCAAStatsScraper:
         Returns:
             pd.DataFrame: DataFrame containing player statistics
         """
-        # This is a placeholder. Actual implementation will depend on the website structure.
         logger.info(f"Getting player stats for team {team_id}, Season {season}")
-        # Placeholder code
-        return pd.DataFrame()
+        response = self._make_request(self._team_url(TEAM_STATS_PATH, team_id), self._season_params(season))
+        return self._parse_stats_table(response)
         
-    def get_game_results(self, team_id, season=None):
+    def get_game_results(self, team_id, season=None, since=None):
         """
         Get game results for a specific team and season.
         
+        Game dates are normalized to ISO strings (YYYY-MM-DD) so they compare
+        with checkpoint watermarks. The site has no date filter, so the whole
+        game log is downloaded and `since` is applied to the parsed table.
+        
         Args:
             team_id (str): NCAA team ID
             season (str): Season year (default: current season)
+            since (str): Only return games played after this ISO date
+                (default: all games)
             
         Returns:
             pd.DataFrame: DataFrame containing game results
         """
-        # This is a placeholder. Actual implementation will depend on the website structure.
-        logger.info(f"Getting game results for team {team_id}, Season {season}")
-        # Placeholder code
-        return pd.DataFrame()
+        logger.info(f"Getting game results for team {team_id}, Season {season}, since {since}")
+        response = self._make_request(self._team_url(GAME_LOG_PATH, team_id), self._season_params(season))
+        return self._parse_game_results(response, since)
         
-    def _make_request(self, url, params=None):
+    def _parse_game_results(self, response, since=None):
+        """
+        Parse a game log page, keeping games played after `since`.
+        
+        Args:
+            response (requests.Response): Fetched game log page
+            since (str): ISO date; earlier games are dropped (default: keep all)
+            
+        Returns:
+            pd.DataFrame: Game results with ISO dates
+        """
+        import pandas as pd
+        
+        games = self._parse_stats_table(response, table_attrs=GAME_LOG_ATTRS)
+        if 'date' in games.columns:
+            games['date'] = pd.to_datetime(games['date'], errors='coerce').dt.strftime('%Y-%m-%d')
+            if since is not None:
+                games = games[games['date'] > since].reset_index(drop=True)
+        return games
+        
+    def crawl_teams(self, team_ids, season=None, max_workers=8, checkpoint=None, incremental=False,
+                    sink=None, stats_path=None):
+        """
+        Crawl several teams concurrently, yielding each team as it completes.
+        
+        Teams are fetched by a bounded thread pool; every request still goes
+        through the shared per-host rate limiter. At most `max_workers * 2`
+        teams are queued at once so long crawls keep memory bounded.
+        
+        With a checkpoint, each team's outcome is recorded as it completes and
+        an interrupted crawl resumes with the teams it had not finished. Pages
+        already fetched for those teams are served from the checkpoint, so the
+        resumed crawl only requests the pages it never got. With a sink, each
+        team's tables are written out as soon as the team completes.
+        
+        An incremental crawl requests each team's game log conditionally, with
+        the ETag / Last-Modified saved alongside the team's watermark for the
+        season. A 304 Not Modified means no game was played since: the stats
+        page is skipped and the team comes back 'unchanged'. Otherwise both
+        pages are fetched in full, as the site cannot filter by date, and only
+        the games after the watermark are returned.
+        
+        Request, throttle (rate limiter waits), parse, write and checkpoint
+        times, pages, bytes, retries and cache hits are collected in
+        `self.stats`; a summary is logged when the crawl ends and appended
+        to `stats_path` if given.
+        
+        Args:
+            team_ids (iterable): NCAA team IDs to crawl
+            season (str): Season year (default: current season)
+            max_workers (int): Maximum number of concurrent workers
+            checkpoint (CrawlCheckpoint): Store for resumable crawl state
+            incremental (bool): Revalidate each team's game log and return
+                only games newer than its watermark in the checkpoint
+            sink (DataSink): Destination for each team's tables; teams found
+                unchanged are not written
+            stats_path (str): JSON Lines file the run's summary is appended to
+            
+        Yields:
+            dict: {'team_id', 'player_stats', 'game_results', 'error'} for each
+                team, in completion order. 'error' is None on success. With a
+                checkpoint, 'changed' tells whether the team's data differs
+                from the last completed crawl. Teams an incremental crawl
+                found not modified have 'unchanged' True and both tables None.
+            
+        Raises:
+            ValueError: If incremental is requested without a checkpoint, or
+                with a sink whose modes differ from INCREMENTAL_SINK_MODES
+        """
+        if incremental and checkpoint is None:
+            raise ValueError("Incremental crawls require a checkpoint")
+        if incremental and sink is not None:
+            for dataset, mode in INCREMENTAL_SINK_MODES.items():
+                if sink.mode_for(dataset) not in (None, mode):
+                    raise ValueError(f"Incremental crawls must {mode} {dataset} in the sink, "
+                                     f"e.g. PartitionedParquetSink(root, mode={INCREMENTAL_SINK_MODES!r})")
+        
+        if checkpoint is not None:
+            keys = {self._team_key(team_id, season): team_id for team_id in team_ids}
+            remaining = checkpoint.start_run(keys)
+            logger.info(f"Crawling {len(remaining)} of {len(keys)} teams "
+                        f"({len(keys) - len(remaining)} already done)")
+            team_ids = [keys[key] for key in remaining]
+        
+        team_ids = iter(team_ids)
+        max_pending = max_workers * 2
+        self.stats = stats = CrawlStats()
+        stats.start()
+        retries_before = self.transport.retries
+        throttle_before = (self.transport.throttle_seconds, self.transport.throttled)
+        
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                pending = {}
+                
+                def submit_next():
+                    for team_id in team_ids:
+                        since = checkpoint.get_watermark(team_id, season) if incremental else None
+                        validators = checkpoint.get_validators(team_id, season) if since is not None else None
+                        future = executor.submit(self._crawl_frontier_team, checkpoint, team_id, season,
+                                                 since, validators)
+                        pending[future] = team_id
+                        return True
+                    return False
+                
+                while len(pending) < max_pending and submit_next():
+                    pass
+                
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        team_id = pending.pop(future)
+                        try:
+                            result = future.result()
+                        except Exception as e:
+                            logger.error(f"Crawl failed for team {team_id}: {e}")
+                            result = {'team_id': team_id, 'player_stats': None,
+                                      'game_results': None, 'error': e}
+                        if result['error'] is None:
+                            stats.add(teams=1)
+                        else:
+                            stats.add(failures=1)
+                        if sink is not None and result['error'] is None and not result.get('unchanged'):
+                            with stats.stage('write'):
+                                self._write_team(sink, result, season)
+                        if checkpoint is not None:
+                            with stats.stage('checkpoint'):
+                                self._record_team(checkpoint, result, season)
+                        yield result
+                        submit_next()
+        finally:
+            stats.finish()
+            stats.add(retries=self.transport.retries - retries_before)
+            stats.reassign(self.transport.throttle_seconds - throttle_before[0], 'request', 'throttle',
+                           calls=self.transport.throttled - throttle_before[1])
+            stats.log_summary()
+            if stats_path is not None:
+                stats.write(stats_path, season=season)
+        
+    def plan_crawl(self, team_ids, checkpoint, budget, season=None, scheduler=None):
+        """
+        Choose which teams to crawl this run within a request budget.
+        
+        Team staleness is estimated from the checkpoint's fetch history and
+        game-date watermarks; see StalenessScheduler.
+        
+        Args:
+            team_ids (iterable): Candidate NCAA team IDs
+            checkpoint (CrawlCheckpoint): Store holding past crawl state
+            budget (int): Maximum number of requests for the run
+            season (str): Season year (default: current season)
+            scheduler (StalenessScheduler): Scoring policy (default settings if None)
+            
+        Returns:
+            list: Team IDs to pass to crawl_teams, most valuable first
+        """
+        scheduler = scheduler or StalenessScheduler()
+        teams = []
+        for team_id in team_ids:
+            history = checkpoint.get_fetch_history(self._team_key(team_id, season))
+            teams.append(dict(history, team_id=team_id,
+                              last_game_date=checkpoint.get_watermark(team_id, season)))
+        plan = scheduler.plan(teams, budget)
+        logger.info(f"Scheduled {len(plan)} of {len(teams)} teams within a budget of {budget} requests")
+        return plan
+        
+    def _crawl_frontier_team(self, checkpoint, team_id, season=None, since=None, validators=None):
+        """
+        Crawl one team, saving its pages to the checkpoint as they are fetched.
+        
+        Args:
+            checkpoint (CrawlCheckpoint): Checkpoint store, or None
+            team_id (str): NCAA team ID
+            season (str): Season year (default: current season)
+            since (str): Only return games played after this ISO date
+            validators (dict): Revalidation headers for the game log
+            
+        Returns:
+            dict: Crawl result for the team
+        """
+        if checkpoint is not None:
+            self._local.frontier = (checkpoint, self._team_key(team_id, season))
+        try:
+            return self._crawl_team(team_id, season, since=since, validators=validators)
+        finally:
+            self._local.frontier = None
+        
+    def _crawl_team(self, team_id, season=None, since=None, validators=None):
+        """
+        Fetch every page for one team.
+        
+        The game log is fetched first, conditionally when validators are
+        given; if it was not modified, the stats page is not fetched.
+        
+        Args:
+            team_id (str): NCAA team ID
+            season (str): Season year (default: current season)
+            since (str): Only return games played after this ISO date
+            validators (dict): Revalidation headers for the game log
+            
+        Returns:
+            dict: Crawl result for the team, with the game log's validators
+        """
+        logger.info(f"Crawling team {team_id}, Season {season}, since {since}")
+        game_log = self._make_request(self._team_url(GAME_LOG_PATH, team_id), self._season_params(season),
+                                      headers=validators or None)
+        if game_log.status_code == 304:
+            return {'team_id': team_id, 'player_stats': None, 'game_results': None, 'error': None,
+                    'unchanged': True}
+        return {
+            'team_id': team_id,
+            'player_stats': self.get_player_stats(team_id, season),
+            'game_results': self._parse_game_results(game_log, since),
+            'error': None,
+            'validators': self._validators(game_log),
+        }
+        
+    def _validators(self, response):
+        """Revalidation headers for a fetched page."""
+        headers = {}
+        if response.headers.get('ETag'):
+            headers['If-None-Match'] = response.headers['ETag']
+        if response.headers.get('Last-Modified'):
+            headers['If-Modified-Since'] = response.headers['Last-Modified']
+        return headers
+        
+    def _team_url(self, path, team_id):
+        """Absolute URL of one of a team's pages."""
+        return self.base_url.rstrip('/') + path.format(team_id=team_id)
+        
+    def _season_params(self, season=None):
+        """Query parameters selecting a season, or None for the current one."""
+        return {'year': season} if season is not None else None
+        
+    def _team_key(self, team_id, season=None):
+        """Frontier key identifying one team's crawl for a season."""
+        return f"team/{team_id}/season/{season or 'current'}"
+        
+    def _write_team(self, sink, result, season=None):
+        """
+        Write a team's tables to a sink and finalize its partitions.
+        
+        Args:
+            sink (DataSink): Output sink
+            result (dict): Successful crawl result
+            season (str): Season year
+        """
+        for dataset in ('player_stats', 'game_results'):
+            sink.write(dataset, result[dataset], season, result['team_id'])
+            sink.finish_partition(dataset, season, result['team_id'])
+        
+    def _record_team(self, checkpoint, result, season=None):
+        """
+        Record a team's crawl outcome in the checkpoint.
+        
+        Args:
+            checkpoint (CrawlCheckpoint): Checkpoint store
+            result (dict): Crawl result, updated in place with 'changed'
+            season (str): Season year
+        """
+        key = self._team_key(result['team_id'], season)
+        if result['error'] is not None:
+            checkpoint.mark_failed(key, result['error'])
+            return
+        if result.get('unchanged'):
+            entry = checkpoint.get_entry(key)
+            result['changed'] = checkpoint.mark_done(key, entry['content_hash'] if entry else None)
+            return
+        
+        digest = content_hash(''.join(
+            frame.to_csv(index=False) for frame in (result['player_stats'], result['game_results'])
+            if frame is not None
+        ))
+        result['changed'] = checkpoint.mark_done(key, digest)
+        
+        games = result['game_results']
+        # Dates that failed to parse are NaN and must not become the watermark
+        if games is not None and 'date' in games.columns and games['date'].notna().any():
+            checkpoint.set_watermark(result['team_id'], games['date'].dropna().max(), season=season,
+                                     validators=result.get('validators'))
+        
+    def _parse_stats_table(self, response, table_attrs=None):
+        """
+        Parse a stats table from a page into typed columns.
+        
+        Args:
+            response (requests.Response): Fetched page
+            table_attrs (dict): Attributes identifying the table
+                (default: the player stats grid)
+            
+        Returns:
+            pd.DataFrame: Parsed table
+        """
+        from scraping.stats_parser import parse_stats_table
+        
+        with self.stats.stage('parse'):
+            return parse_stats_table(response.content, table_attrs=table_attrs)
+        
+    def _make_request(self, url, params=None, headers=None):
         """
         Helper method to make HTTP requests with error handling.
         
+        During a checkpointed crawl, a page saved by an interrupted run is
+        returned without sending a request, and every page fetched is saved.
+        
+        Args:
+            url (str): URL to request
+            params (dict): Query parameters
+            headers (dict): Conditional request headers; the response may
+                then be a 304 Not Modified
+            
+        Returns:
+            requests.Response: Response object
+        """
+        import requests
+        
+        frontier = getattr(self._local, 'frontier', None)
+        if frontier is not None:
+            page_url = requests.Request('GET', url, params=params).prepare().url
+            saved = frontier[0].get_page(page_url)
+            if saved is not None:
+                self.stats.add(pages=1, cache_hits=1)
+                return self._saved_response(saved)
+        
+        with self.stats.stage('request'):
+            response = self._fetch(url, params, headers)
+        if frontier is not None:
+            checkpoint, key = frontier
+            checkpoint.save_page(page_url, key, response.content, {
+                'url': response.url, 'status_code': response.status_code,
+                'headers': dict(response.headers), 'encoding': response.encoding,
+            })
+        return response
+        
+    def _saved_response(self, page):
+        """
+        Rebuild a response from a page saved in the checkpoint.
+        
+        Args:
+            page (dict): Page returned by CrawlCheckpoint.get_page
+            
+        Returns:
+            requests.Response: Response carrying the saved body
+        """
+        import requests
+        from requests.structures import CaseInsensitiveDict
+        
+        meta = page['meta']
+        response = requests.Response()
+        response.status_code = meta['status_code']
+        response._content = page['content']
+        response.headers = CaseInsensitiveDict(meta['headers'])
+        response.url = meta['url']
+        response.encoding = meta['encoding']
+        response.from_checkpoint = True
+        return response
+        
+    def _fetch(self, url, params=None, headers=None):
+        """
+        Fetch a page through the cache and the transport.
+        
+        Conditional requests from the caller bypass the cache, so that a 304
+        reaches the caller instead of being answered with the cached page.
+        
         Args:
             url (str): URL to request
             params (dict): Query parameters
+            headers (dict): Conditional request headers from the caller
             
         Returns:
             requests.Response: Response object
         """
+        import requests
+        
+        cached = self.cache.lookup(url, params) if self.cache is not None and headers is None else None
+        if cached is not None:
+            if self.cache.is_fresh(cached):
+                response = self.cache.serve(cached)
+                if response is not None:
+                    self.stats.add(pages=1, cache_hits=1)
+                    return response
+            headers = self.cache.conditional_headers(cached)
+        
         try:
-            response = self.session.get(url, params=params)
+            response = self.transport.get(url, params=params, headers=headers)
+            if cached is not None and response.status_code == 304:
+                cached_response = self.cache.serve(cached, revalidated=True)
+                if cached_response is not None:
+                    self.stats.add(pages=1, cache_hits=1)
+                    return cached_response
+                # Entry vanished from disk: refetch without validators
+                response = self.transport.get(url, params=params)
             response.raise_for_status()
+            self.stats.add(pages=1, bytes_downloaded=len(response.content))
+            if response.status_code == 304:
+                return response
+            if self.cache is not None:
+                self.cache.store(url, params, response)
             return response
         except requests.exceptions.RequestException as e:
             logger.error(f"Request failed: {e}")
             raise
 
+def configure_logging(log_file=LOG_FILE, level=logging.INFO):
+    """
+    Send log records to a file and the console.
+    
+    Only the command-line entry point calls this; library users configure
+    logging themselves.
+    
+    Args:
+        log_file (str): File to append log records to
+        level (int): Minimum level to log
+    """
+    logging.basicConfig(
+        level=level,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[logging.FileHandler(log_file), logging.StreamHandler()]
+    )
+
 def main():
     """Test the scraper functionality."""
+    configure_logging()
     scraper = NCAAStatsScraper()
     
     # Example usage (commented out as these are placeholders)
@@ -0,0 +1,126 @@
+"""
+Per-Host Rate Limiting
+
+This module provides a thread-safe token-bucket rate limiter that keeps one
+bucket per host, so concurrent scraper workers stay polite to each site.
+"""
+
+import threading
+import time
+from urllib.parse import urlparse
+
+
+class TokenBucket:
+    """
+    A thread-safe token bucket.
+
+    Tokens refill continuously at `rate` per second up to `capacity`. Each
+    request takes one token and waits when the bucket is empty.
+    """
+
+    def __init__(self, rate, capacity=1, clock=time.monotonic, sleep=time.sleep):
+        """
+        Initialize the bucket full.
+
+        Args:
+            rate (float): Tokens added per second
+            capacity (int): Maximum number of tokens (burst size)
+            clock (callable): Monotonic clock, overridable for tests
+            sleep (callable): Sleep function, overridable for tests
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(capacity)
+        self._last_refill = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        """Add the tokens earned since the last refill. Caller holds the lock."""
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._last_refill) * self.rate)
+        self._last_refill = now
+
+    def try_acquire(self):
+        """
+        Take a token without waiting.
+
+        Returns:
+            float: 0 if a token was taken, otherwise seconds until one is available
+        """
+        with self._lock:
+            self._refill()
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+
+    def acquire(self):
+        """
+        Take a token, waiting until one is available.
+
+        Returns:
+            float: Total seconds spent waiting
+        """
+        waited = 0.0
+        while True:
+            wait = self.try_acquire()
+            if wait == 0:
+                return waited
+            # Sleep outside the lock so other threads can refill and check
+            self._sleep(wait)
+            waited += wait
+
+
+class HostRateLimiter:
+    """
+    A collection of token buckets keyed by URL host.
+
+    One limiter is shared by every worker of a crawl, so the total request
+    rate to each host stays within its budget however many threads run.
+    """
+
+    def __init__(self, rate=1.0, capacity=1, host_rates=None):
+        """
+        Initialize the limiter.
+
+        Args:
+            rate (float): Default requests per second for each host
+            capacity (int): Default burst size for each host
+            host_rates (dict): Optional per-host overrides as
+                {host: rate} or {host: (rate, capacity)}
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.host_rates = host_rates or {}
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def _get_bucket(self, host):
+        """Get or create the bucket for a host."""
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                override = self.host_rates.get(host, (self.rate, self.capacity))
+                if not isinstance(override, tuple):
+                    override = (override, self.capacity)
+                bucket = TokenBucket(*override)
+                self._buckets[host] = bucket
+            return bucket
+
+    def acquire(self, url):
+        """
+        Wait for permission to send a request to the URL's host.
+
+        Args:
+            url (str): URL about to be requested
+
+        Returns:
+            float: Seconds spent waiting
+        """
+        return self._get_bucket(urlparse(url).netloc).acquire()
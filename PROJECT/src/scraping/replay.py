@@ -0,0 +1,209 @@
+"""
+HTTP Record and Replay
+
+This module lets the scraper run against an archive instead of the live
+site. In record mode a transport adapter passes requests through and
+appends every request/response pair to a JSON Lines archive. In replay mode
+another adapter serves the archived responses back deterministically, with
+optional latency injection so concurrency gains can be measured offline.
+
+Both adapters mount on the scraper's requests session, so everything above
+the session (transport retries, cache, parsing) runs unchanged.
+"""
+
+import base64
+import json
+import random
+import threading
+import time
+from collections import defaultdict
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+# Request headers kept in the archive (enough to understand conditional requests)
+RECORDED_REQUEST_HEADERS = ['Accept', 'If-None-Match', 'If-Modified-Since']
+
+
+class ReplayMissError(requests.exceptions.RequestException):
+    """Raised in replay mode when a request has no archived response."""
+
+
+def request_key(method, url):
+    """Key matching a live request to archived exchanges."""
+    return f"{method.upper()} {url}"
+
+
+class RecordingAdapter(HTTPAdapter):
+    """
+    A transport adapter that records every exchange it sends.
+
+    Attributes:
+        path (str): Archive file exchanges are appended to
+        recorded (int): Number of exchanges recorded
+    """
+
+    def __init__(self, path, **kwargs):
+        """
+        Initialize the adapter.
+
+        Args:
+            path (str): JSON Lines archive to append to
+            **kwargs: Passed to HTTPAdapter (pool settings)
+        """
+        super().__init__(**kwargs)
+        self.path = path
+        self.recorded = 0
+        self._lock = threading.Lock()
+
+    def send(self, request, **kwargs):
+        """Send the request and append the exchange to the archive."""
+        start = time.perf_counter()
+        response = super().send(request, **kwargs)
+        # Reading content here buffers streamed bodies, which is fine for pages
+        body = response.content
+        entry = {
+            'method': request.method,
+            'url': request.url,
+            'request_headers': {h: request.headers[h] for h in RECORDED_REQUEST_HEADERS
+                                if h in request.headers},
+            'status_code': response.status_code,
+            'reason': response.reason,
+            'headers': dict(response.headers),
+            'body': base64.b64encode(body).decode('ascii'),
+            'elapsed': time.perf_counter() - start,
+        }
+        line = json.dumps(entry) + '\n'
+        with self._lock:
+            with open(self.path, 'a') as f:
+                f.write(line)
+            self.recorded += 1
+        return response
+
+
+class ReplayAdapter(BaseAdapter):
+    """
+    A transport adapter serving responses from a recorded archive.
+
+    Requests are matched on method and full URL. When the same request was
+    recorded several times, the recordings are served in order and the last
+    one is repeated, so replays are deterministic.
+
+    Attributes:
+        served (int): Number of responses served
+        misses (int): Number of requests with no archived response
+    """
+
+    def __init__(self, path, latency=0.0, use_recorded_latency=False, seed=0, sleep=time.sleep):
+        """
+        Load an archive for replay.
+
+        Args:
+            path (str): JSON Lines archive written by RecordingAdapter
+            latency (float or tuple): Seconds added to every response, or a
+                (min, max) range sampled uniformly
+            use_recorded_latency (bool): Wait as long as the original request
+                took instead of using `latency`
+            seed (int): Seed for sampled latencies
+            sleep (callable): Sleep function, overridable for tests
+        """
+        super().__init__()
+        self.path = path
+        self.latency = latency
+        self.use_recorded_latency = use_recorded_latency
+        self._random = random.Random(seed)
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._positions = defaultdict(int)
+        self.served = 0
+        self.misses = 0
+
+        self._exchanges = defaultdict(list)
+        with open(path, 'r') as f:
+            for line in f:
+                if line.strip():
+                    entry = json.loads(line)
+                    self._exchanges[request_key(entry['method'], entry['url'])].append(entry)
+
+    def _next_exchange(self, key):
+        """Pick the next recording for a request. Caller holds the lock."""
+        recordings = self._exchanges.get(key)
+        if not recordings:
+            return None
+        position = self._positions[key]
+        self._positions[key] = position + 1
+        return recordings[min(position, len(recordings) - 1)]
+
+    def _delay(self, entry):
+        """Seconds to wait before serving an exchange. Caller holds the lock."""
+        if self.use_recorded_latency:
+            return entry.get('elapsed', 0.0)
+        if isinstance(self.latency, tuple):
+            return self._random.uniform(*self.latency)
+        return self.latency
+
+    def send(self, request, **kwargs):
+        """Serve the archived response for a request."""
+        key = request_key(request.method, request.url)
+        with self._lock:
+            entry = self._next_exchange(key)
+            if entry is None:
+                self.misses += 1
+            else:
+                self.served += 1
+                delay = self._delay(entry)
+        if entry is None:
+            raise ReplayMissError(f"No recorded response for {key}", request=request)
+        if delay > 0:
+            self._sleep(delay)
+
+        response = requests.Response()
+        response.status_code = entry['status_code']
+        response.reason = entry.get('reason')
+        response.headers = CaseInsensitiveDict(entry['headers'])
+        response._content = base64.b64decode(entry['body'])
+        response.url = request.url
+        response.request = request
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response.connection = self
+        return response
+
+    def close(self):
+        """Nothing to release; present for the adapter interface."""
+
+
+def enable_recording(session, path, **adapter_kwargs):
+    """
+    Record every request a session sends.
+
+    Args:
+        session (requests.Session): Session to record
+        path (str): Archive file to append to
+        **adapter_kwargs: Passed to the adapter (pool settings)
+
+    Returns:
+        RecordingAdapter: The mounted adapter
+    """
+    adapter = RecordingAdapter(path, **adapter_kwargs)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return adapter
+
+
+def enable_replay(session, path, **replay_kwargs):
+    """
+    Serve every request a session sends from an archive.
+
+    Args:
+        session (requests.Session): Session to replay into
+        path (str): Archive written in record mode
+        **replay_kwargs: Passed to ReplayAdapter (latency settings)
+
+    Returns:
+        ReplayAdapter: The mounted adapter
+    """
+    adapter = ReplayAdapter(path, **replay_kwargs)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return adapter
@@ -0,0 +1,151 @@
+"""
+Staleness-Based Crawl Scheduler
+
+This module decides which teams are worth refreshing on a given run. Each
+team is scored by the probability that its pages changed since they were
+last fetched, estimated from:
+
+- how often past fetches found changed content (smoothed change rate),
+- how long ago the team was last fetched, and
+- how recently the team last played (idle teams rarely change).
+
+Given a request budget, teams are picked greedily by score per page so the
+highest-value pages are fetched first.
+"""
+
+from datetime import datetime, date
+
+# Pages fetched per team: player stats and game results
+DEFAULT_PAGES_PER_TEAM = 2
+
+
+def _to_datetime(value):
+    """Parse an ISO string or date into a datetime (None passes through)."""
+    if value is None or isinstance(value, datetime):
+        return value
+    if isinstance(value, date):
+        return datetime(value.year, value.month, value.day)
+    return datetime.fromisoformat(str(value))
+
+
+class StalenessScheduler:
+    """
+    Rank teams by expected staleness and plan crawls within a request budget.
+
+    Team state is a dict with:
+        team_id: NCAA team ID
+        last_fetched_at: When the team was last crawled (None if never)
+        last_game_date: Date of the newest game seen for the team
+        fetch_count: Number of completed fetches
+        change_count: Number of fetches that found changed content
+        pages (optional): Requests needed to refresh the team
+    """
+
+    def __init__(self, pages_per_team=DEFAULT_PAGES_PER_TEAM, prior_changes=1, prior_fetches=2,
+                 activity_halflife_days=7, clock=datetime.now):
+        """
+        Initialize the scheduler.
+
+        Args:
+            pages_per_team (int): Default requests needed to refresh one team
+            prior_changes (float): Pseudo-count of changes added to every team's history
+            prior_fetches (float): Pseudo-count of fetches added to every team's history
+            activity_halflife_days (float): Days after a team's last game at
+                which its activity weight halves
+            clock (callable): Returns the current datetime, overridable for tests
+        """
+        self.pages_per_team = pages_per_team
+        self.prior_changes = prior_changes
+        self.prior_fetches = prior_fetches
+        self.activity_halflife_days = activity_halflife_days
+        self._clock = clock
+
+    def change_rate(self, team):
+        """
+        Smoothed probability that one fetch finds changed content.
+
+        Args:
+            team (dict): Team state
+
+        Returns:
+            float: Change probability per fetch
+        """
+        changes = team.get('change_count', 0) + self.prior_changes
+        fetches = team.get('fetch_count', 0) + self.prior_fetches
+        return min(1.0, changes / fetches)
+
+    def score(self, team):
+        """
+        Estimate the probability that a team's pages are stale.
+
+        Args:
+            team (dict): Team state
+
+        Returns:
+            float: Staleness score between 0 and 1
+        """
+        now = self._clock()
+        last_fetched = _to_datetime(team.get('last_fetched_at'))
+        if last_fetched is None:
+            return 1.0
+
+        last_game = _to_datetime(team.get('last_game_date'))
+        if last_game is not None and last_game.date() >= last_fetched.date():
+            # A game on or after the last fetch day has not been picked up yet
+            return 1.0
+
+        days_since_fetch = max(0.0, (now - last_fetched).total_seconds() / 86400)
+        # Past fetches were roughly daily, so the per-fetch rate is per day
+        stale = 1 - (1 - self.change_rate(team)) ** days_since_fetch
+
+        if last_game is not None:
+            days_since_game = max(0.0, (now - last_game).total_seconds() / 86400)
+            stale *= 0.5 ** (days_since_game / self.activity_halflife_days)
+        return stale
+
+    def rank(self, teams):
+        """
+        Rank teams by expected staleness per requested page.
+
+        Args:
+            teams (iterable): Team states
+
+        Returns:
+            list: Team states with 'score' and 'value' (score per page) added,
+                highest value first; ties keep input order
+        """
+        ranked = []
+        for team in teams:
+            pages = team.get('pages') or self.pages_per_team
+            score = self.score(team)
+            ranked.append(dict(team, score=score, value=score / pages, pages=pages))
+        ranked.sort(key=lambda t: -t['value'])
+        return ranked
+
+    def plan(self, teams, budget, min_score=0.0):
+        """
+        Pick the teams to fetch within a request budget.
+
+        Teams are taken in ranked order; a team that does not fit the
+        remaining budget is skipped so cheaper teams further down can still
+        be scheduled.
+
+        Args:
+            teams (iterable): Team states
+            budget (int): Maximum number of requests for the run
+            min_score (float): Skip teams less likely than this to be stale
+
+        Returns:
+            list: Team IDs to fetch, most valuable first
+        """
+        planned = []
+        remaining = budget
+        for team in self.rank(teams):
+            if team['score'] <= min_score:
+                continue
+            if team['pages'] <= remaining:
+                planned.append(team['team_id'])
+                remaining -= team['pages']
+            if remaining <= 0:
+                break
+        return planned
@@ -0,0 +1,284 @@
+"""
+Scraped Data Sinks
+
+This module provides sinks the crawler writes to as each team completes,
+so a full crawl never has to hold every table in memory. The partitioned
+sink writes compact Parquet files laid out by dataset, season and team:
+
+    <root>/<dataset>/season=<season>/team_id=<team_id>/part-00000.parquet
+
+Part files are first written to a staging directory (<root>/_staging/...)
+and only moved into the partition, with a _SUCCESS marker, once it is
+complete. Downstream jobs can start reading finished partitions while the
+crawl is still running, and a crawl that fails mid-partition leaves the
+previous contents in place.
+"""
+
+import logging
+import os
+import shutil
+import threading
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+SUCCESS_MARKER = '_SUCCESS'
+
+# Directory under the root holding partitions that are still being written
+STAGING_DIR = '_staging'
+
+WRITE_MODES = ('overwrite', 'append')
+
+
+class DataSink:
+    """
+    Base class for crawl output sinks.
+
+    Subclasses implement write and finish_partition; close flushes anything
+    still buffered. Sinks can be used as context managers.
+    """
+
+    def write(self, dataset, frame, season, team_id):
+        """
+        Add rows to a partition.
+
+        Args:
+            dataset (str): Dataset name, e.g. 'player_stats'
+            frame (pd.DataFrame): Rows to write
+            season (str): Season the rows belong to
+            team_id (str): Team the rows belong to
+        """
+        raise NotImplementedError
+
+    def finish_partition(self, dataset, season, team_id):
+        """
+        Mark a partition as complete.
+
+        Args:
+            dataset (str): Dataset name
+            season (str): Season of the partition
+            team_id (str): Team of the partition
+        """
+        raise NotImplementedError
+
+    def mode_for(self, dataset):
+        """
+        Tell how a rerun treats a dataset's existing partitions.
+
+        Args:
+            dataset (str): Dataset name
+
+        Returns:
+            str: 'overwrite' or 'append', or None if the sink does not say
+        """
+        return None
+
+    def close(self):
+        """Flush buffered rows and release resources."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class PartitionedParquetSink(DataSink):
+    """
+    A sink writing Parquet files partitioned by season and team.
+
+    Rows are buffered per partition and flushed to a new part file whenever
+    a partition's buffer reaches `flush_rows`, keeping memory bounded even
+    for very large partitions. Part files go to a staging directory until
+    finish_partition swaps them in.
+
+    Attributes:
+        rows_written (int): Total rows written to part files
+        files_written (int): Total part files written
+        bytes_written (int): Total size of part files written
+    """
+
+    def __init__(self, root_dir, flush_rows=50_000, compression='zstd', mode='overwrite'):
+        """
+        Initialize the sink.
+
+        Args:
+            root_dir (str): Root directory of the output dataset
+            flush_rows (int): Buffered rows per partition before a part file is written
+            compression (str): Parquet compression codec
+            mode (str or dict): 'overwrite' replaces a partition's files from
+                earlier runs when the partition is finished; 'append' adds the
+                new parts to them. A dict maps dataset names to modes, with
+                'overwrite' for datasets it does not list; incremental crawls
+                need {'game_results': 'append'}
+
+        Raises:
+            ValueError: If a mode is not 'overwrite' or 'append'
+        """
+        for value in (mode.values() if isinstance(mode, dict) else [mode]):
+            if value not in WRITE_MODES:
+                raise ValueError(f"Unsupported mode '{value}', expected 'overwrite' or 'append'")
+        self.root_dir = root_dir
+        self.flush_rows = flush_rows
+        self.compression = compression
+        self.mode = mode
+        self._buffers = {}
+        self._part_numbers = {}
+        self._lock = threading.Lock()
+        self.rows_written = 0
+        self.files_written = 0
+        self.bytes_written = 0
+
+    def partition_dir(self, dataset, season, team_id):
+        """
+        Get the directory of a partition.
+
+        Args:
+            dataset (str): Dataset name
+            season (str): Season of the partition
+            team_id (str): Team of the partition
+
+        Returns:
+            str: Partition directory path
+        """
+        return os.path.join(self.root_dir, dataset, f"season={season or 'current'}", f"team_id={team_id}")
+
+    def mode_for(self, dataset):
+        """Write mode of a dataset ('overwrite' or 'append')."""
+        if isinstance(self.mode, dict):
+            return self.mode.get(dataset, 'overwrite')
+        return self.mode
+
+    def _staging_dir(self, dataset, season, team_id):
+        """Directory a partition's part files are written to until it is finished."""
+        return os.path.join(self.root_dir, STAGING_DIR, os.path.relpath(
+            self.partition_dir(dataset, season, team_id), self.root_dir))
+
+    def write(self, dataset, frame, season, team_id):
+        """Buffer rows for a partition, flushing a part file when full."""
+        if frame is None or frame.empty:
+            return
+        key = (dataset, season, team_id)
+        with self._lock:
+            self._open_partition_locked(key)
+            buffer = self._buffers.setdefault(key, [])
+            buffer.append(frame)
+            if sum(len(f) for f in buffer) >= self.flush_rows:
+                self._flush_locked(key)
+
+    def finish_partition(self, dataset, season, team_id):
+        """
+        Flush a partition and swap its staged parts in.
+
+        In overwrite mode the staged directory, with its _SUCCESS marker,
+        replaces the partition; in append mode the staged parts are moved
+        next to the existing ones. Writing to the partition again starts a
+        new staging round.
+        """
+        key = (dataset, season, team_id)
+        with self._lock:
+            self._open_partition_locked(key)
+            self._flush_locked(key)
+            staging = self._staging_dir(*key)
+            directory = self.partition_dir(*key)
+            if self.mode_for(dataset) == 'overwrite':
+                self._write_atomic(os.path.join(staging, SUCCESS_MARKER), b'')
+                old = f"{staging}.old"
+                shutil.rmtree(old, ignore_errors=True)
+                if os.path.isdir(directory):
+                    os.replace(directory, old)
+                os.makedirs(os.path.dirname(directory), exist_ok=True)
+                os.replace(staging, directory)
+                shutil.rmtree(old, ignore_errors=True)
+            else:
+                os.makedirs(directory, exist_ok=True)
+                for name in sorted(os.listdir(staging)):
+                    os.replace(os.path.join(staging, name), os.path.join(directory, name))
+                self._write_atomic(os.path.join(directory, SUCCESS_MARKER), b'')
+                os.rmdir(staging)
+            del self._part_numbers[key]
+
+    def close(self):
+        """Flush every buffered partition without finishing it; its parts stay staged."""
+        with self._lock:
+            for key in list(self._buffers):
+                self._flush_locked(key)
+
+    def _open_partition_locked(self, key):
+        """
+        Prepare a partition's staging directory the first time it is written. Caller holds the lock.
+
+        Parts staged by an earlier, unfinished run are discarded. In append
+        mode new parts are numbered after the partition's existing ones.
+        """
+        if key in self._part_numbers:
+            return
+        staging = self._staging_dir(*key)
+        shutil.rmtree(staging, ignore_errors=True)
+        os.makedirs(staging)
+        part = 0
+        directory = self.partition_dir(*key)
+        if self.mode_for(key[0]) == 'append' and os.path.isdir(directory):
+            part = max((int(name[len('part-'):-len('.parquet')]) + 1 for name in os.listdir(directory)
+                        if name.startswith('part-') and name.endswith('.parquet')), default=0)
+        self._part_numbers[key] = part
+
+    def _flush_locked(self, key):
+        """Write a partition's buffered rows as a new part file. Caller holds the lock."""
+        frames = self._buffers.pop(key, None)
+        if not frames:
+            return
+        frame = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+
+        directory = self._staging_dir(*key)
+        part = self._part_numbers[key]
+        self._part_numbers[key] = part + 1
+
+        path = os.path.join(directory, f"part-{part:05d}.parquet")
+        tmp_path = f"{path}.tmp"
+        frame.to_parquet(tmp_path, index=False, compression=self.compression)
+        os.replace(tmp_path, path)
+
+        self.rows_written += len(frame)
+        self.files_written += 1
+        self.bytes_written += os.path.getsize(path)
+        logger.debug(f"Wrote {len(frame)} rows to {path}")
+
+    def _write_atomic(self, path, data):
+        """Write bytes to a temporary file and rename it into place."""
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+
+def read_partitions(root_dir, dataset, completed_only=True):
+    """
+    Read a dataset written by PartitionedParquetSink.
+
+    Args:
+        root_dir (str): Root directory of the output dataset
+        dataset (str): Dataset name
+        completed_only (bool): Skip partitions without a _SUCCESS marker,
+            e.g. one a crash left mid-append (staged parts are never read)
+
+    Returns:
+        pd.DataFrame: Rows from every part file, with season and team_id columns
+    """
+    frames = []
+    dataset_dir = os.path.join(root_dir, dataset)
+    if not os.path.isdir(dataset_dir):
+        return pd.DataFrame()
+    for season_dir in sorted(os.listdir(dataset_dir)):
+        for team_dir in sorted(os.listdir(os.path.join(dataset_dir, season_dir))):
+            directory = os.path.join(dataset_dir, season_dir, team_dir)
+            if completed_only and not os.path.exists(os.path.join(directory, SUCCESS_MARKER)):
+                continue
+            for name in sorted(os.listdir(directory)):
+                if name.endswith('.parquet'):
+                    frame = pd.read_parquet(os.path.join(directory, name))
+                    frame['season'] = season_dir.split('=', 1)[1]
+                    frame['team_id'] = team_dir.split('=', 1)[1]
+                    frames.append(frame)
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
@@ -0,0 +1,258 @@
+"""
+Stats Table Parser
+
+This module parses NCAA statistics tables straight into typed DataFrame
+columns. When lxml is installed the page is parsed by lxml directly and only
+the target table is walked; otherwise BeautifulSoup builds a tree of just
+that table (via SoupStrainer). Either way cells are appended to per-column
+lists instead of building a dict per row, and each column is converted to
+numbers in one vectorized step.
+"""
+
+import re
+
+import numpy as np
+import pandas as pd
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.builder import ParserRejectedMarkup
+
+try:
+    import lxml.html
+    DEFAULT_PARSER = 'lxml'
+except ImportError:
+    DEFAULT_PARSER = 'html.parser'
+
+# The player statistics grid on NCAA team pages
+DEFAULT_TABLE_ATTRS = {'id': 'stat_grid'}
+
+# Cell text treated as missing
+MISSING_VALUES = ['', '-', '--']
+
+
+def normalize_column_name(name):
+    """
+    Convert a header cell into a snake_case column name.
+
+    Args:
+        name (str): Header text, e.g. 'Red Cards'
+
+    Returns:
+        str: Column name, e.g. 'red_cards'
+    """
+    return re.sub(r'[^0-9a-z]+', '_', name.strip().lower()).strip('_')
+
+
+def unique_column_names(names):
+    """
+    Make header names usable as distinct DataFrame columns.
+
+    Empty names become 'column_<position>' (counting from 1) and repeated
+    names are numbered from their second occurrence: 'gp', 'gp_2', 'gp_3'.
+
+    Args:
+        names (list): Normalized header names
+
+    Returns:
+        list: Names in the same order, all non-empty and distinct
+    """
+    names = [name or f"column_{i}" for i, name in enumerate(names, 1)]
+    taken = set(names)
+    seen = set()
+    unique = []
+    for name in names:
+        if name in seen:
+            suffix = 2
+            while f"{name}_{suffix}" in taken:
+                suffix += 1
+            name = f"{name}_{suffix}"
+            taken.add(name)
+        seen.add(name)
+        unique.append(name)
+    return unique
+
+
+def _numeric_masks(values):
+    """
+    Classify cell strings as integers or decimals, element-wise.
+
+    Args:
+        values (np.ndarray): Cell strings with thousands separators removed
+
+    Returns:
+        tuple: (is_integer, is_number) boolean arrays
+    """
+    unsigned = np.char.lstrip(values, '+-')
+    is_integer = np.char.isdigit(unsigned)
+    is_number = is_integer | np.char.isdigit(np.char.replace(unsigned, '.', '', count=1))
+    return is_integer, is_number
+
+
+def coerce_values(values):
+    """
+    Convert a column of cell strings to a typed numpy array.
+
+    Thousands separators are stripped and missing markers become NaN. A
+    column of integers becomes int64 (float64 if any cell is missing) and a
+    column of numbers float64. Anything else stays text, with None for
+    missing cells; so do columns holding integers too large for int64.
+
+    Args:
+        values (list): Cell strings
+
+    Returns:
+        np.ndarray: int64, float64 or object array
+    """
+    text = np.array(values, dtype=str)
+    cleaned = np.char.replace(text, ',', '')
+    missing = np.isin(cleaned, MISSING_VALUES)
+    is_integer, is_number = _numeric_masks(cleaned)
+    try:
+        if is_integer.all():
+            return cleaned.astype(np.int64)
+        if (is_number | missing).all():
+            # Raises OverflowError for integers that would lose precision as floats
+            cleaned[is_integer].astype(np.int64)
+            return np.where(missing, 'nan', cleaned).astype(np.float64)
+    except (ValueError, OverflowError):
+        pass
+    column = text.astype(object)
+    column[missing] = None
+    return column
+
+
+def coerce_column(values):
+    """
+    Convert a column of cell strings to the narrowest sensible type.
+
+    See coerce_values for the rules.
+
+    Args:
+        values (list): Cell strings
+
+    Returns:
+        pd.Series: Integer, float or object series
+    """
+    column = coerce_values(values)
+    return pd.Series(column, dtype=column.dtype)
+
+
+def _cell_text(text):
+    """Collapse runs of whitespace inside a cell's text."""
+    return ' '.join(text.split())
+
+
+def _xpath_literal(value):
+    """Quote a string as an XPath 1.0 literal, using concat() if it holds both quote kinds."""
+    if "'" not in value:
+        return f"'{value}'"
+    if '"' not in value:
+        return f'"{value}"'
+    parts = value.split("'")
+    return 'concat(' + ", \"'\", ".join(f"'{part}'" for part in parts) + ')'
+
+
+def _table_xpath(table_attrs):
+    """Build an XPath selecting a table by its attributes."""
+    conditions = []
+    for name, value in table_attrs.items():
+        if not re.fullmatch(r'[A-Za-z_][\w.-]*', name):
+            raise ValueError(f"Invalid table attribute name: {name!r}")
+        if name == 'class':
+            conditions.append(f"contains(concat(' ', normalize-space(@class), ' '), {_xpath_literal(f' {value} ')})")
+        else:
+            conditions.append(f"@{name}={_xpath_literal(str(value))}")
+    return '//table' + ''.join(f'[{condition}]' for condition in conditions)
+
+
+def _extract_with_lxml(html, table_attrs):
+    """Read header names and column cell lists with lxml."""
+    try:
+        document = lxml.html.fromstring(html)
+    except (lxml.etree.ParserError, ValueError):
+        return [], []
+    tables = document.xpath(_table_xpath(table_attrs))
+    if not tables:
+        return [], []
+    table = tables[0]
+
+    header_rows = table.xpath('./thead/tr') or table.xpath('.//tr')
+    if not header_rows:
+        return [], []
+    header_row = header_rows[0]
+    headers = [normalize_column_name(cell.text_content()) for cell in header_row.xpath('./th|./td')]
+
+    columns = [[] for _ in headers]
+    width = len(headers)
+    for row in table.xpath('./tbody/tr|./tr'):
+        if row is header_row:
+            continue
+        cells = row.xpath('./td|./th')
+        if not cells:
+            continue
+        for i in range(width):
+            columns[i].append(_cell_text(cells[i].text_content()) if i < len(cells) else '')
+    return headers, columns
+
+
+def _extract_with_soup(html, table_attrs, parser):
+    """Read header names and column cell lists with BeautifulSoup."""
+    try:
+        soup = BeautifulSoup(html, parser, parse_only=SoupStrainer('table', attrs=table_attrs))
+    except ParserRejectedMarkup:
+        return [], []
+    table = soup.find('table')
+    if table is None:
+        return [], []
+
+    header_row = table.find('thead')
+    header_row = header_row.find('tr') if header_row is not None else table.find('tr')
+    if header_row is None:
+        return [], []
+    headers = [normalize_column_name(cell.get_text()) for cell in header_row.find_all(['th', 'td'])]
+
+    columns = [[] for _ in headers]
+    width = len(headers)
+    body = table.find('tbody') or table
+    for row in body.find_all('tr', recursive=False):
+        if row is header_row:
+            continue
+        cells = row.find_all(['td', 'th'], recursive=False)
+        if not cells:
+            continue
+        for i in range(width):
+            columns[i].append(_cell_text(cells[i].get_text()) if i < len(cells) else '')
+    return headers, columns
+
+
+def parse_stats_table(html, table_attrs=None, parser=None):
+    """
+    Parse a statistics table from an HTML page into a typed DataFrame.
+
+    Header names come from the table's <thead> (or its first row when there
+    is none). Empty and repeated names are made distinct by
+    unique_column_names. Rows in <tfoot>, such as team totals, are skipped.
+
+    Args:
+        html (str or bytes): Page content
+        table_attrs (dict): Attributes identifying the table
+            (default: the NCAA player stats grid)
+        parser (str): 'lxml' or a BeautifulSoup parser name
+            (default: lxml when installed, otherwise html.parser)
+
+    Returns:
+        pd.DataFrame: One typed column per table column; empty if the table
+            is not found
+
+    Raises:
+        ValueError: If a table attribute name is not a valid XML name
+    """
+    table_attrs = table_attrs or DEFAULT_TABLE_ATTRS
+    parser = parser or DEFAULT_PARSER
+    if parser == 'lxml':
+        headers, columns = _extract_with_lxml(html, table_attrs)
+    else:
+        headers, columns = _extract_with_soup(html, table_attrs, parser)
+    if not headers:
+        return pd.DataFrame()
+    return pd.DataFrame({name: coerce_column(values)
+                         for name, values in zip(unique_column_names(headers), columns)})
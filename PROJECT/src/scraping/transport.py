@@ -0,0 +1,265 @@
+"""
+Resilient HTTP Transport
+
+This module provides the transport layer used by the scraper: a pooled
+requests session with connect/read timeouts, exponential backoff with jitter
+that honors Retry-After, and a per-host circuit breaker that stops sending
+requests to a host that keeps failing.
+"""
+
+import logging
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+# Status codes worth retrying: rate limiting and transient server errors
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+class CircuitOpenError(requests.exceptions.RequestException):
+    """Raised when a request is refused because the host's circuit is open."""
+
+
+class CircuitBreaker:
+    """
+    A per-host circuit breaker.
+
+    After `failure_threshold` consecutive failures the circuit opens and
+    requests fail fast. Once `reset_timeout` seconds have passed a single
+    trial request is let through (half-open); success closes the circuit,
+    failure opens it again.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold=5, reset_timeout=60, clock=time.monotonic):
+        """
+        Initialize the breaker closed.
+
+        Args:
+            failure_threshold (int): Consecutive failures that open the circuit
+            reset_timeout (float): Seconds to wait before a trial request
+            clock (callable): Monotonic clock, overridable for tests
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = None
+        self._trial_in_flight = False
+
+    def allow_request(self):
+        """
+        Check whether a request may be sent.
+
+        Returns:
+            bool: True if the request may proceed
+        """
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and self._clock() - self.opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                self._trial_in_flight = False
+            if self.state == self.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self):
+        """Close the circuit after a successful request."""
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        """Count a failure, opening the circuit when the threshold is reached."""
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    logger.warning(f"Circuit opened after {self.failures} consecutive failures")
+                self.state = self.OPEN
+                self.opened_at = self._clock()
+                self._trial_in_flight = False
+
+
+def parse_retry_after(value, now=None):
+    """
+    Parse a Retry-After header value.
+
+    Args:
+        value (str): Header value, either delta-seconds or an HTTP date
+        now (datetime): Current time for HTTP dates (default: now, UTC)
+
+    Returns:
+        float: Seconds to wait, or None if the value cannot be parsed
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    now = now or datetime.now(timezone.utc)
+    return max(0.0, (retry_at - now).total_seconds())
+
+
+class Transport:
+    """
+    A pooled HTTP session with timeouts, retries and per-host circuit breaking.
+
+    Attributes:
+        session (requests.Session): Underlying pooled session
+        retries (int): Total number of retried attempts
+        throttle_seconds (float): Total seconds spent waiting for the rate limiter
+        throttled (int): Attempts that had to wait for the rate limiter
+    """
+
+    def __init__(self, pool_size=10, connect_timeout=5, read_timeout=30, max_retries=3,
+                 backoff_factor=0.5, max_backoff=60, failure_threshold=5, reset_timeout=60,
+                 rate_limiter=None, session=None, sleep=time.sleep, clock=time.monotonic):
+        """
+        Initialize the transport.
+
+        Args:
+            pool_size (int): Connections kept open per host
+            connect_timeout (float): Seconds to wait for a connection
+            read_timeout (float): Seconds to wait for response data
+            max_retries (int): Retries after the first attempt
+            backoff_factor (float): Base delay; attempt n waits up to
+                backoff_factor * 2**n seconds (full jitter)
+            max_backoff (float): Upper bound on any single wait, including
+                Retry-After
+            failure_threshold (int): Consecutive failures that open a host's circuit
+            reset_timeout (float): Seconds before an open circuit allows a trial
+            rate_limiter (HostRateLimiter): Optional limiter consulted before
+                every attempt, including retries
+            session (requests.Session): Session to mount the pool on
+                (default: a new session)
+            sleep (callable): Sleep function, overridable for tests
+            clock (callable): Monotonic clock for the circuit breakers
+        """
+        self.pool_size = pool_size
+        self.timeout = (connect_timeout, read_timeout)
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.rate_limiter = rate_limiter
+        self._sleep = sleep
+        self._clock = clock
+        self._breakers = {}
+        self._lock = threading.Lock()
+        self.retries = 0
+        self.throttle_seconds = 0.0
+        self.throttled = 0
+
+        self.session = session if session is not None else requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def get_breaker(self, url):
+        """
+        Get the circuit breaker for a URL's host.
+
+        Args:
+            url (str): Request URL
+
+        Returns:
+            CircuitBreaker: The host's breaker
+        """
+        host = urlparse(url).netloc
+        with self._lock:
+            breaker = self._breakers.get(host)
+            if breaker is None:
+                breaker = CircuitBreaker(self.failure_threshold, self.reset_timeout, clock=self._clock)
+                self._breakers[host] = breaker
+            return breaker
+
+    def _backoff(self, attempt, response=None):
+        """Seconds to wait before the next attempt."""
+        if response is not None:
+            retry_after = parse_retry_after(response.headers.get('Retry-After'))
+            if retry_after is not None:
+                return min(retry_after, self.max_backoff)
+        return random.uniform(0, min(self.max_backoff, self.backoff_factor * 2 ** attempt))
+
+    def get(self, url, params=None, headers=None):
+        """
+        Send a GET request with retries.
+
+        Responses with a retryable status are retried; if retries run out the
+        last response is returned so the caller can inspect or raise it.
+
+        Args:
+            url (str): URL to request
+            params (dict): Query parameters
+            headers (dict): Extra request headers
+
+        Returns:
+            requests.Response: Response object
+
+        Raises:
+            CircuitOpenError: If the host's circuit is open
+            requests.exceptions.RequestException: If every attempt failed
+                to get a response
+        """
+        breaker = self.get_breaker(url)
+        attempt = 0
+        while True:
+            if not breaker.allow_request():
+                raise CircuitOpenError(f"Circuit open for {urlparse(url).netloc}")
+            if self.rate_limiter is not None:
+                waited = self.rate_limiter.acquire(url)
+                if waited:
+                    with self._lock:
+                        self.throttle_seconds += waited
+                        self.throttled += 1
+
+            response = None
+            try:
+                response = self.session.get(url, params=params, headers=headers, timeout=self.timeout)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                breaker.record_failure()
+                if attempt >= self.max_retries:
+                    raise
+                logger.warning(f"Request to {url} failed ({e}), retrying")
+            except Exception:
+                # Not retried, but still settles a half-open trial
+                breaker.record_failure()
+                raise
+            else:
+                if response.status_code not in RETRY_STATUS_CODES:
+                    breaker.record_success()
+                    return response
+                breaker.record_failure()
+                if attempt >= self.max_retries:
+                    return response
+                logger.warning(f"Request to {url} returned {response.status_code}, retrying")
+
+            delay = self._backoff(attempt, response)
+            attempt += 1
+            with self._lock:
+                self.retries += 1
+            self._sleep(delay)
@@ -0,0 +1,121 @@
+"""
+Shared fixtures for the test suite.
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Serve responses from the server's route table and record each request."""
+    
+    def do_GET(self):
+        path = self.path.split('?', 1)[0]
+        if self.headers.get('Transfer-Encoding', '').lower() == 'chunked':
+            self.body = self._read_chunked()
+        else:
+            length = int(self.headers.get('Content-Length') or 0)
+            self.body = self.rfile.read(length) if length else b''
+        self.server.requests.append({'method': self.command, 'path': self.path,
+                                     'headers': dict(self.headers), 'body': self.body})
+        route = self.server.routes.get(path)
+        if route is None:
+            status, headers, body = 404, {}, b'Not Found'
+        else:
+            status, headers, body = route(self)
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        if 'Content-Length' not in headers:
+            self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    do_POST = do_PUT = do_DELETE = do_GET
+    
+    def _read_chunked(self):
+        """Read a request body sent with chunked transfer encoding."""
+        chunks = []
+        while True:
+            size = int(self.rfile.readline().split(b';', 1)[0], 16)
+            if size == 0:
+                # Skip any trailers up to the blank line
+                while self.rfile.readline() not in (b'\r\n', b'\n', b''):
+                    pass
+                return b''.join(chunks)
+            chunks.append(self.rfile.read(size))
+            self.rfile.readline()
+    
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def stand_in_server():
+    """
+    Run a local HTTP server standing in for a remote site.
+    
+    Register routes with ``server.routes[path] = handler`` where ``handler``
+    takes the request handler and returns ``(status, headers, body)``. The
+    server's ``url`` attribute is its base URL and ``requests`` lists every
+    request received (method, path, headers and body). Every method is
+    routed the same way; check ``handler.command`` to tell them apart.
+    """
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StandInHandler)
+    server.daemon_threads = True
+    server.routes = {}
+    server.requests = []
+    server.url = f"http://127.0.0.1:{server.server_address[1]}"
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def range_route():
+    """
+    Build stand-in routes that serve bytes with HTTP Range support.
+    
+    ``range_route(data)`` returns a route answering ``Range: bytes=a-b``
+    requests with 206 and a Content-Range header. ``cut_at`` simulates a
+    dropped connection: the first ``drops`` responses announce their full
+    length but stop after ``cut_at`` bytes. ``ranges=False`` makes the route
+    ignore Range headers.
+    """
+    def make(data, cut_at=None, drops=1, ranges=True):
+        lock = threading.Lock()
+        remaining_drops = [drops if cut_at is not None else 0]
+        
+        def route(handler):
+            start, end = 0, len(data) - 1
+            status, headers = 200, {}
+            requested = handler.headers.get('Range')
+            if ranges:
+                headers['Accept-Ranges'] = 'bytes'
+            if ranges and requested:
+                first, _, last = requested.split('=', 1)[1].partition('-')
+                start = int(first)
+                if start >= len(data):
+                    return 416, {'Content-Range': f"bytes */{len(data)}"}, b''
+                end = min(int(last), end) if last else end
+                status = 206
+                headers['Content-Range'] = f"bytes {start}-{end}/{len(data)}"
+            body = data[start:end + 1]
+            with lock:
+                drop = remaining_drops[0] > 0 and cut_at < len(body)
+                if drop:
+                    remaining_drops[0] -= 1
+            if drop:
+                headers['Content-Length'] = str(len(body))
+                body = body[:cut_at]
+            return status, headers, body
+        
+        return route
+    
+    return make
@@ -0,0 +1,343 @@
+"""
+Tests for the pooled session, retry rules, downloads and uploads of the week 4 API client.
+"""
+
+import sys
+import os
+import hashlib
+import json
+import re
+import random
+import subprocess
+import textwrap
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+import pytest
+import requests
+from urllib3 import encode_multipart_formdata
+
+# Add the week 4 course directory to the path for imports
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(os.path.join(REPO_DIR, 'COURSE', 'week_4'))
+import api_client
+from api_client import APIClient, MultipartStream
+
+
+def flaky_route(statuses, headers=None):
+    """Answer with each status in turn, then 200 with a JSON body."""
+    remaining = list(statuses)
+
+    def route(handler):
+        if remaining:
+            return remaining.pop(0), dict(headers or {}), json.dumps({'error': 'try again'})
+        return 200, {'Content-Type': 'application/json'}, json.dumps({'ok': True})
+
+    return route
+
+@pytest.fixture
+def delays(monkeypatch):
+    """Record retry delays instead of sleeping."""
+    recorded = []
+    monkeypatch.setattr(api_client.time, 'sleep', recorded.append)
+    return recorded
+
+@pytest.fixture
+def client(stand_in_server):
+    with APIClient(stand_in_server.url, auth_token='secret', pool_size=4) as client:
+        yield client
+
+def test_session_is_pooled_and_authenticated(client, stand_in_server):
+    """Test that requests share the pooled session and carry the default headers."""
+    stand_in_server.routes['/items'] = flaky_route([])
+
+    assert client.get('items', params={'page': 2}) == {'ok': True}
+    assert client.post('/items', json_data={'name': 'x'}) == {'ok': True}
+
+    adapter = client.session.get_adapter(stand_in_server.url)
+    assert adapter._pool_maxsize == 4
+    first, second = stand_in_server.requests
+    assert first['path'] == '/items?page=2'
+    assert first['headers']['Authorization'] == 'Bearer secret'
+    assert second['method'] == 'POST' and json.loads(second['body']) == {'name': 'x'}
+
+def test_error_responses_raise_value_error(client, stand_in_server):
+    """Test that an error status is reported with the API's message."""
+    stand_in_server.routes['/items'] = lambda h: (400, {}, json.dumps({'error': 'bad page'}))
+
+    with pytest.raises(ValueError, match='400: bad page'):
+        client.get('items')
+
+    for body, message in (([{'error': 'bad'}], "400: [{'error': 'bad'}]"), ('just a string', '400: just a string')):
+        stand_in_server.routes['/items'] = lambda h, body=body: (400, {}, json.dumps(body))
+        with pytest.raises(ValueError, match=re.escape(message)):
+            client.get('items')
+
+def test_idempotent_requests_retry_with_backoff(client, stand_in_server, delays):
+    """Test that GET retries server errors with growing, jittered delays."""
+    stand_in_server.routes['/items'] = flaky_route([500, 502, 503])
+
+    assert client.retry_request('get', 'items', max_retries=3, retry_delay=1) == {'ok': True}
+
+    assert len(stand_in_server.requests) == 4
+    assert len(delays) == 3
+    assert all(0 <= delay <= 2 ** attempt for attempt, delay in enumerate(delays))
+
+def test_retry_after_and_max_delay(client, stand_in_server, delays):
+    """Test that Retry-After is honoured up to max_delay."""
+    stand_in_server.routes['/items'] = flaky_route([429, 429], headers={'Retry-After': '120'})
+
+    client.retry_request('get', 'items', max_retries=2, max_delay=5)
+
+    assert delays == [5, 5]
+
+def test_retry_after_http_date(client, stand_in_server, delays):
+    """Test that a Retry-After HTTP date is turned into the seconds until then."""
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+    retry_after = format_datetime(retry_at, usegmt=True)
+    stand_in_server.routes['/items'] = flaky_route([503], headers={'Retry-After': retry_after})
+
+    client.retry_request('get', 'items', max_retries=1, max_delay=60)
+
+    assert len(delays) == 1 and 25 < delays[0] <= 30
+
+def test_non_idempotent_requests_retry_only_when_safe(client, stand_in_server, delays):
+    """Test that POST is retried on 503 or with an idempotency key, but not on 500."""
+    stand_in_server.routes['/orders'] = flaky_route([500])
+    with pytest.raises(ValueError):
+        client.retry_request('post', 'orders', json_data={'n': 1})
+    assert len(stand_in_server.requests) == 1
+
+    stand_in_server.routes['/orders'] = flaky_route([503])
+    assert client.retry_request('post', 'orders', json_data={'n': 1}) == {'ok': True}
+
+    stand_in_server.routes['/orders'] = flaky_route([500])
+    assert client.retry_request('post', 'orders', json_data={'n': 1},
+                                headers={'Idempotency-Key': 'order-1'}) == {'ok': True}
+    assert len(stand_in_server.requests) == 5
+
+    stand_in_server.routes['/orders'] = flaky_route([500])
+    assert client.retry_request('post', 'orders', json_data={'n': 1},
+                                headers={'idempotency-key': 'order-2'}) == {'ok': True}
+
+    stand_in_server.routes['/orders'] = flaky_route([500])
+    client.session.headers['IDEMPOTENCY-KEY'] = 'batch-1'
+    assert client.retry_request('post', 'orders', json_data={'n': 1}) == {'ok': True}
+    assert len(stand_in_server.requests) == 9
+
+def test_connection_errors_are_retried_then_raised(delays):
+    """Test that connection failures are retried for GET and raised after the last try."""
+    client = APIClient('http://127.0.0.1:9', timeout=1)
+
+    with pytest.raises(requests.exceptions.ConnectionError):
+        client.retry_request('get', 'items', max_retries=2)
+
+    assert len(delays) == 2
+
+DATA = random.Random(0).randbytes(300_000)
+DATA_SHA256 = hashlib.sha256(DATA).hexdigest()
+
+def read(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+def test_download_streams_and_verifies_checksum(client, stand_in_server, range_route, tmp_path):
+    """Test that a streamed download is verified and moved into place."""
+    stand_in_server.routes['/dump'] = range_route(DATA)
+    path = str(tmp_path / 'exports' / 'dump.bin')
+
+    assert client.download_file('dump', path, checksum=f"sha256:{DATA_SHA256}", chunk_size=8192)
+
+    assert read(path) == DATA
+    assert not os.path.exists(path + '.part')
+
+def test_download_resumes_partial_file(client, stand_in_server, range_route, tmp_path):
+    """Test that an existing .part file is continued with a Range request."""
+    stand_in_server.routes['/dump'] = range_route(DATA)
+    path = str(tmp_path / 'dump.bin')
+    with open(path + '.part', 'wb') as f:
+        f.write(DATA[:100_000])
+
+    client.download_file('dump', path, checksum=DATA_SHA256)
+
+    assert read(path) == DATA
+    assert stand_in_server.requests[0]['headers']['Range'] == 'bytes=100000-'
+
+def test_dropped_connections_are_resumed(client, stand_in_server, range_route, tmp_path):
+    """Test that a download cut off mid-stream picks up where it stopped."""
+    stand_in_server.routes['/dump'] = range_route(DATA, cut_at=120_000, drops=2)
+    path = str(tmp_path / 'dump.bin')
+
+    client.download_file('dump', path, checksum=DATA_SHA256, chunk_size=8192)
+
+    assert read(path) == DATA
+    first, second, third = [r['headers'].get('Range') for r in stand_in_server.requests]
+    assert first is None
+    assert 100_000 < int(second[6:-1]) <= 120_000
+    assert int(third[6:-1]) > int(second[6:-1])
+
+def test_first_connection_failure_is_retried(client, stand_in_server, range_route, tmp_path, monkeypatch):
+    """Test that a failure before any .part file exists is retried, or raised as a request error."""
+    stand_in_server.routes['/dump'] = range_route(DATA)
+    path = str(tmp_path / 'dump.bin')
+    real_request = client.session.request
+    failures = [requests.exceptions.ConnectionError("connection refused")]
+
+    def flaky_request(*args, **kwargs):
+        if failures:
+            raise failures.pop()
+        return real_request(*args, **kwargs)
+
+    monkeypatch.setattr(client.session, 'request', flaky_request)
+    assert client.download_file('dump', path, checksum=DATA_SHA256)
+    assert read(path) == DATA
+
+    with APIClient('http://127.0.0.1:9', timeout=1) as refused:
+        with pytest.raises(requests.exceptions.ConnectionError):
+            refused.download_file('dump', str(tmp_path / 'refused.bin'), max_retries=1)
+    assert not os.path.exists(tmp_path / 'refused.bin.part')
+
+def test_stale_part_is_not_resumed_without_resume(client, stand_in_server, range_route, tmp_path, monkeypatch):
+    """Test that resume=False never splices a stale .part file in, even after an early error."""
+    stand_in_server.routes['/dump'] = range_route(DATA)
+    path = str(tmp_path / 'dump.bin')
+    with open(path + '.part', 'wb') as f:
+        f.write(b'x' * 1000)
+    real_request = client.session.request
+    failures = [requests.exceptions.ConnectionError("connection refused")]
+
+    def flaky_request(*args, **kwargs):
+        if failures:
+            raise failures.pop()
+        return real_request(*args, **kwargs)
+
+    monkeypatch.setattr(client.session, 'request', flaky_request)
+    assert client.download_file('dump', path, checksum=DATA_SHA256, resume=False)
+
+    assert read(path) == DATA
+    assert 'Range' not in stand_in_server.requests[0]['headers']
+
+def test_parallel_segmented_download(client, stand_in_server, range_route, tmp_path):
+    """Test that segments are fetched as separate ranges into one file."""
+    stand_in_server.routes['/dump'] = range_route(DATA, cut_at=10_000)
+    path = str(tmp_path / 'dump.bin')
+
+    client.download_file('dump', path, checksum=DATA_SHA256, segments=4)
+
+    assert read(path) == DATA
+    ranges = sorted(r['headers']['Range'] for r in stand_in_server.requests)
+    assert 'bytes=0-74999' in ranges and 'bytes=225000-299999' in ranges
+    assert len(ranges) == 1 + 4 + 1
+
+def test_segments_fall_back_without_range_support(client, stand_in_server, range_route, tmp_path):
+    """Test that servers ignoring Range get a single streamed download."""
+    stand_in_server.routes['/dump'] = range_route(DATA, ranges=False)
+    path = str(tmp_path / 'dump.bin')
+
+    client.download_file('dump', path, checksum=DATA_SHA256, segments=4)
+
+    assert read(path) == DATA
+
+def test_checksum_mismatch_discards_download(client, stand_in_server, range_route, tmp_path):
+    """Test that a corrupt download is removed and reported."""
+    stand_in_server.routes['/dump'] = range_route(DATA)
+    path = str(tmp_path / 'dump.bin')
+
+    with pytest.raises(api_client.DownloadError):
+        client.download_file('dump', path, checksum='sha256:' + '0' * 64)
+
+    assert not os.path.exists(path) and not os.path.exists(path + '.part')
+
+def echo_upload(handler):
+    """Report the size of the uploaded body and how it was sent."""
+    return 200, {'Content-Type': 'application/json'}, json.dumps({
+        'bytes': len(handler.body),
+        'chunked': handler.headers.get('Transfer-Encoding') == 'chunked',
+    })
+
+@pytest.fixture
+def export_file(tmp_path):
+    path = tmp_path / 'export.csv'
+    path.write_bytes(b'player,goals\n' + b''.join(b'p%d,%d\n' % (i, i % 9) for i in range(20_000)))
+    return str(path)
+
+def test_multipart_stream_matches_standard_encoding(export_file):
+    """Test that the streamed body is byte-for-byte a standard multipart body."""
+    with open(export_file, 'rb') as f:
+        expected, content_type = encode_multipart_formdata(
+            {'season': '2024', 'file': ('export.csv', f.read(), 'text/csv')}, boundary='b0undary')
+    progress = []
+
+    stream = MultipartStream(export_file, fields={'season': '2024'}, chunk_size=4096,
+                             progress_callback=lambda sent, total: progress.append((sent, total)),
+                             boundary='b0undary')
+
+    assert stream.content_type == content_type
+    assert len(stream) == len(expected)
+    assert b''.join(iter(lambda: stream.read(1000), b'')) == expected
+    assert progress[-1] == (len(expected), len(expected))
+    assert [sent for sent, _ in progress] == sorted(sent for sent, _ in progress)
+    assert len(progress) > len(expected) // 4096
+
+def test_multipart_stream_escapes_header_params(tmp_path):
+    """Test that quotes and line breaks in names cannot break out of the part headers."""
+    path = tmp_path / 'a"b\r\nX-Injected: 1.csv'
+    path.write_bytes(b'x')
+    expected, _ = encode_multipart_formdata(
+        {'se"ason\n': '2024', 'fi"le': (path.name, b'x', 'text/csv')}, boundary='b0undary')
+    
+    stream = MultipartStream(str(path), file_field='fi"le', fields={'se"ason\n': '2024'},
+                             boundary='b0undary')
+    body = b''.join(iter(stream))
+    
+    assert body == expected
+    assert b'filename="a%22b%0D%0AX-Injected: 1.csv"' in body
+    assert b'name="se%22ason%0A"' in body
+
+@pytest.mark.parametrize('chunked', [False, True])
+def test_upload_file_streams_body(client, stand_in_server, export_file, chunked):
+    """Test uploads with a Content-Length header and with chunked transfer encoding."""
+    stand_in_server.routes['/imports'] = echo_upload
+    progress = []
+
+    result = client.upload_file('imports', export_file, additional_data={'season': '2024'},
+                                progress_callback=lambda sent, total: progress.append(sent),
+                                chunked=chunked, chunk_size=8192)
+
+    request = stand_in_server.requests[0]
+    assert result == {'bytes': progress[-1], 'chunked': chunked}
+    assert request['headers']['Content-Type'].startswith('multipart/form-data; boundary=')
+    assert ('Content-Length' in request['headers']) != chunked
+    assert b'name="season"\r\n\r\n2024' in request['body']
+    with open(export_file, 'rb') as f:
+        assert f.read() in request['body']
+
+def test_upload_missing_file_raises(client):
+    """Test that a missing file is reported before anything is sent."""
+    with pytest.raises(FileNotFoundError):
+        client.upload_file('imports', 'no/such/file.csv')
+
+def test_upload_memory_stays_flat(stand_in_server, tmp_path):
+    """Test that uploading a file three times the memory budget barely grows peak RSS."""
+    budget = 16 * 1024 * 1024
+    path = tmp_path / 'bulk.bin'
+    with open(path, 'wb') as f:
+        for _ in range(3 * budget // (1024 * 1024)):
+            f.write(os.urandom(1024 * 1024))
+    stand_in_server.routes['/imports'] = echo_upload
+
+    # Measure in a fresh interpreter so the server's copy of the body is not counted
+    script = textwrap.dedent(f"""
+        import json, resource, sys
+        sys.path.append({os.path.join(REPO_DIR, 'COURSE', 'week_4')!r})
+        from api_client import APIClient
+        client = APIClient({stand_in_server.url!r}, timeout=60)
+        before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        result = client.upload_file('imports', {str(path)!r}, chunk_size=1024 * 1024)
+        after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        print(json.dumps({{'growth_kb': after - before, 'bytes': result['bytes']}}))
+    """)
+    output = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, check=True)
+    report = json.loads(output.stdout.strip().splitlines()[-1])
+
+    assert report['bytes'] > 3 * budget
+    assert report['growth_kb'] * 1024 < budget
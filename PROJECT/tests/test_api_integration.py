@@ -0,0 +1,93 @@
+"""
+Tests for the streaming downloads of the week 3 API integration exercise.
+"""
+
+import sys
+import os
+import hashlib
+import random
+import pytest
+import requests
+
+# Add the week 3 course directory to the path for imports
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(os.path.join(REPO_DIR, 'COURSE', 'week_3'))
+from api_integration import DownloadError, download_file_from_url
+
+DATA = random.Random(1).randbytes(250_000)
+DATA_SHA256 = hashlib.sha256(DATA).hexdigest()
+
+
+def read(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+def test_download_resumes_after_drop_and_verifies(stand_in_server, range_route, tmp_path):
+    """Test that a partial file and a dropped connection are both resumed."""
+    stand_in_server.routes['/dump'] = range_route(DATA, cut_at=50_000)
+    path = str(tmp_path / 'dump.bin')
+    with open(path + '.part', 'wb') as f:
+        f.write(DATA[:40_000])
+
+    assert download_file_from_url(f"{stand_in_server.url}/dump", path,
+                                  checksum=f"sha256:{DATA_SHA256}", chunk_size=4096)
+
+    assert read(path) == DATA
+    assert stand_in_server.requests[0]['headers']['Range'] == 'bytes=40000-'
+    assert len(stand_in_server.requests) == 2
+
+def test_parallel_segments_and_checksum_mismatch(stand_in_server, range_route, tmp_path):
+    """Test segmented downloads and that a wrong checksum discards the file."""
+    stand_in_server.routes['/dump'] = range_route(DATA)
+    url = f"{stand_in_server.url}/dump"
+    path = str(tmp_path / 'dump.bin')
+
+    download_file_from_url(url, path, checksum=DATA_SHA256, segments=3)
+    assert read(path) == DATA
+    assert len(stand_in_server.requests) == 1 + 3
+
+    with pytest.raises(DownloadError):
+        download_file_from_url(url, str(tmp_path / 'bad.bin'), checksum='md5:' + '0' * 32)
+    assert os.listdir(tmp_path) == ['dump.bin']
+
+class FlakySession(requests.Session):
+    """A session whose first request fails before connecting."""
+
+    def __init__(self):
+        super().__init__()
+        self.failures = 1
+
+    def get(self, *args, **kwargs):
+        if self.failures:
+            self.failures -= 1
+            raise requests.exceptions.ConnectionError("connection refused")
+        return super().get(*args, **kwargs)
+
+def test_first_connection_failure_is_retried(stand_in_server, range_route, tmp_path):
+    """Test that a failure before any .part file exists is retried, or raised as a request error."""
+    stand_in_server.routes['/dump'] = range_route(DATA)
+    path = str(tmp_path / 'dump.bin')
+
+    with FlakySession() as session:
+        assert download_file_from_url(f"{stand_in_server.url}/dump", path, checksum=DATA_SHA256,
+                                      session=session)
+    assert read(path) == DATA
+
+    with pytest.raises(requests.exceptions.ConnectionError):
+        download_file_from_url('http://127.0.0.1:9/dump', str(tmp_path / 'refused.bin'),
+                               max_retries=1, timeout=1)
+    assert not os.path.exists(tmp_path / 'refused.bin.part')
+
+def test_stale_part_is_not_resumed_without_resume(stand_in_server, range_route, tmp_path):
+    """Test that resume=False never splices a stale .part file in, even after an early error."""
+    stand_in_server.routes['/dump'] = range_route(DATA)
+    path = str(tmp_path / 'dump.bin')
+    with open(path + '.part', 'wb') as f:
+        f.write(b'x' * 1000)
+
+    with FlakySession() as session:
+        assert download_file_from_url(f"{stand_in_server.url}/dump", path, checksum=DATA_SHA256,
+                                      resume=False, session=session)
+
+    assert read(path) == DATA
+    assert 'Range' not in stand_in_server.requests[0]['headers']
@@ -0,0 +1,236 @@
+"""
+Tests for the response cache of the week 4 multi-API client.
+"""
+
+import sys
+import os
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+
+# Add the week 4 course directory to the path for imports
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(os.path.join(REPO_DIR, 'COURSE', 'week_4'))
+from api_integration_advanced import MultiAPIClient, ResponseCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def client(stand_in_server):
+    config = {'weather': {'base_url': stand_in_server.url, 'api_key': 'k',
+                          'endpoints': {'current': '/weather'}}}
+    return MultiAPIClient(config)
+
+def test_lru_eviction_by_entries_and_bytes():
+    """Test that least recently used entries go first when either budget is exceeded."""
+    cache = ResponseCache(max_entries=2, max_bytes=1000)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.get('a')
+    cache.set('c', 3)
+
+    assert cache.get('b') is None
+    assert cache.get('a') == 1 and cache.get('c') == 3
+
+    cache = ResponseCache(max_entries=10, max_bytes=20)
+    cache.set('a', 'x' * 10)
+    cache.set('b', 'y' * 10)
+    assert cache.get('a') is None
+    assert cache.stats()['bytes'] == 12
+    assert cache.stats()['evictions'] == 1
+
+    cache.set('huge', 'z' * 100)
+    assert cache.get('huge') is None
+
+def test_per_key_ttl():
+    """Test that entries expire after their own TTL."""
+    clock = FakeClock()
+    cache = ResponseCache(default_ttl=60, clock=clock)
+    cache.set('short', 1, ttl=5)
+    cache.set('long', 2)
+
+    clock.now = 10
+
+    assert cache.get('short') is None
+    assert cache.get('long') == 2
+    stats = cache.stats()
+    assert stats['expirations'] == 1 and stats['hits'] == 1 and stats['misses'] == 1
+
+def test_concurrent_misses_coalesce():
+    """Test that one loader call serves every concurrent miss."""
+    cache = ResponseCache()
+    calls = []
+
+    def loader():
+        calls.append(1)
+        time.sleep(0.1)
+        return {'temp': 21}
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: cache.get_or_load('k', loader), range(8)))
+
+    assert results == [{'temp': 21}] * 8
+    assert len(calls) == 1
+    stats = cache.stats()
+    assert stats['loads'] == 1 and stats['coalesced'] == 7
+    assert cache.get_or_load('k', loader) == {'temp': 21}
+    assert len(calls) == 1
+
+def test_load_errors_reach_waiters_and_are_not_cached():
+    """Test that a failed load raises in every caller and the next call retries."""
+    cache = ResponseCache()
+    started = threading.Event()
+
+    def failing():
+        started.set()
+        time.sleep(0.05)
+        raise RuntimeError("upstream down")
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        leader = executor.submit(cache.get_or_load, 'k', failing)
+        started.wait()
+        waiter = executor.submit(cache.get_or_load, 'k', lambda: 'unused')
+        for future in (leader, waiter):
+            with pytest.raises(RuntimeError):
+                future.result()
+
+    assert cache.get_or_load('k', lambda: 'ok') == 'ok'
+    assert cache.stats()['load_errors'] == 1
+
+def test_client_sends_one_request_for_concurrent_callers(client, stand_in_server):
+    """Test that concurrent identical calls reach the API once."""
+    def weather(handler):
+        time.sleep(0.1)
+        return 200, {'Content-Type': 'application/json'}, json.dumps({'main': {'temp': 18}})
+
+    stand_in_server.routes['/weather'] = weather
+
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        results = list(executor.map(lambda _: client.get_weather_data('Boston'), range(6)))
+
+    assert all(r == {'main': {'temp': 18}} for r in results)
+    assert len(stand_in_server.requests) == 1
+    assert 'appid=k' in stand_in_server.requests[0]['path']
+    assert client.cache.stats()['coalesced'] == 5
+
+def test_unknown_location_raises_value_error(client, stand_in_server):
+    """Test that a 404 from the weather API is reported as a ValueError."""
+    with pytest.raises(ValueError):
+        client.get_weather_data('Atlantis')
+
+def new_tracker():
+    return {'active': 0, 'peak': 0, 'lock': threading.Lock()}
+
+def tracked_route(delay, body=None, trackers=()):
+    """Serve a JSON body after a delay, tracking the peak number of overlapping requests."""
+    state = new_tracker()
+    trackers = (state,) + tuple(trackers)
+
+    def route(handler):
+        for tracker in trackers:
+            with tracker['lock']:
+                tracker['active'] += 1
+                tracker['peak'] = max(tracker['peak'], tracker['active'])
+        time.sleep(delay)
+        for tracker in trackers:
+            with tracker['lock']:
+                tracker['active'] -= 1
+        return 200, {'Content-Type': 'application/json'}, json.dumps(body or {'path': handler.path})
+
+    return route, state
+
+def test_parallel_fetch_returns_partial_results(client, stand_in_server):
+    """Test that failures and timeouts are reported per request, in order."""
+    stand_in_server.routes['/ok'], _ = tracked_route(0.0, {'value': 1})
+    stand_in_server.routes['/slow'], _ = tracked_route(0.5)
+    stand_in_server.routes['/broken'] = lambda h: (500, {}, 'error')
+
+    results = client.fetch_parallel_data([
+        {'url': f"{stand_in_server.url}/ok"},
+        {'url': f"{stand_in_server.url}/broken"},
+        {'url': f"{stand_in_server.url}/slow", 'timeout': 0.1},
+    ])
+
+    assert [r['ok'] for r in results] == [True, False, False]
+    assert results[0]['data'] == {'value': 1}
+    assert 'HTTPError' in results[1]['error']
+    assert 'timed out' in results[2]['error'].lower()
+
+def test_timeouts_start_when_a_call_starts(client):
+    """Test that a call queued behind a timed-out call still gets its full timeout."""
+    release = threading.Event()
+    calls = [
+        {'func': lambda: release.wait(5), 'timeout': 0.1},
+        {'func': lambda: 'done', 'timeout': 0.2},
+    ]
+    # The stuck call keeps the only worker thread for 0.5s after timing out
+    threading.Timer(0.6, release.set).start()
+
+    results = asyncio.run(client._run_calls(calls, max_concurrency=1))
+
+    assert [r['ok'] for r in results] == [False, True]
+    assert results[1]['data'] == 'done'
+    release.set()
+
+def test_blocking_methods_refuse_a_running_loop(client):
+    """Test that the blocking wrappers point callers in a running loop to the async methods."""
+    async def call_from_loop():
+        with pytest.raises(RuntimeError, match='fetch_parallel_data_async'):
+            client.fetch_parallel_data([])
+        with pytest.raises(RuntimeError, match='combine_data_async'):
+            client.combine_data('Boston')
+        return await client.fetch_parallel_data_async([])
+
+    assert asyncio.run(call_from_loop()) == []
+
+def test_global_and_per_api_limits(client, stand_in_server):
+    """Test that requests in flight stay within the global and per-API limits."""
+    total = new_tracker()
+    stand_in_server.routes['/a'], a_state = tracked_route(0.05, trackers=[total])
+    stand_in_server.routes['/b'], _ = tracked_route(0.05, trackers=[total])
+    configs = [{'url': f"{stand_in_server.url}/a", 'api': 'a'} for _ in range(12)] + \
+              [{'url': f"{stand_in_server.url}/b", 'api': 'b'} for _ in range(12)]
+
+    results = client.fetch_parallel_data(configs, max_concurrency=6, api_limits={'a': 2})
+
+    assert all(r['ok'] for r in results)
+    assert a_state['peak'] == 2
+    assert total['peak'] == 6
+
+def test_combine_data_runs_sources_concurrently(stand_in_server):
+    """Test that combine_data overlaps its sub-requests and reports failed sources."""
+    # Each source only answers once the other one is in flight too
+    both_in_flight = threading.Barrier(2, timeout=5)
+
+    def overlapping(body):
+        def route(handler):
+            both_in_flight.wait()
+            return 200, {'Content-Type': 'application/json'}, json.dumps(body)
+        return route
+
+    stand_in_server.routes['/weather'] = overlapping({'main': {'temp': 18}})
+    stand_in_server.routes['/everything'] = overlapping({'articles': [{'title': 'Storm'}]})
+    stand_in_server.routes['/query'] = lambda h: (503, {}, 'unavailable')
+    url = stand_in_server.url
+    client = MultiAPIClient({
+        'weather': {'base_url': url, 'endpoints': {'current': '/weather'}},
+        'news': {'base_url': url, 'endpoints': {'everything': '/everything', 'top_headlines': '/top'}},
+        'stocks': {'base_url': url, 'endpoints': {'time_series_daily': '/query'}},
+    })
+
+    combined = client.combine_data('Boston', stock_symbols=['AAPL'])
+
+    assert combined['weather'] == {'main': {'temp': 18}}
+    assert combined['news'] == [{'title': 'Storm'}]
+    assert combined['stocks'] == {'AAPL': None}
+    assert list(combined['errors']) == ['stocks.AAPL']
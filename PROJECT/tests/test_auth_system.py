@@ -0,0 +1,329 @@
+"""
+Tests for the storage and token handling of the week 4 authentication system.
+"""
+
+import sys
+import os
+import json
+import sqlite3
+import subprocess
+import textwrap
+import threading
+import time
+import jwt
+import pytest
+from flask import Flask, g
+
+# Add the week 4 course directory to the path for imports
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+WEEK_4_DIR = os.path.join(REPO_DIR, 'COURSE', 'week_4')
+sys.path.append(WEEK_4_DIR)
+import auth_system
+from auth_system import (AuthManager, AuthStore, HasherBusyError, PasswordHasher, TokenCache, hash_api_key,
+                         require_api_key, require_jwt_token, require_role)
+
+# Keep password hashing cheap in tests
+ITERATIONS = 1000
+
+
+@pytest.fixture
+def db_path(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return str(tmp_path / 'auth.db')
+
+@pytest.fixture
+def auth(db_path):
+    manager = AuthManager(db_path=db_path, password_iterations=ITERATIONS)
+    yield manager
+    manager.close()
+
+@pytest.fixture
+def make_auth(db_path):
+    """Create further managers, by default on the same database; all are closed after the test."""
+    managers = []
+
+    def make(**kwargs):
+        kwargs.setdefault('password_iterations', ITERATIONS)
+        if 'store' not in kwargs:
+            kwargs.setdefault('db_path', db_path)
+        manager = AuthManager(**kwargs)
+        managers.append(manager)
+        return manager
+
+    yield make
+    for manager in managers:
+        manager.close()
+
+def test_register_and_authenticate(auth):
+    """Test registration, login, duplicate usernames and wrong passwords."""
+    user = auth.register_user('sam', 'pa55word', 'sam@example.com')
+
+    assert user['username'] == 'sam' and 'password_hash' not in user and 'salt' not in user
+    with pytest.raises(ValueError):
+        auth.register_user('sam', 'other', 'other@example.com')
+
+    ok, data = auth.authenticate_user('sam', 'pa55word')
+    assert ok and data['role'] == 'user' and data['last_login']
+    assert auth.authenticate_user('sam', 'wrong') == (False, None)
+    assert auth.authenticate_user('nobody', 'pa55word') == (False, None)
+
+def test_password_hasher_rejects_when_saturated(monkeypatch):
+    """Test that hashes beyond the workers and queue fail fast and metrics track the pool."""
+    release = threading.Event()
+    real_pbkdf2 = auth_system.hashlib.pbkdf2_hmac
+
+    def blocking_pbkdf2(*args):
+        release.wait()
+        return real_pbkdf2(*args)
+
+    monkeypatch.setattr(auth_system.hashlib, 'pbkdf2_hmac', blocking_pbkdf2)
+    hasher = PasswordHasher(max_workers=1, max_queue=1)
+    callers = [threading.Thread(target=hasher.hash, args=('pw', 'salt', ITERATIONS)) for _ in range(2)]
+    try:
+        for caller in callers:
+            caller.start()
+        deadline = time.time() + 5
+        while (hasher.stats()['active'], hasher.stats()['queue_depth']) != (1, 1) and time.time() < deadline:
+            time.sleep(0.01)
+        assert hasher.stats()['active'] == 1 and hasher.stats()['queue_depth'] == 1
+
+        start = time.perf_counter()
+        with pytest.raises(HasherBusyError):
+            hasher.hash('pw', 'salt', ITERATIONS)
+        assert time.perf_counter() - start < 0.1
+    finally:
+        release.set()
+        for caller in callers:
+            caller.join()
+
+    stats = hasher.stats()
+    assert stats['completed'] == 2 and stats['rejected'] == 1 and stats['queue_depth'] == 0
+    assert stats['hash_ms_p95'] > 0 and stats['wait_ms_p95'] >= stats['wait_ms_p50']
+    assert hasher.hash('pw', 'salt', ITERATIONS) == real_pbkdf2('sha256', b'pw', b'salt', ITERATIONS)
+    hasher.shutdown()
+
+@pytest.mark.parametrize('value', ['fast', '0'])
+def test_invalid_hash_cost_setting_falls_back(value):
+    """Test that a bad PASSWORD_HASH_ITERATIONS value logs a warning instead of breaking the import."""
+    script = (f"import sys; sys.path.append({WEEK_4_DIR!r}); "
+              "import auth_system; print(auth_system.PASSWORD_HASH_ITERATIONS)")
+    env = dict(os.environ, PASSWORD_HASH_ITERATIONS=value)
+
+    output = subprocess.run([sys.executable, '-c', script], env=env, capture_output=True, text=True, check=True)
+
+    assert output.stdout.strip() == '200000'
+    assert f"Ignoring invalid PASSWORD_HASH_ITERATIONS='{value}'" in output.stderr
+
+def test_login_rehashes_after_cost_change(auth, make_auth):
+    """Test that a successful login upgrades a hash made with another cost factor."""
+    auth.register_user('sam', 'pa55word', 'sam@example.com')
+    stronger = make_auth(password_iterations=ITERATIONS * 2)
+
+    assert stronger.authenticate_user('sam', 'pa55word')[0]
+    assert stronger.store.get_user('sam')['iterations'] == ITERATIONS * 2
+    assert stronger.authenticate_user('sam', 'pa55word')[0]
+    assert not stronger.authenticate_user('sam', 'wrong')[0]
+
+def test_api_keys_are_stored_hashed(auth, db_path):
+    """Test key validation, permissions and revocation, with only the hash on disk."""
+    key = auth.generate_api_key('Scout Team', ['read', 'write'])
+
+    assert auth.validate_api_key(key, ['read']) == (True, 'Scout Team', ['read', 'write'])
+    assert auth.validate_api_key(key, ['admin'])[0] is False
+    assert auth.validate_api_key('not-a-key') == (False, None, None)
+
+    with sqlite3.connect(db_path) as conn:
+        stored = [row[0] for row in conn.execute("SELECT key_hash FROM api_keys")]
+    assert stored == [hash_api_key(key)]
+
+    assert auth.revoke_api_key(key) is True
+    assert auth.revoke_api_key(key) is False
+    assert auth.validate_api_key(key)[0] is False
+
+def test_api_key_validation_is_cached(auth):
+    """Test that repeat validations skip the store and revocation takes effect at once."""
+    key = auth.generate_api_key('Scout Team', ['read', 'write'])
+    auth.validate_api_key(key)
+    auth.store.close()
+
+    assert auth.validate_api_key(key, ['read']) == (True, 'Scout Team', ['read', 'write'])
+    assert auth.validate_api_key(key, {'read', 'admin'}) == (False, 'Scout Team', ['read', 'write'])
+    assert auth.key_cache.stats()['hits'] == 2
+
+    auth.store = AuthStore(auth.store.path)
+    auth.revoke_api_key(key)
+    assert auth.key_cache.stats()['invalidations'] == 1
+    assert auth.validate_api_key(key) == (False, None, None)
+
+def test_api_key_decorator(auth):
+    """Test the 401 and 403 responses of the API key decorator."""
+    app = Flask(__name__)
+
+    @app.route('/write', methods=['POST'])
+    @require_api_key(auth, ['write'])
+    def write():
+        return {'owner': g.api_key_owner}
+
+    client = app.test_client()
+    reader = auth.generate_api_key('Reader', ['read'])
+    writer = auth.generate_api_key('Writer', ['read', 'write'])
+
+    assert client.post('/write').status_code == 401
+    assert client.post('/write', headers={'X-API-Key': 'wrong'}).status_code == 401
+    assert client.post('/write', headers={'X-API-Key': reader}).status_code == 403
+    response = client.post('/write', headers={'X-API-Key': writer})
+    assert response.status_code == 200 and response.get_json() == {'owner': 'Writer'}
+
+def test_data_persists_across_instances(auth, make_auth):
+    """Test that a new manager on the same database sees earlier changes."""
+    auth.register_user('sam', 'pa55word', 'sam@example.com', role='admin')
+    key = auth.generate_api_key('Sam', ['read'])
+
+    reopened = make_auth()
+
+    assert reopened.authenticate_user('sam', 'pa55word')[1]['role'] == 'admin'
+    assert reopened.validate_api_key(key)[0]
+    assert reopened.store.count_users() == 1
+
+def test_json_files_are_migrated_once(make_auth, tmp_path):
+    """Test that users and keys from the old JSON files are imported and the files retired."""
+    legacy = make_auth(store=AuthStore(':memory:'))
+    password_hash, salt = legacy._hash_password('pa55word')
+    (tmp_path / 'users.json').write_text(json.dumps({
+        'old': {'email': 'old@example.com', 'role': 'admin', 'password_hash': password_hash, 'salt': salt}}))
+    (tmp_path / 'api_keys.json').write_text(json.dumps({
+        'legacy-key': {'owner': 'Old Client', 'permissions': ['read']}}))
+
+    auth = make_auth()
+
+    assert auth.authenticate_user('old', 'pa55word')[0]
+    assert auth.validate_api_key('legacy-key', ['read'])[1] == 'Old Client'
+    assert sorted(os.listdir(tmp_path)) == ['api_keys.json.migrated', 'auth.db', 'auth.db-shm',
+                                            'auth.db-wal', 'users.json.migrated']
+
+def test_migration_tolerates_files_moved_by_another_process(make_auth, tmp_path, monkeypatch):
+    """Test that a JSON file retired by a concurrent migration does not fail startup."""
+    (tmp_path / 'api_keys.json').write_text(json.dumps({'legacy-key': {'owner': 'Old Client'}}))
+    replace = os.replace
+
+    def racing_replace(src, dst):
+        # The other process retires the file just before this one does
+        if os.path.exists(src):
+            replace(src, dst)
+        replace(src, dst)
+    monkeypatch.setattr(auth_system.os, 'replace', racing_replace)
+
+    auth = make_auth()
+
+    assert auth.validate_api_key('legacy-key')[1] == 'Old Client'
+    assert (tmp_path / 'api_keys.json.migrated').exists()
+
+def test_concurrent_registration_across_processes(db_path):
+    """Test that writers in several processes neither lose users nor duplicate a username."""
+    script = textwrap.dedent(f"""
+        import sys
+        sys.path.append({WEEK_4_DIR!r})
+        from auth_system import AuthManager
+        worker = sys.argv[1]
+        auth = AuthManager(db_path={db_path!r}, password_iterations={ITERATIONS})
+        for i in range(40):
+            auth.register_user(f"user{{worker}}_{{i}}", 'pw', f"{{worker}}{{i}}@example.com")
+        try:
+            auth.register_user('shared', 'pw', 'shared@example.com')
+            print('won')
+        except ValueError:
+            print('lost')
+    """)
+    AuthStore(db_path).close()
+    workers = [subprocess.Popen([sys.executable, '-c', script, str(n)], stdout=subprocess.PIPE, text=True)
+               for n in range(4)]
+    outcomes = [worker.communicate()[0].strip() for worker in workers]
+
+    assert sorted(outcomes) == ['lost', 'lost', 'lost', 'won']
+    store = AuthStore(db_path)
+    try:
+        assert store.count_users() == 4 * 40 + 1
+    finally:
+        store.close()
+
+def test_jwt_validation_is_cached(auth):
+    """Test token round trips, rejected tokens and that repeat validations hit the cache."""
+    token = auth.generate_jwt_token({'username': 'sam', 'email': 'sam@example.com', 'role': 'admin'})
+
+    ok, payload = auth.validate_jwt_token(token)
+    assert ok and payload['sub'] == 'sam' and payload['role'] == 'admin'
+    assert auth.validate_jwt_token(token) == (True, payload)
+    assert auth.token_cache.stats()['hits'] == 1
+
+    expired = jwt.encode({'sub': 'sam', 'jti': 'old', 'exp': int(time.time()) - 10},
+                         auth_system.JWT_SECRET, algorithm=auth_system.JWT_ALGORITHM)
+    forged = jwt.encode(payload, 'wrong-secret', algorithm=auth_system.JWT_ALGORITHM)
+    for bad in (expired, forged, token[:-2], '', None):
+        assert auth.validate_jwt_token(bad) == (False, None)
+
+def test_refresh_and_revocation_invalidate_cached_tokens(auth, make_auth):
+    """Test that refreshed and revoked tokens are rejected here and in other managers."""
+    token = auth.generate_jwt_token({'username': 'sam', 'role': 'user'})
+    other = make_auth()
+    assert auth.validate_jwt_token(token)[0] and other.validate_jwt_token(token)[0]
+
+    new_token = auth.refresh_jwt_token(token)
+
+    assert auth.validate_jwt_token(token) == (False, None)
+    assert auth.validate_jwt_token(new_token)[1]['sub'] == 'sam'
+    with pytest.raises(ValueError):
+        auth.refresh_jwt_token(token)
+    assert auth.revoke_jwt_token(new_token) is True
+    assert auth.validate_jwt_token(new_token) == (False, None)
+
+    # Another process only sees revocations once its cached entry is dropped
+    other.token_cache.clear()
+    assert other.validate_jwt_token(token) == (False, None)
+
+def test_token_cache_is_bounded_and_expires():
+    """Test LRU eviction and expiry at the earlier of the entry's expiry and the cache TTL."""
+    now = [1000.0]
+    cache = TokenCache(max_entries=2, ttl=60, clock=lambda: now[0])
+    cache.set('a', {'sub': 'a'}, expires_at=1010)
+    cache.set('b', {'sub': 'b'}, expires_at=2000)
+    cache.get('a')
+    cache.set('c', {'sub': 'c'})
+
+    assert cache.get('b') is None
+    assert cache.get('a')['sub'] == 'a' and cache.stats()['evictions'] == 1
+
+    now[0] = 1010
+    assert cache.get('a') is None
+    assert cache.get('c') is not None
+    now[0] = 1061
+    assert cache.get('c') is None
+    assert len(cache) == 0
+
+    disabled = TokenCache(max_entries=0)
+    disabled.set('a', {'sub': 'a'})
+    assert disabled.get('a') is None
+
+def test_jwt_decorators(auth):
+    """Test the 401 and 403 responses of the JWT and role decorators."""
+    app = Flask(__name__)
+
+    @app.route('/me')
+    @require_jwt_token(auth)
+    def me():
+        return {'user': g.jwt_payload['sub']}
+
+    @app.route('/admin')
+    @require_role(auth, ['admin'])
+    def admin():
+        return {'ok': True}
+
+    client = app.test_client()
+    user_token = auth.generate_jwt_token({'username': 'sam', 'role': 'user'})
+    admin_token = auth.generate_jwt_token({'username': 'ann', 'role': 'admin'})
+
+    assert client.get('/me').status_code == 401
+    assert client.get('/me', headers={'Authorization': 'Bearer nonsense'}).status_code == 401
+    response = client.get('/me', headers={'Authorization': f"Bearer {user_token}"})
+    assert response.status_code == 200 and response.get_json() == {'user': 'sam'}
+    assert client.get('/admin', headers={'Authorization': f"Bearer {user_token}"}).status_code == 403
+    assert client.get('/admin', headers={'Authorization': f"Bearer {admin_token}"}).status_code == 200
@@ -0,0 +1,87 @@
+"""
+Tests for the crawl checkpoint store.
+"""
+
+import sys
+import os
+import pytest
+
+# Add the src directory to the path for imports
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(__file__)), 'src'))
+from scraping.checkpoint import CrawlCheckpoint, content_hash
+
+
+@pytest.fixture
+def checkpoint(tmp_path):
+    store = CrawlCheckpoint(str(tmp_path / 'crawl.db'))
+    yield store
+    store.close()
+
+def test_start_run_registers_pending_keys(checkpoint):
+    """Test that a new crawl registers every key as pending."""
+    assert checkpoint.start_run(['a', 'b', 'c']) == ['a', 'b', 'c']
+    assert checkpoint.counts() == {'pending': 3, 'done': 0, 'failed': 0}
+
+def test_interrupted_run_resumes_unfinished_keys(checkpoint, tmp_path):
+    """Test that a rerun after a crash only returns unfinished keys."""
+    checkpoint.start_run(['a', 'b', 'c'])
+    checkpoint.mark_done('a', content_hash('A'))
+    checkpoint.mark_failed('b', 'timeout')
+    checkpoint.close()
+    
+    reopened = CrawlCheckpoint(str(tmp_path / 'crawl.db'))
+    assert reopened.start_run(['a', 'b', 'c']) == ['b', 'c']
+    assert reopened.get_entry('b')['error'] == 'timeout'
+    reopened.close()
+
+def test_completed_run_starts_fresh(checkpoint):
+    """Test that once nothing is pending, the next run fetches every key."""
+    checkpoint.start_run(['a', 'b'])
+    checkpoint.mark_done('a', 'h1')
+    checkpoint.mark_done('b', 'h2')
+    
+    assert checkpoint.start_run(['a', 'b']) == ['a', 'b']
+    assert checkpoint.get_entry('a')['content_hash'] == 'h1'
+
+def test_mark_done_reports_content_changes(checkpoint):
+    """Test that mark_done compares against the previous content hash."""
+    assert checkpoint.mark_done('a', 'h1') is True
+    assert checkpoint.mark_done('a', 'h1') is False
+    assert checkpoint.mark_done('a', 'h2') is True
+    assert checkpoint.get_entry('a')['attempts'] == 3
+
+def test_watermark_only_moves_forward(checkpoint):
+    """Test that watermarks keep the newest game date."""
+    assert checkpoint.get_watermark('T1') is None
+    checkpoint.set_watermark('T1', '2024-10-05')
+    checkpoint.set_watermark('T1', '2024-09-01')
+    assert checkpoint.get_watermark('T1') == '2024-10-05'
+
+def test_watermarks_are_kept_per_season(checkpoint):
+    """Test that each season has its own watermark and game log validators."""
+    checkpoint.set_watermark('T1', '2024-10-05', season='2024', validators={'If-None-Match': '"a"'})
+    checkpoint.set_watermark('T1', '2023-11-01', season='2023')
+    
+    assert checkpoint.get_watermark('T1', '2024') == '2024-10-05'
+    assert checkpoint.get_watermark('T1', '2023') == '2023-11-01'
+    assert checkpoint.get_watermark('T1') is None
+    assert checkpoint.get_validators('T1', '2024') == {'If-None-Match': '"a"'}
+    assert checkpoint.get_validators('T1', '2023') == {}
+
+def test_pages_are_kept_until_their_key_is_done(checkpoint):
+    """Test that saved pages survive until the key completes or a new run starts."""
+    checkpoint.start_run(['a', 'b'])
+    checkpoint.save_page('http://x/a?p=1', 'a', b'<p>A</p>', {'status_code': 200})
+    checkpoint.save_page('http://x/b', 'b', b'<p>B</p>')
+    
+    page = checkpoint.get_page('http://x/a?p=1')
+    assert page['content'] == b'<p>A</p>' and page['meta'] == {'status_code': 200}
+    assert page['content_hash'] == content_hash(b'<p>A</p>')
+    
+    checkpoint.mark_done('a', 'h1')
+    assert checkpoint.get_page('http://x/a?p=1') is None
+    checkpoint.mark_failed('b', 'timeout')
+    assert checkpoint.get_page('http://x/b')['key'] == 'b'
+    
+    checkpoint.start_run(['a', 'b'])
+    assert checkpoint.get_page('http://x/b') is None
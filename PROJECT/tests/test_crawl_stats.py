@@ -0,0 +1,134 @@
+"""
+Tests for crawl throughput statistics.
+"""
+
+import sys
+import os
+import pandas as pd
+import pytest
+
+# Add the src directory to the path for imports
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(__file__)), 'src'))
+from scraping.crawl_stats import CrawlStats, read_stats
+from scraping.ncaa_scraper import NCAAStatsScraper
+from scraping.rate_limiter import HostRateLimiter
+from scraping.stats_parser import DEFAULT_TABLE_ATTRS
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def scraper(stand_in_server, tmp_path):
+    page = '<table id="stat_grid"><thead><tr><th>Player</th><th>Goals</th></tr></thead>' \
+           '<tbody><tr><td>A</td><td>3</td></tr></tbody></table>'
+    stand_in_server.routes['/team'] = lambda h: (200, {'ETag': '"v1"'}, page) \
+        if h.headers.get('If-None-Match') != '"v1"' else (304, {}, b'')
+    return NCAAStatsScraper(base_url=stand_in_server.url,
+                            rate_limiter=HostRateLimiter(rate=1000, capacity=1000),
+                            cache_dir=str(tmp_path / 'cache'))
+
+def test_stage_timing_and_summary():
+    """Test stage totals, shares, rates and the bottleneck."""
+    clock = FakeClock()
+    stats = CrawlStats(clock=clock)
+    stats.start()
+    with stats.stage('request'):
+        clock.now += 3.0
+    with stats.stage('parse'):
+        clock.now += 1.0
+    stats.add(pages=8, bytes_downloaded=4000)
+    stats.finish()
+
+    summary = stats.summary()
+
+    assert summary['elapsed_s'] == 4.0
+    assert summary['request_s'] == 3.0 and summary['request_calls'] == 1
+    assert summary['request_share'] == 0.75
+    assert summary['pages_per_second'] == 2.0
+    assert summary['bytes_per_second'] == 1000.0
+    assert stats.bottleneck() == 'request'
+
+def test_reassign_moves_time_between_stages():
+    """Test that time timed inside one stage can be moved to another."""
+    clock = FakeClock()
+    stats = CrawlStats(clock=clock)
+    with stats.stage('request'):
+        clock.now += 3.0
+    stats.reassign(2.5, 'request', 'throttle', calls=2)
+
+    summary = stats.summary()
+
+    assert summary['request_s'] == 0.5 and summary['request_calls'] == 1
+    assert summary['throttle_s'] == 2.5 and summary['throttle_calls'] == 2
+    assert stats.bottleneck() == 'throttle'
+
+def test_write_appends_one_line_per_run(tmp_path):
+    """Test that each run is appended to the stats file."""
+    path = str(tmp_path / 'stats' / 'crawl_stats.jsonl')
+    for pages in (1, 2):
+        stats = CrawlStats()
+        stats.start()
+        stats.add(pages=pages)
+        stats.finish()
+        stats.write(path, season='2024')
+
+    runs = read_stats(path)
+
+    assert [run['pages'] for run in runs] == [1, 2]
+    assert runs[0]['season'] == '2024'
+
+def test_scraper_counts_pages_bytes_and_cache_hits(scraper, stand_in_server):
+    """Test that requests and parsing are recorded in the scraper's stats."""
+    url = f"{stand_in_server.url}/team"
+    first = scraper._make_request(url)
+    scraper._make_request(url)
+    scraper._parse_stats_table(first, table_attrs=DEFAULT_TABLE_ATTRS)
+
+    summary = scraper.stats.summary()
+
+    assert summary['pages'] == 2
+    assert summary['cache_hits'] == 1
+    assert summary['bytes_downloaded'] == len(first.content)
+    assert summary['request_calls'] == 2
+    assert summary['parse_calls'] == 1
+
+def test_crawl_writes_stats_file(scraper, monkeypatch, tmp_path):
+    """Test that a crawl counts teams and failures and writes its summary."""
+    def fake_crawl_team(team_id, season=None, since=None, validators=None):
+        if team_id == 'bad':
+            raise ValueError("boom")
+        return {'team_id': team_id, 'player_stats': pd.DataFrame(),
+                'game_results': pd.DataFrame(), 'error': None}
+
+    monkeypatch.setattr(scraper, '_crawl_team', fake_crawl_team)
+    path = str(tmp_path / 'crawl_stats.jsonl')
+
+    list(scraper.crawl_teams(['a', 'b', 'bad'], season='2024', stats_path=path))
+
+    run, = read_stats(path)
+    assert run['teams'] == 2
+    assert run['failures'] == 1
+    assert run['season'] == '2024'
+    assert run['finished_at'] is not None
+
+def test_rate_limiter_waits_count_as_throttle(stand_in_server):
+    """Test that waiting for a token is reported as throttling, not request time."""
+    for team_id in ('T1', 'T2'):
+        stand_in_server.routes[f"/teams/{team_id}"] = lambda h: (200, {}, '<p>no stats</p>')
+        stand_in_server.routes[f"/teams/{team_id}/games"] = lambda h: (200, {}, '<p>no games</p>')
+    rate = 20
+    scraper = NCAAStatsScraper(base_url=stand_in_server.url,
+                               rate_limiter=HostRateLimiter(rate=rate, capacity=1))
+
+    list(scraper.crawl_teams(['T1', 'T2'], max_workers=2))
+
+    summary = scraper.stats.summary()
+    assert summary['throttle_calls'] >= 2
+    assert summary['throttle_s'] >= 0.9 * 3 / rate
+    assert summary['request_s'] < summary['throttle_s']
@@ -0,0 +1,155 @@
+"""
+Tests for the JSON endpoint mode of the week 5 dynamic scraper.
+"""
+
+import sys
+import os
+import json
+import threading
+import time
+from urllib.parse import urlparse, parse_qs
+import pytest
+import requests
+
+# Add the week 5 course directory to the path for imports
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(os.path.join(REPO_DIR, 'COURSE', 'week_5'))
+import dynamic_scraper
+from dynamic_scraper import EndpointError, extract_via_json_endpoint, scrape_player_stats
+
+PLAYERS = [{'name': f"Player {i}", 'goals': i % 7} for i in range(95)]
+PAGE_SIZE = 10
+
+
+def players_route(delay=0.0, announce_total=True, not_found_past_end=False):
+    """Serve PLAYERS in pages, tracking how many requests overlap."""
+    state = {'active': 0, 'peak': 0, 'lock': threading.Lock()}
+
+    def route(handler):
+        query = parse_qs(urlparse(handler.path).query)
+        page = int(query['page'][0])
+        size = int(query.get('per_page', [PAGE_SIZE])[0])
+        with state['lock']:
+            state['active'] += 1
+            state['peak'] = max(state['peak'], state['active'])
+        time.sleep(delay)
+        with state['lock']:
+            state['active'] -= 1
+        records = PLAYERS[(page - 1) * size:page * size]
+        if not records and not_found_past_end:
+            return 404, {'Content-Type': 'application/json'}, json.dumps({'error': 'No such page'})
+        body = {'data': {'players': records}}
+        if announce_total:
+            body['meta'] = {'total': len(PLAYERS)}
+        return 200, {'Content-Type': 'application/json'}, json.dumps(body)
+
+    return route, state
+
+@pytest.fixture
+def config(stand_in_server):
+    return {
+        'url': f"{stand_in_server.url}/stats",
+        'data_endpoint': f"{stand_in_server.url}/api/players",
+        'params': {'season': '2024'},
+        'page_size_param': 'per_page',
+        'page_size': PAGE_SIZE,
+        'records_key': 'data.players',
+        'total_records_key': 'meta.total',
+    }
+
+def test_fetches_all_pages_in_order(stand_in_server, config):
+    """Test that every page is fetched once and records keep page order."""
+    stand_in_server.routes['/api/players'], _ = players_route()
+
+    players = extract_via_json_endpoint(config, max_workers=4)
+
+    assert players == PLAYERS
+    assert len(stand_in_server.requests) == 10
+    assert all('season=2024' in r['path'] for r in stand_in_server.requests)
+
+def test_pages_are_fetched_concurrently(stand_in_server, config):
+    """Test that pages after the first overlap, bounded by max_workers."""
+    route, state = players_route(delay=0.05)
+    stand_in_server.routes['/api/players'] = route
+
+    start = time.perf_counter()
+    extract_via_json_endpoint(config, max_workers=3)
+    elapsed = time.perf_counter() - start
+
+    assert state['peak'] == 3
+    assert elapsed < 10 * 0.05
+
+def test_paginates_until_empty_without_total(stand_in_server, config):
+    """Test that unannounced page counts are probed until an empty page."""
+    stand_in_server.routes['/api/players'], _ = players_route(announce_total=False)
+    del config['total_records_key']
+
+    players = extract_via_json_endpoint(config, max_workers=4)
+
+    assert players == PLAYERS
+
+def test_paginates_until_not_found_without_total(stand_in_server, config):
+    """Test that a 404 past the last page ends unannounced pagination."""
+    stand_in_server.routes['/api/players'], _ = players_route(announce_total=False, not_found_past_end=True)
+    del config['total_records_key']
+
+    players = extract_via_json_endpoint(config, max_workers=4)
+
+    assert players == PLAYERS
+
+    stand_in_server.routes['/api/players'] = lambda h: (404, {}, 'Not found')
+    with pytest.raises(requests.exceptions.HTTPError):
+        extract_via_json_endpoint(config)
+
+@pytest.mark.parametrize('id_key', [None, 'name'])
+def test_stops_when_page_param_is_ignored(stand_in_server, config, id_key):
+    """Test that an endpoint repeating its first page for every page number ends pagination."""
+    first = json.dumps({'data': {'players': PLAYERS[:PAGE_SIZE]}})
+    stand_in_server.routes['/api/players'] = lambda h: (200, {'Content-Type': 'application/json'}, first)
+    del config['total_records_key']
+    config['id_key'] = id_key
+
+    players = extract_via_json_endpoint(config, max_workers=4)
+
+    assert players == PLAYERS[:PAGE_SIZE]
+    assert len(stand_in_server.requests) == 1 + 4
+
+def test_stops_after_a_short_page(stand_in_server, config):
+    """Test that a page with fewer than page_size records is taken as the last."""
+    stand_in_server.routes['/api/players'], _ = players_route(announce_total=False)
+    del config['total_records_key']
+
+    players = extract_via_json_endpoint(config, max_workers=3)
+
+    assert players == PLAYERS
+    assert len(stand_in_server.requests) == 1 + 9
+
+def test_bad_payload_raises(stand_in_server, config):
+    """Test that HTML or a missing records key is reported."""
+    stand_in_server.routes['/api/players'] = lambda h: (200, {'Content-Type': 'text/html'}, '<html></html>')
+
+    with pytest.raises(EndpointError):
+        extract_via_json_endpoint(config)
+
+def test_browser_is_only_a_fallback(stand_in_server, config, monkeypatch):
+    """Test that the browser runs only when the endpoint fails."""
+    browser_calls = []
+    monkeypatch.setattr(dynamic_scraper, 'extract_with_browser',
+                        lambda cfg: browser_calls.append(cfg) or [{'name': 'From browser'}])
+    stand_in_server.routes['/api/players'], _ = players_route()
+
+    assert scrape_player_stats(config) == PLAYERS
+    assert browser_calls == []
+
+    stand_in_server.routes['/api/players'] = lambda h: (500, {}, 'error')
+    assert scrape_player_stats(config) == [{'name': 'From browser'}]
+    with pytest.raises(requests.exceptions.HTTPError):
+        scrape_player_stats(config, browser_fallback=False)
+
+def test_browser_needs_a_url(config, monkeypatch):
+    """Test that a config without a url is rejected before a browser starts."""
+    monkeypatch.setattr(dynamic_scraper, 'initialize_driver', lambda: pytest.fail("Browser was started"))
+    del config['url']
+
+    with pytest.raises(ValueError, match='url'):
+        dynamic_scraper.extract_with_browser(config)
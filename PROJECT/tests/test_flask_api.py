@@ -0,0 +1,177 @@
+"""
+Tests for the week 4 Flask API server.
+"""
+
+import sys
+import os
+import importlib
+import json
+import time
+import pytest
+
+# Add the week 4 course directory to the path for imports
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(os.path.join(REPO_DIR, 'COURSE', 'week_4'))
+from auth_system import AuthManager, HasherBusyError
+
+
+@pytest.fixture
+def api(tmp_path, monkeypatch):
+    # Importing the module writes books.json to the working directory
+    monkeypatch.chdir(tmp_path)
+    module = importlib.import_module('flask_api')
+    manager = AuthManager(db_path=str(tmp_path / 'auth.db'), password_iterations=1000)
+    store = module.BookStore(str(tmp_path / 'library.json'), flush_interval=0.05, books=module.SAMPLE_BOOKS)
+    monkeypatch.setattr(module, 'auth_manager', manager)
+    monkeypatch.setattr(module, 'book_store', store)
+    yield module
+    store.close()
+    manager.close()
+
+@pytest.fixture
+def client(api):
+    return api.app.test_client()
+
+def ids(response):
+    assert response.status_code == 200
+    return [book['id'] for book in response.get_json()]
+
+def test_require_api_key_checks_write_permission(api):
+    """Test that write routes need a valid, unrevoked key with write permission."""
+    view = api.require_api_key(lambda: 'ok')
+    reader = api.auth_manager.generate_api_key('Reader', ['read'])
+    writer = api.auth_manager.generate_api_key('Writer', ['read', 'write'])
+
+    def call(headers):
+        with api.app.test_request_context('/api/v1/books', method='POST', headers=headers):
+            result = view()
+        return result if result == 'ok' else result.status_code
+
+    assert call({}) == 401
+    assert call({'X-API-Key': 'not-a-key'}) == 401
+    assert call({'X-API-Key': reader}) == 403
+    assert call({'X-API-Key': writer}) == 'ok'
+    assert call({'X-API-Key': writer}) == 'ok'
+    assert api.auth_manager.key_cache.stats()['hits'] >= 1
+
+    api.auth_manager.revoke_api_key(writer)
+    assert call({'X-API-Key': writer}) == 401
+
+def test_register_and_login(api, client):
+    """Test that users register and log in through the AuthManager."""
+    user = {'username': 'sam', 'password': 'pa55word', 'email': 'sam@example.com'}
+
+    response = client.post('/api/v1/auth/register', json=user)
+    assert response.status_code == 201
+    assert response.get_json()['username'] == 'sam' and 'password_hash' not in response.get_json()
+    assert client.post('/api/v1/auth/register', json=user).status_code == 409
+    assert client.post('/api/v1/auth/register', json={'username': 'kim'}).status_code == 400
+
+    token = client.post('/api/v1/auth/login', json=user).get_json()['token']
+    assert api.auth_manager.validate_jwt_token(token)[1]['sub'] == 'sam'
+    assert client.post('/api/v1/auth/login', json=dict(user, password='wrong')).status_code == 401
+
+def test_saturated_password_hashing_returns_503(api, client, monkeypatch):
+    """Test that a full hashing pool is reported to login and registration as a retryable 503."""
+    def busy(*args, **kwargs):
+        raise HasherBusyError("busy")
+
+    monkeypatch.setattr(api.auth_manager.password_hasher, 'hash', busy)
+
+    for path in ('/api/v1/auth/register', '/api/v1/auth/login'):
+        response = client.post(path, json={'username': 'sam', 'password': 'pa55word'})
+        assert response.status_code == 503
+        assert response.headers['Retry-After'] == '1'
+
+def test_search_matches_every_query_word(client):
+    """Test token search over title, author and genre, with year filters and paging."""
+    assert ids(client.get('/api/v1/books/search?q=Great+GATSBY')) == ['1']
+    assert ids(client.get('/api/v1/books/search?q=fiction')) == ['1', '2']
+    assert ids(client.get('/api/v1/books/search?q=fiction&min_year=1950')) == ['2']
+    assert ids(client.get('/api/v1/books/search?q=fiction&offset=1&limit=5')) == ['2']
+    assert ids(client.get('/api/v1/books/search?q=orwell+gatsby')) == []
+    assert ids(client.get('/api/v1/books/search?q=gats')) == []
+    assert client.get('/api/v1/books/search').status_code == 400
+    assert client.get('/api/v1/books/search?q=fiction&limit=x').status_code == 400
+
+def test_list_filters_and_stats(client):
+    """Test genre, author and year range filters on the book list, and collection stats."""
+    assert ids(client.get('/api/v1/books')) == ['1', '2', '3']
+    assert ids(client.get('/api/v1/books?min_year=1940&max_year=1960')) == ['2', '3']
+    assert ids(client.get('/api/v1/books?max_year=1925')) == ['1']
+    assert ids(client.get('/api/v1/books?genre=fiction')) == ['1', '2']
+    assert ids(client.get('/api/v1/books?author=george+orwell')) == ['3']
+    assert ids(client.get('/api/v1/books?author=george')) == []
+    assert ids(client.get('/api/v1/books?offset=1&limit=1')) == ['2']
+    assert client.get('/api/v1/books/3').get_json()['title'] == '1984'
+    assert client.get('/api/v1/books/99').status_code == 404
+    assert client.get('/api/v1/stats').get_json() == {
+        'total_books': 3, 'books_per_genre': {'Fiction': 2, 'Dystopian': 1},
+        'oldest_year': 1925, 'newest_year': 1960}
+
+def test_writes_update_indexes_and_persist_behind(api, client, tmp_path):
+    """Test that create, update and delete keep the indexes current and reach the file."""
+    headers = {'X-API-Key': api.auth_manager.generate_api_key('Editor', ['read', 'write'])}
+
+    response = client.post('/api/v1/books', headers=headers,
+                           json={'title': 'Brave New World', 'author': 'Aldous Huxley',
+                                 'published_year': 1932, 'genre': 'Dystopian'})
+    assert response.status_code == 201
+    new_id = response.get_json()['id']
+    assert ids(client.get('/api/v1/books/search?q=huxley')) == [new_id]
+    assert ids(client.get('/api/v1/books?min_year=1930&max_year=1940')) == [new_id]
+
+    response = client.put(f"/api/v1/books/{new_id}", headers=headers,
+                          json={'title': 'Island', 'published_year': 1962})
+    assert response.get_json()['author'] == 'Aldous Huxley'
+    assert ids(client.get('/api/v1/books/search?q=brave')) == []
+    assert ids(client.get('/api/v1/books/search?q=island+huxley')) == [new_id]
+    assert ids(client.get('/api/v1/books?min_year=1961')) == [new_id]
+    assert ids(client.get('/api/v1/books'))[-1] == new_id
+
+    assert client.delete('/api/v1/books/2', headers=headers).status_code == 200
+    assert client.delete('/api/v1/books/2', headers=headers).status_code == 404
+    assert ids(client.get('/api/v1/books?genre=fiction')) == ['1']
+    assert client.post('/api/v1/books', headers=headers, json={'title': 'No author'}).status_code == 400
+    assert client.put('/api/v1/books/1', headers=headers, json={'published_year': '1925'}).status_code == 400
+
+    # The file is replaced atomically, but an earlier save may not include every write yet
+    expected = ['1', '3', new_id]
+    path = tmp_path / 'library.json'
+    saved = None
+    deadline = time.time() + 5
+    while saved != expected and time.time() < deadline:
+        if path.exists():
+            saved = [book['id'] for book in json.loads(path.read_text())]
+        time.sleep(0.02)
+    assert saved == expected
+
+def test_duplicate_ids_in_the_file_are_skipped(api, tmp_path, caplog):
+    """Test that a repeated ID in the books file keeps the first book and logs a warning."""
+    path = tmp_path / 'dupes.json'
+    path.write_text(json.dumps([
+        {'id': '1', 'title': 'Dune', 'author': 'Frank Herbert', 'published_year': 1965},
+        {'id': '1', 'title': 'Emma', 'author': 'Jane Austen', 'published_year': 1815},
+        {'id': '2', 'title': 'Ulysses', 'author': 'James Joyce', 'published_year': 1922},
+    ]))
+
+    store = api.BookStore(str(path), flush_interval=60)
+
+    assert len(store) == 2
+    assert store.get('1')['title'] == 'Dune'
+    assert store.search('emma') == [] and store.query(max_year=1900) == []
+    assert 'duplicate book ID 1' in caplog.text
+    store.close()
+
+def test_close_saves_pending_changes(api, tmp_path):
+    """Test that changes not yet written behind are saved on close and reloaded."""
+    path = str(tmp_path / 'slow.json')
+    store = api.BookStore(path, flush_interval=60, books=[])
+    store.add({'id': 'a', 'title': 'Dune', 'author': 'Frank Herbert', 'published_year': 1965})
+    assert not os.path.exists(path)
+
+    store.close()
+
+    reloaded = api.BookStore(path)
+    assert reloaded.search('dune')[0]['author'] == 'Frank Herbert'
+    assert reloaded.stats()['oldest_year'] == 1965
@@ -0,0 +1,183 @@
+"""
+Tests for the on-disk conditional-request HTTP cache.
+"""
+
+import sys
+import os
+import json
+import threading
+import time
+import pytest
+import requests
+
+# Add the src directory to the path for imports
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(__file__)), 'src'))
+from scraping.http_cache import HTTPCache, make_cache_key
+from scraping.ncaa_scraper import NCAAStatsScraper
+from scraping.rate_limiter import HostRateLimiter
+
+PAGE = '<html><table><tr><td>stats</td></tr></table></html>' * 20
+
+
+def etag_route(handler):
+    """Serve PAGE with an ETag, answering 304 when the client already has it."""
+    if handler.headers.get('If-None-Match') == '"v1"':
+        return 304, {'ETag': '"v1"'}, b''
+    return 200, {'ETag': '"v1"', 'Content-Type': 'text/html'}, PAGE
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+    
+    def __call__(self):
+        return self.now
+
+@pytest.fixture
+def scraper(stand_in_server, tmp_path):
+    stand_in_server.routes['/team'] = etag_route
+    return NCAAStatsScraper(base_url=stand_in_server.url,
+                            rate_limiter=HostRateLimiter(rate=1000, capacity=1000),
+                            cache_dir=str(tmp_path / 'cache'))
+
+def test_cache_key_ignores_param_order():
+    """Test that parameter order does not change the cache key."""
+    assert make_cache_key('u', {'a': 1, 'b': 2}) == make_cache_key('u', {'b': 2, 'a': 1})
+    assert make_cache_key('u', {'a': 1}) != make_cache_key('u', {'a': 2})
+
+def test_refetch_sends_validators_and_serves_304_from_cache(scraper, stand_in_server):
+    """Test that a 304 response is answered with the cached body."""
+    url = f"{stand_in_server.url}/team"
+    first = scraper._make_request(url, params={'id': 1})
+    second = scraper._make_request(url, params={'id': 1})
+    
+    assert second.status_code == 200
+    assert second.text == first.text == PAGE
+    assert stand_in_server.requests[1]['headers'].get('If-None-Match') == '"v1"'
+    
+    stats = scraper.cache.stats()
+    assert stats['hits'] == 1
+    assert stats['misses'] == 1
+    assert stats['revalidations'] == 1
+    assert stats['hit_ratio'] == 0.5
+    assert stats['bytes_saved'] == len(PAGE)
+
+def test_different_params_are_cached_separately(scraper, stand_in_server):
+    """Test that the cache is keyed by URL and params."""
+    url = f"{stand_in_server.url}/team"
+    scraper._make_request(url, params={'id': 1})
+    scraper._make_request(url, params={'id': 2})
+    
+    assert 'If-None-Match' not in stand_in_server.requests[1]['headers']
+    assert scraper.cache.stats()['entries'] == 2
+
+def test_cache_survives_restart(scraper, stand_in_server):
+    """Test that entries on disk are reused by a new cache instance."""
+    url = f"{stand_in_server.url}/team"
+    scraper._make_request(url)
+    
+    reopened = HTTPCache(scraper.cache.cache_dir)
+    assert reopened.lookup(url) is not None
+
+def test_responses_without_validators_are_not_cached(scraper, stand_in_server):
+    """Test that pages without ETag or Last-Modified are not stored."""
+    stand_in_server.routes['/plain'] = lambda h: (200, {}, 'plain')
+    scraper._make_request(f"{stand_in_server.url}/plain")
+    
+    assert scraper.cache.stats()['entries'] == 0
+    assert scraper.cache.stats()['misses'] == 0
+
+def test_ttl_eviction(tmp_path):
+    """Test that entries not revalidated within the TTL are dropped."""
+    clock = FakeClock()
+    cache = HTTPCache(str(tmp_path), ttl=60, clock=clock)
+    response = requests.Response()
+    response.status_code = 200
+    response._content = b'body'
+    response.headers['ETag'] = '"x"'
+    cache.store('http://h/a', None, response)
+    
+    clock.now += 30
+    assert cache.lookup('http://h/a') is not None
+    clock.now += 31
+    assert cache.lookup('http://h/a') is None
+    assert cache.stats()['evictions'] == 1
+    assert not os.listdir(tmp_path)
+
+def test_size_eviction_drops_least_recently_used(tmp_path):
+    """Test that the cache stays under max_bytes by evicting LRU entries."""
+    clock = FakeClock()
+    cache = HTTPCache(str(tmp_path), max_bytes=25, clock=clock)
+    for name in ['a', 'b', 'c']:
+        clock.now += 1
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b'x' * 10
+        response.headers['ETag'] = f'"{name}"'
+        response.url = f'http://h/{name}'
+        cache.store(f'http://h/{name}', None, response)
+        if name == 'b':
+            # Touch 'a' so 'b' becomes the least recently used
+            clock.now += 1
+            cache.serve(cache.lookup('http://h/a'))
+    
+    assert cache.lookup('http://h/a') is not None
+    assert cache.lookup('http://h/b') is None
+    assert cache.lookup('http://h/c') is not None
+    assert cache.stats()['stored_bytes'] <= 25
+
+def etag_response(body, etag):
+    response = requests.Response()
+    response.status_code = 200
+    response._content = body
+    response.headers['ETag'] = etag
+    return response
+
+def test_corrupt_metadata_is_dropped_on_load(tmp_path):
+    """Test that metadata files missing their fields are dropped instead of failing the load."""
+    cache = HTTPCache(str(tmp_path))
+    cache.store('http://h/good', None, etag_response(b'good', '"g"'))
+    good = json.loads((tmp_path / f"{make_cache_key('http://h/good')}.json").read_text())
+    broken = [('bad', {'url': 'http://h/bad'}), ('list', [1, 2])] + [
+        (f'no_{field}', {k: v for k, v in good.items() if k != field})
+        for field in ('url', 'status_code', 'headers')] + [('str_size', dict(good, size='4'))]
+    for name, meta in broken:
+        key = make_cache_key(f'http://h/{name}')
+        (tmp_path / f'{key}.json').write_text(json.dumps(meta))
+        (tmp_path / f'{key}.body').write_bytes(b'body')
+    
+    reopened = HTTPCache(str(tmp_path))
+    
+    assert reopened.stats()['entries'] == 1
+    assert reopened.lookup('http://h/good') is not None
+    assert sorted(os.listdir(tmp_path)) == sorted(f"{make_cache_key('http://h/good')}.{ext}"
+                                                  for ext in ('body', 'json'))
+
+def test_slow_disk_write_does_not_block_other_entries(tmp_path):
+    """Test that lookups and stores of other entries proceed while one entry's files are written."""
+    cache = HTTPCache(str(tmp_path))
+    slow_key = make_cache_key('http://h/slow')
+    writing, release = threading.Event(), threading.Event()
+    real_write = cache._write_atomic
+    
+    def slow_write(path, data):
+        if os.path.basename(path).startswith(slow_key):
+            writing.set()
+            release.wait(5)
+        real_write(path, data)
+    
+    cache._write_atomic = slow_write
+    writer = threading.Thread(target=cache.store, args=('http://h/slow', None, etag_response(b'slow', '"s"')))
+    writer.start()
+    try:
+        assert writing.wait(5)
+        start = time.perf_counter()
+        assert cache.store('http://h/fast', None, etag_response(b'fast', '"f"'))
+        assert cache.serve(cache.lookup('http://h/fast')).content == b'fast'
+        assert cache.stats()['entries'] == 1
+        assert time.perf_counter() - start < 1
+    finally:
+        release.set()
+        writer.join()
+    
+    assert cache.serve(cache.lookup('http://h/slow')).content == b'slow'
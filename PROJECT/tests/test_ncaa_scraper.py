@@ -0,0 +1,298 @@
+"""
+Tests for the NCAA stats scraper.
+"""
+
+import sys
+import os
+import threading
+import time
+import pandas as pd
+import pytest
+
+# Add the src directory to the path for imports
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(__file__)), 'src'))
+from scraping.ncaa_scraper import NCAAStatsScraper
+
+
+@pytest.fixture
+def scraper():
+    return NCAAStatsScraper(base_url="http://stats.example")
+
+def test_crawl_teams_streams_in_completion_order(scraper, monkeypatch):
+    """Test that finished teams are yielded before slower ones complete."""
+    delays = {'slow': 0.3, 'fast': 0.0}
+    
+    def fake_crawl_team(team_id, season=None, since=None, validators=None):
+        time.sleep(delays[team_id])
+        return {'team_id': team_id, 'player_stats': pd.DataFrame(),
+                'game_results': pd.DataFrame(), 'error': None}
+    
+    monkeypatch.setattr(scraper, '_crawl_team', fake_crawl_team)
+    
+    results = list(scraper.crawl_teams(['slow', 'fast'], max_workers=2))
+    
+    assert [r['team_id'] for r in results] == ['fast', 'slow']
+
+def test_crawl_teams_bounds_concurrency(scraper, monkeypatch):
+    """Test that no more than max_workers teams are fetched at once."""
+    lock = threading.Lock()
+    active = []
+    peak = []
+    
+    def fake_crawl_team(team_id, season=None, since=None, validators=None):
+        with lock:
+            active.append(team_id)
+            peak.append(len(active))
+        time.sleep(0.01)
+        with lock:
+            active.remove(team_id)
+        return {'team_id': team_id, 'player_stats': None, 'game_results': None, 'error': None}
+    
+    monkeypatch.setattr(scraper, '_crawl_team', fake_crawl_team)
+    
+    results = list(scraper.crawl_teams(range(30), max_workers=3))
+    
+    assert sorted(r['team_id'] for r in results) == list(range(30))
+    assert max(peak) <= 3
+
+def test_crawl_teams_reports_failures(scraper, monkeypatch):
+    """Test that one failing team does not stop the crawl."""
+    def fake_crawl_team(team_id, season=None, since=None, validators=None):
+        if team_id == 'bad':
+            raise RuntimeError("boom")
+        return {'team_id': team_id, 'player_stats': None, 'game_results': None, 'error': None}
+    
+    monkeypatch.setattr(scraper, '_crawl_team', fake_crawl_team)
+    
+    results = {r['team_id']: r for r in scraper.crawl_teams(['good', 'bad'])}
+    
+    assert results['good']['error'] is None
+    assert isinstance(results['bad']['error'], RuntimeError)
+
+def test_crawl_teams_resumes_from_checkpoint(scraper, monkeypatch, tmp_path):
+    """Test that a crawl killed midway only refetches unfinished teams."""
+    from scraping.checkpoint import CrawlCheckpoint
+    checkpoint = CrawlCheckpoint(str(tmp_path / 'crawl.db'))
+    crawled = []
+    
+    def fake_crawl_team(team_id, season=None, since=None, validators=None):
+        crawled.append(team_id)
+        return {'team_id': team_id, 'player_stats': pd.DataFrame({'goals': [1]}),
+                'game_results': pd.DataFrame(), 'error': None}
+    
+    monkeypatch.setattr(scraper, '_crawl_team', fake_crawl_team)
+    
+    # Simulate a crash after the first team completes
+    crawl = scraper.crawl_teams(['T1', 'T2', 'T3'], season='2024', max_workers=1, checkpoint=checkpoint)
+    finished = next(crawl)['team_id']
+    crawl.close()
+    crawled.clear()
+    
+    results = list(scraper.crawl_teams(['T1', 'T2', 'T3'], season='2024', max_workers=1,
+                                       checkpoint=checkpoint))
+    
+    unfinished = sorted({'T1', 'T2', 'T3'} - {finished})
+    assert sorted(crawled) == unfinished
+    assert sorted(r['team_id'] for r in results) == unfinished
+    assert checkpoint.counts()['done'] == 3
+    checkpoint.close()
+
+def test_incremental_crawl_uses_watermarks(scraper, monkeypatch, tmp_path):
+    """Test that incremental crawls only ask for games after the watermark."""
+    from scraping.checkpoint import CrawlCheckpoint
+    checkpoint = CrawlCheckpoint(str(tmp_path / 'crawl.db'))
+    requested_since = {}
+    
+    def fake_crawl_team(team_id, season=None, since=None, validators=None):
+        requested_since[team_id] = since
+        games = pd.DataFrame({'date': ['2024-09-01', '2024-09-08']})
+        return {'team_id': team_id, 'player_stats': pd.DataFrame(),
+                'game_results': games, 'error': None}
+    
+    monkeypatch.setattr(scraper, '_crawl_team', fake_crawl_team)
+    
+    first = list(scraper.crawl_teams(['T1'], checkpoint=checkpoint, incremental=True))
+    second = list(scraper.crawl_teams(['T1'], checkpoint=checkpoint, incremental=True))
+    
+    assert requested_since['T1'] == '2024-09-08'
+    assert first[0]['changed'] is True
+    assert second[0]['changed'] is False
+    checkpoint.close()
+
+def test_watermarks_are_kept_per_season(scraper, monkeypatch, tmp_path):
+    """Test that a season's watermark is not applied to other seasons, and unparsed dates set none."""
+    from scraping.checkpoint import CrawlCheckpoint
+    checkpoint = CrawlCheckpoint(str(tmp_path / 'crawl.db'))
+    checkpoint.set_watermark('T1', '2024-10-05', season='2024')
+    requested_since = {}
+    dates = {'2023': ['2023-09-02'], None: ['TBD', 'Postponed']}
+    
+    def fake_crawl_team(team_id, season=None, since=None, validators=None):
+        requested_since[season] = since
+        games = pd.DataFrame({'date': pd.to_datetime(pd.Series(dates[season]), format='%Y-%m-%d',
+                                                     errors='coerce').dt.strftime('%Y-%m-%d')})
+        return {'team_id': team_id, 'player_stats': pd.DataFrame(),
+                'game_results': games, 'error': None}
+    
+    monkeypatch.setattr(scraper, '_crawl_team', fake_crawl_team)
+    
+    list(scraper.crawl_teams(['T1'], season='2023', checkpoint=checkpoint, incremental=True))
+    list(scraper.crawl_teams(['T1'], checkpoint=checkpoint, incremental=True))
+    
+    assert requested_since == {'2023': None, None: None}
+    assert checkpoint.get_watermark('T1', '2023') == '2023-09-02'
+    assert checkpoint.get_watermark('T1', '2024') == '2024-10-05'
+    assert checkpoint.get_watermark('T1') is None
+    checkpoint.close()
+
+def test_incremental_crawl_requires_checkpoint(scraper):
+    """Test that incremental mode without a checkpoint is rejected."""
+    with pytest.raises(ValueError):
+        list(scraper.crawl_teams(['T1'], incremental=True))
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+GAME_LOG_PAGE = """<table id="game_log">
+  <thead><tr><th>Date</th><th>Opponent</th><th>Result</th><th>Goals</th></tr></thead>
+  <tbody>
+    <tr><td>09/01/2024</td><td>Eastern State</td><td>W 2-1</td><td>2</td></tr>
+    <tr><td>09/08/2024</td><td>Northern Tech</td><td>L 0-1</td><td>0</td></tr>
+  </tbody>
+</table>"""
+
+def test_crawl_fetches_team_pages_at_the_limited_rate(stand_in_server):
+    """Test that a crawl of a stand-in site fetches and parses each team's pages through the rate limiter."""
+    from scraping.rate_limiter import HostRateLimiter
+    with open(os.path.join(FIXTURES_DIR, 'team_stats_page.html'), 'rb') as f:
+        stats_page = f.read()
+    grants = []
+    
+    class RecordingLimiter(HostRateLimiter):
+        def acquire(self, url):
+            waited = super().acquire(url)
+            grants.append(time.monotonic())
+            return waited
+    
+    def page(body):
+        return lambda handler: (200, {'Content-Type': 'text/html; charset=utf-8'}, body)
+    
+    for team_id in ('T1', 'T2', 'T3'):
+        stand_in_server.routes[f"/teams/{team_id}"] = page(stats_page)
+        stand_in_server.routes[f"/teams/{team_id}/games"] = page(GAME_LOG_PAGE)
+    rate = 20
+    scraper = NCAAStatsScraper(base_url=stand_in_server.url,
+                               rate_limiter=RecordingLimiter(rate=rate, capacity=1))
+    
+    results = {r['team_id']: r for r in scraper.crawl_teams(['T1', 'T2', 'T3'], season='2024',
+                                                            max_workers=3)}
+    
+    assert all(r['error'] is None for r in results.values())
+    assert scraper.stats.summary()['pages'] == 6
+    assert sorted(r['path'] for r in stand_in_server.requests) == sorted(
+        f"/teams/{t}{page}?year=2024" for t in ('T1', 'T2', 'T3') for page in ('', '/games'))
+    players = results['T1']['player_stats']
+    assert list(players.columns[:2]) == ['jersey', 'player'] and len(players) > 0
+    assert results['T2']['game_results']['date'].tolist() == ['2024-09-01', '2024-09-08']
+    assert scraper.get_game_results('T3', since='2024-09-01')['opponent'].tolist() == ['Northern Tech']
+    # One token per 1/rate seconds, shared by all three workers: the k-th
+    # grant cannot come before k/rate (a thread may record its grant late)
+    grants.sort()
+    assert len(grants) == 7
+    assert all(grant - grants[0] >= (k - 0.5) / rate for k, grant in enumerate(grants))
+
+def test_resumed_crawl_skips_pages_already_fetched(stand_in_server, tmp_path):
+    """Test that pages fetched before a crash are served from the checkpoint, not requested again."""
+    from scraping.checkpoint import CrawlCheckpoint
+    from scraping.rate_limiter import HostRateLimiter
+    checkpoint = CrawlCheckpoint(str(tmp_path / 'crawl.db'))
+    for team_id in ('T1', 'T2'):
+        stand_in_server.routes[f"/teams/{team_id}"] = lambda h: (200, {}, '<p>no stats yet</p>')
+        stand_in_server.routes[f"/teams/{team_id}/games"] = lambda h: (200, {}, GAME_LOG_PAGE)
+    scraper = NCAAStatsScraper(base_url=stand_in_server.url,
+                               rate_limiter=HostRateLimiter(rate=1000, capacity=1000))
+    
+    # Die after one team is recorded; the other is fetched but never recorded
+    crawl = scraper.crawl_teams(['T1', 'T2'], max_workers=1, checkpoint=checkpoint)
+    unfinished = ({'T1', 'T2'} - {next(crawl)['team_id']}).pop()
+    crawl.close()
+    assert len(stand_in_server.requests) == 4
+    assert checkpoint.get_entry(f"team/{unfinished}/season/current")['status'] == 'pending'
+    
+    resumed = list(scraper.crawl_teams(['T1', 'T2'], max_workers=1, checkpoint=checkpoint))
+    
+    assert len(stand_in_server.requests) == 4
+    assert [r['team_id'] for r in resumed] == [unfinished]
+    assert resumed[0]['game_results']['date'].tolist() == ['2024-09-01', '2024-09-08']
+    assert scraper.stats.summary()['cache_hits'] == 2
+    
+    # The next run starts fresh and fetches every page again
+    list(scraper.crawl_teams(['T1', 'T2'], max_workers=1, checkpoint=checkpoint))
+    assert len(stand_in_server.requests) == 8
+    checkpoint.close()
+
+def test_incremental_crawl_revalidates_the_game_log(stand_in_server, tmp_path):
+    """Test that an unmodified game log costs one conditional request and skips the stats page."""
+    from scraping.checkpoint import CrawlCheckpoint
+    from scraping.rate_limiter import HostRateLimiter
+    checkpoint = CrawlCheckpoint(str(tmp_path / 'crawl.db'))
+    game_log = {'etag': '"v1"', 'body': GAME_LOG_PAGE}
+    
+    def games_route(handler):
+        if handler.headers.get('If-None-Match') == game_log['etag']:
+            return 304, {'ETag': game_log['etag']}, ''
+        return 200, {'ETag': game_log['etag']}, game_log['body']
+    
+    stand_in_server.routes['/teams/T1'] = lambda h: (200, {}, '<p>no stats yet</p>')
+    stand_in_server.routes['/teams/T1/games'] = games_route
+    scraper = NCAAStatsScraper(base_url=stand_in_server.url,
+                               rate_limiter=HostRateLimiter(rate=1000, capacity=1000))
+    
+    def crawl():
+        return list(scraper.crawl_teams(['T1'], season='2024', checkpoint=checkpoint, incremental=True))[0]
+    
+    first = crawl()
+    assert len(first['game_results']) == 2
+    assert checkpoint.get_watermark('T1', '2024') == '2024-09-08'
+    
+    unchanged = crawl()
+    assert unchanged['unchanged'] is True and unchanged['changed'] is False
+    assert unchanged['player_stats'] is None and unchanged['game_results'] is None
+    assert [r['path'] for r in stand_in_server.requests[2:]] == ['/teams/T1/games?year=2024']
+    assert stand_in_server.requests[2]['headers']['If-None-Match'] == '"v1"'
+    
+    game_log['etag'] = '"v2"'
+    game_log['body'] = GAME_LOG_PAGE.replace('</tbody>', '<tr><td>09/15/2024</td><td>Western</td>'
+                                             '<td>W 3-0</td><td>3</td></tr></tbody>')
+    delta = crawl()
+    assert delta['game_results']['opponent'].tolist() == ['Western']
+    assert len(stand_in_server.requests) == 5
+    assert checkpoint.get_validators('T1', '2024') == {'If-None-Match': '"v2"'}
+    checkpoint.close()
+
+def test_import_is_lazy_and_side_effect_free(tmp_path):
+    """Test that importing the module loads no heavy dependency, keeps sys.path and writes no files."""
+    import subprocess
+    src_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'src')
+    lazy = ('pandas', 'requests', 'bs4', 'scraping.transport', 'scraping.http_cache',
+            'scraping.replay', 'scraping.stats_parser')
+    probe = ("import sys; path = list(sys.path); import scraping.ncaa_scraper; "
+             f"assert sys.path == path, 'sys.path changed'; "
+             f"print(','.join(m for m in {lazy!r} if m in sys.modules))")
+    env = dict(os.environ, PYTHONPATH=src_dir, PYTHONDONTWRITEBYTECODE='1')
+    
+    output = subprocess.run([sys.executable, '-c', probe], cwd=tmp_path, env=env,
+                            capture_output=True, text=True, check=True).stdout
+    
+    assert output.strip() == ''
+    assert os.listdir(tmp_path) == []
+
+def test_runs_as_a_script(tmp_path):
+    """Test that the module still runs as a plain script, outside the package."""
+    import subprocess
+    script = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'src', 'scraping', 'ncaa_scraper.py')
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE='1')
+    env.pop('PYTHONPATH', None)
+    
+    subprocess.run([sys.executable, script], cwd=tmp_path, env=env, capture_output=True, check=True)
+    
+    assert os.listdir(tmp_path) == ['scraper.log']
@@ -0,0 +1,111 @@
+"""
+Tests for blocked player identity resolution.
+"""
+
+import sys
+import os
+import pandas as pd
+import pytest
+
+# Add the src directory to the path for imports
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(__file__)), 'src'))
+from analysis.player_identity import (
+    PlayerIdentityResolver,
+    normalize_name,
+    first_name_similarity,
+    name_similarity
+)
+
+
+@pytest.fixture
+def records():
+    return pd.DataFrame([
+        # Same player across seasons and sources, spelled differently
+        {'first_name': 'Michael', 'last_name': 'Rodríguez', 'team': 'UNC', 'season': '2022', 'source': 'ncaa'},
+        {'first_name': 'Mike', 'last_name': 'Rodriguez', 'team': 'UNC', 'season': '2023', 'source': 'roster'},
+        {'first_name': 'M.', 'last_name': 'Rodriguez Jr.', 'team': 'UNC', 'season': '2023', 'source': 'manual'},
+        # Transfer to another team with the same spelling
+        {'first_name': 'Michael', 'last_name': 'Rodriguez', 'team': 'DUKE', 'season': '2024', 'source': 'ncaa'},
+        # A different player on the same roster
+        {'first_name': 'Maria', 'last_name': 'Rodrigues', 'team': 'UNC', 'season': '2023', 'source': 'roster'},
+        {'first_name': 'Sam', 'last_name': 'Okafor', 'team': 'UVA', 'season': '2023', 'source': 'ncaa'},
+    ])
+
+def test_normalize_name():
+    """Test accent, punctuation and suffix normalization."""
+    assert normalize_name('Rodríguez Jr.') == 'rodriguez'
+    assert normalize_name("O'Neil-Smith") == 'o neil smith'
+    assert normalize_name(None) == ''
+
+def test_name_similarity():
+    """Test nickname, initial and typo handling."""
+    assert first_name_similarity('mike', 'michael') == 0.95
+    assert first_name_similarity('m', 'michael') < first_name_similarity('alex', 'alexander')
+    assert name_similarity('john', 'smith', 'john', 'smith') == 1.0
+    assert name_similarity('john', 'smith', 'john', 'smyth') > 0.85
+    assert name_similarity('john', 'smith', 'peter', 'jones') < 0.5
+
+def test_resolve_links_variants(records):
+    """Test that spelling variants and transfers share one canonical ID."""
+    resolved = PlayerIdentityResolver().resolve(records)
+    ids = resolved['canonical_id']
+
+    assert ids[0] == ids[1] == ids[2] == ids[3]
+    assert ids[4] != ids[0]
+    assert ids[5] not in set(ids[:5])
+    assert resolved.loc[:, records.columns].equals(records)
+
+def test_roster_conflicts_are_never_merged():
+    """Test that two entries on the same roster stay separate players."""
+    records = pd.DataFrame([
+        {'first_name': 'Jon', 'last_name': 'Smith', 'team': 'UNC', 'season': '2023', 'source': 'ncaa'},
+        {'first_name': 'Jonathan', 'last_name': 'Smith', 'team': 'UNC', 'season': '2023', 'source': 'ncaa'},
+    ])
+
+    resolved = PlayerIdentityResolver().resolve(records)
+
+    assert resolved['canonical_id'].nunique() == 2
+
+def test_source_ids_link_records():
+    """Test that a shared source ID links records whatever the names say."""
+    records = pd.DataFrame([
+        {'first_name': 'Kai', 'last_name': 'Nakamura', 'team': 'UNC', 'source': 'ncaa', 'source_id': '991'},
+        {'first_name': 'Kaito', 'last_name': 'Nakamura-Lee', 'team': 'UNC', 'source': 'ncaa', 'source_id': '991'},
+    ])
+
+    resolved = PlayerIdentityResolver().resolve(records)
+
+    assert resolved['canonical_id'].nunique() == 1
+
+def test_ids_are_stable(records):
+    """Test that IDs ignore input order and existing IDs are kept."""
+    resolver = PlayerIdentityResolver()
+    first = resolver.resolve(records)
+    shuffled = resolver.resolve(records.sample(frac=1, random_state=3))
+    assert shuffled['canonical_id'].sort_index().equals(first['canonical_id'])
+
+    # A later run keeps earlier IDs and extends them to new records
+    known = first.assign(canonical_id=first['canonical_id'].where(first.index != 0, 'PL-legacy'))
+    known.loc[1:3, 'canonical_id'] = None
+    new = pd.DataFrame([{'first_name': 'Michael', 'last_name': 'Rodriguez', 'team': 'DUKE',
+                         'season': '2025', 'source': 'ncaa', 'canonical_id': None}])
+    rerun = resolver.resolve(pd.concat([known, new], ignore_index=True))
+
+    assert (rerun.loc[[0, 1, 2, 3, 6], 'canonical_id'] == 'PL-legacy').all()
+    assert rerun.loc[5, 'canonical_id'] == first.loc[5, 'canonical_id']
+
+def test_blocking_avoids_all_pairs():
+    """Test that unrelated names are never compared."""
+    syllables = ['ba', 'ke', 'lo', 'mi', 'nu', 'ra', 'so', 'ti', 'vo', 'we']
+    names = [a + b + c for a in syllables for b in syllables for c in syllables][:500]
+    records = pd.DataFrame({
+        'first_name': names[::-1],
+        'last_name': names,
+        'team': [f"T{i % 20}" for i in range(500)],
+    })
+    resolver = PlayerIdentityResolver()
+
+    resolver.resolve(records)
+
+    assert resolver.stats['entries'] == 500
+    assert resolver.stats['comparisons'] < 500 * 499 // 2 // 10
@@ -17,7 +17,9 @@ from analysis.player_metrics import (
     calculate_shot_accuracy,
     calculate_conversion_rate,
     calculate_efficiency_score,
-    compare_players
+    compare_players,
+    build_metrics_snapshot,
+    FLOAT32_RELATIVE_ERROR_BOUND
 )
 
 # Sample data for testing
@@ -133,4 +135,58 @@ def test_handle_zero_division(sample_player_data):
     
     # Test assists per 90
     assists_per_90 = calculate_assists_per_90(sample_player_data)
-    assert np.isnan(assists_per_90.iloc[4])
\ No newline at end of file
+    assert np.isnan(assists_per_90.iloc[4])
+
+def test_compare_players_float32(sample_player_data):
+    """Test that float32 mode stores metrics in single precision within bounds."""
+    metrics = ['goals_per_90', 'assists_per_90', 'goal_contributions',
+               'shot_accuracy', 'conversion_rate', 'efficiency_score']
+    expected = compare_players(sample_player_data, metrics)
+    result = compare_players(sample_player_data, metrics, dtype='float32')
+    
+    assert (result.dtypes == np.float32).all()
+    np.testing.assert_allclose(result.to_numpy(dtype=np.float64),
+                               expected.to_numpy(dtype=np.float64),
+                               rtol=FLOAT32_RELATIVE_ERROR_BOUND)
+
+def test_compare_players_float32_rankings_stable():
+    """Test that float32 metrics rank players the same way as float64."""
+    rng = np.random.default_rng(0)
+    n = 50_000
+    shots = rng.integers(0, 60, n)
+    shots_on_goal = (shots * rng.random(n)).astype(np.int64)
+    player_stats = pd.DataFrame({
+        'minutes': rng.integers(0, 2000, n),
+        'goals': (shots_on_goal * rng.random(n)).astype(np.int64),
+        'assists': rng.integers(0, 15, n),
+        'shots': shots,
+        'shots_on_goal': shots_on_goal,
+    })
+    metrics = ['goals_per_90', 'assists_per_90', 'shot_accuracy',
+               'conversion_rate', 'efficiency_score']
+    full = compare_players(player_stats, metrics)
+    reduced = compare_players(player_stats, metrics, dtype='float32').astype(np.float64)
+    
+    # Ratio metrics keep exactly the same ranking
+    for metric in ['goals_per_90', 'assists_per_90', 'shot_accuracy', 'conversion_rate']:
+        pd.testing.assert_series_equal(full[metric].rank(method='dense'),
+                                       reduced[metric].rank(method='dense'))
+    
+    # Efficiency score may only swap players that are within the error bound
+    order = reduced['efficiency_score'].dropna().sort_values(kind='stable').index
+    in_float32_order = full['efficiency_score'].loc[order].to_numpy()
+    steps = np.diff(in_float32_order)
+    assert (steps >= -FLOAT32_RELATIVE_ERROR_BOUND * np.abs(in_float32_order[1:])).all()
+
+def test_compare_players_rejects_unknown_dtype(sample_player_data):
+    """Test that unsupported precisions are rejected."""
+    with pytest.raises(ValueError):
+        compare_players(sample_player_data, dtype='float16')
+
+def test_build_metrics_snapshot(sample_player_data):
+    """Test that the snapshot keeps identifiers next to the metrics."""
+    snapshot = build_metrics_snapshot(sample_player_data, ['goals_per_90'], dtype='float32')
+    
+    assert list(snapshot.columns) == ['player_id', 'first_name', 'last_name',
+                                      'team', 'position', 'goals_per_90']
+    assert snapshot['goals_per_90'].dtype == np.float32
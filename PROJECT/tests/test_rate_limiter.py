@@ -0,0 +1,85 @@
+"""
+Tests for the per-host token-bucket rate limiter.
+"""
+
+import sys
+import os
+import threading
+import pytest
+
+# Add the src directory to the path for imports
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(__file__)), 'src'))
+from scraping.rate_limiter import TokenBucket, HostRateLimiter
+
+
+class FakeClock:
+    """A manually advanced clock whose sleep moves time forward."""
+    
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+    
+    def __call__(self):
+        return self.now
+    
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+def test_bucket_allows_burst_then_waits(clock):
+    """Test that a full bucket serves its capacity immediately, then throttles."""
+    bucket = TokenBucket(rate=2, capacity=3, clock=clock, sleep=clock.sleep)
+    
+    assert [bucket.acquire() for _ in range(3)] == [0, 0, 0]
+    
+    # The fourth request waits for one token at 2 tokens per second
+    assert bucket.acquire() == pytest.approx(0.5)
+    assert clock.now == pytest.approx(0.5)
+
+def test_bucket_refills_over_time(clock):
+    """Test that tokens refill with elapsed time up to capacity."""
+    bucket = TokenBucket(rate=1, capacity=2, clock=clock, sleep=clock.sleep)
+    bucket.acquire()
+    bucket.acquire()
+    
+    clock.now += 10
+    assert bucket.try_acquire() == 0
+    assert bucket.try_acquire() == 0
+    assert bucket.try_acquire() > 0
+
+def test_bucket_rejects_invalid_rate():
+    """Test that non-positive rates are rejected."""
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+
+def test_limiter_keeps_separate_buckets_per_host():
+    """Test that each host has its own budget and overrides apply."""
+    limiter = HostRateLimiter(rate=0.001, capacity=1, host_rates={'fast.example': (1000, 5)})
+    
+    assert limiter.acquire('https://a.example/page1') == 0
+    assert limiter.acquire('https://b.example/page1') == 0
+    assert limiter._get_bucket('a.example').try_acquire() > 0
+    
+    for _ in range(5):
+        assert limiter.acquire('https://fast.example/stats') == 0
+
+def test_limiter_is_shared_across_threads():
+    """Test that concurrent callers never exceed the burst size."""
+    limiter = HostRateLimiter(rate=0.001, capacity=4)
+    bucket = limiter._get_bucket('stats.example')
+    granted = []
+    
+    def worker():
+        granted.append(bucket.try_acquire() == 0)
+    
+    threads = [threading.Thread(target=worker) for _ in range(20)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    
+    assert sum(granted) == 4
@@ -0,0 +1,83 @@
+"""
+Tests for record-and-replay HTTP mode.
+"""
+
+import sys
+import os
+import json
+import pytest
+
+# Add the src directory to the path for imports
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(__file__)), 'src'))
+from scraping.ncaa_scraper import NCAAStatsScraper
+from scraping.rate_limiter import HostRateLimiter
+from scraping.replay import ReplayAdapter, ReplayMissError
+
+
+def make_scraper(base_url, **kwargs):
+    return NCAAStatsScraper(base_url=base_url,
+                            rate_limiter=HostRateLimiter(rate=1000, capacity=1000), **kwargs)
+
+@pytest.fixture
+def archive(stand_in_server, tmp_path):
+    """Record two pages from the stand-in server into an archive."""
+    counter = {'n': 0}
+    
+    def stats(handler):
+        counter['n'] += 1
+        return 200, {'Content-Type': 'text/html; charset=utf-8'}, f'<p>visit {counter["n"]}</p>'
+    stand_in_server.routes['/stats'] = stats
+    stand_in_server.routes['/team'] = lambda h: (200, {'ETag': '"t"'}, '<p>team</p>')
+    
+    path = str(tmp_path / 'archive.jsonl')
+    scraper = make_scraper(stand_in_server.url, record_path=path)
+    scraper._make_request(f"{stand_in_server.url}/stats", params={'id': 1})
+    scraper._make_request(f"{stand_in_server.url}/stats", params={'id': 1})
+    scraper._make_request(f"{stand_in_server.url}/team")
+    return path
+
+def test_recording_archives_every_exchange(archive):
+    """Test that each request/response pair is appended to the archive."""
+    with open(archive) as f:
+        entries = [json.loads(line) for line in f]
+    
+    assert len(entries) == 3
+    assert entries[0]['url'].endswith('/stats?id=1')
+    assert entries[2]['headers']['ETag'] == '"t"'
+
+def test_replay_serves_recordings_in_order(archive, stand_in_server):
+    """Test that replay is deterministic and never touches the network."""
+    seen = len(stand_in_server.requests)
+    scraper = make_scraper(stand_in_server.url, replay_path=archive)
+    url = f"{stand_in_server.url}/stats"
+    
+    bodies = [scraper._make_request(url, params={'id': 1}).text for _ in range(3)]
+    
+    assert bodies == ['<p>visit 1</p>', '<p>visit 2</p>', '<p>visit 2</p>']
+    assert scraper._make_request(f"{stand_in_server.url}/team").headers['ETag'] == '"t"'
+    assert len(stand_in_server.requests) == seen
+
+def test_replay_miss_raises(archive):
+    """Test that unrecorded requests fail instead of going to the network."""
+    scraper = make_scraper("http://127.0.0.1:9", replay_path=archive)
+    
+    with pytest.raises(ReplayMissError):
+        scraper._make_request("http://127.0.0.1:9/unknown")
+
+def test_latency_injection(archive, stand_in_server):
+    """Test fixed and ranged latency injection."""
+    sleeps = []
+    adapter = ReplayAdapter(archive, latency=(0.01, 0.02), sleep=sleeps.append)
+    scraper = make_scraper(stand_in_server.url)
+    scraper.session.mount('http://', adapter)
+    
+    scraper._make_request(f"{stand_in_server.url}/team")
+    scraper._make_request(f"{stand_in_server.url}/team")
+    
+    assert len(sleeps) == 2
+    assert all(0.01 <= s <= 0.02 for s in sleeps)
+    assert adapter.served == 2
+    
+    recorded = ReplayAdapter(archive, use_recorded_latency=True, sleep=sleeps.append)
+    first_exchange = next(iter(recorded._exchanges.values()))[0]
+    assert recorded._delay(first_exchange) == first_exchange['elapsed'] > 0
@@ -0,0 +1,81 @@
+"""
+Tests for the staleness-based crawl scheduler.
+"""
+
+import sys
+import os
+from datetime import datetime
+import pytest
+
+# Add the src directory to the path for imports
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(__file__)), 'src'))
+from scraping.scheduler import StalenessScheduler
+
+NOW = datetime(2024, 10, 15, 6, 0)
+
+
+@pytest.fixture
+def scheduler():
+    return StalenessScheduler(pages_per_team=2, clock=lambda: NOW)
+
+def team(team_id, last_fetched_at='2024-10-14T06:00', last_game_date='2024-10-10',
+         fetch_count=10, change_count=5, **extra):
+    return dict(team_id=team_id, last_fetched_at=last_fetched_at, last_game_date=last_game_date,
+                fetch_count=fetch_count, change_count=change_count, **extra)
+
+def test_never_fetched_and_new_games_are_most_stale(scheduler):
+    """Test that unseen teams and teams with unfetched games score highest."""
+    assert scheduler.score(team('new', last_fetched_at=None)) == 1.0
+    assert scheduler.score(team('played', last_game_date='2024-10-14')) == 1.0
+    assert scheduler.score(team('quiet')) < 1.0
+
+def test_idle_teams_score_lower(scheduler):
+    """Test that teams whose last game was long ago are deprioritized."""
+    active = scheduler.score(team('active', last_game_date='2024-10-12'))
+    idle = scheduler.score(team('idle', last_game_date='2024-08-01'))
+    assert active > idle
+
+def test_frequently_changing_teams_score_higher(scheduler):
+    """Test that past change frequency raises the score."""
+    volatile = scheduler.score(team('volatile', change_count=9))
+    stable = scheduler.score(team('stable', change_count=0))
+    assert volatile > stable
+
+def test_longer_since_fetch_scores_higher(scheduler):
+    """Test that staleness grows with time since the last fetch."""
+    recent = scheduler.score(team('recent', last_fetched_at='2024-10-15T00:00'))
+    old = scheduler.score(team('old', last_fetched_at='2024-10-12T00:00', last_game_date='2024-10-10'))
+    assert old > recent
+
+def test_plan_respects_budget_and_order(scheduler):
+    """Test that the plan picks the highest-value teams within the budget."""
+    teams = [
+        team('stable', change_count=0, last_game_date='2024-08-01'),
+        team('new', last_fetched_at=None),
+        team('played', last_game_date='2024-10-14'),
+        team('volatile', change_count=9),
+    ]
+    
+    assert scheduler.plan(teams, budget=4) == ['new', 'played']
+    assert scheduler.plan(teams, budget=6) == ['new', 'played', 'volatile']
+
+def test_plan_skips_teams_that_do_not_fit(scheduler):
+    """Test that an expensive team is skipped in favour of cheaper ones."""
+    teams = [team('big', last_fetched_at=None, pages=10), team('small', last_game_date='2024-10-14')]
+    assert scheduler.plan(teams, budget=3) == ['small']
+
+def test_plan_crawl_uses_checkpoint_history(tmp_path):
+    """Test that the scraper builds team state from the checkpoint."""
+    from scraping.checkpoint import CrawlCheckpoint
+    from scraping.ncaa_scraper import NCAAStatsScraper
+    checkpoint = CrawlCheckpoint(str(tmp_path / 'crawl.db'))
+    scraper = NCAAStatsScraper(base_url="http://stats.example")
+    checkpoint.mark_done(scraper._team_key('T1', '2024'), 'h1')
+    checkpoint.mark_done(scraper._team_key('T1', '2024'), 'h1')
+    
+    history = checkpoint.get_fetch_history(scraper._team_key('T1', '2024'))
+    assert history['fetch_count'] == 2 and history['change_count'] == 1
+    
+    # T2 was never fetched, so it is planned first
+    assert scraper.plan_crawl(['T1', 'T2'], checkpoint, budget=2, season='2024') == ['T2']
+    checkpoint.close()
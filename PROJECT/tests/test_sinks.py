@@ -0,0 +1,137 @@
+"""
+Tests for the partitioned Parquet sink.
+"""
+
+import sys
+import os
+import pandas as pd
+import pytest
+
+# Add the src directory to the path for imports
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(__file__)), 'src'))
+from scraping.sinks import PartitionedParquetSink, read_partitions, SUCCESS_MARKER
+
+pytest.importorskip('pyarrow')
+
+
+def player_rows(n, start=0):
+    return pd.DataFrame({'player_id': [f'P{i}' for i in range(start, start + n)],
+                         'goals': list(range(start, start + n))})
+
+def test_partitions_are_laid_out_by_season_and_team(tmp_path):
+    """Test the dataset/season/team directory layout and _SUCCESS markers."""
+    sink = PartitionedParquetSink(str(tmp_path))
+    sink.write('player_stats', player_rows(3), '2024', 'T1')
+    sink.finish_partition('player_stats', '2024', 'T1')
+    
+    directory = tmp_path / 'player_stats' / 'season=2024' / 'team_id=T1'
+    assert sorted(os.listdir(directory)) == [SUCCESS_MARKER, 'part-00000.parquet']
+    assert sink.rows_written == 3
+
+def test_large_partitions_flush_in_parts(tmp_path):
+    """Test that buffers are flushed to new part files once full."""
+    sink = PartitionedParquetSink(str(tmp_path), flush_rows=10)
+    for start in range(0, 25, 5):
+        sink.write('player_stats', player_rows(5, start), '2024', 'T1')
+    sink.finish_partition('player_stats', '2024', 'T1')
+    
+    directory = tmp_path / 'player_stats' / 'season=2024' / 'team_id=T1'
+    assert len([n for n in os.listdir(directory) if n.endswith('.parquet')]) == 3
+    assert read_partitions(str(tmp_path), 'player_stats')['goals'].tolist() == list(range(25))
+
+def test_unfinished_partitions_are_hidden_from_readers(tmp_path):
+    """Test that parts stay staged, out of readers' sight, until the partition is finished."""
+    sink = PartitionedParquetSink(str(tmp_path), flush_rows=2)
+    sink.write('player_stats', player_rows(2), '2024', 'T1')
+    sink.finish_partition('player_stats', '2024', 'T1')
+    sink.write('player_stats', player_rows(4), '2024', 'T2')
+    
+    assert set(read_partitions(str(tmp_path), 'player_stats')['team_id']) == {'T1'}
+    assert set(read_partitions(str(tmp_path), 'player_stats', completed_only=False)['team_id']) == {'T1'}
+    assert not any(name.endswith('.tmp') for _, _, names in os.walk(tmp_path) for name in names)
+    
+    sink.finish_partition('player_stats', '2024', 'T2')
+    assert set(read_partitions(str(tmp_path), 'player_stats')['team_id']) == {'T1', 'T2'}
+
+def test_failed_rerun_keeps_the_previous_partition(tmp_path):
+    """Test that an overwrite which never finishes leaves the old files in place."""
+    with PartitionedParquetSink(str(tmp_path)) as sink:
+        sink.write('player_stats', player_rows(3), '2024', 'T1')
+        sink.finish_partition('player_stats', '2024', 'T1')
+    
+    sink = PartitionedParquetSink(str(tmp_path), flush_rows=1)
+    sink.write('player_stats', player_rows(1, start=10), '2024', 'T1')
+    sink.close()
+    assert read_partitions(str(tmp_path), 'player_stats')['goals'].tolist() == [0, 1, 2]
+    
+    # The next run discards the abandoned staged part
+    with PartitionedParquetSink(str(tmp_path)) as sink:
+        sink.write('player_stats', player_rows(2, start=20), '2024', 'T1')
+        sink.finish_partition('player_stats', '2024', 'T1')
+    assert read_partitions(str(tmp_path), 'player_stats')['goals'].tolist() == [20, 21]
+
+def test_overwrite_and_append_modes(tmp_path):
+    """Test that reruns replace partitions unless appending."""
+    for _ in range(2):
+        with PartitionedParquetSink(str(tmp_path)) as sink:
+            sink.write('game_results', player_rows(3), '2024', 'T1')
+            sink.finish_partition('game_results', '2024', 'T1')
+    assert len(read_partitions(str(tmp_path), 'game_results')) == 3
+    
+    with PartitionedParquetSink(str(tmp_path), mode='append') as sink:
+        sink.write('game_results', player_rows(2, start=3), '2024', 'T1')
+        sink.finish_partition('game_results', '2024', 'T1')
+    assert len(read_partitions(str(tmp_path), 'game_results')) == 5
+    
+    modes = {'game_results': 'append'}
+    with PartitionedParquetSink(str(tmp_path), mode=modes) as sink:
+        assert sink.mode_for('player_stats') == 'overwrite'
+        sink.write('game_results', player_rows(1, start=5), '2024', 'T1')
+        sink.finish_partition('game_results', '2024', 'T1')
+    assert read_partitions(str(tmp_path), 'game_results')['goals'].tolist() == list(range(6))
+    
+    with pytest.raises(ValueError):
+        PartitionedParquetSink(str(tmp_path), mode={'game_results': 'merge'})
+
+def test_crawl_writes_each_team_to_sink(tmp_path, monkeypatch):
+    """Test that crawl_teams streams completed teams into the sink."""
+    from scraping.ncaa_scraper import NCAAStatsScraper
+    scraper = NCAAStatsScraper(base_url="http://stats.example")
+    
+    def fake_crawl_team(team_id, season=None, since=None, validators=None):
+        return {'team_id': team_id, 'player_stats': player_rows(2),
+                'game_results': pd.DataFrame({'date': ['2024-09-01']}), 'error': None}
+    monkeypatch.setattr(scraper, '_crawl_team', fake_crawl_team)
+    
+    with PartitionedParquetSink(str(tmp_path)) as sink:
+        for _ in scraper.crawl_teams(['T1', 'T2'], season='2024', sink=sink):
+            pass
+    
+    stats = read_partitions(str(tmp_path), 'player_stats')
+    assert sorted(stats['team_id'].unique()) == ['T1', 'T2']
+    assert len(read_partitions(str(tmp_path), 'game_results')) == 2
+
+def test_incremental_crawl_appends_games_and_replaces_stats(tmp_path, monkeypatch):
+    """Test that incremental crawls need per-table modes and keep game history."""
+    from scraping.checkpoint import CrawlCheckpoint
+    from scraping.ncaa_scraper import NCAAStatsScraper, INCREMENTAL_SINK_MODES
+    scraper = NCAAStatsScraper(base_url="http://stats.example")
+    checkpoint = CrawlCheckpoint(str(tmp_path / 'crawl.db'))
+    game_dates = iter([['2024-09-01', '2024-09-08'], ['2024-09-15']])
+    
+    def fake_crawl_team(team_id, season=None, since=None, validators=None):
+        return {'team_id': team_id, 'player_stats': player_rows(2),
+                'game_results': pd.DataFrame({'date': next(game_dates)}), 'error': None}
+    monkeypatch.setattr(scraper, '_crawl_team', fake_crawl_team)
+    root = str(tmp_path / 'out')
+    
+    with PartitionedParquetSink(root) as sink:
+        with pytest.raises(ValueError):
+            list(scraper.crawl_teams(['T1'], season='2024', checkpoint=checkpoint, incremental=True, sink=sink))
+    for _ in range(2):
+        with PartitionedParquetSink(root, mode=INCREMENTAL_SINK_MODES) as sink:
+            list(scraper.crawl_teams(['T1'], season='2024', checkpoint=checkpoint, incremental=True, sink=sink))
+    
+    assert read_partitions(root, 'game_results')['date'].tolist() == ['2024-09-01', '2024-09-08', '2024-09-15']
+    assert len(read_partitions(root, 'player_stats')) == 2
+    checkpoint.close()
@@ -0,0 +1,96 @@
+"""
+Tests for the stats table parser.
+"""
+
+import sys
+import os
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add the src directory to the path for imports
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(__file__)), 'src'))
+from scraping.stats_parser import parse_stats_table, coerce_column, normalize_column_name, unique_column_names
+
+FIXTURE_PATH = os.path.join(os.path.dirname(__file__), 'fixtures', 'team_stats_page.html')
+
+
+@pytest.fixture
+def team_stats_page():
+    with open(FIXTURE_PATH, 'rb') as f:
+        return f.read()
+
+def test_parses_only_the_stats_grid(team_stats_page):
+    """Test that the stats grid is parsed and the totals row skipped."""
+    stats = parse_stats_table(team_stats_page)
+    
+    assert len(stats) == 28
+    assert list(stats.columns[:4]) == ['jersey', 'player', 'yr', 'pos']
+    assert 'Totals' not in stats['player'].tolist()
+
+def test_columns_are_typed(team_stats_page):
+    """Test that numeric columns are converted, including thousands separators."""
+    stats = parse_stats_table(team_stats_page)
+    
+    assert stats['minutes'].dtype == np.int64
+    assert stats['shots'].dtype == np.int64
+    assert stats['player'].dtype == object
+    assert stats['minutes'].max() > 1000
+
+def test_parsers_agree(team_stats_page):
+    """Test that lxml and html.parser produce the same table."""
+    pd.testing.assert_frame_equal(parse_stats_table(team_stats_page, parser='lxml'),
+                                  parse_stats_table(team_stats_page, parser='html.parser'))
+
+def test_other_tables_can_be_selected(team_stats_page):
+    """Test that table_attrs picks a different table."""
+    summary = parse_stats_table(team_stats_page, table_attrs={'id': 'team_summary'})
+    
+    assert summary.to_dict('records') == [{'record': '12-4-2', 'conference': '8-2-1'}]
+
+@pytest.mark.parametrize('parser', ['lxml', 'html.parser'])
+def test_attribute_values_with_quotes(parser):
+    """Test that quotes in table_attrs values are matched literally."""
+    html = ("<table id=\"it's &quot;here&quot;\"><tr><th>GP</th></tr><tr><td>3</td></tr></table>"
+            "<table id='other'><tr><th>GP</th></tr><tr><td>9</td></tr></table>")
+
+    table = parse_stats_table(html, table_attrs={'id': 'it\'s "here"'}, parser=parser)
+
+    assert table['gp'].tolist() == [3]
+    assert parse_stats_table(html, table_attrs={'id': "it's"}, parser=parser).empty
+
+def test_invalid_attribute_name_raises():
+    """Test that attribute names which would break the XPath are rejected."""
+    with pytest.raises(ValueError):
+        parse_stats_table('<table></table>', table_attrs={"id='x' or @id": 'y'}, parser='lxml')
+
+@pytest.mark.parametrize('parser', ['lxml', 'html.parser'])
+def test_repeated_and_empty_headers_are_kept(parser):
+    """Test that columns with the same or no header name do not overwrite each other."""
+    html = ("<table id='stat_grid'><tr><th>GP</th><th></th><th>Goals</th><th>GP</th><th>%</th></tr>"
+            "<tr><td>1</td><td>x</td><td>2</td><td>3</td><td>4</td></tr></table>")
+
+    table = parse_stats_table(html, parser=parser)
+
+    assert table.to_dict('records') == [{'gp': 1, 'column_2': 'x', 'goals': 2, 'gp_2': 3, 'column_5': 4}]
+
+def test_unique_column_names():
+    """Test numbering of repeated names around names already taken."""
+    assert unique_column_names(['a', 'a', 'a_2', '', 'a']) == ['a', 'a_3', 'a_2', 'column_4', 'a_4']
+
+def test_missing_table_returns_empty_frame():
+    """Test that pages without the table give an empty DataFrame."""
+    assert parse_stats_table('<html><body><p>No stats</p></body></html>').empty
+
+def test_coerce_column():
+    """Test numeric coercion with missing markers and text columns."""
+    assert coerce_column(['1', '2,500', '3']).tolist() == [1, 2500, 3]
+    assert coerce_column(['1', '', '-']).isna().tolist() == [False, True, True]
+    assert coerce_column(['F', 'MF', '']).tolist()[:2] == ['F', 'MF']
+    assert coerce_column(['9' * 30, '1']).tolist() == ['9' * 30, '1']
+    assert coerce_column(['9223372036854775807', '1']).dtype == np.int64
+
+def test_normalize_column_name():
+    """Test header normalization."""
+    assert normalize_column_name(' Red Cards ') == 'red_cards'
+    assert normalize_column_name('SOG%') == 'sog'
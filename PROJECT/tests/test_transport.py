@@ -0,0 +1,177 @@
+"""
+Tests for the scraper transport: pooling, timeouts, retries and circuit breaking.
+"""
+
+import sys
+import os
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+import pytest
+import requests
+
+# Add the src directory to the path for imports
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(__file__)), 'src'))
+from scraping.transport import Transport, CircuitBreaker, CircuitOpenError, parse_retry_after
+from scraping.ncaa_scraper import NCAAStatsScraper
+from scraping.rate_limiter import HostRateLimiter
+
+
+def flaky_route(failures, status=503, headers=None):
+    """Fail `failures` times with `status`, then succeed."""
+    calls = {'count': 0}
+    
+    def route(handler):
+        calls['count'] += 1
+        if calls['count'] <= failures:
+            return status, headers or {}, 'unavailable'
+        return 200, {}, 'ok'
+    return route
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self):
+        return self.now
+
+@pytest.fixture
+def sleeps():
+    return []
+
+@pytest.fixture
+def transport(sleeps):
+    return Transport(pool_size=4, connect_timeout=1, read_timeout=0.5, max_retries=3,
+                     backoff_factor=0.1, failure_threshold=3, sleep=sleeps.append)
+
+def test_pool_size_is_configured(transport):
+    """Test that the session's adapters use the configured pool size."""
+    adapter = transport.session.get_adapter('http://example.com')
+    assert adapter._pool_maxsize == 4
+    assert transport.timeout == (1, 0.5)
+
+def test_retries_transient_errors_with_jittered_backoff(transport, stand_in_server, sleeps):
+    """Test that 503s are retried with delays bounded by exponential backoff."""
+    stand_in_server.routes['/flaky'] = flaky_route(2)
+    
+    response = transport.get(f"{stand_in_server.url}/flaky")
+    
+    assert response.status_code == 200
+    assert len(stand_in_server.requests) == 3
+    assert transport.retries == 2
+    assert 0 <= sleeps[0] <= 0.1
+    assert 0 <= sleeps[1] <= 0.2
+
+def test_honors_retry_after(transport, stand_in_server, sleeps):
+    """Test that Retry-After replaces the computed backoff."""
+    stand_in_server.routes['/limited'] = flaky_route(1, status=429, headers={'Retry-After': '7'})
+    
+    response = transport.get(f"{stand_in_server.url}/limited")
+    
+    assert response.status_code == 200
+    assert sleeps == [7.0]
+
+def test_returns_last_response_when_retries_run_out(transport, stand_in_server):
+    """Test that a persistently failing page is returned for the caller to raise."""
+    transport.failure_threshold = 10
+    stand_in_server.routes['/down'] = flaky_route(100, status=500)
+    
+    response = transport.get(f"{stand_in_server.url}/down")
+    
+    assert response.status_code == 500
+    assert len(stand_in_server.requests) == 4
+
+def test_read_timeout_is_retried_then_raised(transport, stand_in_server):
+    """Test that slow responses time out instead of hanging the crawl."""
+    transport.failure_threshold = 10
+    
+    def slow(handler):
+        time.sleep(1)
+        return 200, {}, 'late'
+    stand_in_server.routes['/slow'] = slow
+    
+    with pytest.raises(requests.exceptions.Timeout):
+        transport.get(f"{stand_in_server.url}/slow")
+    assert len(stand_in_server.requests) == 4
+
+def test_circuit_opens_and_stops_requests(transport, stand_in_server):
+    """Test that a failing host is not contacted once its circuit is open."""
+    transport.max_retries = 0
+    stand_in_server.routes['/down'] = flaky_route(100, status=503)
+    url = f"{stand_in_server.url}/down"
+    
+    for _ in range(3):
+        transport.get(url)
+    with pytest.raises(CircuitOpenError):
+        transport.get(url)
+    
+    assert len(stand_in_server.requests) == 3
+
+def test_circuit_half_opens_after_reset_timeout():
+    """Test that one trial request is allowed after the reset timeout."""
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30, clock=clock)
+    breaker.record_failure()
+    breaker.record_failure()
+    assert not breaker.allow_request()
+    
+    clock.now = 31
+    assert breaker.allow_request()
+    assert not breaker.allow_request()
+    
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow_request()
+
+def test_failed_trial_reopens_circuit():
+    """Test that a failed half-open trial opens the circuit again."""
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+    breaker.record_failure()
+    clock.now = 11
+    assert breaker.allow_request()
+    
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow_request()
+
+def test_unretried_error_settles_a_half_open_trial():
+    """Test that an error other than a connection failure or timeout does not wedge a half-open circuit."""
+    clock = FakeClock()
+    
+    class BrokenSession(requests.Session):
+        def get(self, url, **kwargs):
+            raise requests.exceptions.ChunkedEncodingError("connection broken mid-body")
+    
+    transport = Transport(failure_threshold=1, reset_timeout=10, session=BrokenSession(), clock=clock)
+    breaker = transport.get_breaker('http://stats.example/')
+    breaker.record_failure()
+    clock.now = 11
+    
+    with pytest.raises(requests.exceptions.ChunkedEncodingError):
+        transport.get('http://stats.example/')
+    
+    assert breaker.state == CircuitBreaker.OPEN
+    clock.now = 22
+    assert breaker.allow_request()
+
+def test_parse_retry_after():
+    """Test delta-seconds and HTTP-date Retry-After values."""
+    now = datetime(2024, 9, 1, 12, 0, 0, tzinfo=timezone.utc)
+    assert parse_retry_after('120') == 120
+    assert parse_retry_after(format_datetime(now + timedelta(seconds=30), usegmt=True), now=now) == 30
+    assert parse_retry_after('soon') is None
+    assert parse_retry_after(None) is None
+
+def test_scraper_raises_after_retries(stand_in_server, sleeps):
+    """Test that _make_request raises once the transport gives up."""
+    stand_in_server.routes['/down'] = flaky_route(100, status=502)
+    limiter = HostRateLimiter(rate=1000, capacity=1000)
+    scraper = NCAAStatsScraper(base_url=stand_in_server.url, rate_limiter=limiter,
+                               transport=Transport(max_retries=1, rate_limiter=limiter,
+                                                   sleep=sleeps.append))
+    
+    with pytest.raises(requests.exceptions.HTTPError):
+        scraper._make_request(f"{stand_in_server.url}/down")
+    assert len(stand_in_server.requests) == 2
@@ -0,0 +1,99 @@
+"""
+Tests for the columnar table extraction of the week 5 web scraper.
+"""
+
+import sys
+import os
+import csv
+import numpy as np
+from bs4 import BeautifulSoup
+
+# Add the week 5 course directory to the path for imports
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(os.path.join(REPO_DIR, 'COURSE', 'week_5'))
+from web_scraper import (coerce_column, extract_player_stats, extract_table_columns,
+                         save_columns_to_csv)
+
+STATS_PAGE = """
+<table class="stats-table">
+  <thead><tr><th>Player Name</th><th>Goals</th><th>Minutes</th><th>Rating</th></tr></thead>
+  <tbody>
+    <tr><td>Alex Moreno</td><td>3</td><td>1,200</td><td>7.5</td></tr>
+    <tr><td>Sam Okafor</td><td>0</td><td>905</td><td>-</td></tr>
+    <tr><td>Jo Lindqvist</td><td>11</td><td>2,310</td><td>8.25</td></tr>
+  </tbody>
+</table>
+"""
+
+
+def test_columns_match_dict_per_row_extraction():
+    """Test that columnar extraction holds the same cells as the dict-per-row path."""
+    soup = BeautifulSoup(STATS_PAGE, 'html.parser')
+
+    columns = extract_table_columns(soup)
+    players = extract_player_stats(soup)
+
+    assert list(columns) == list(players[0])
+    assert columns['Player Name'].tolist() == [p['Player Name'] for p in players]
+    assert columns['Goals'].dtype == np.int64
+    assert columns['Goals'].tolist() == [int(p['Goals']) for p in players]
+
+def test_numeric_coercion():
+    """Test thousands separators, missing values and text columns."""
+    assert coerce_column(['1,200', '905', '-3']).tolist() == [1200, 905, -3]
+
+    rating = coerce_column(['7.5', '-', '8'])
+    assert rating.dtype == np.float64
+    assert np.isnan(rating[1]) and rating[2] == 8.0
+
+    position = coerce_column(['F', 'N/A', '10'])
+    assert position.dtype == object
+    assert position.tolist() == ['F', None, '10']
+
+    huge = '9' * 30
+    assert coerce_column([huge, '1']).tolist() == [huge, '1']
+    assert coerce_column([huge, '-', '2.5']).tolist() == [huge, None, '2.5']
+
+def test_header_detection_without_thead():
+    """Test header rows made of <th> cells, text over numbers, and no header."""
+    th_rows = '<table class="stats-table"><tr><th>Name</th><th>Goals</th></tr>' \
+              '<tr><td>A</td><td>3</td></tr></table>'
+    text_row = '<table class="stats-table"><tr><td>Name</td><td>Goals</td></tr>' \
+               '<tr><td>A</td><td>3</td></tr><tr><td>B</td><td>4</td></tr></table>'
+    no_header = '<table class="stats-table"><tr><td>A</td><td>3</td></tr>' \
+                '<tr><td>B</td><td>4</td></tr></table>'
+
+    for html in (th_rows, text_row):
+        columns = extract_table_columns(BeautifulSoup(html, 'html.parser'))
+        assert list(columns) == ['Name', 'Goals']
+
+    columns = extract_table_columns(BeautifulSoup(no_header, 'html.parser'))
+    assert list(columns) == ['col_1', 'col_2']
+    assert columns['col_2'].tolist() == [3, 4]
+
+def test_repeated_headers_and_totals():
+    """Test that repeated header text keeps every column and <tfoot> totals are skipped."""
+    html = """<table class="stats-table">
+      <thead><tr><th>Player</th><th>G</th><th>G</th><th></th></tr></thead>
+      <tbody><tr><td>Alex</td><td>1</td><td>2</td><td>x</td></tr></tbody>
+      <tfoot><tr><td>Total</td><td>1</td><td>2</td><td></td></tr></tfoot>
+    </table>"""
+
+    columns = extract_table_columns(BeautifulSoup(html, 'html.parser'))
+
+    assert list(columns) == ['Player', 'G', 'G_2', 'col_4']
+    assert columns['Player'].tolist() == ['Alex']
+    assert columns['G'].tolist() == [1] and columns['G_2'].tolist() == [2]
+
+def test_save_columns_in_batches(tmp_path):
+    """Test that batched writes produce every row, with missing values left empty."""
+    columns = extract_table_columns(BeautifulSoup(STATS_PAGE, 'html.parser'))
+    path = str(tmp_path / 'out' / 'players.csv')
+
+    assert save_columns_to_csv(columns, path, batch_size=2) == 3
+
+    with open(path, newline='') as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == ['Player Name', 'Goals', 'Minutes', 'Rating']
+    assert rows[2] == ['Sam Okafor', '0', '905', '']
+    assert len(rows) == 4